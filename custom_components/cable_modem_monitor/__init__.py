@@ -90,6 +90,7 @@ from .const import (
 )
 from .coordinator import CableModemConfigEntry, CableModemRuntimeData
 from .core.log_buffer import setup_log_buffer
+from .fetch_mask_adapter import attach_fetch_mask_listener
 from .lib.utils import get_device_name
 from .mapping_manager import ChannelMap, build_channel_map
 from .migrations import async_run_migrations
@@ -545,6 +546,11 @@ async def async_setup_entry(
     # Step 10: Forward platform setup
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Step 10a: Install the fetch mask listener — once entities are
+    # registered, prune sections and system_info fields whose sensors
+    # are all disabled from subsequent polls. See § Fetch Mask Adapter.
+    attach_fetch_mask_listener(hass, entry, orchestrator)
+
     # Step 11: Update device registry
     _update_device_registry(hass, entry)
 
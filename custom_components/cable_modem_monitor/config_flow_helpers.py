@@ -10,8 +10,10 @@ blocks the HA event loop.
 
 from __future__ import annotations
 
+import functools
 import logging
 from collections import Counter
+from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -31,6 +33,7 @@ from solentlabs.cable_modem_monitor_core.config_loader import (
 from solentlabs.cable_modem_monitor_core.connectivity import (
     ConnectivityResult,
     detect_protocol,
+    run_probes,
     test_http_head,
     test_icmp,
 )
@@ -311,14 +314,16 @@ def detect_probes(
     *,
     legacy_ssl: bool = False,
 ) -> dict[str, bool]:
-    """Test ICMP and HTTP HEAD, using modem.yaml ``health.supports_head`` as a ceiling."""
+    """Test ICMP and HTTP HEAD concurrently, using modem.yaml ``health.supports_head`` as a ceiling."""
     health_cfg = modem_config.health
-    supports_icmp = test_icmp(host)
-    if health_cfg and not health_cfg.supports_head:
-        supports_head = False
-    else:
-        supports_head = test_http_head(base_url, legacy_ssl=legacy_ssl)
-    return {"supports_icmp": supports_icmp, "supports_head": supports_head}
+    probes: dict[str, Callable[[], bool]] = {"supports_icmp": functools.partial(test_icmp, host)}
+    if not health_cfg or health_cfg.supports_head:
+        probes["supports_head"] = functools.partial(test_http_head, base_url, legacy_ssl=legacy_ssl)
+    results = run_probes(probes)
+    return {
+        "supports_icmp": results.get("supports_icmp", False),
+        "supports_head": results.get("supports_head", False),
+    }
 
 
 # ---------------------------------------------------------------------------
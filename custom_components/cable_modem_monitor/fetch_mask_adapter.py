@@ -0,0 +1,186 @@
+"""HA-side fetch-mask wiring — prune polls to what enabled entities read.
+
+Core owns fetch-list *semantics* — which pages feed which sections and
+fields, and which of those Core itself always needs — and exposes
+``Orchestrator.set_fetch_mask``. HA owns the *signal*: the entity
+registry says which sensors the user has disabled. A channel direction
+or system_info field whose registered sensors are all disabled feeds
+nothing, so its pages need not be requested every poll.
+
+The derivation is deliberately conservative: only a category with at
+least one registered sensor, every one of them disabled, is pruned.
+Anything unknown to the registry — fields never minted as entities,
+fields a future poll may produce — stays in the fetch list.
+
+Shape:
+
+- ``build_fetch_mask(hass, entry)`` — pure registry read, returns the
+  ``FetchMask`` or ``None`` when nothing can be pruned.
+- ``attach_fetch_mask_listener(hass, entry, orchestrator)`` — the
+  single entry point. Applies the mask once after platform setup and
+  re-applies it whenever one of the entry's sensors is enabled or
+  disabled.
+
+See HA_ADAPTER_SPEC.md § Fetch Mask Adapter.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.const import Platform
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from solentlabs.cable_modem_monitor_core.fetch_list import ALL_SECTIONS, FetchMask
+
+from .const import CONF_MODEL
+
+if TYPE_CHECKING:
+    from solentlabs.cable_modem_monitor_core.orchestration.orchestrator import (
+        Orchestrator,
+    )
+
+    from .coordinator import CableModemConfigEntry
+
+_LOGGER = logging.getLogger(__name__)
+
+# Sensor unique_id suffixes that read no parser section the mask can
+# prune — identity, health probes, and Core-derived values (error
+# totals and rates come from the downstream aggregate Core always reads).
+_NON_SECTION_SUFFIXES: frozenset[str] = frozenset(
+    {
+        "cable_modem_status",
+        "cable_modem_info",
+        "cable_modem_ping_latency",
+        "cable_modem_tcp_latency",
+        "cable_modem_http_latency",
+        "cable_modem_last_boot_time",
+        "cable_modem_total_corrected",
+        "cable_modem_total_uncorrected",
+        "cable_modem_rate_corrected",
+        "cable_modem_rate_uncorrected",
+    }
+)
+
+# Channel sensors and the per-direction count sensor both read a
+# channel section.
+_DIRECTION_PREFIXES = {
+    "cable_modem_ds_": "downstream",
+    "cable_modem_us_": "upstream",
+}
+_COUNT_SUFFIXES = {
+    "cable_modem_downstream_channel_count": "downstream",
+    "cable_modem_upstream_channel_count": "upstream",
+}
+
+
+def _classify(suffix: str) -> tuple[str, str] | None:
+    """Map a sensor unique_id suffix to ``("section", name)`` or ``("field", name)``.
+
+    Returns ``None`` for sensors that read nothing prunable.
+    """
+    if suffix in _NON_SECTION_SUFFIXES or suffix.startswith("cable_modem_lan_"):
+        return None
+    if suffix in _COUNT_SUFFIXES:
+        return ("section", _COUNT_SUFFIXES[suffix])
+    for prefix, direction in _DIRECTION_PREFIXES.items():
+        if suffix.startswith(prefix):
+            return ("section", direction)
+    # Everything else is a system_info pass-through (software_version
+    # and the Tier 3 SystemInfoFieldSensor family).
+    if suffix.startswith("cable_modem_"):
+        return ("field", suffix.removeprefix("cable_modem_"))
+    return None
+
+
+def build_fetch_mask(hass: HomeAssistant, entry: CableModemConfigEntry) -> FetchMask | None:
+    """Derive the fetch mask from this entry's sensors in the entity registry.
+
+    A channel direction is pruned when every registered sensor reading
+    it is disabled; a system_info field is ignored on the same rule.
+    The system_info section itself is never pruned here — display-only
+    fields (hardware_version, model_name) have no entity to consult.
+
+    Returns:
+        The mask, or ``None`` when nothing can be pruned.
+    """
+    registry = er.async_get(hass)
+    prefix = f"{entry.entry_id}_"
+    # name → [any enabled?]; a key present means at least one sensor
+    enabled_by_section: dict[str, bool] = {}
+    enabled_by_field: dict[str, bool] = {}
+
+    for reg_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+        if reg_entry.domain != Platform.SENSOR or not reg_entry.unique_id.startswith(prefix):
+            continue
+        kind = _classify(reg_entry.unique_id.removeprefix(prefix))
+        if kind is None:
+            continue
+        target = enabled_by_section if kind[0] == "section" else enabled_by_field
+        target[kind[1]] = target.get(kind[1], False) or not reg_entry.disabled
+
+    pruned_sections = {name for name, enabled in enabled_by_section.items() if not enabled}
+    ignored_fields = frozenset(name for name, enabled in enabled_by_field.items() if not enabled)
+    if not pruned_sections and not ignored_fields:
+        return None
+    return FetchMask(
+        sections=ALL_SECTIONS - pruned_sections,
+        ignored_system_info_fields=ignored_fields,
+    )
+
+
+def attach_fetch_mask_listener(
+    hass: HomeAssistant,
+    entry: CableModemConfigEntry,
+    orchestrator: Orchestrator,
+) -> None:
+    """Keep Core's fetch mask in step with the entry's enabled sensors.
+
+    Called once during ``async_setup_entry``, after platform setup so
+    the first poll's entities are registered. Applies the initial mask,
+    then recomputes it on every ``disabled_by`` change to one of this
+    entry's entities. Core picks the new mask up at the start of the
+    next poll — ``set_fetch_mask`` only parks it, so calling from the
+    event loop is safe.
+
+    Enabling an entity also makes HA reload the entry; the reload
+    recomputes the mask from scratch, so the listener matters most
+    for the disable direction, which HA applies without a reload.
+    """
+    model = entry.data.get(CONF_MODEL, "")
+    registry = er.async_get(hass)
+
+    @callback
+    def _apply() -> None:
+        mask = build_fetch_mask(hass, entry)
+        orchestrator.set_fetch_mask(mask)
+        if mask is None:
+            _LOGGER.debug("Fetch mask [%s] — all sections read", model)
+            return
+        _LOGGER.debug(
+            "Fetch mask [%s] — sections: %s, ignored system_info fields: %s",
+            model,
+            ", ".join(sorted(mask.sections)),
+            ", ".join(sorted(mask.ignored_system_info_fields)) or "none",
+        )
+
+    @callback
+    def _event_filter(event_data: er.EventEntityRegistryUpdatedData) -> bool:
+        if event_data["action"] != "update" or "disabled_by" not in event_data["changes"]:
+            return False
+        reg_entry = registry.async_get(event_data["entity_id"])
+        return reg_entry is not None and reg_entry.config_entry_id == entry.entry_id
+
+    @callback
+    def _on_registry_update(event: Event[er.EventEntityRegistryUpdatedData]) -> None:
+        _apply()
+
+    _apply()
+    entry.async_on_unload(
+        hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            _on_registry_update,
+            event_filter=_event_filter,
+        )
+    )
@@ -15,6 +15,13 @@ Also validates HAR files for the same patterns.
 Reference data (safe values, allowlists) is loaded from
 ``data/pii_safe_values.json`` so it can be reused by other tools.
 
+Results are cached per fixture, keyed by the SHA-256 of its contents, in
+``.fixture_pii_cache.json`` next to this package. A pre-commit run only
+re-checks fixtures that changed since the last run. Editing this script,
+its reference data, the catalog's credential fields or the har-capture
+version discards the cache. ``--jobs N`` checks uncached fixtures in N
+worker processes, for full-catalog scans after a cache reset.
+
 Exit codes:
 - 0: No PII found
 - 1: Potential PII detected (review required)
@@ -22,12 +29,18 @@ Exit codes:
 
 from __future__ import annotations
 
+import argparse
+import hashlib
 import json
+import os
 import re
 import sys
 import tempfile
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from importlib import metadata
 from pathlib import Path
+from typing import Any
 
 import yaml
 from har_capture.patterns import load_allowlist
@@ -196,6 +209,20 @@ SESSION_TOKEN_PATTERNS = [
 
 IP_PATTERN = re.compile(r"\b(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\b")
 
+# One pass over the content decides which pattern families above can
+# match at all. Each family's trigger is a literal every one of its
+# patterns contains, and no two triggers share text, so a file without
+# a family's trigger skips that family's regexes and a file with it
+# runs them unchanged.
+_FAMILY_TRIGGERS = re.compile(
+    r"(?P<tagvalue>tagValueList)"
+    r"|(?P<moto>Current(?:Pw|Password))"
+    r"|(?P<ssid>ssid|networkName)"
+    r"|(?P<token>sessionid|token)"
+    r"|(?P<ip>\d\.\d)",
+    re.IGNORECASE,
+)
+
 # JS/code identifier: starts with s/S, all word characters (SNRLevel, SnmpLog, etc.)
 _JS_IDENT = re.compile(r"^[sS]\w+$")
 
@@ -435,6 +462,35 @@ def check_ips_in_content(content: str, filepath: Path) -> list[str]:
     return issues
 
 
+_FAMILY_CHECKS: dict[str, Callable[[str, Path], list[str]]] = {
+    "tagvalue": check_tagvaluelist_credentials,
+    "moto": check_motorola_passwords,
+    "ssid": check_ssids,
+    "token": check_session_tokens,
+    "ip": check_ips_in_content,
+}
+
+
+def _pattern_families(content: str) -> set[str]:
+    """Families whose trigger appears in *content* (see ``_FAMILY_TRIGGERS``)."""
+    found: set[str] = set()
+    for match in _FAMILY_TRIGGERS.finditer(content):
+        found.add(str(match.lastgroup))
+        if len(found) == len(_FAMILY_CHECKS):
+            break
+    return found
+
+
+def _check_content(content: str, filepath: Path, families: tuple[str, ...]) -> list[str]:
+    """Run the pattern checks of *families*, in order, that can match *content*."""
+    found = _pattern_families(content)
+    issues: list[str] = []
+    for family in families:
+        if family in found:
+            issues.extend(_FAMILY_CHECKS[family](content, filepath))
+    return issues
+
+
 def check_html_file(filepath: Path) -> list[str]:
     """Check a single HTML file for PII."""
     issues = []
@@ -445,11 +501,7 @@ def check_html_file(filepath: Path) -> list[str]:
         if not _is_safe_finding(finding):
             issues.append(f"  {finding['pattern']}: {finding['match']} (line {finding['line']})")
 
-    issues.extend(check_tagvaluelist_credentials(content, filepath))
-    issues.extend(check_motorola_passwords(content, filepath))
-    issues.extend(check_ssids(content, filepath))
-    issues.extend(check_session_tokens(content, filepath))
-    issues.extend(check_ips_in_content(content, filepath))
+    issues.extend(_check_content(content, filepath, ("tagvalue", "moto", "ssid", "token", "ip")))
 
     return issues
 
@@ -463,9 +515,7 @@ def check_json_file(filepath: Path) -> list[str]:
     except Exception as e:
         return [f"  Failed to read file: {e}"]
 
-    issues.extend(check_ssids(content, filepath))
-    issues.extend(check_session_tokens(content, filepath))
-    issues.extend(check_ips_in_content(content, filepath))
+    issues.extend(_check_content(content, filepath, ("ssid", "token", "ip")))
 
     findings = check_for_pii(content, str(filepath), custom_patterns=_CATALOG_PII_PATTERNS)
     for finding in findings:
@@ -552,31 +602,142 @@ _CHECKER = {
 }
 
 
-def _scan_directory(root: Path) -> tuple[int, int]:
+# JSON files that are not captured from a modem: state.json is harness
+# bookkeeping; catalog_index.json is generated from the modem*.yaml
+# files (free-text notes included), which are not fixtures either.
+_NOT_FIXTURES = frozenset({"state.json", "catalog_index.json"})
+
+
+def _is_fixture(path: Path) -> bool:
+    """True for files one of ``_CHECKER`` scans."""
+    if not path.is_file() or path.name in _NOT_FIXTURES:
+        return False
+    return path.suffix.lower() in _CHECKER
+
+
+def _check_file(path: Path) -> list[str]:
+    """PII findings for one fixture (process-pool entry point)."""
+    return _CHECKER[path.suffix.lower()](path)
+
+
+# ---------------------------------------------------------------------------
+# Result cache
+# ---------------------------------------------------------------------------
+
+_DEFAULT_CACHE = Path(__file__).parent.parent / ".fixture_pii_cache.json"
+
+
+def _checker_fingerprint() -> str:
+    """Digest of everything besides a fixture's bytes that decides its findings."""
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    for data_file in sorted(_DATA_DIR.glob("*.json")):
+        digest.update(data_file.name.encode() + b"\0" + data_file.read_bytes())
+    try:
+        har_capture_version = metadata.version("har-capture")
+    except metadata.PackageNotFoundError:
+        har_capture_version = ""
+    digest.update(f"\0har-capture={har_capture_version}\0".encode())
+    if _CATALOG_PII_PATTERNS is not None:
+        digest.update(Path(_CATALOG_PII_PATTERNS).read_bytes())
+    return digest.hexdigest()
+
+
+class _ResultCache:
+    """Per-fixture findings keyed by content hash, stored as one JSON file.
+
+    A file written under a different ``_checker_fingerprint()`` is
+    ignored, as is one that cannot be read. ``save`` keeps only the
+    fixtures looked up in this run, so deleted fixtures drop out.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._fingerprint = _checker_fingerprint()
+        self._stored: dict[str, Any] = {}
+        self._current: dict[str, dict[str, Any]] = {}
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("code") == self._fingerprint and isinstance(data.get("files"), dict):
+            self._stored = data["files"]
+
+    def get(self, key: str, digest: str) -> list[str] | None:
+        """Cached findings for fixture *key* with content *digest*, or ``None``."""
+        record = self._stored.get(key)
+        if isinstance(record, dict) and record.get("sha256") == digest and isinstance(record.get("issues"), list):
+            self._current[key] = record
+            return list(record["issues"])
+        return None
+
+    def put(self, key: str, digest: str, issues: list[str]) -> None:
+        """Record the findings for fixture *key* with content *digest*."""
+        self._current[key] = {"sha256": digest, "issues": issues}
+
+    def save(self) -> None:
+        """Write the cache atomically if anything changed."""
+        if self._current == self._stored:
+            return
+        payload = {"code": self._fingerprint, "files": self._current}
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.replace(tmp, self.path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+
+def _check_files(paths: list[Path], *, jobs: int, cache: _ResultCache | None) -> list[list[str]]:
+    """Findings for each of *paths*, in order.
+
+    Cached fixtures are not read past hashing. The rest are checked
+    serially, or in *jobs* worker processes when ``jobs > 1``.
+    """
+    results: list[list[str] | None] = [None] * len(paths)
+    digests: list[str | None] = [None] * len(paths)
+    misses: list[int] = []
+    for i, path in enumerate(paths):
+        if cache is not None:
+            try:
+                digests[i] = hashlib.sha256(path.read_bytes()).hexdigest()
+            except OSError:
+                digests[i] = None
+            digest = digests[i]
+            if digest is not None:
+                results[i] = cache.get(path.as_posix(), digest)
+        if results[i] is None:
+            misses.append(i)
+
+    if jobs > 1 and len(misses) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            checked = list(pool.map(_check_file, [paths[i] for i in misses]))
+    else:
+        checked = [_check_file(paths[i]) for i in misses]
+
+    for i, issues in zip(misses, checked, strict=True):
+        results[i] = issues
+        digest = digests[i]
+        if cache is not None and digest is not None:
+            cache.put(paths[i].as_posix(), digest, issues)
+    return [issues or [] for issues in results]
+
+
+def _scan_directory(root: Path, *, jobs: int = 1, cache: _ResultCache | None = None) -> tuple[int, int]:
     """Scan a directory tree for PII in fixture files.
 
     Returns (files_checked, exit_code).
     """
     exit_code = 0
     checked_dirs: set[Path] = set()
-    files_checked = 0
 
-    for path in sorted(root.rglob("*")):
-        if not path.is_file():
-            continue
-        suffix = path.suffix.lower()
-        if suffix == ".json" and path.name == "state.json":
-            continue
-
-        checker = _CHECKER.get(suffix)
-        if checker is None:
-            continue
-
-        files_checked += 1
-        if _report_issues(path, checker(path)):
+    fixtures = [path for path in sorted(root.rglob("*")) if _is_fixture(path)]
+    for path, issues in zip(fixtures, _check_files(fixtures, jobs=jobs, cache=cache), strict=True):
+        if _report_issues(path, issues):
             exit_code = 1
 
-        if suffix in (".html", ".htm"):
+        if path.suffix.lower() in (".html", ".htm"):
             fixture_dir = path.parent
             if fixture_dir not in checked_dirs:
                 checked_dirs.add(fixture_dir)
@@ -584,7 +745,9 @@ def _scan_directory(root: Path) -> tuple[int, int]:
                     print(f"\n  Missing metadata.yaml in {fixture_dir}")
                     exit_code = 1
 
-    return files_checked, exit_code
+    if cache is not None:
+        cache.save()
+    return len(fixtures), exit_code
 
 
 # ---------------------------------------------------------------------------
@@ -598,13 +761,31 @@ def main() -> int:
     Invoked from repo root by pre-commit and CI. Path is relative
     to the repo root.
     """
+    parser = argparse.ArgumentParser(description="Check catalog fixtures for PII")
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Worker processes for fixtures not in the cache (default: 1)",
+    )
+    parser.add_argument(
+        "--cache-file",
+        type=Path,
+        default=_DEFAULT_CACHE,
+        help=f"Per-fixture result cache (default: {_DEFAULT_CACHE.name} in the catalog package)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Check every fixture and leave the cache untouched")
+    args = parser.parse_args()
+
     fixture_root = Path("packages/cable_modem_monitor_catalog/solentlabs/cable_modem_monitor_catalog/modems")
 
     if not fixture_root.exists():
         print("PII check: catalog modems directory not found")
         return 0
 
-    files_checked, exit_code = _scan_directory(fixture_root)
+    cache = None if args.no_cache else _ResultCache(args.cache_file)
+    files_checked, exit_code = _scan_directory(fixture_root, jobs=args.jobs, cache=cache)
 
     if files_checked == 0:
         print("PII check: no fixture files found")
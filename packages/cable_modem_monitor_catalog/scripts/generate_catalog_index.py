@@ -4,6 +4,7 @@
 Reads modem.yaml files from the catalog package and generates:
   - README.md: modem landscape table, chipset info, ISP coverage, status summary
   - CATALOG_AUDIT.md: verification status, HAR capture needs, community callout candidates
+  - modems/catalog_index.json: prebuilt index read by catalog_manager discovery
 
 Usage:
     python packages/cable_modem_monitor_catalog/scripts/generate_catalog_index.py
@@ -34,6 +35,7 @@ from catalog_reference import (  # noqa: E402  # pyright: ignore[reportMissingIm
     isp_to_badge,
     protocol_to_badge,
 )
+from solentlabs.cable_modem_monitor_core.catalog_manager import write_catalog_index  # noqa: E402
 from solentlabs.cable_modem_monitor_core.models.modem_config.auth import (  # noqa: E402
     get_strategy_display_labels,
 )
@@ -679,6 +681,7 @@ def main() -> None:
         sys.stdout.write(generate_catalog_audit())
     else:
         generate_index(args.output)
+        write_catalog_index(CATALOG_DIR)
         generate_catalog_audit(catalog_root / "CATALOG_AUDIT.md")
 
 
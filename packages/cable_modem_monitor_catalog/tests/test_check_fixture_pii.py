@@ -0,0 +1,157 @@
+"""Tests for the fixture PII checker's result cache, worker pool and trigger gating.
+
+Table-driven tests check that trigger gating never skips a family whose
+pattern matches; inline tests for the per-fixture cache and ``--jobs``.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+# check_fixture_pii lives in the catalog package's scripts/ directory, not
+# as an installed module, so load it by file path. It is registered in
+# sys.modules so the worker pool can pickle its entry point.
+_SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "check_fixture_pii.py"
+_spec = importlib.util.spec_from_file_location("check_fixture_pii", _SCRIPT)
+assert _spec is not None and _spec.loader is not None
+pii = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = pii
+_spec.loader.exec_module(pii)
+
+_TOKEN_JSON = '{"csrf_token": "c0ffee"}'
+
+
+def _ungated(content: str, path: Path) -> list[str]:
+    """Every family's checks, run without looking at triggers."""
+    issues: list[str] = []
+    for check in pii._FAMILY_CHECKS.values():
+        issues.extend(check(content, path))
+    return issues
+
+
+# ┌────────────────────┬───────────────────────────────────────────────┐
+# │ id                 │ content                                       │
+# ├────────────────────┼───────────────────────────────────────────────┤
+# │ csrf-underscore    │ "csrf_token" in JSON                          │
+# │ auth-dash          │ "auth-token" in JSON                          │
+# │ token-upper        │ "TOKEN" holding hex                           │
+# │ sessionid-mixed    │ "SessionId" holding hex                       │
+# │ network-name       │ "networkName" in JSON                         │
+# │ ssid-upper         │ "SSID" in JSON                                │
+# │ ssid-class         │ ssidValue CSS class around the name           │
+# │ tagvaluelist       │ credential-like value in a tagValueList       │
+# │ moto-mixed         │ var currentpwAdmin in lower/mixed case        │
+# │ public-ip          │ non-allowed IPv4 address                      │
+# │ all-families       │ one file triggering every family              │
+# └────────────────────┴───────────────────────────────────────────────┘
+#
+# fmt: off
+_GATING_CASES = [
+    ("csrf-underscore", _TOKEN_JSON),
+    ("auth-dash",       '{"auth-token": "abcd1234"}'),
+    ("token-upper",     '{"TOKEN": "0123456789abcdef0123"}'),
+    ("sessionid-mixed", '{"SessionId": "0123456789abcdef0123"}'),
+    ("network-name",    '{"networkName": "HomeNet"}'),
+    ("ssid-upper",      '{"SSID": "HomeNet"}'),
+    ("ssid-class",      '<td class="ssidValue">HomeNet</td>'),
+    ("tagvaluelist",    "var tagValueList = 'HomeNet1234|1|2';"),
+    ("moto-mixed",      "var currentpwAdmin = 'hunter22';"),
+    ("public-ip",       "<td>45.33.12.7</td>"),
+    ("all-families",    "var tagValueList = 'HomeNet1234|1';\nvar CurrentPwUser = 'hunter22';\n"
+                        '{"ssid": "HomeNet", "sessionid": "0123456789abcdef0123"}\n<td>45.33.12.7</td>'),
+]
+# fmt: on
+
+
+@pytest.mark.parametrize(
+    "content",
+    [c[1] for c in _GATING_CASES],
+    ids=[c[0] for c in _GATING_CASES],
+)
+def test_gating_keeps_every_matching_family(content: str) -> None:
+    path = Path("fixture.html")
+    expected = _ungated(content, path)
+    assert expected
+    assert pii._check_content(content, path, tuple(pii._FAMILY_CHECKS)) == expected
+
+
+class TestResultCache:
+    """Findings keyed by content hash, discarded when the checker changes."""
+
+    def _check(self, fixture: Path, cache_file: Path) -> tuple[list[str], list[Path]]:
+        """Findings for *fixture* through a fresh cache, and the files actually checked."""
+        checked: list[Path] = []
+
+        def check_file(path: Path) -> list[str]:
+            checked.append(path)
+            issues: list[str] = pii.check_json_file(path)
+            return issues
+
+        cache = pii._ResultCache(cache_file)
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(pii, "_check_file", check_file)
+            (issues,) = pii._check_files([fixture], jobs=1, cache=cache)
+        cache.save()
+        return issues, checked
+
+    def test_hit_then_miss_after_change(self, tmp_path: Path) -> None:
+        fixture = tmp_path / "data.json"
+        fixture.write_text(_TOKEN_JSON)
+        cache_file = tmp_path / "cache.json"
+
+        first, checked = self._check(fixture, cache_file)
+        assert first
+        assert checked == [fixture]
+
+        second, checked = self._check(fixture, cache_file)
+        assert second == first
+        assert checked == []
+
+        fixture.write_text('{"status": "ok"}')
+        third, checked = self._check(fixture, cache_file)
+        assert third == []
+        assert checked == [fixture]
+
+    def test_fingerprint_change_invalidates(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        fixture = tmp_path / "data.json"
+        fixture.write_text(_TOKEN_JSON)
+        cache_file = tmp_path / "cache.json"
+        self._check(fixture, cache_file)
+
+        monkeypatch.setattr(pii, "_checker_fingerprint", lambda: "changed")
+        issues, checked = self._check(fixture, cache_file)
+        assert issues
+        assert checked == [fixture]
+
+    def test_unreadable_cache_is_a_miss(self, tmp_path: Path) -> None:
+        fixture = tmp_path / "data.json"
+        fixture.write_text(_TOKEN_JSON)
+        cache_file = tmp_path / "cache.json"
+        cache_file.write_text("{not json")
+
+        _, checked = self._check(fixture, cache_file)
+        assert checked == [fixture]
+
+
+def test_jobs_match_serial_findings_and_order(tmp_path: Path) -> None:
+    """Worker processes return the serial run's findings, in input order."""
+    contents = [
+        '{"csrf_token": "c0ffee"}',
+        '{"status": "ok"}',
+        '{"ssid": "HomeNet"}',
+        "<td>45.33.12.7</td>",
+        '{"networkName": "Cafe", "auth_token": "abcd"}',
+    ]
+    paths = []
+    for i, content in enumerate(contents):
+        path = tmp_path / f"f{i}.json"
+        path.write_text(content)
+        paths.append(path)
+
+    serial = pii._check_files(paths, jobs=1, cache=None)
+    assert sum(1 for issues in serial if issues) == 4
+    assert pii._check_files(paths, jobs=3, cache=None) == serial
@@ -23,3 +23,15 @@ def test_catalog_path_contains_modems() -> None:
 
     children = [p for p in CATALOG_PATH.iterdir() if p.is_dir()]
     assert len(children) > 0
+
+
+def test_catalog_index_is_current() -> None:
+    """The shipped catalog_index.json matches every modem*.yaml by hash.
+
+    Regenerate with
+    ``python -m solentlabs.cable_modem_monitor_core catalog-index``.
+    """
+    from solentlabs.cable_modem_monitor_catalog import CATALOG_PATH
+    from solentlabs.cable_modem_monitor_core.catalog_manager import verify_catalog_index
+
+    assert verify_catalog_index(CATALOG_PATH) == []
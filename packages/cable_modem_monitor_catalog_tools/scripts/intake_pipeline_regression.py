@@ -17,11 +17,16 @@ run and, in CI, writes a GitHub step summary plus a timestamped JSON
 scorecard artifact (the durable trend record). Correctness of each
 modem's parse is gated independently by the golden replay tests.
 
+HARs run in a process pool (``--jobs``). Results are cached by the
+content of everything they depend on (see ``regression.cache``), so a
+rerun only recomputes HARs whose inputs or pipeline code changed.
+
 Usage:
     python .../intake_pipeline_regression.py
     python .../intake_pipeline_regression.py --modem arris/sb8200
     python .../intake_pipeline_regression.py -v
     python .../intake_pipeline_regression.py --scorecard scorecard.json
+    python .../intake_pipeline_regression.py --jobs 1 --no-cache
 """
 
 from __future__ import annotations
@@ -31,6 +36,8 @@ import json
 import os
 import sys
 from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -41,8 +48,11 @@ from solentlabs.cable_modem_monitor_catalog_tools.analysis.types import FleetPat
 from solentlabs.cable_modem_monitor_catalog_tools.grading import GRADE_SEVERITY
 from solentlabs.cable_modem_monitor_catalog_tools.regression import (
     ModemResult,
+    ResultCache,
     build_scorecard,
     fleet_accuracy,
+    fleet_fingerprint,
+    result_cache_key,
     result_status,
 )
 from solentlabs.cable_modem_monitor_core.test_harness import resolve_modem_config
@@ -51,6 +61,8 @@ CATALOG_ROOT = (
     Path(__file__).resolve().parents[2] / "cable_modem_monitor_catalog/solentlabs/cable_modem_monitor_catalog/modems"
 )
 
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[1] / ".intake_regression_cache"
+
 
 # ---------------------------------------------------------------------------
 # Discovery
@@ -425,6 +437,81 @@ def run_modem(
     return result
 
 
+def _committed_inputs(har_path: Path, modem_dir: Path) -> list[Path]:
+    """Committed files a HAR's result is graded against, for the cache key."""
+    committed_path = resolve_modem_config(har_path.stem, modem_dir)
+    return [
+        committed_path or modem_dir / "modem.yaml",
+        modem_dir / "modem.yaml",
+        modem_dir / "parser.yaml",
+        har_path.parent / f"{har_path.stem}.expected.json",
+    ]
+
+
+# Fleet patterns for pool workers, installed once per process by the
+# initializer rather than pickled with every task.
+_worker_fleet: FleetPatterns | None = None
+
+
+def _init_worker(fleet: FleetPatterns) -> None:
+    """Pool initializer: install the fleet patterns for this worker."""
+    global _worker_fleet
+    _worker_fleet = fleet
+
+
+def _run_modem_task(task: tuple[str, Path, Path]) -> ModemResult:
+    """Pool entry point: ``run_modem`` with the worker's fleet patterns."""
+    modem_id, har_path, modem_dir = task
+    return run_modem(modem_id, har_path, modem_dir, fleet=_worker_fleet)
+
+
+def run_modems(
+    runnable: list[tuple[str, Path, Path]],
+    fleet: FleetPatterns,
+    *,
+    jobs: int,
+    cache: ResultCache | None,
+) -> Iterator[tuple[ModemResult, bool]]:
+    """Yield ``(result, from_cache)`` per HAR, in discovery order.
+
+    Cache hits are served without running anything; misses run in a
+    pool of *jobs* processes (in-process when *jobs* is 1) and are
+    written back to the cache.
+    """
+    keys: list[str | None] = [None] * len(runnable)
+    cached: dict[int, ModemResult] = {}
+    if cache is not None:
+        fleet_digest = fleet_fingerprint(CATALOG_ROOT)
+        for i, (_, har_path, modem_dir) in enumerate(runnable):
+            key = result_cache_key(har_path, _committed_inputs(har_path, modem_dir), fleet_digest)
+            keys[i] = key
+            hit = cache.get(key)
+            if hit is not None:
+                cached[i] = hit
+
+    misses = [task for i, task in enumerate(runnable) if i not in cached]
+    if jobs > 1 and len(misses) > 1:
+        executor = ProcessPoolExecutor(min(jobs, len(misses)), initializer=_init_worker, initargs=(fleet,))
+        fresh = executor.map(_run_modem_task, misses)
+    else:
+        executor = None
+        fresh = (run_modem(*task, fleet=fleet) for task in misses)
+
+    try:
+        for i in range(len(runnable)):
+            if i in cached:
+                yield cached[i], True
+                continue
+            result = next(fresh)
+            key = keys[i]
+            if cache is not None and key is not None:
+                cache.put(key, result)
+            yield result, False
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
 def _grade_actions_stage(
     result: ModemResult,
     analysis_data: dict[str, Any],
@@ -673,6 +760,26 @@ def main() -> None:
         metavar="PATH",
         help="Write JSON scorecard for trend tracking",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        metavar="N",
+        help="Worker processes (default: CPU count; 1 runs in-process)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        metavar="PATH",
+        help=f"Result cache directory (default: {DEFAULT_CACHE_DIR.name} in the package)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Recompute every HAR and leave the cache untouched",
+    )
     args = parser.parse_args()
 
     modems = discover_modems(args.modem)
@@ -693,7 +800,7 @@ def main() -> None:
     # Scan fleet patterns once — feeds into analyze_har and generate_config
     from solentlabs.cable_modem_monitor_catalog_tools.fleet_scanner import scan_fleet
 
-    fleet = scan_fleet(CATALOG_ROOT)
+    fleet = scan_fleet(CATALOG_ROOT, cache_path=None if args.no_cache else args.cache_dir / "fleet_patterns.json")
     print(
         f"Fleet patterns: {len(fleet.selector_directions)} selectors, "
         f"{len(fleet.system_info_labels)} labels, "
@@ -706,11 +813,17 @@ def main() -> None:
     else:
         print()
 
+    cache = None if args.no_cache else ResultCache(args.cache_dir)
     results: list[ModemResult] = []
-    for modem_id, har_path, modem_dir in runnable:
-        print(f"  {modem_id} ({har_path.name})")
-        r = run_modem(modem_id, har_path, modem_dir, verbose=args.verbose, fleet=fleet)
+    hits = 0
+    for r, from_cache in run_modems(runnable, fleet, jobs=args.jobs, cache=cache):
+        print(f"  {r.modem} ({r.har_file})" + (" [cached]" if from_cache else ""))
+        if args.verbose:
+            _print_result(r)
         results.append(r)
+        hits += from_cache
+    if cache is not None:
+        print(f"\n  {hits}/{len(results)} result(s) from cache ({cache.directory})")
 
     _print_summary(results, incomplete=incomplete)
     _print_auth_audit(CATALOG_ROOT)
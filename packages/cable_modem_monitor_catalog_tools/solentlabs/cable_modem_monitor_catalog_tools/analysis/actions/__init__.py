@@ -11,6 +11,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from ..documents import DocumentStore
 from ..types import CoreGap
 from .hnap import detect_hnap_actions
 from .http import detect_http_actions
@@ -24,6 +25,7 @@ def detect_actions(
     transport: str,
     warnings: list[str] | None = None,
     core_gaps: list[CoreGap] | None = None,
+    documents: DocumentStore | None = None,
 ) -> ActionsDetail:
     """Detect logout and restart actions from HAR entries.
 
@@ -35,6 +37,8 @@ def detect_actions(
         transport: Detected transport (``http`` or ``hnap``).
         warnings: Mutable list to append suggestions to.
         core_gaps: Mutable list to append core gap items to.
+        documents: Analysis-wide document store shared with the
+            other phases.
 
     Returns:
         ActionsDetail with detected actions and credential annotations.
@@ -46,6 +50,6 @@ def detect_actions(
     if transport == "hnap":
         result = detect_hnap_actions(entries)
     else:
-        result = detect_http_actions(entries, warnings, core_gaps)
+        result = detect_http_actions(entries, warnings, core_gaps, documents)
     result._classify_credentials()
     return result
@@ -12,6 +12,7 @@ import re
 from typing import Any
 
 from ...validation.har_utils import is_static_resource, parse_form_params, path_from_url
+from ..documents import DocumentStore
 from ..types import CoreGap
 from .callsite import find_ajax_callsites
 from .patterns import get_logout_patterns, get_restart_patterns
@@ -44,6 +45,7 @@ def detect_http_actions(
     entries: list[dict[str, Any]],
     warnings: list[str] | None = None,
     core_gaps: list[CoreGap] | None = None,
+    documents: DocumentStore | None = None,
 ) -> ActionsDetail:
     """Detect HTTP logout and restart actions.
 
@@ -51,6 +53,8 @@ def detect_http_actions(
         entries: HAR ``log.entries`` list.
         warnings: Mutable list to append suggestions to.
         core_gaps: Mutable list to append core gap items to.
+        documents: Analysis-wide document store. Ajax call sites are
+            parsed once per page for both actions.
 
     Returns:
         ActionsDetail with detected HTTP logout and restart actions.
@@ -59,15 +63,17 @@ def detect_http_actions(
         warnings = []
     if core_gaps is None:
         core_gaps = []
+    if documents is None:
+        documents = DocumentStore()
     cookie_names = _collect_set_cookie_names(entries)
 
     logout = _find_http_action(entries, _LOGOUT_PATTERNS, "logout", warnings)
     if logout is None:
-        logout = _find_http_action_in_source(entries, _LOGOUT_PATTERNS, "logout", cookie_names, warnings)
+        logout = _find_http_action_in_source(entries, _LOGOUT_PATTERNS, "logout", cookie_names, warnings, documents)
 
     restart = _find_http_action(entries, _RESTART_PATTERNS, "restart", warnings)
     if restart is None:
-        restart = _find_http_action_in_source(entries, _RESTART_PATTERNS, "restart", cookie_names, warnings)
+        restart = _find_http_action_in_source(entries, _RESTART_PATTERNS, "restart", cookie_names, warnings, documents)
 
     # Flag unmatched action-like POSTs as core gaps (only when both traffic
     # and source-scan came up empty — source_inferred counts as found)
@@ -184,6 +190,7 @@ def _find_http_action_in_source(
     action_name: str,
     cookie_names: frozenset[str],
     warnings: list[str],
+    documents: DocumentStore,
 ) -> ActionDetail | None:
     """Scan captured page source for action endpoint references.
 
@@ -196,7 +203,9 @@ def _find_http_action_in_source(
     fallback_method = "GET" if action_name == "logout" else "POST"
 
     return (
-        _find_action_in_ajax_callsites(entries, patterns, action_name, fallback_method, cookie_names, warnings)
+        _find_action_in_ajax_callsites(
+            entries, patterns, action_name, fallback_method, cookie_names, warnings, documents
+        )
         or _find_action_in_form_actions(entries, patterns, action_name, fallback_method, warnings)
         or _find_action_in_quoted_strings(entries, patterns, fallback_method)
     )
@@ -209,13 +218,14 @@ def _find_action_in_ajax_callsites(
     fallback_method: str,
     cookie_names: frozenset[str],
     warnings: list[str],
+    documents: DocumentStore,
 ) -> ActionDetail | None:
     """Find an action endpoint at a ``$.ajax({...})`` call site."""
     for entry in entries:
         body = entry.get("response", {}).get("content", {}).get("text", "")
         if not body or "$.ajax" not in body:
             continue
-        for site in find_ajax_callsites(body):
+        for site in documents.view(body, find_ajax_callsites):
             path = site.url if site.url.startswith("/") else f"/{site.url}"
             if not any(p.search(path) for p in patterns):
                 continue
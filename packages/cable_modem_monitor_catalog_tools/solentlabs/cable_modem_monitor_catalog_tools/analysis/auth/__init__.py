@@ -10,6 +10,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from ..documents import DocumentStore
 from ..types import CoreGap
 from .hnap import detect_hnap_auth
 from .http import detect_http_auth
@@ -24,6 +25,7 @@ def detect_auth(
     warnings: list[str],
     hard_stops: list[str],
     core_gaps: list[CoreGap] | None = None,
+    documents: DocumentStore | None = None,
 ) -> AuthDetail:
     """Detect auth strategy from HAR entries.
 
@@ -38,6 +40,8 @@ def detect_auth(
         warnings: Mutable list to append warnings to.
         hard_stops: Mutable list to append hard stops to.
         core_gaps: Mutable list to append core gap items to.
+        documents: Analysis-wide document store shared with the
+            other phases.
 
     Returns:
         AuthDetail with strategy, extracted fields, and confidence.
@@ -46,4 +50,4 @@ def detect_auth(
         core_gaps = []
     if transport == "hnap":
         return detect_hnap_auth(entries, warnings)
-    return detect_http_auth(entries, warnings, hard_stops, core_gaps)
+    return detect_http_auth(entries, warnings, hard_stops, core_gaps, documents)
@@ -8,6 +8,10 @@ This is NOT used at runtime by ``FormAuthManager``. The auth manager
 sends exactly what modem.yaml declares — no runtime HTML parsing.
 Keeping field discovery at build time ensures the YAML is the complete,
 intentional declaration of what gets POSTed.
+
+Each function accepts the page as a string or as a tree already parsed
+by the caller, so ``analyze_har`` parses a login page once for all of
+them (see ``analysis.documents``).
 """
 
 from __future__ import annotations
@@ -21,7 +25,7 @@ _logger = logging.getLogger(__name__)
 
 
 def extract_hidden_fields(
-    html: str,
+    html: str | BeautifulSoup,
     form_selector: str = "",
 ) -> dict[str, str]:
     """Extract ``<input type="hidden">`` fields from an HTML login page.
@@ -32,7 +36,7 @@ def extract_hidden_fields(
     freezing dynamic values (e.g. CSRF tokens) in ``hidden_fields``.
 
     Args:
-        html: Raw HTML string (login page body).
+        html: Login page body, raw or already parsed.
         form_selector: CSS selector to target a specific ``<form>``.
             If empty, uses the first ``<form>`` found. If no
             ``<form>`` exists, falls back to page-level hidden inputs.
@@ -44,7 +48,7 @@ def extract_hidden_fields(
     if not html:
         return {}
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = _parse(html)
     scope = _find_form_scope(soup, form_selector)
     if scope is None:
         return {}
@@ -61,7 +65,7 @@ def extract_hidden_fields(
 
 
 def extract_form_fields(
-    html: str,
+    html: str | BeautifulSoup,
     form_selector: str = "",
 ) -> dict[str, str]:
     """Extract input fields from an HTML login page.
@@ -71,7 +75,7 @@ def extract_form_fields(
     with their default values.
 
     Args:
-        html: Raw HTML string (login page body).
+        html: Login page body, raw or already parsed.
         form_selector: CSS selector to target a specific ``<form>``.
             If empty, uses the first ``<form>`` found. If no
             ``<form>`` exists, falls back to all ``<input>`` elements
@@ -84,7 +88,7 @@ def extract_form_fields(
     if not html:
         return {}
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = _parse(html)
     scope = _find_form_scope(soup, form_selector)
     if scope is None:
         return {}
@@ -97,7 +101,7 @@ def extract_form_fields(
     return fields
 
 
-def detect_form_selector(html: str, post_action: str) -> str:
+def detect_form_selector(html: str | BeautifulSoup, post_action: str) -> str:
     """Detect a CSS selector for the login form when a page has multiple forms.
 
     Needed when the login page contains more than one ``<form>`` element —
@@ -106,7 +110,7 @@ def detect_form_selector(html: str, post_action: str) -> str:
     may be a search form or other non-login form.
 
     Args:
-        html: Raw HTML string (login page body).
+        html: Login page body, raw or already parsed.
         post_action: The path the login POST targets (e.g. ``/goform/login``).
             Used to match the ``action`` attribute of the correct ``<form>``.
 
@@ -118,7 +122,7 @@ def detect_form_selector(html: str, post_action: str) -> str:
     if not html:
         return ""
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = _parse(html)
     forms = soup.find_all("form")
     if len(forms) <= 1:
         return ""
@@ -141,6 +145,13 @@ def detect_form_selector(html: str, post_action: str) -> str:
     return ""
 
 
+def _parse(html: str | BeautifulSoup) -> BeautifulSoup:
+    """Parse *html* unless the caller already did."""
+    if isinstance(html, BeautifulSoup):
+        return html
+    return BeautifulSoup(html, "html.parser")
+
+
 def _find_form_scope(
     soup: BeautifulSoup,
     form_selector: str,
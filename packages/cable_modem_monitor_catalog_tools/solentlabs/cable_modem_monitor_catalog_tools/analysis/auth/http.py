@@ -23,6 +23,7 @@ from ...validation.har_utils import (
     parse_form_params,
     path_from_url,
 )
+from ..documents import DocumentStore
 from ..types import CoreGap
 from .patterns import (
     get_login_url_patterns,
@@ -69,6 +70,7 @@ def detect_http_auth(
     warnings: list[str],
     hard_stops: list[str],
     core_gaps: list[CoreGap] | None = None,
+    documents: DocumentStore | None = None,
 ) -> AuthDetail:
     """Walk the HTTP auth decision tree.
 
@@ -80,6 +82,8 @@ def detect_http_auth(
         warnings: Mutable list to append warnings to.
         hard_stops: Mutable list to append hard stops to.
         core_gaps: Mutable list to append core gap items to.
+        documents: Analysis-wide document store; the login page is
+            parsed through it.
 
     Returns:
         AuthDetail with strategy, extracted fields, and confidence.
@@ -126,7 +130,7 @@ def detect_http_auth(
         if signals.form_nonce_entry is not None:
             return _extract_form_nonce(signals)
         # Standard form auth
-        return _extract_form(entries, signals, warnings)
+        return _extract_form(entries, signals, warnings, documents or DocumentStore())
 
     # Auth signals detected but no strategy matched -> HARD STOP + evidence
     hard_stops.append(
@@ -695,6 +699,7 @@ def _extract_form(
     entries: list[dict[str, Any]],
     signals: _HttpAuthSignals,
     warnings: list[str],
+    documents: DocumentStore,
 ) -> AuthDetail:
     """Extract standard form auth fields.
 
@@ -743,8 +748,9 @@ def _extract_form(
     # (fields not discoverable, or with values different from the HTML).
     form_selector = ""
     if login_page_html:
-        form_selector = detect_form_selector(login_page_html, post_path)
-        discoverable = extract_hidden_fields(login_page_html, form_selector)
+        login_soup = documents.soup(login_page_html)
+        form_selector = detect_form_selector(login_soup, post_path)
+        discoverable = extract_hidden_fields(login_soup, form_selector)
         hidden_fields = {
             name: value
             for name, value in hidden_fields.items()
@@ -0,0 +1,90 @@
+"""Per-analysis document store shared by every ``analyze_har`` phase.
+
+The phases read the same response bodies over and over. Auth parses
+the login page. Actions scan every page for ajax call sites once per
+action. Format detection builds a BeautifulSoup tree per data page,
+and unread-resource reporting parses every JSON body that format
+detection already parsed. ``DocumentStore`` decodes each body once and
+memoizes what is derived from it, so the second phase to ask gets the
+first phase's result.
+
+Derived views are keyed by body text. Python caches a ``str``'s hash,
+so repeat lookups are O(1), and identical bodies served at two URLs
+share one parse. A store lives for one analysis. Everything it returns
+is shared between phases and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, cast
+
+from ..validation.har_utils import decode_body
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+__all__ = ["DocumentStore"]
+
+_NOT_JSON = object()
+
+
+class DocumentStore:
+    """Memoized decoded bodies, JSON documents, soups and derived views.
+
+    Bodies are cached per response object. JSON documents, soups and
+    views are cached per body text.
+    """
+
+    def __init__(self) -> None:
+        # id() is only unique while the object lives; keep the response
+        # alongside its body so the id cannot be recycled.
+        self._bodies: dict[int, tuple[dict[str, Any], str]] = {}
+        self._json: dict[str, Any] = {}
+        self._soups: dict[str, BeautifulSoup] = {}
+        self._views: dict[tuple[Callable[[str], object], str], object] = {}
+
+    def body(self, response: dict[str, Any]) -> str:
+        """Decoded text of a HAR response (base64-aware, see ``decode_body``)."""
+        cached = self._bodies.get(id(response))
+        if cached is None:
+            cached = (response, decode_body(response))
+            self._bodies[id(response)] = cached
+        return cached[1]
+
+    def json(self, text: str) -> Any:
+        """Parsed JSON document, or ``None`` when *text* is not JSON."""
+        value = self._json.get(text, _NOT_JSON)
+        if value is _NOT_JSON:
+            try:
+                value = json.loads(text) if text else None
+            except (ValueError, TypeError):
+                value = None
+            self._json[text] = value
+        return value
+
+    def soup(self, text: str) -> BeautifulSoup:
+        """BeautifulSoup tree of *text* (``html.parser``)."""
+        soup = self._soups.get(text)
+        if soup is None:
+            from bs4 import BeautifulSoup
+
+            soup = BeautifulSoup(text, "html.parser")
+            self._soups[text] = soup
+        return soup
+
+    def view[T](self, text: str, extract: Callable[[str], T]) -> T:
+        """Result of ``extract(text)``, computed once per (extractor, text).
+
+        Phases pass their own extractors (tables, label pairs, script
+        blocks, ajax call sites), so a body scanned by more than one
+        caller, or more than once by the same caller, is scanned once.
+        """
+        key = (extract, text)
+        if key in self._views:
+            # Keyed by the extractor, so the stored value is its T.
+            return cast(T, self._views[key])
+        value = extract(text)
+        self._views[key] = value
+        return value
@@ -51,7 +51,8 @@ from xml.etree.ElementTree import Element, ParseError
 
 import defusedxml.ElementTree as DefusedET
 
-from ..validation.har_utils import content_type_of, decode_body, is_static_resource
+from ..validation.har_utils import content_type_of, is_static_resource
+from .documents import DocumentStore
 from .format.http import analyze_page
 from .format.table_analysis import is_channel_table
 from .format.types import PageAnalysis
@@ -186,9 +187,10 @@ def captured_fields(
     channel_keys: set[str] = set()
     system_keys: set[str] = set()
     aggregate_fields: set[str] = set()
+    documents = DocumentStore()
 
-    for entry in _data_entries(entries):
-        _scan_entry(entry, channel_keys, system_keys, aggregate_fields)
+    for entry in _data_entries(entries, documents):
+        _scan_entry(entry, documents, channel_keys, system_keys, aggregate_fields)
 
     channel = _resolve(channel_keys, (JSON_KEY_MAP, HEADER_FIELD_MAP))
     system = _resolve(system_keys, (_JSON_SYSINFO_MAP, _LABEL_FIELD_MAP, _ID_FIELD_MAP))
@@ -199,7 +201,7 @@ def captured_fields(
     return channel, system
 
 
-def _data_entries(entries: list[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+def _data_entries(entries: list[dict[str, Any]], documents: DocumentStore) -> Iterator[dict[str, Any]]:
     """Yield every 200 response that can carry a field name.
 
     Deliberately not deduplicated by path, unlike ``identify_data_pages``:
@@ -215,18 +217,19 @@ def _data_entries(entries: list[dict[str, Any]]) -> Iterator[dict[str, Any]]:
             continue
         if not any(known in content_type_of(response) for known in _DATA_CONTENT_TYPES):
             continue
-        if decode_body(response):
+        if documents.body(response):
             yield entry
 
 
 def _scan_entry(
     entry: dict[str, Any],
+    documents: DocumentStore,
     channel_keys: set[str],
     system_keys: set[str],
     aggregate_fields: set[str],
 ) -> None:
     """Collect candidate key names from one response."""
-    page = analyze_page(entry)
+    page = analyze_page(entry, documents)
 
     if page.json_data is not None:
         _walk_json(page.json_data, False, channel_keys, system_keys)
@@ -235,7 +238,7 @@ def _scan_entry(
 
     # analyze_page classifies HTML only; XML is decoded here.
     if "xml" in page.content_type:
-        _walk_xml(decode_body(entry.get("response", {})), channel_keys, system_keys)
+        _walk_xml(documents.body(entry.get("response", {})), channel_keys, system_keys)
         return
 
     _walk_page(page, channel_keys, system_keys)
@@ -13,6 +13,7 @@ import posixpath
 from typing import Any
 
 from ...validation.har_utils import WARNING_PREFIX
+from ..documents import DocumentStore
 from ..mapping.channel_detection import detect_channel_type_fixed
 from ..mapping.system_info import detect_system_info
 from ..types import FleetPatterns
@@ -47,6 +48,7 @@ def detect_sections(
     hard_stops: list[str],
     *,
     fleet: FleetPatterns | None = None,
+    documents: DocumentStore | None = None,
 ) -> dict[str, Any]:
     """Run Phases 5-6: format detection, field mapping, section assembly.
 
@@ -56,6 +58,8 @@ def detect_sections(
         warnings: Mutable list to append warnings to.
         hard_stops: Mutable list to append hard stops to.
         fleet: Optional fleet patterns for augmented detection.
+        documents: Analysis-wide document store shared with the
+            other phases.
 
     Returns:
         Sections dict with downstream, upstream, and system_info keys.
@@ -64,7 +68,7 @@ def detect_sections(
     if transport == "hnap":
         return detect_hnap_sections(entries, warnings, hard_stops, fleet=fleet)
 
-    return _detect_http_sections(entries, warnings, hard_stops, fleet=fleet)
+    return _detect_http_sections(entries, warnings, hard_stops, fleet=fleet, documents=documents)
 
 
 def _detect_http_sections(
@@ -73,6 +77,7 @@ def _detect_http_sections(
     hard_stops: list[str],
     *,
     fleet: FleetPatterns | None = None,
+    documents: DocumentStore | None = None,
 ) -> dict[str, Any]:
     """Detect HTTP format sections from data pages.
 
@@ -85,9 +90,11 @@ def _detect_http_sections(
         return {}
 
     # Phase 5: Analyze each data page
+    if documents is None:
+        documents = DocumentStore()
     page_analyses: list[PageAnalysis] = []
     for entry in data_pages:
-        page = analyze_page(entry)
+        page = analyze_page(entry, documents)
         page_analyses.append(page)
 
     # Phase 5-6: Assemble channel sections from table/JS/JSON pages
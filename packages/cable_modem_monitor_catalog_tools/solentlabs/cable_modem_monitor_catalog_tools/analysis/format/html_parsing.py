@@ -16,6 +16,7 @@ from __future__ import annotations
 import re
 
 from bs4 import BeautifulSoup, Tag
+from solentlabs.cable_modem_monitor_core.parsers.table_selector import table_index
 
 from .types import DetectedLabelPair, DetectedTable
 
@@ -312,17 +313,15 @@ def detect_tables(body: str) -> list[DetectedTable]:
 
     Consistent with the parser-side table selector in
     ``parsers.table_selector`` which applies the same wrapper-cell
-    filtering.
+    filtering. Ordinals are counted by the same ``TableIndex`` that
+    ``find_table`` reads for ``nth`` selectors.
     """
     body = _ORPHANED_TD_RE.sub(r"\1<tr>\2\3", body)
     body = _UNCLOSED_TH_RE.sub(r"\1\2</th>", body)
     soup = BeautifulSoup(body, "html.parser")
     tables: list[DetectedTable] = []
 
-    for idx, table_el in enumerate(soup.find_all("table")):
-        if not isinstance(table_el, Tag):
-            continue
-
+    for idx, table_el in enumerate(table_index(soup).tables):
         if not _is_data_table(table_el):
             continue
 
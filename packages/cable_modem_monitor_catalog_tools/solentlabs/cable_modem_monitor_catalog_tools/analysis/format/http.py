@@ -14,11 +14,11 @@ from typing import Any
 
 from ...validation.har_utils import (
     content_type_of,
-    decode_body,
     has_content,
     is_static_resource,
     path_from_url,
 )
+from ..documents import DocumentStore
 from .html_parsing import detect_label_pairs, detect_tables
 from .table_analysis import is_channel_table, is_transposed
 from .types import (
@@ -119,32 +119,40 @@ def identify_data_pages(
     return result
 
 
-def analyze_page(entry: dict[str, Any]) -> PageAnalysis:
+def analyze_page(entry: dict[str, Any], documents: DocumentStore | None = None) -> PageAnalysis:
     """Analyze a single data page entry for extractable content.
 
     Returns a PageAnalysis with all detected content types:
     tables, JS functions, label-value pairs, and/or JSON data.
     A page can contribute to multiple sections.
+
+    Args:
+        entry: HAR entry for the data page.
+        documents: Analysis-wide document store. Decoded bodies and
+            detected tables are shared with the other phases through
+            it; a private store is used when omitted.
     """
+    if documents is None:
+        documents = DocumentStore()
     req = entry.get("request", {})
     resp = entry.get("response", {})
     url = req.get("url", "")
     resource = path_from_url(url)
     content_type = content_type_of(resp)
-    body = decode_body(resp)
+    body = documents.body(resp)
 
     page = PageAnalysis(resource=resource, content_type=content_type)
 
     if _looks_like_json(content_type, body):
-        page.json_data = _parse_json_body(body)
+        page.json_data = _json_object(documents.json(body))
 
     # Fall through to HTML parsing when JSON sniffing matched but
     # parsing failed (body started with { or [ but wasn't valid JSON).
     if page.json_data is None and "text/html" in content_type:
-        page.tables = detect_tables(body)
-        page.js_functions = _detect_js_functions(body)
-        page.js_json_variables = _detect_js_json_variables(body)
-        page.label_pairs = detect_label_pairs(body)
+        page.tables = documents.view(body, detect_tables)
+        page.js_functions = documents.view(body, _detect_js_functions)
+        page.js_json_variables = documents.view(body, _detect_js_json_variables)
+        page.label_pairs = documents.view(body, detect_label_pairs)
 
     return page
 
@@ -286,11 +294,15 @@ def _parse_json_body(body: str) -> dict[str, Any] | None:
     if not body:
         return None
     try:
-        data = json_mod.loads(body)
-        if isinstance(data, dict):
-            return data
-        if isinstance(data, list) and data and isinstance(data[0], dict):
-            return {"_raw": data}
-        return None
+        return _json_object(json_mod.loads(body))
     except (json_mod.JSONDecodeError, TypeError):
         return None
+
+
+def _json_object(data: Any) -> dict[str, Any] | None:
+    """Shape a parsed JSON document for section assembly (see ``_parse_json_body``)."""
+    if isinstance(data, dict):
+        return data
+    if isinstance(data, list) and data and isinstance(data[0], dict):
+        return {"_raw": data}
+    return None
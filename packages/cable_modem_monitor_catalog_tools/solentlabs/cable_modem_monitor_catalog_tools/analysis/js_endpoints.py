@@ -58,6 +58,7 @@ from ..validation.har_utils import (
     is_static_resource,
     path_from_url,
 )
+from .documents import DocumentStore
 
 # -----------------------------------------------------------------------
 # Comment stripping
@@ -172,6 +173,7 @@ def extract_endpoints_from_js(js_source: str) -> list[str]:
 def detect_uncaptured_endpoints(
     entries: list[dict[str, Any]],
     warnings: list[str],
+    documents: DocumentStore | None = None,
 ) -> None:
     """Scan HAR JS content for server endpoints not captured as requests.
 
@@ -181,9 +183,11 @@ def detect_uncaptured_endpoints(
     Args:
         entries: HAR log entries.
         warnings: Mutable list to append warnings to.
+        documents: Analysis-wide document store shared with the
+            other phases.
     """
     captured = _collect_captured_paths(entries)
-    uncaptured = _find_uncaptured(entries, captured)
+    uncaptured = _find_uncaptured(entries, captured, documents or DocumentStore())
 
     for endpoint in sorted(uncaptured):
         sources = sorted(uncaptured[endpoint])
@@ -218,6 +222,7 @@ def _collect_captured_paths(entries: list[dict[str, Any]]) -> set[str]:
 def _find_uncaptured(
     entries: list[dict[str, Any]],
     captured: set[str],
+    documents: DocumentStore,
 ) -> dict[str, set[str]]:
     """Scan entries for JS endpoint refs not in the captured set.
 
@@ -227,8 +232,8 @@ def _find_uncaptured(
     uncaptured: dict[str, set[str]] = {}
 
     for entry in entries:
-        for js_text, label in _extract_js_sources(entry):
-            for ep in extract_endpoints_from_js(js_text):
+        for js_text, label in _extract_js_sources(entry, documents):
+            for ep in documents.view(js_text, extract_endpoints_from_js):
                 normalized = _normalize_path(ep)
                 bare = normalized.rsplit("/", 1)[-1]
                 if normalized not in captured and bare not in captured:
@@ -239,6 +244,7 @@ def _find_uncaptured(
 
 def _extract_js_sources(
     entry: dict[str, Any],
+    documents: DocumentStore,
 ) -> list[tuple[str, str]]:
     """Extract JS text and source labels from a single HAR entry.
 
@@ -261,15 +267,17 @@ def _extract_js_sources(
 
     content_type = resp.get("content", {}).get("mimeType", "")
     if "html" in content_type.lower():
-        for block_match in _SCRIPT_BLOCK.finditer(body):
-            block = block_match.group(1).strip()
-            if block:
-                page_label = f"inline JS in {source_label or '/'}"
-                sources.append((block, page_label))
+        page_label = f"inline JS in {source_label or '/'}"
+        sources.extend((block, page_label) for block in documents.view(body, _script_blocks))
 
     return sources
 
 
+def _script_blocks(body: str) -> list[str]:
+    """Non-empty inline ``<script>`` bodies of an HTML page."""
+    return [block for match in _SCRIPT_BLOCK.finditer(body) if (block := match.group(1).strip())]
+
+
 def _strip_js_comments(source: str) -> str:
     """Remove JS comments to avoid matching patterns in dead code.
 
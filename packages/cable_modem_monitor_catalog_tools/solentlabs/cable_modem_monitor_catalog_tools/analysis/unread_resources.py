@@ -30,7 +30,6 @@ See ONBOARDING_SPEC.md "Post-Analysis: Unread Resources".
 
 from __future__ import annotations
 
-import json
 from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Any
@@ -38,6 +37,7 @@ from typing import Any
 from ..validation.har_utils import content_type_of, is_static_resource, path_from_url
 from .actions.types import ActionsDetail
 from .auth.types import AuthDetail
+from .documents import DocumentStore
 
 # Auth fields that name an endpoint the generated config fetches. A
 # resource reached during the login flow is read, not unread.
@@ -73,12 +73,17 @@ def detect_unread_resources(
     auth: AuthDetail,
     actions: ActionsDetail,
     transport: str,
+    documents: DocumentStore | None = None,
 ) -> list[UnreadResource]:
-    """Report the HAR's 2xx JSON endpoints that no part of the config consumes."""
+    """Report the HAR's 2xx JSON endpoints that no part of the config consumes.
+
+    JSON bodies are parsed through *documents*, so pages format
+    detection already parsed are not parsed again.
+    """
     mapped = _mapped_endpoints(sections, auth, actions)
 
     unread: list[UnreadResource] = []
-    for path, (response, body) in sorted(_json_candidates(entries).items()):
+    for path, (response, body) in sorted(_json_candidates(entries, documents or DocumentStore()).items()):
         # HNAP puts every call, data and action alike, behind one endpoint.
         # Reporting it as unread would be wrong on every HNAP modem.
         if transport == "hnap" and "/HNAP1/" in path:
@@ -103,6 +108,7 @@ def detect_unread_resources(
 
 def _json_candidates(
     entries: list[dict[str, Any]],
+    documents: DocumentStore,
 ) -> dict[str, tuple[dict[str, Any], Any]]:
     """Map each path answering 2xx with a JSON object or array to its richest response."""
     candidates: dict[str, tuple[dict[str, Any], Any]] = {}
@@ -119,10 +125,7 @@ def _json_candidates(
             continue
 
         text = response.get("content", {}).get("text", "") or ""
-        try:
-            body = json.loads(text)
-        except (ValueError, TypeError):
-            continue
+        body = documents.json(text)
         if not isinstance(body, (dict, list)):
             continue
 
@@ -11,12 +11,19 @@ Orchestrates Phases 1-6 of the ONBOARDING_SPEC decision tree:
 Then the post-analysis passes: JS endpoint discovery, request
 requirements, and unread-resource reporting.
 
+Every phase reads response bodies through one ``DocumentStore``, so a
+body is decoded, parsed as JSON or parsed as HTML once per analysis no
+matter how many phases look at it.
+
 Per ONBOARDING_SPEC.md ``analyze_har`` tool contract.
 """
 
 from __future__ import annotations
 
 import json
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -25,6 +32,7 @@ from solentlabs.cable_modem_monitor_core.har import load_har_json
 
 from .analysis.actions import ActionsDetail, detect_actions
 from .analysis.auth import AuthDetail, detect_auth
+from .analysis.documents import DocumentStore
 from .analysis.format import detect_sections
 from .analysis.js_endpoints import detect_uncaptured_endpoints
 from .analysis.request_requirements import detect_request_requirements
@@ -36,7 +44,12 @@ from .analysis.unread_resources import UnreadResource, detect_unread_resources
 
 @dataclass
 class AnalysisResult:
-    """Complete result of HAR analysis (Phases 1-6)."""
+    """Complete result of HAR analysis (Phases 1-6).
+
+    ``timings`` maps each phase to its wall-clock seconds, in run order.
+    It is diagnostic only and stays out of ``to_dict()`` so the tool
+    output is reproducible.
+    """
 
     transport: TransportResult
     auth: AuthDetail
@@ -47,6 +60,7 @@ class AnalysisResult:
     hard_stops: list[str] = field(default_factory=list)
     core_gaps: list[CoreGap] = field(default_factory=list)
     unread_resources: list[UnreadResource] = field(default_factory=list)
+    timings: dict[str, float] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to a plain dict matching the MCP tool output contract."""
@@ -93,41 +107,47 @@ def analyze_har(
         ValueError: If HAR file cannot be parsed or has no entries.
     """
     har_path = Path(har_path)
-    entries = _load_har_entries(har_path)
+    timings: dict[str, float] = {}
+    with _timed(timings, "load"):
+        entries = _load_har_entries(har_path)
 
     warnings: list[str] = []
     hard_stops: list[str] = []
     core_gaps: list[CoreGap] = []
+    documents = DocumentStore()
 
     # Phase 1: Transport
-    transport_result = TransportResult.detect(entries)
+    with _timed(timings, "transport"):
+        transport_result = TransportResult.detect(entries)
+    transport = transport_result.transport
 
     # Phase 2: Auth
-    auth_result = detect_auth(entries, transport_result.transport, warnings, hard_stops, core_gaps)
+    with _timed(timings, "auth"):
+        auth_result = detect_auth(entries, transport, warnings, hard_stops, core_gaps, documents)
 
     # Phase 3: Session
-    session_result = SessionDetail.detect(entries, transport_result.transport, auth_result.strategy, warnings)
+    with _timed(timings, "session"):
+        session_result = SessionDetail.detect(entries, transport, auth_result.strategy, warnings)
 
     # Phase 4: Actions
-    actions_result = detect_actions(entries, transport_result.transport, warnings, core_gaps)
+    with _timed(timings, "actions"):
+        actions_result = detect_actions(entries, transport, warnings, core_gaps, documents)
 
     # Phase 5-6: Format detection and field mapping
-    sections = detect_sections(entries, transport_result.transport, warnings, hard_stops, fleet=fleet)
+    with _timed(timings, "format"):
+        sections = detect_sections(entries, transport, warnings, hard_stops, fleet=fleet, documents=documents)
 
     # Post-analysis: JS endpoint discovery
-    detect_uncaptured_endpoints(entries, warnings)
+    with _timed(timings, "js_endpoints"):
+        detect_uncaptured_endpoints(entries, warnings, documents)
 
     # Post-analysis: Request requirements detection
-    detect_request_requirements(entries, transport_result.transport, session_result, warnings)
+    with _timed(timings, "request_requirements"):
+        detect_request_requirements(entries, transport, session_result, warnings)
 
     # Post-analysis: Unread resource reporting
-    unread = detect_unread_resources(
-        entries,
-        sections,
-        auth_result,
-        actions_result,
-        transport_result.transport,
-    )
+    with _timed(timings, "unread_resources"):
+        unread = detect_unread_resources(entries, sections, auth_result, actions_result, transport, documents)
 
     return AnalysisResult(
         transport=transport_result,
@@ -139,9 +159,20 @@ def analyze_har(
         hard_stops=hard_stops,
         core_gaps=core_gaps,
         unread_resources=unread,
+        timings=timings,
     )
 
 
+@contextmanager
+def _timed(timings: dict[str, float], phase: str) -> Iterator[None]:
+    """Record the wall-clock seconds spent in the ``with`` block under *phase*."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[phase] = time.perf_counter() - start
+
+
 def _load_har_entries(har_path: Path) -> list[dict[str, Any]]:
     """Load HAR file and return entries list.
 
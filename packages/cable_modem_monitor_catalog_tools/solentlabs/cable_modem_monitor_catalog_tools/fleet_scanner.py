@@ -4,7 +4,9 @@ Two responsibilities:
 
 **Pattern extraction** (``scan_fleet``): reads all ``parser.yaml`` files
 and builds a ``FleetPatterns`` instance used by Core's analyzer to augment
-baseline detection with proven patterns from the existing catalog.
+baseline detection with proven patterns from the existing catalog. With
+``cache_path``, only the files whose contents changed since the last
+scan are parsed.
 
 **Catalog health audit** (``audit_fleet_auth``): sweeps all ``modem.yaml``
 files and checks that form-auth fixtures contain the login page responses
@@ -22,75 +24,178 @@ Usage::
 
 from __future__ import annotations
 
+import hashlib
 import json
-from dataclasses import dataclass
+import os
+import tempfile
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from functools import cache
 from pathlib import Path
 from typing import Any
 
 import yaml
+from solentlabs.cable_modem_monitor_catalog_tools.analysis import types as analysis_types
 from solentlabs.cable_modem_monitor_catalog_tools.analysis.types import FleetPatterns
 from solentlabs.cable_modem_monitor_catalog_tools.validation.fixture_integrity import check_login_page_in_har
+from solentlabs.cable_modem_monitor_core.har import LfsPointerError, find_har_files, load_har_json
 
 
-def scan_fleet(catalog_path: Path) -> FleetPatterns:
+def scan_fleet(catalog_path: Path, *, cache_path: Path | None = None) -> FleetPatterns:
     """Scan all parser.yaml files and build fleet patterns.
 
+    Each file's contribution is extracted on its own and the
+    contributions are merged in path order, so a file's patterns can be
+    cached by content hash and only changed files are parsed again.
+
     Args:
         catalog_path: Root of the modem catalog directory
             (``modems/{manufacturer}/{model}/``).
+        cache_path: JSON file of per-file contributions keyed by
+            SHA-256 of the parser.yaml contents. Read if present,
+            rewritten when any file changed. ``None`` parses every
+            file and writes nothing.
 
     Returns:
         ``FleetPatterns`` populated from the fleet's proven configs.
     """
-    selector_directions: dict[str, str] = {}
-    system_info_labels: dict[str, tuple[str, int]] = {}
-    system_info_ids: dict[str, tuple[str, int]] = {}
-    system_info_json_keys: dict[str, tuple[str, int]] = {}
-    delimiters: set[str] = set()
-    channel_type_values: set[str] = set()
-    aggregate_fields: list[tuple[str, str]] = []
-    seen_aggregates: set[tuple[str, str]] = set()
-    js_function_layouts: dict[str, dict[str, Any]] = {}
-    hnap_response_layouts: dict[str, dict[str, Any]] = {}
-    uptime_formats: set[str] = set()
-    docsis_status_values: set[str] = set()
+    cached = _load_scan_cache(cache_path, catalog_path)
+    records: dict[str, dict[str, Any]] = {}
 
     for parser_path in sorted(catalog_path.rglob("parser.yaml")):
         try:
-            data = yaml.safe_load(parser_path.read_text(encoding="utf-8"))
-        except (yaml.YAMLError, OSError):
+            raw = parser_path.read_bytes()
+        except OSError:
             continue
+        rel = parser_path.relative_to(catalog_path).as_posix()
+        digest = hashlib.sha256(raw).hexdigest()
+        record = cached.get(rel)
+        if not isinstance(record, dict) or record.get("sha256") != digest:
+            record = {"sha256": digest, "patterns": _scan_parser(raw)}
+        records[rel] = record
+
+    if cache_path is not None and records != cached:
+        _write_scan_cache(cache_path, catalog_path, records)
+
+    return _merge_patterns(_patterns_from_json(record["patterns"]) for record in records.values())
 
-        if not isinstance(data, dict):
-            continue
 
-        _extract_selectors(data, selector_directions)
-        _extract_system_info_labels(data, system_info_labels)
-        _extract_system_info_ids(data, system_info_ids)
-        _extract_system_info_json_keys(data, system_info_json_keys)
-        _extract_delimiters(data, delimiters)
-        _extract_channel_type_values(data, channel_type_values)
-        _extract_aggregates(data, aggregate_fields, seen_aggregates)
-        _extract_js_function_layouts(data, js_function_layouts)
-        _extract_hnap_response_layouts(data, hnap_response_layouts)
+def _scan_parser(raw: bytes) -> dict[str, Any]:
+    """One parser.yaml's contribution, as the JSON the scan cache stores.
+
+    Fresh and cached contributions take the same JSON round trip, so a
+    cache hit can never merge differently from a miss.
+    """
+    patterns = FleetPatterns()
+    try:
+        data = yaml.safe_load(raw.decode("utf-8"))
+    except yaml.YAMLError:
+        data = None
+
+    if isinstance(data, dict):
+        _extract_selectors(data, patterns.selector_directions)
+        _extract_system_info_labels(data, patterns.system_info_labels)
+        _extract_system_info_ids(data, patterns.system_info_ids)
+        _extract_system_info_json_keys(data, patterns.system_info_json_keys)
+        _extract_delimiters(data, patterns.delimiters)
+        _extract_channel_type_values(data, patterns.channel_type_values)
+        _extract_aggregates(data, patterns.aggregate_fields, set())
+        _extract_js_function_layouts(data, patterns.js_function_layouts)
+        _extract_hnap_response_layouts(data, patterns.hnap_response_layouts)
+        uptime_formats: set[str] = set()
         _extract_uptime_formats(data, uptime_formats)
-        _extract_docsis_status_values(data, docsis_status_values)
-
-    return FleetPatterns(
-        selector_directions=selector_directions,
-        system_info_labels=system_info_labels,
-        system_info_ids=system_info_ids,
-        system_info_json_keys=system_info_json_keys,
-        delimiters=delimiters,
-        channel_type_values=channel_type_values,
-        aggregate_fields=aggregate_fields,
-        js_function_layouts=js_function_layouts,
-        hnap_response_layouts=hnap_response_layouts,
-        # Longest first: a more specific pattern must be tried before a
-        # shorter one that would also match a prefix of the same value.
-        uptime_formats=sorted(uptime_formats, key=lambda f: (-len(f), f)),
-        docsis_status_success_values=docsis_status_values,
-    )
+        patterns.uptime_formats = sorted(uptime_formats)
+        _extract_docsis_status_values(data, patterns.docsis_status_success_values)
+
+    encoded = asdict(patterns)
+    for name in _SET_FIELDS:
+        encoded[name] = sorted(encoded[name])
+    result: dict[str, Any] = json.loads(json.dumps(encoded, default=str))
+    return result
+
+
+def _patterns_from_json(data: dict[str, Any]) -> FleetPatterns:
+    """Rebuild one contribution from ``_scan_parser`` output."""
+    patterns = FleetPatterns(**data)
+    for name in _SET_FIELDS:
+        setattr(patterns, name, set(getattr(patterns, name)))
+    for name in _TIERED_FIELDS:
+        setattr(patterns, name, {key: (field, tier) for key, (field, tier) in getattr(patterns, name).items()})
+    patterns.aggregate_fields = [(source, name) for source, name in patterns.aggregate_fields]
+    return patterns
+
+
+def _merge_patterns(parts: Iterable[FleetPatterns]) -> FleetPatterns:
+    """Merge per-file contributions in path order.
+
+    Each field keeps the rule its extractor applies within a file:
+    selector directions are last-wins, tiered maps and layouts are
+    first-wins, aggregates keep first-seen order, the rest are sets.
+    """
+    merged = FleetPatterns()
+    uptime_formats: set[str] = set()
+    for part in parts:
+        merged.selector_directions.update(part.selector_directions)
+        for name in (*_TIERED_FIELDS, "js_function_layouts", "hnap_response_layouts"):
+            target = getattr(merged, name)
+            for key, value in getattr(part, name).items():
+                target.setdefault(key, value)
+        for name in _SET_FIELDS:
+            getattr(merged, name).update(getattr(part, name))
+        merged.aggregate_fields.extend(pair for pair in part.aggregate_fields if pair not in merged.aggregate_fields)
+        uptime_formats.update(part.uptime_formats)
+
+    # Longest first: a more specific pattern must be tried before a
+    # shorter one that would also match a prefix of the same value.
+    merged.uptime_formats = sorted(uptime_formats, key=lambda f: (-len(f), f))
+    return merged
+
+
+# ---------------------------------------------------------------------------
+# Scan cache
+# ---------------------------------------------------------------------------
+
+_SET_FIELDS: tuple[str, ...] = ("delimiters", "channel_type_values", "docsis_status_success_values")
+_TIERED_FIELDS: tuple[str, ...] = ("system_info_labels", "system_info_ids", "system_info_json_keys")
+
+
+@cache
+def _scanner_fingerprint() -> str:
+    """Digest of the extraction code; a cache written by other code is discarded."""
+    digest = hashlib.sha256()
+    for source in (Path(__file__), Path(analysis_types.__file__)):
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def _load_scan_cache(cache_path: Path | None, catalog_path: Path) -> dict[str, Any]:
+    """Per-file records from *cache_path*, or empty when unusable."""
+    if cache_path is None:
+        return {}
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    if data.get("code") != _scanner_fingerprint() or data.get("catalog") != str(catalog_path.resolve()):
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _write_scan_cache(cache_path: Path, catalog_path: Path, records: dict[str, dict[str, Any]]) -> None:
+    """Atomically replace *cache_path* with *records*."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"code": _scanner_fingerprint(), "catalog": str(catalog_path.resolve()), "files": records}
+    fd, tmp = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp, cache_path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
 
 
 # ---------------------------------------------------------------------------
@@ -116,7 +221,7 @@ class AuthAuditIssue:
 def audit_fleet_auth(catalog_path: Path) -> list[AuthAuditIssue]:
     """Scan form-auth fixtures for the login-flow responses replay needs.
 
-    Two checks per ``test_data/*.har``:
+    Two checks per ``test_data/*.har`` (or ``.har.gz`` / ``.har.zst``):
 
     - With ``login_page`` and ``action`` set, the fixture must hold a GET
       response for the login page with a non-empty HTML body referencing
@@ -158,12 +263,11 @@ def audit_fleet_auth(catalog_path: Path) -> list[AuthAuditIssue]:
         test_data = modem_dir / "test_data"
         modem_rel = str(modem_dir.relative_to(catalog_path))
 
-        for har_path in sorted(test_data.glob("*.har")):
+        for har_path in find_har_files(test_data):
             try:
-                with open(har_path, encoding="utf-8") as f:
-                    har_data: Any = json.load(f)
+                har_data: Any = load_har_json(har_path, resolve_lfs=False)
                 entries: list[Any] = har_data.get("log", {}).get("entries", [])
-            except (OSError, json.JSONDecodeError):
+            except (OSError, ValueError, LfsPointerError):
                 continue
 
             if login_page and action:
@@ -2,18 +2,22 @@
 
 The regression script (scripts/intake_pipeline_regression.py) supplies
 discovery, pipeline stages, and printing; the reusable pieces (result
-classification and the trend scorecard) live here so they are
-unit-tested.
+classification, the trend scorecard and the result cache) live here so
+they are unit-tested.
 """
 
+from .cache import ResultCache, fleet_fingerprint, result_cache_key
 from .results import STATUS_SEVERITY, ModemResult, fleet_accuracy, result_key, result_status
 from .scorecard import build_scorecard
 
 __all__ = [
     "STATUS_SEVERITY",
     "ModemResult",
+    "ResultCache",
     "build_scorecard",
     "fleet_accuracy",
+    "fleet_fingerprint",
+    "result_cache_key",
     "result_key",
     "result_status",
 ]
@@ -0,0 +1,139 @@
+"""Content-addressed cache of per-HAR regression results.
+
+A regression result is a pure function of its inputs: the HAR, the
+committed files it is graded against, the fleet configs that feed
+``FleetPatterns``, and the pipeline code itself. ``result_cache_key``
+hashes all of them, so a cached result is only reused when a fresh run
+would produce the same one, and editing any pipeline module, HAR or
+config recomputes exactly the HARs it can affect.
+
+The code fingerprint hashes the installed catalog_tools and Core source
+trees rather than trusting the version string, which stays
+``0.0.0+dev`` between releases.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Iterable
+from functools import cache
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+from .results import ModemResult
+
+# Source files whose contents decide a regression result. Pattern and
+# registry JSON files are data the analyzers load at import time.
+_CODE_SUFFIXES: tuple[str, ...] = (".py", ".json", ".yaml")
+
+# Bumped when the cached record layout changes.
+_CACHE_FORMAT = 1
+
+
+def result_cache_key(
+    har_path: Path,
+    committed: Iterable[Path],
+    fleet_digest: str,
+) -> str:
+    """Key for one HAR's regression result.
+
+    Args:
+        har_path: The HAR run through the pipeline.
+        committed: Committed files the result is graded against
+            (modem config, parser.yaml, golden file). Missing paths
+            are hashed as absent, so creating one changes the key.
+        fleet_digest: ``fleet_fingerprint()`` of the catalog.
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"format={_CACHE_FORMAT}\0code={code_fingerprint()}\0fleet={fleet_digest}\0".encode())
+    for path in (har_path, *committed):
+        digest.update(path.name.encode() + b"\0")
+        digest.update(_file_digest(path).encode() + b"\0")
+    return digest.hexdigest()
+
+
+def fleet_fingerprint(catalog_root: Path) -> str:
+    """Digest of every config file ``scan_fleet`` can read under *catalog_root*."""
+    digest = hashlib.sha256()
+    for path in sorted(catalog_root.rglob("*.yaml")):
+        digest.update(path.relative_to(catalog_root).as_posix().encode() + b"\0")
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+@cache
+def code_fingerprint() -> str:
+    """Digest of the catalog_tools and Core versions and source trees."""
+    from solentlabs import cable_modem_monitor_catalog_tools, cable_modem_monitor_core
+
+    digest = hashlib.sha256()
+    for package in (cable_modem_monitor_catalog_tools, cable_modem_monitor_core):
+        assert package.__file__ is not None  # regular packages, not namespaces
+        root = Path(package.__file__).parent
+        digest.update(f"{package.__name__}={_version(package.__name__)}\0".encode())
+        for path in sorted(p for p in root.rglob("*") if p.suffix in _CODE_SUFFIXES and p.is_file()):
+            digest.update(path.relative_to(root).as_posix().encode() + b"\0")
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Directory of cached ``ModemResult`` records, one JSON file per key.
+
+    Unreadable or stale-format records are treated as misses. Writes go
+    through a temporary file and ``os.replace``, so an interrupted run
+    never leaves a truncated record behind.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    def get(self, key: str) -> ModemResult | None:
+        """Cached result for *key*, or ``None`` on a miss."""
+        try:
+            record = json.loads((self.directory / f"{key}.json").read_text())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(record, dict) or record.get("format") != _CACHE_FORMAT:
+            return None
+        try:
+            return ModemResult.from_dict(record["result"])
+        except (KeyError, TypeError):
+            return None
+
+    def put(self, key: str, result: ModemResult) -> None:
+        """Store *result* under *key*."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        record: dict[str, Any] = {"format": _CACHE_FORMAT, "result": result.to_dict()}
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(record, f)
+            os.replace(tmp, self.directory / f"{key}.json")
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+
+def _file_digest(path: Path) -> str:
+    """SHA-256 of a file's bytes, or ``"absent"``."""
+    try:
+        with path.open("rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+    except FileNotFoundError:
+        return "absent"
+
+
+def _version(distribution: str) -> str:
+    """Installed distribution version, or empty when not installed."""
+    try:
+        return metadata.version(distribution.replace(".", "-").replace("_", "-"))
+    except metadata.PackageNotFoundError:
+        return ""
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
+from typing import Any
 
 from ..grading import Grade
 
@@ -38,6 +39,19 @@ class ModemResult:
             return 0.0
         return self.matching_fields / self.total_fields * 100
 
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize every field to plain JSON types (see ``from_dict``)."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ModemResult:
+        """Rebuild a result serialized by ``to_dict``."""
+        grades = {
+            dim: {item: Grade(**grade) for item, grade in items.items()}
+            for dim, items in data.get("grades", {}).items()
+        }
+        return cls(**{**data, "grades": grades})
+
 
 def result_status(result: ModemResult) -> str:
     """Classify a result as clean, drift, or failure."""
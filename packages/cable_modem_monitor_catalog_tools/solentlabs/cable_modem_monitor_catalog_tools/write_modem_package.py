@@ -23,6 +23,7 @@ from pathlib import Path
 from typing import Any
 
 import yaml
+from solentlabs.cable_modem_monitor_core.har import load_har_json
 from solentlabs.cable_modem_monitor_core.validation.parser_sandbox import validate_parser_sandbox
 
 from .validation.fixture_integrity import check_login_page_in_har
@@ -193,11 +194,7 @@ def _check_har_login_page(modem_yaml: str, har_path: str) -> str:
         return ""
 
     try:
-        import gzip as _gzip
-
-        opener = _gzip.open if har_file.suffix == ".gz" else open
-        with opener(har_file) as f:
-            har_data: Any = json.load(f)
+        har_data: Any = load_har_json(har_file)
         entries: list[Any] = har_data.get("log", {}).get("entries", [])
     except Exception:
         return ""
@@ -0,0 +1,177 @@
+"""Tests for the per-analysis document store.
+
+Table-driven tests for JSON decoding; inline tests for memoization and
+for the store being shared across ``analyze_har`` phases.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from solentlabs.cable_modem_monitor_catalog_tools.analysis.auth.form_discovery import (
+    detect_form_selector,
+    extract_hidden_fields,
+)
+from solentlabs.cable_modem_monitor_catalog_tools.analysis.documents import DocumentStore
+from solentlabs.cable_modem_monitor_catalog_tools.analysis.format.html_parsing import detect_tables
+from solentlabs.cable_modem_monitor_catalog_tools.analysis.format.http import analyze_page
+from solentlabs.cable_modem_monitor_catalog_tools.analyze_har import analyze_har
+from tests._helpers import write_har
+
+_TABLE_PAGE = (
+    "<html><body><table>"
+    "<tr><th>Channel</th><th>Power</th></tr>"
+    "<tr><td>1</td><td>3.2</td></tr>"
+    "<tr><td>2</td><td>2.9</td></tr>"
+    "</table></body></html>"
+)
+
+_LOGIN_PAGE = (
+    '<form id="search" action="/search"><input name="q"></form>'
+    '<form id="loginForm" action="/goform/login">'
+    '<input type="hidden" name="csrf" value="abc">'
+    "</form>"
+)
+
+
+def _entry(path: str, body: str, mime: str = "text/html", **content: Any) -> dict[str, Any]:
+    return {
+        "request": {"method": "GET", "url": f"http://192.168.100.1{path}", "headers": []},
+        "response": {
+            "status": 200,
+            "headers": [{"name": "Content-Type", "value": mime}],
+            "content": {"mimeType": mime, "size": len(body), "text": body, **content},
+        },
+    }
+
+
+# =====================================================================
+# JSON — table-driven
+# =====================================================================
+
+# ┌──────────────┬──────────────────────┬─────────────────────┐
+# │ id           │ text                 │ parsed              │
+# ├──────────────┼──────────────────────┼─────────────────────┤
+# │ object       │ {"a": 1}             │ {"a": 1}            │
+# │ array        │ [1, 2]               │ [1, 2]              │
+# │ empty        │ ""                   │ None                │
+# │ invalid      │ {not json}           │ None                │
+# │ html         │ <html></html>        │ None                │
+# └──────────────┴──────────────────────┴─────────────────────┘
+#
+# fmt: off
+_JSON_CASES = [
+    ("object",  '{"a": 1}',      {"a": 1}),
+    ("array",   "[1, 2]",        [1, 2]),
+    ("empty",   "",              None),
+    ("invalid", "{not json}",    None),
+    ("html",    "<html></html>", None),
+]
+# fmt: on
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [(c[1], c[2]) for c in _JSON_CASES],
+    ids=[c[0] for c in _JSON_CASES],
+)
+def test_json(text: str, expected: Any) -> None:
+    assert DocumentStore().json(text) == expected
+
+
+# =====================================================================
+# Memoization — inline
+# =====================================================================
+
+
+class TestMemoization:
+    """Each view is computed once per body."""
+
+    def test_body_decodes_base64_once(self) -> None:
+        encoded = base64.b64encode(b"<html>hi</html>").decode()
+        response = _entry("/", encoded, encoding="base64")["response"]
+        documents = DocumentStore()
+        with patch(
+            "solentlabs.cable_modem_monitor_catalog_tools.analysis.documents.decode_body",
+            wraps=lambda r: base64.b64decode(r["content"]["text"]).decode(),
+        ) as decode:
+            assert documents.body(response) == "<html>hi</html>"
+            assert documents.body(response) == "<html>hi</html>"
+        assert decode.call_count == 1
+
+    def test_json_parsed_once(self) -> None:
+        documents = DocumentStore()
+        first = documents.json('{"a": [1]}')
+        assert documents.json('{"a": [1]}') is first
+
+    def test_equal_bodies_share_soup(self) -> None:
+        documents = DocumentStore()
+        # Two distinct str objects with equal contents.
+        a = "".join(["<p>", "x", "</p>"])
+        b = "".join(["<p>", "x", "</p>"])
+        assert documents.soup(a) is documents.soup(b)
+
+    def test_view_per_extractor(self) -> None:
+        documents = DocumentStore()
+        tables = documents.view(_TABLE_PAGE, detect_tables)
+        assert documents.view(_TABLE_PAGE, detect_tables) is tables
+        assert documents.view(_TABLE_PAGE, len) == len(_TABLE_PAGE)
+
+    def test_analyze_page_shares_tables(self) -> None:
+        documents = DocumentStore()
+        entry = _entry("/status.html", _TABLE_PAGE)
+        assert analyze_page(entry, documents).tables is analyze_page(entry, documents).tables
+
+    def test_form_discovery_accepts_parsed_tree(self) -> None:
+        soup = DocumentStore().soup(_LOGIN_PAGE)
+        selector = detect_form_selector(soup, "/goform/login")
+        assert selector == detect_form_selector(_LOGIN_PAGE, "/goform/login") == "form#loginForm"
+        assert extract_hidden_fields(soup, selector) == {"csrf": "abc"}
+
+
+# =====================================================================
+# analyze_har — inline
+# =====================================================================
+
+
+class TestAnalyzeHar:
+    """One store per analysis, timed per phase."""
+
+    @pytest.fixture
+    def har_file(self, tmp_path: Path) -> Path:
+        entries = [
+            _entry("/status.html", _TABLE_PAGE),
+            _entry("/api/info", json.dumps({"model": "T100"}), mime="application/json"),
+        ]
+        return write_har(tmp_path, {"log": {"version": "1.2", "entries": entries}})
+
+    def test_phase_timings(self, har_file: Path) -> None:
+        result = analyze_har(har_file)
+        assert list(result.timings) == [
+            "load",
+            "transport",
+            "auth",
+            "session",
+            "actions",
+            "format",
+            "js_endpoints",
+            "request_requirements",
+            "unread_resources",
+        ]
+        assert all(seconds >= 0 for seconds in result.timings.values())
+        assert "timings" not in result.to_dict()
+
+    def test_each_body_parsed_once(self, har_file: Path) -> None:
+        """Format detection and unread-resource reporting share one JSON parse."""
+        with patch(
+            "solentlabs.cable_modem_monitor_catalog_tools.analysis.documents.json.loads",
+            wraps=json.loads,
+        ) as loads:
+            analyze_har(har_file)
+        parsed = [call.args[0] for call in loads.call_args_list]
+        assert parsed.count(json.dumps({"model": "T100"})) == 1
@@ -0,0 +1,110 @@
+"""Tests for the content-addressed regression result cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from solentlabs.cable_modem_monitor_catalog_tools.grading import Grade
+from solentlabs.cable_modem_monitor_catalog_tools.regression import (
+    ModemResult,
+    ResultCache,
+    fleet_fingerprint,
+    result_cache_key,
+)
+
+
+@pytest.fixture
+def modem(tmp_path: Path) -> tuple[Path, list[Path]]:
+    """A HAR plus the committed files it is graded against."""
+    (tmp_path / "test_data").mkdir()
+    har = tmp_path / "test_data" / "modem.har"
+    har.write_text('{"log": {"entries": []}}')
+    (tmp_path / "modem.yaml").write_text("model: A100\n")
+    (tmp_path / "parser.yaml").write_text("downstream: {}\n")
+    committed = [tmp_path / "modem.yaml", tmp_path / "parser.yaml", tmp_path / "test_data" / "modem.expected.json"]
+    return har, committed
+
+
+def _result() -> ModemResult:
+    return ModemResult(
+        modem="acme/a100",
+        har_file="modem.har",
+        golden_diffs=["downstream[0].power: 1 vs 2"],
+        grades={"actions": {"restart": Grade("partial", "params not extracted")}},
+        channel_counts={"downstream": 8},
+        total_fields=10,
+        matching_fields=9,
+    )
+
+
+# ┌──────────────────┬──────────────────────────────────────┐
+# │ id               │ change                               │
+# ├──────────────────┼──────────────────────────────────────┤
+# │ har-edited       │ HAR bytes change                     │
+# │ config-edited    │ committed parser.yaml changes        │
+# │ golden-created   │ a missing golden file appears        │
+# │ fleet-changed    │ another modem's config changes       │
+# └──────────────────┴──────────────────────────────────────┘
+#
+# fmt: off
+_INVALIDATION_CASES = [
+    ("har-edited",     "test_data/modem.har",           '{"log": {"entries": [{}]}}', "fleet"),
+    ("config-edited",  "parser.yaml",                   "upstream: {}\n",             "fleet"),
+    ("golden-created", "test_data/modem.expected.json", "{}",                         "fleet"),
+    ("fleet-changed",  None,                            None,                         "fleet-2"),
+]
+# fmt: on
+
+
+@pytest.mark.parametrize(
+    ("relpath", "content", "fleet"),
+    [c[1:] for c in _INVALIDATION_CASES],
+    ids=[c[0] for c in _INVALIDATION_CASES],
+)
+def test_key_tracks_inputs(
+    modem: tuple[Path, list[Path]],
+    relpath: str | None,
+    content: str | None,
+    fleet: str,
+) -> None:
+    har, committed = modem
+    before = result_cache_key(har, committed, "fleet")
+    assert result_cache_key(har, committed, "fleet") == before
+    if relpath is not None and content is not None:
+        (har.parent.parent / relpath).write_text(content)
+    assert result_cache_key(har, committed, fleet) != before
+
+
+class TestResultCache:
+    """Storage round trip and miss handling."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        cache = ResultCache(tmp_path / "cache")
+        cache.put("k", _result())
+        assert cache.get("k") == _result()
+
+    def test_miss(self, tmp_path: Path) -> None:
+        assert ResultCache(tmp_path).get("absent") is None
+
+    def test_corrupt_record_is_a_miss(self, tmp_path: Path) -> None:
+        (tmp_path / "k.json").write_text("{truncated")
+        assert ResultCache(tmp_path).get("k") is None
+
+    def test_stale_format_is_a_miss(self, tmp_path: Path) -> None:
+        (tmp_path / "k.json").write_text('{"format": 0, "result": {}}')
+        assert ResultCache(tmp_path).get("k") is None
+
+    def test_no_temp_files_left(self, tmp_path: Path) -> None:
+        cache = ResultCache(tmp_path)
+        cache.put("k", _result())
+        assert [p.name for p in tmp_path.iterdir()] == ["k.json"]
+
+
+def test_fleet_fingerprint_covers_every_config(tmp_path: Path) -> None:
+    (tmp_path / "acme" / "a100").mkdir(parents=True)
+    parser = tmp_path / "acme" / "a100" / "parser.yaml"
+    parser.write_text("downstream: {}\n")
+    before = fleet_fingerprint(tmp_path)
+    parser.write_text("upstream: {}\n")
+    assert fleet_fingerprint(tmp_path) != before
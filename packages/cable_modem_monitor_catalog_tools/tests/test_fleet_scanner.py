@@ -6,9 +6,12 @@ These tests run against the real catalog to verify extraction correctness.
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+import yaml
 from solentlabs.cable_modem_monitor_catalog import CATALOG_PATH
 from solentlabs.cable_modem_monitor_catalog_tools.analysis.types import FleetPatterns
 from solentlabs.cable_modem_monitor_catalog_tools.fleet_scanner import AuthAuditIssue, audit_fleet_auth, scan_fleet
@@ -259,3 +262,57 @@ class TestScanFleetEdgeCases:
         bad_yaml.write_text("{{invalid yaml", encoding="utf-8")
         fleet = scan_fleet(tmp_path)
         assert isinstance(fleet, FleetPatterns)
+
+
+class TestScanCache:
+    """Per-file contributions cached by parser.yaml content hash."""
+
+    def test_cached_scan_matches_uncached(self, fleet: FleetPatterns, tmp_path: Path) -> None:
+        """Cold and warm cached scans both equal a plain scan, order included."""
+        cache_path = tmp_path / "fleet_patterns.json"
+        for _ in ("cold", "warm"):
+            scanned = scan_fleet(CATALOG_PATH, cache_path=cache_path)
+            assert scanned == fleet
+            assert list(scanned.selector_directions) == list(fleet.selector_directions)
+            assert scanned.uptime_formats == fleet.uptime_formats
+
+    def test_only_changed_files_reparsed(self, tmp_path: Path) -> None:
+        """A warm scan parses only the parser.yaml whose contents changed."""
+        catalog = tmp_path / "modems"
+        for model in ("a100", "b200"):
+            (catalog / "acme" / model).mkdir(parents=True)
+            (catalog / "acme" / model / "parser.yaml").write_text("downstream: {}\n", encoding="utf-8")
+        cache_path = tmp_path / "fleet_patterns.json"
+        scan_fleet(catalog, cache_path=cache_path)
+
+        (catalog / "acme" / "b200" / "parser.yaml").write_text("upstream: {}\n", encoding="utf-8")
+        with patch(
+            "solentlabs.cable_modem_monitor_catalog_tools.fleet_scanner.yaml.safe_load",
+            wraps=yaml.safe_load,
+        ) as safe_load:
+            scan_fleet(catalog, cache_path=cache_path)
+            assert safe_load.call_count == 1
+            scan_fleet(catalog, cache_path=cache_path)
+            assert safe_load.call_count == 1
+
+    def test_corrupt_cache_rescans(self, fleet: FleetPatterns, tmp_path: Path) -> None:
+        """An unreadable cache file is ignored and rewritten."""
+        cache_path = tmp_path / "fleet_patterns.json"
+        cache_path.write_text("{truncated", encoding="utf-8")
+        assert scan_fleet(CATALOG_PATH, cache_path=cache_path) == fleet
+        assert json.loads(cache_path.read_text(encoding="utf-8"))["files"]
+
+    def test_merge_keeps_first_wins_across_files(self, tmp_path: Path) -> None:
+        """System info labels resolve to the first file in path order."""
+        for model, field in (("a100", "software_version"), ("b200", "firmware")):
+            parser = tmp_path / "acme" / model / "parser.yaml"
+            parser.parent.mkdir(parents=True)
+            parser.write_text(
+                f"system_info:\n  sources:\n    - format: html_fields\n"
+                f"      fields:\n        - label: Software Version\n          field: {field}\n",
+                encoding="utf-8",
+            )
+        plain = scan_fleet(tmp_path)
+        cached = scan_fleet(tmp_path, cache_path=tmp_path / "fleet_patterns.json")
+        assert plain == cached
+        assert [field for field, _ in plain.system_info_labels.values()] == ["software_version"]
@@ -0,0 +1,292 @@
+"""Core command-line entry point.
+
+Usage::
+
+    # One modem, one poll, JSON Lines to stdout
+    python -m solentlabs.cable_modem_monitor_core poll \\
+        --modem arris/sb8200 --host 192.168.100.1
+
+    # A fleet file, polled continuously, to a file, a Unix socket and
+    # an OpenMetrics endpoint
+    python -m solentlabs.cable_modem_monitor_core poll \\
+        --config fleet.yaml --daemon \\
+        --output /var/log/modems.jsonl --socket /run/cmm.sock \\
+        --metrics-port 9464
+
+    # Regenerate (or --check) the catalog index shipped with the catalog
+    python -m solentlabs.cable_modem_monitor_core catalog-index [--check]
+
+    # Rank catalog models for an unknown modem (no credentials used)
+    python -m solentlabs.cable_modem_monitor_core identify --host 192.168.100.1
+
+See ORCHESTRATION_SPEC.md § Headless Poller, § Catalog Manager and
+§ Modem Identification.
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import logging
+import signal
+import sys
+import threading
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from .catalog_manager import verify_catalog_index, write_catalog_index
+from .exporter import MetricsServer, OpenMetricsExporter
+from .identify import identify_modem
+from .poller import (
+    FileSink,
+    JsonLinesWriter,
+    Poller,
+    PollerConfig,
+    PollTarget,
+    Sink,
+    SocketSink,
+    StreamSink,
+    load_poller_config,
+    resolve_catalog_path,
+)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m solentlabs.cable_modem_monitor_core",
+        description="Cable Modem Monitor Core tools.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    poll = commands.add_parser("poll", help="Poll modems and emit JSON Lines snapshots.")
+    source = poll.add_mutually_exclusive_group(required=True)
+    source.add_argument("--config", type=Path, help="Fleet file (YAML) listing modems to poll")
+    source.add_argument("--modem", help="Single modem: catalog directory (e.g., arris/sb8200)")
+    poll.add_argument("--host", help="Single modem: host or IP (required with --modem)")
+    poll.add_argument("--variant", default=None, help="Single modem: modem.yaml variant")
+    poll.add_argument("--protocol", choices=["http", "https"], default="http")
+    poll.add_argument("--username", default="")
+    poll.add_argument(
+        "--password-env",
+        default="",
+        help="Single modem: environment variable holding the password",
+    )
+    poll.add_argument("--interval", type=float, default=600.0, help="Single modem: seconds between polls")
+    poll.add_argument("--catalog", default=None, help="Catalog root (default: installed catalog package)")
+    poll.add_argument("--daemon", action="store_true", help="Poll continuously until interrupted")
+    poll.add_argument(
+        "--output",
+        action="append",
+        default=None,
+        help="Append records to this file ('-' for stdout). Repeatable. Default: stdout",
+    )
+    poll.add_argument("--socket", type=Path, default=None, help="Broadcast records on this Unix socket")
+    poll.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Daemon: serve OpenMetrics at http://HOST:PORT/metrics",
+    )
+    poll.add_argument("--metrics-host", default="127.0.0.1", help="Metrics bind address (default: 127.0.0.1)")
+    poll.add_argument("--max-workers", type=int, default=None, help="Concurrent polls (default: 4)")
+    poll.add_argument("--timeout", type=float, default=None, help="One-shot: give up after this many seconds")
+    poll.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="Add each poll's traced allocation peak to its record (slow; use with --max-workers 1)",
+    )
+    poll.add_argument(
+        "--stream-html",
+        action="store_true",
+        help="Parse HTML resources while they download",
+    )
+    poll.add_argument(
+        "--log-level",
+        default="WARNING",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="Logging level, to stderr (default: WARNING)",
+    )
+
+    index = commands.add_parser("catalog-index", help="Generate the catalog index used by catalog discovery.")
+    index.add_argument("--catalog", default=None, help="Catalog root (default: installed catalog package)")
+    index.add_argument("--check", action="store_true", help="Exit 1 if the index is missing or out of date")
+    index.add_argument("--log-level", default="WARNING", choices=["DEBUG", "INFO", "WARNING", "ERROR"])
+
+    identify = commands.add_parser("identify", help="Rank catalog models for a modem from unauthenticated requests.")
+    identify.add_argument("--host", required=True, help="Modem host or IP")
+    identify.add_argument("--protocol", choices=["http", "https"], default="http")
+    identify.add_argument("--catalog", default=None, help="Catalog root (default: installed catalog package)")
+    identify.add_argument("--max-requests", type=int, choices=[1, 2], default=2)
+    identify.add_argument("--limit", type=int, default=5, help="Candidates to print (default: 5)")
+    identify.add_argument("--log-level", default="WARNING", choices=["DEBUG", "INFO", "WARNING", "ERROR"])
+    return parser
+
+
+def _run_catalog_index(args: argparse.Namespace) -> int:
+    try:
+        catalog_path = resolve_catalog_path(args.catalog)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    if args.check:
+        stale = verify_catalog_index(catalog_path)
+        for rel in stale:
+            print(f"stale: {rel}", file=sys.stderr)
+        return 1 if stale else 0
+    print(write_catalog_index(catalog_path))
+    return 0
+
+
+def _run_identify(args: argparse.Namespace) -> int:
+    try:
+        catalog_path = resolve_catalog_path(args.catalog)
+        result = identify_modem(
+            f"{args.protocol}://{args.host}",
+            catalog_path,
+            max_requests=args.max_requests,
+            limit=args.limit,
+        )
+    except (ConnectionError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    for candidate in result.candidates:
+        print(json.dumps(dataclasses.asdict(candidate), separators=(",", ":")))
+    return 0 if result.candidates else 1
+
+
+def _load_config(args: argparse.Namespace) -> PollerConfig:
+    """Fleet file, or a one-modem fleet from the single-modem flags."""
+    if args.config is not None:
+        config = load_poller_config(args.config)
+    else:
+        if not args.host:
+            raise ValueError("--host is required with --modem")
+        target = PollTarget(
+            name=args.host,
+            modem_dir=args.modem,
+            host=args.host,
+            variant=args.variant,
+            protocol=args.protocol,
+            username=args.username,
+            password_env=args.password_env,
+            scan_interval=args.interval,
+        )
+        config = PollerConfig(modems=[target])
+    if args.max_workers is not None:
+        config.max_workers = args.max_workers
+    if args.catalog is not None:
+        config.catalog = args.catalog
+    if args.profile_memory:
+        for target in config.modems:
+            target.profile_memory = True
+    if args.stream_html:
+        for target in config.modems:
+            target.stream_html = True
+    return config
+
+
+def _open_sinks(args: argparse.Namespace) -> list[Sink]:
+    """Open every requested sink; on failure, close the ones already open.
+
+    Raises:
+        OSError: An output file or the socket path cannot be opened.
+    """
+    sinks: list[Sink] = []
+    try:
+        for output in args.output or ["-"]:
+            sinks.append(StreamSink(sys.stdout) if output == "-" else FileSink(Path(output)))
+        if args.socket is not None:
+            sinks.append(SocketSink(args.socket))
+    except OSError:
+        for sink in sinks:
+            sink.close()
+        raise
+    return sinks
+
+
+def _run_poll(args: argparse.Namespace) -> int:
+    try:
+        config = _load_config(args)
+        catalog_path = resolve_catalog_path(config.catalog)
+    except (FileNotFoundError, ValueError, ValidationError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.metrics_port is not None and not args.daemon:
+        print("Error: --metrics-port requires --daemon", file=sys.stderr)
+        return 1
+
+    try:
+        writer = JsonLinesWriter(_open_sinks(args))
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    exporter: OpenMetricsExporter | None = None
+    metrics_server: MetricsServer | None = None
+    if args.metrics_port is not None:
+        exporter = OpenMetricsExporter()
+        try:
+            metrics_server = MetricsServer(exporter, args.metrics_host, args.metrics_port)
+        except OSError as e:
+            writer.close()
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        metrics_server.start()
+        print(f"Serving metrics at {metrics_server.base_url}/metrics", file=sys.stderr)
+
+    poller = Poller(
+        config.modems,
+        writer,
+        catalog_path=catalog_path,
+        max_workers=config.max_workers,
+        jitter=config.jitter,
+        exporter=exporter,
+    )
+    try:
+        if args.daemon:
+            stop = threading.Event()
+            signal.signal(signal.SIGTERM, lambda *_: stop.set())
+            try:
+                poller.run_forever(stop)
+            except KeyboardInterrupt:
+                stop.set()
+        else:
+            poller.run_once(args.timeout)
+    except (FileNotFoundError, ValueError, TimeoutError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        poller.close()
+        writer.close()
+        if metrics_server is not None:
+            metrics_server.close()
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for ``python -m solentlabs.cable_modem_monitor_core``.
+
+    Args:
+        argv: Command-line arguments. Defaults to ``sys.argv[1:]``.
+
+    Returns:
+        Exit code (0 for success, 1 for errors).
+    """
+    args = _build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=getattr(logging, args.log_level),
+        format="%(asctime)s %(name)s %(levelname)s %(message)s",
+        stream=sys.stderr,
+    )
+    if args.command == "catalog-index":
+        return _run_catalog_index(args)
+    if args.command == "identify":
+        return _run_identify(args)
+    return _run_poll(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,20 +4,40 @@ Factory-driven: ``create_auth_manager(config)`` selects the right
 strategy from modem.yaml. Each manager authenticates on a
 ``requests.Session`` that the resource loader then uses.
 
+Strategy managers are imported on first access — an entry only ever
+loads the one its modem.yaml declares (see ``lazy_exports``).
+
 See MODEM_YAML_SPEC.md Auth section.
 """
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+from ..lazy_exports import lazy_exports
 from .base import AuthContext, AuthResult, BaseAuthManager
-from .basic import BasicAuthManager
 from .factory import create_auth_manager
-from .form import FormAuthManager
-from .form_nonce import FormNonceAuthManager
-from .form_pbkdf2 import FormPbkdf2AuthManager
-from .hnap import HnapAuthManager
 from .none import NoneAuthManager
-from .url_token import UrlTokenAuthManager
+
+if TYPE_CHECKING:
+    from .basic import BasicAuthManager
+    from .form import FormAuthManager
+    from .form_nonce import FormNonceAuthManager
+    from .form_pbkdf2 import FormPbkdf2AuthManager
+    from .hnap import HnapAuthManager
+    from .url_token import UrlTokenAuthManager
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "BasicAuthManager": ".basic",
+        "FormAuthManager": ".form",
+        "FormNonceAuthManager": ".form_nonce",
+        "FormPbkdf2AuthManager": ".form_pbkdf2",
+        "HnapAuthManager": ".hnap",
+        "UrlTokenAuthManager": ".url_token",
+    },
+)
 
 __all__ = [
     "AuthContext",
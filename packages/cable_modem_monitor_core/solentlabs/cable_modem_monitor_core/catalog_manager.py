@@ -4,13 +4,23 @@ Walks the catalog directory and returns summaries of all available
 modems and their variants.  Designed for consumer config flows
 (manufacturer/model/variant dropdowns) without loading full configs.
 
+When the catalog ships a ``catalog_index.json`` (generated at build
+time by ``write_catalog_index``), both listings read the display fields
+from it in one shot instead of parsing every ``modem*.yaml``. The index
+is used only while the YAML files on disk match it (same file set, same
+SHA-256 of each file); otherwise discovery falls back to the scan.
+
 See ORCHESTRATION_SPEC.md § Catalog Manager.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+from collections.abc import Iterable
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -18,6 +28,18 @@ import yaml
 
 _logger = logging.getLogger(__name__)
 
+#: Index file name, at the catalog root (next to the manufacturer dirs).
+CATALOG_INDEX_NAME = "catalog_index.json"
+
+#: Bumped when the index layout or the indexed field set changes.
+CATALOG_INDEX_VERSION = 1
+
+# How far above a modem directory list_variants() looks for the index
+_INDEX_SEARCH_DEPTH = 3
+
+# Absolute YAML path → indexed display fields (None: not a mapping)
+_Index = dict[Path, dict[str, Any] | None]
+
 
 @dataclass
 class ModemSummary:
@@ -91,9 +113,15 @@ def list_modems(catalog_path: Path) -> list[ModemSummary]:
         _logger.warning("Catalog path does not exist: %s", catalog_path)
         return raw_results
 
-    for modem_yaml in sorted(catalog_path.rglob("modem.yaml")):
+    index = load_catalog_index(catalog_path)
+    if index is not None:
+        modem_yamls = sorted(p for p in index if p.name == "modem.yaml")
+    else:
+        modem_yamls = sorted(catalog_path.rglob("modem.yaml"))
+
+    for modem_yaml in modem_yamls:
         try:
-            summary = _load_summary(modem_yaml)
+            summary = _load_summary(modem_yaml, index)
             if summary is not None:
                 raw_results.append(summary)
         except Exception:
@@ -118,23 +146,24 @@ def list_modems(catalog_path: Path) -> list[ModemSummary]:
     # from modem.yaml is preserved.
     for summary in grouped:
         all_dirs = [summary.path] + summary.sibling_dirs
-        if _any_variant_confirmed(all_dirs):
+        if _any_variant_confirmed(all_dirs, index):
             summary.status = "confirmed"
 
     _logger.info(
-        "Catalog discovery: %d modems found (%d directories)",
+        "Catalog discovery: %d modems found (%d directories, %s)",
         len(grouped),
         len(raw_results),
+        "index" if index is not None else "scan",
     )
     return grouped
 
 
-def _any_variant_confirmed(dirs: list[Path]) -> bool:
+def _any_variant_confirmed(dirs: list[Path], index: _Index | None = None) -> bool:
     """Return True if any modem*.yaml file in the given directories has status: confirmed."""
     for d in dirs:
-        for yaml_path in d.glob("modem*.yaml"):
+        for yaml_path in _variant_files(d, index):
             try:
-                raw: dict[str, Any] = yaml.safe_load(yaml_path.read_text())
+                raw = _read_raw(yaml_path, index)
                 if isinstance(raw, dict) and raw.get("status") == "confirmed":
                     return True
             except Exception:
@@ -201,13 +230,15 @@ def list_variants(
         List of :class:`VariantInfo`, sorted with default variants first.
     """
     results: list[VariantInfo] = []
+    dirs = [modem_dir] + (sibling_dirs or [])
+    index = _index_for_dirs(dirs)
 
-    for d in [modem_dir] + (sibling_dirs or []):
+    for d in dirs:
         if not d.is_dir():
             _logger.warning("Modem directory does not exist: %s", d)
             continue
 
-        for yaml_path in sorted(d.glob("modem*.yaml")):
+        for yaml_path in sorted(_variant_files(d, index)):
             stem = yaml_path.stem
             if stem == "modem":
                 variant_name: str | None = None
@@ -217,7 +248,7 @@ def list_variants(
                 continue
 
             try:
-                info = _load_variant(yaml_path, variant_name)
+                info = _load_variant(yaml_path, variant_name, index)
                 if info is not None:
                     results.append(info)
             except Exception:
@@ -234,9 +265,9 @@ def list_variants(
     return results
 
 
-def _load_variant(yaml_path: Path, name: str | None) -> VariantInfo | None:
+def _load_variant(yaml_path: Path, name: str | None, index: _Index | None = None) -> VariantInfo | None:
     """Load a single variant YAML and extract display fields."""
-    raw: dict[str, Any] = yaml.safe_load(yaml_path.read_text())
+    raw = _read_raw(yaml_path, index)
     if not isinstance(raw, dict):
         _logger.warning("Unexpected YAML content in %s", yaml_path)
         return None
@@ -254,13 +285,13 @@ def _load_variant(yaml_path: Path, name: str | None) -> VariantInfo | None:
     )
 
 
-def _load_summary(modem_yaml: Path) -> ModemSummary | None:
+def _load_summary(modem_yaml: Path, index: _Index | None = None) -> ModemSummary | None:
     """Load a single modem.yaml and extract a summary.
 
     Returns None if the file cannot be parsed or is missing required
     fields. Logs warnings for skipped files.
     """
-    raw: dict[str, Any] = yaml.safe_load(modem_yaml.read_text())
+    raw = _read_raw(modem_yaml, index)
     if not isinstance(raw, dict):
         _logger.warning("Unexpected YAML content in %s", modem_yaml)
         return None
@@ -286,3 +317,187 @@ def _load_summary(modem_yaml: Path) -> ModemSummary | None:
         transport=raw.get("transport", "http"),
         path=modem_yaml.parent,
     )
+
+
+# ------------------------------------------------------------------
+# Catalog index
+# ------------------------------------------------------------------
+
+# Display fields copied into the index, in their modem.yaml shape so
+# _load_summary / _load_variant read index and YAML alike.
+_INDEXED_KEYS = (
+    "manufacturer",
+    "model",
+    "model_aliases",
+    "brands",
+    "status",
+    "default_host",
+    "transport",
+    "isps",
+    "notes",
+)
+_INDEXED_NESTED = {"auth": ("strategy",), "hardware": ("docsis_version", "hw_version")}
+
+
+def build_catalog_index(catalog_path: Path) -> dict[str, Any]:
+    """Build the index document for every ``modem*.yaml`` under *catalog_path*.
+
+    Each entry records the file's SHA-256, size, and the display fields
+    ``list_modems`` / ``list_variants`` read. Paths are POSIX, relative
+    to *catalog_path*.
+
+    Raises:
+        yaml.YAMLError: A catalog file does not parse — the build
+            should fail rather than ship an index that hides it.
+    """
+    files: dict[str, Any] = {}
+    for yaml_path in sorted(catalog_path.rglob("modem*.yaml")):
+        content = yaml_path.read_bytes()
+        files[yaml_path.relative_to(catalog_path).as_posix()] = {
+            "sha256": hashlib.sha256(content).hexdigest(),
+            "size": len(content),
+            "fields": _index_fields(yaml.safe_load(content)),
+        }
+    return {"version": CATALOG_INDEX_VERSION, "files": files}
+
+
+def write_catalog_index(catalog_path: Path) -> Path:
+    """Generate ``catalog_index.json`` at the catalog root.
+
+    Returns:
+        Path of the written index.
+    """
+    index_path = catalog_path / CATALOG_INDEX_NAME
+    document = build_catalog_index(catalog_path)
+    index_path.write_text(json.dumps(document, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+    return index_path
+
+
+def verify_catalog_index(catalog_path: Path) -> list[str]:
+    """Compare the shipped index against the catalog by content hash.
+
+    The runtime staleness check over the whole catalog, reporting
+    which files differ — intended for CI and build checks.
+
+    Returns:
+        Relative paths that are missing from, extra in, or changed
+        since the index. A missing or unreadable index returns
+        ``[CATALOG_INDEX_NAME]``. Empty when the index is current.
+    """
+    document = _read_index_document(catalog_path / CATALOG_INDEX_NAME)
+    if document is None:
+        return [CATALOG_INDEX_NAME]
+    expected = build_catalog_index(catalog_path)["files"]
+    indexed = document["files"]
+    return sorted(
+        rel
+        for rel in expected.keys() | indexed.keys()
+        if rel not in expected or rel not in indexed or expected[rel]["sha256"] != indexed[rel]["sha256"]
+    )
+
+
+def load_catalog_index(catalog_path: Path, dirs: list[Path] | None = None) -> _Index | None:
+    """Load the index if it matches the YAML files on disk, by content hash.
+
+    Args:
+        catalog_path: Catalog root holding ``catalog_index.json``.
+        dirs: Restrict the staleness check to these modem directories
+            (``list_variants``). None checks the whole catalog.
+
+    Returns:
+        Absolute YAML path → display fields, or None when there is no
+        usable index (absent, unreadable, other version, or stale).
+    """
+    document = _read_index_document(catalog_path / CATALOG_INDEX_NAME)
+    if document is None:
+        return None
+    files: dict[str, Any] = document["files"]
+
+    indexed: Iterable[tuple[str, Any]]
+    if dirs is None:
+        on_disk = catalog_path.rglob("modem*.yaml")
+        indexed = files.items()
+    else:
+        on_disk = (p for d in dirs for p in d.glob("modem*.yaml"))
+        prefixes = {_relative_dir(d, catalog_path) for d in dirs}
+        indexed = ((rel, e) for rel, e in files.items() if rel.rpartition("/")[0] in prefixes)
+
+    expected = dict(indexed)
+    disk_files = {p.relative_to(catalog_path).as_posix(): p for p in on_disk}
+    if disk_files.keys() != expected.keys() or not all(
+        _has_digest(path, expected[rel]["sha256"]) for rel, path in disk_files.items()
+    ):
+        _logger.debug("Catalog index is stale, scanning YAML: %s", catalog_path / CATALOG_INDEX_NAME)
+        return None
+    return {catalog_path / rel: entry["fields"] for rel, entry in files.items()}
+
+
+def _has_digest(path: Path, sha256: str) -> bool:
+    """Whether *path*'s content hashes to *sha256*.
+
+    Hashing a small YAML file is far cheaper than parsing it.
+    """
+    return hashlib.sha256(path.read_bytes()).hexdigest() == sha256
+
+
+def _read_index_document(index_path: Path) -> dict[str, Any] | None:
+    """Parsed index document, or None. Memoized on the file's mtime and size."""
+    try:
+        stat = index_path.stat()
+    except OSError:
+        return None
+    return _parse_index(str(index_path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=4)
+def _parse_index(path: str, _mtime_ns: int, _size: int) -> dict[str, Any] | None:
+    try:
+        document = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        _logger.warning("Unreadable catalog index, scanning YAML: %s", path, exc_info=True)
+        return None
+    if not isinstance(document, dict) or document.get("version") != CATALOG_INDEX_VERSION:
+        _logger.debug("Catalog index version mismatch, scanning YAML: %s", path)
+        return None
+    return document
+
+
+def _index_for_dirs(dirs: list[Path]) -> _Index | None:
+    """Find the catalog index above *dirs* and load it for just those dirs."""
+    for root in list(dirs[0].parents)[:_INDEX_SEARCH_DEPTH]:
+        if (root / CATALOG_INDEX_NAME).is_file():
+            if not all(d.is_relative_to(root) for d in dirs):
+                return None
+            return load_catalog_index(root, dirs)
+    return None
+
+
+def _relative_dir(d: Path, root: Path) -> str:
+    rel = d.relative_to(root).as_posix()
+    return "" if rel == "." else rel
+
+
+def _variant_files(d: Path, index: _Index | None) -> list[Path]:
+    """``modem*.yaml`` paths in one directory, from the index when present."""
+    if index is not None:
+        return [p for p in index if p.parent == d]
+    return list(d.glob("modem*.yaml"))
+
+
+def _read_raw(yaml_path: Path, index: _Index | None) -> Any:
+    """Display fields for one YAML file: indexed copy, else parse the file."""
+    if index is not None and yaml_path in index:
+        return index[yaml_path]
+    return yaml.safe_load(yaml_path.read_text())
+
+
+def _index_fields(raw: Any) -> dict[str, Any] | None:
+    """Subset of a parsed modem*.yaml the listings read."""
+    if not isinstance(raw, dict):
+        return None
+    fields: dict[str, Any] = {key: raw[key] for key in _INDEXED_KEYS if key in raw}
+    for section, keys in _INDEXED_NESTED.items():
+        nested = raw.get(section)
+        if isinstance(nested, dict):
+            fields[section] = {key: nested[key] for key in keys if key in nested}
+    return fields
@@ -4,20 +4,39 @@ Entry points for loading and validating modem.yaml and parser.yaml files.
 Used by ``generate_config`` (validates before writing) and by Catalog's
 dev-gate (validates existing files on disk).
 
-File-based functions do ``yaml.safe_load()`` → Pydantic model.
+File-based functions do a safe YAML load → Pydantic model.
 Dict-based functions skip the YAML step (for in-memory validation).
+
+Validated models from the file-based functions are cached process-wide,
+keyed by resolved path and SHA-256 of the file content. Integration
+setup, entry reloads, options changes and the config flow all load
+the same few files; only the first load pays for YAML parsing and
+schema validation. Callers get a deep copy, so per-entry mutation
+(e.g., ``apply_credential_encoding``) never leaks into the cache.
+An edited file hashes differently and is re-validated.
 """
 
 from __future__ import annotations
 
+import hashlib
+import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 import yaml
+from pydantic import BaseModel
 
 from .models.modem_config import ModemConfig
 from .models.parser_config import ParserConfig
 
+# libyaml's C loader is ~5-10x faster; fall back to pure Python when
+# PyYAML was built without it.
+_YamlLoader: Any = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# (model class, resolved path) -> (content sha256, validated model)
+_config_cache: dict[tuple[type[BaseModel], Path], tuple[str, BaseModel]] = {}
+_config_cache_lock = threading.Lock()
+
 
 def load_modem_config(path: Path) -> ModemConfig:
     """Load and validate a modem.yaml file.
@@ -33,8 +52,7 @@ def load_modem_config(path: Path) -> ModemConfig:
         yaml.YAMLError: If file is not valid YAML.
         pydantic.ValidationError: If content fails schema validation.
     """
-    data = _load_yaml(path)
-    return ModemConfig.model_validate(data)
+    return _load_cached(path, ModemConfig)
 
 
 def load_parser_config(path: Path) -> ParserConfig:
@@ -51,8 +69,7 @@ def load_parser_config(path: Path) -> ParserConfig:
         yaml.YAMLError: If file is not valid YAML.
         pydantic.ValidationError: If content fails schema validation.
     """
-    data = _load_yaml(path)
-    return ParserConfig.model_validate(data)
+    return _load_cached(path, ParserConfig)
 
 
 def validate_modem_config(data: dict[str, Any]) -> ModemConfig:
@@ -85,19 +102,53 @@ def validate_parser_config(data: dict[str, Any]) -> ParserConfig:
     return ParserConfig.model_validate(data)
 
 
-def _load_yaml(path: Path) -> dict[str, Any]:
-    """Load a YAML file and return the parsed dict.
+def clear_config_cache() -> None:
+    """Drop every cached validated config.
+
+    Not needed for correctness — content hashing already catches edited
+    files. Useful for tests and for releasing memory after a catalog
+    reload.
+    """
+    with _config_cache_lock:
+        _config_cache.clear()
+
+
+def _load_cached[ModelT: BaseModel](path: Path, model: type[ModelT]) -> ModelT:
+    """Load *path* as *model*, reusing a cached validation when unchanged.
 
     Raises:
         FileNotFoundError: If path does not exist.
         yaml.YAMLError: If file is not valid YAML.
         ValueError: If file parses to something other than a dict.
+        pydantic.ValidationError: If content fails schema validation.
     """
     if not path.exists():
         raise FileNotFoundError(f"Config file not found: {path}")
 
-    text = path.read_text(encoding="utf-8")
-    data = yaml.safe_load(text)
+    raw = path.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    key = (model, path.resolve())
+
+    with _config_cache_lock:
+        cached = _config_cache.get(key)
+    if cached is None or cached[0] != digest:
+        validated = model.model_validate(_parse_yaml(raw.decode("utf-8"), path))
+        with _config_cache_lock:
+            _config_cache[key] = (digest, validated)
+        cached = (digest, validated)
+
+    # The cache is keyed by model class, so the entry is a ModelT.
+    return cast(ModelT, cached[1].model_copy(deep=True))
+
+
+def _parse_yaml(text: str, path: Path) -> dict[str, Any]:
+    """Parse YAML text with the safe loader and require a mapping.
+
+    Raises:
+        yaml.YAMLError: If text is not valid YAML.
+        ValueError: If text parses to something other than a dict.
+    """
+    data = yaml.load(text, Loader=_YamlLoader)  # noqa: S506 - safe loader
 
     if not isinstance(data, dict):
         raise ValueError(f"Expected YAML dict in {path}, got {type(data).__name__}")
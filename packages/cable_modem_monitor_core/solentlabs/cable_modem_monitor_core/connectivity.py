@@ -9,6 +9,10 @@ These probes run **once** during config-flow validation.  The results
 are persisted in the HA config entry and reused at every poll — the
 runtime path never re-discovers protocol or probe support.
 
+Independent probes run concurrently under one shared deadline
+(:func:`run_probes`), so an unreachable or slow host costs one
+timeout rather than the sum of every probe's timeout.
+
 See CONFIG_FLOW_SPEC.md § Step 4 for the validation pipeline.
 """
 
@@ -18,6 +22,9 @@ import logging
 import socket
 import ssl
 import subprocess
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from typing import Any
 
@@ -79,6 +86,66 @@ def create_session(*, legacy_ssl: bool = False) -> requests.Session:
     return session
 
 
+# ---------------------------------------------------------------------------
+# Concurrent probes
+# ---------------------------------------------------------------------------
+
+
+def run_probes[T](
+    probes: Mapping[str, Callable[[], T]],
+    *,
+    timeout: float = _DEFAULT_TIMEOUT,
+    until: Callable[[Mapping[str, T]], bool] | None = None,
+) -> dict[str, T]:
+    """Run independent probes concurrently under one shared deadline.
+
+    Each probe runs in its own worker thread.  Collection stops when
+    every probe has finished, when *until* reports the results so far
+    are conclusive, or when *timeout* seconds have elapsed — whichever
+    comes first.  Probes still running are abandoned; they end on
+    their own socket timeouts, which callers derive from the same
+    deadline.
+
+    Args:
+        probes: Probe name → zero-argument callable.
+        timeout: Shared deadline in seconds for all probes together.
+        until: Optional early-exit predicate, called with the results
+            collected so far after each probe finishes.
+
+    Returns:
+        Results of the probes that finished, keyed by name.  A probe
+        that raised or missed the deadline is absent.
+    """
+    results: dict[str, T] = {}
+    if not probes:
+        return results
+    deadline = time.monotonic() + timeout
+    executor = ThreadPoolExecutor(max_workers=len(probes), thread_name_prefix="cmm-probe")
+    try:
+        pending: dict[Future[T], str] = {executor.submit(probe): name for name, probe in probes.items()}
+        while pending:
+            done, _ = wait(pending, timeout=_remaining(deadline), return_when=FIRST_COMPLETED)
+            if not done:
+                _logger.debug("Probe deadline reached; abandoning %s", sorted(pending.values()))
+                break
+            for future in done:
+                name = pending.pop(future)
+                try:
+                    results[name] = future.result()
+                except Exception as exc:
+                    _logger.debug("Probe %s raised: %s", name, exc)
+            if until is not None and until(results):
+                break
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return results
+
+
+def _remaining(deadline: float) -> float:
+    """Seconds left until *deadline* (``time.monotonic()`` based), never negative."""
+    return max(deadline - time.monotonic(), 0.0)
+
+
 # ---------------------------------------------------------------------------
 # Protocol detection
 # ---------------------------------------------------------------------------
@@ -124,8 +191,8 @@ def _tcp_probe(host: str, port: int, timeout: float) -> bool:
     return False
 
 
-def _tls_handshake(host: str, port: int, timeout: float) -> tuple[bool, bool]:
-    """Probe TLS on host:port; return (handshake_ok, legacy_ssl_needed)."""
+def _tls_handshake(host: str, port: int, deadline: float) -> tuple[bool, bool]:
+    """Probe TLS on host:port by *deadline*; return (handshake_ok, legacy_ssl_needed)."""
     # Phase 1 — standard Python SSL (no SECLEVEL=0).
     # Mirrors create_session(legacy_ssl=False) at runtime.
     std_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
@@ -134,7 +201,7 @@ def _tls_handshake(host: str, port: int, timeout: float) -> tuple[bool, bool]:
 
     try:
         with (
-            socket.create_connection((host, port), timeout=timeout) as raw_sock,
+            socket.create_connection((host, port), timeout=_remaining(deadline)) as raw_sock,
             std_context.wrap_socket(raw_sock, server_hostname=host) as tls_sock,
         ):
             version = tls_sock.version() or ""
@@ -171,7 +238,12 @@ def _tls_handshake(host: str, port: int, timeout: float) -> tuple[bool, bool]:
     # Phase 2 — SECLEVEL=0 fallback.
     # Mirrors create_session(legacy_ssl=True) at runtime.  Standard SSL
     # failed; if the modem accepts a broader cipher set it still needs
-    # LegacySSLAdapter, regardless of its TLS version.
+    # LegacySSLAdapter, regardless of its TLS version.  It gets only what
+    # Phase 1 left of the shared deadline.
+    remaining = _remaining(deadline)
+    if remaining <= 0:
+        _logger.debug("TLS probe %s:%d — SECLEVEL=0 skipped, deadline reached", host, port)
+        return (False, False)
     legacy_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
     legacy_context.check_hostname = False
     legacy_context.verify_mode = ssl.CERT_NONE
@@ -179,7 +251,7 @@ def _tls_handshake(host: str, port: int, timeout: float) -> tuple[bool, bool]:
 
     try:
         with (
-            socket.create_connection((host, port), timeout=timeout) as raw_sock,
+            socket.create_connection((host, port), timeout=remaining) as raw_sock,
             legacy_context.wrap_socket(raw_sock, server_hostname=host) as tls_sock,
         ):
             version = tls_sock.version() or ""
@@ -223,12 +295,26 @@ def _split_host_port(host: str) -> tuple[str, int | None]:
     return (host, None)
 
 
+def _probe_https(hostname: str, port: int, deadline: float) -> tuple[bool, bool]:
+    """TCP-probe then TLS-handshake ``hostname:port`` within *deadline*; return (handshake_ok, legacy_ssl)."""
+    if not _tcp_probe(hostname, port, _remaining(deadline)):
+        return (False, False)
+    if _remaining(deadline) <= 0:
+        _logger.debug("TLS probe %s:%d — skipped, deadline reached", hostname, port)
+        return (False, False)
+    return _tls_handshake(hostname, port, deadline)
+
+
 def detect_protocol(
     host: str,
     *,
     timeout: float = _DEFAULT_TIMEOUT,
 ) -> ConnectivityResult:
-    """TCP-probe :80/:443 and run TLS handshakes to pick the working protocol and session type."""
+    """TCP-probe :80/:443 and run TLS handshakes to pick the working protocol and session type.
+
+    Both transports are probed concurrently; *timeout* bounds the whole
+    detection, not each probe.
+    """
     explicit_protocol, bare_host = _strip_protocol(host)
     hostname, port_override = _split_host_port(bare_host)
     http_port = port_override or 80
@@ -241,14 +327,19 @@ def detect_protocol(
         f" (user-specified {explicit_protocol})" if explicit_protocol else "",
     )
 
-    http_open = False
+    # HTTP and HTTPS are probed concurrently under one deadline.  HTTPS
+    # wins whenever its handshake succeeds, so that outcome ends the
+    # race; an open :80 alone still waits for the HTTPS verdict.
+    deadline = time.monotonic() + timeout
+    probes: dict[str, Callable[[], tuple[bool, bool]]] = {}
     if explicit_protocol in (None, "http"):
-        http_open = _tcp_probe(hostname, http_port, timeout)
+        probes["http"] = lambda: (_tcp_probe(hostname, http_port, _remaining(deadline)), False)
+    if explicit_protocol in (None, "https"):
+        probes["https"] = lambda: _probe_https(hostname, https_port, deadline)
 
-    https_open = False
-    legacy_ssl = False
-    if explicit_protocol in (None, "https") and _tcp_probe(hostname, https_port, timeout):
-        https_open, legacy_ssl = _tls_handshake(hostname, https_port, timeout)
+    results = run_probes(probes, timeout=timeout, until=lambda done: done.get("https", (False, False))[0])
+    http_open = results.get("http", (False, False))[0]
+    https_open, legacy_ssl = results.get("https", (False, False))
 
     if https_open:
         url = f"https://{url_host}"
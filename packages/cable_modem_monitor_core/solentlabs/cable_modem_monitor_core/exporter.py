@@ -0,0 +1,428 @@
+"""OpenMetrics exporter — snapshots, health and poll timing for a TSDB.
+
+Renders the latest state of every modem in OpenMetrics text format
+(``application/openmetrics-text; version=1.0.0``), served over HTTP by
+``MetricsServer`` for Prometheus-compatible scrapers.
+
+Rendering is incremental. Each update re-renders only the sample lines
+of the modem that changed, stored per metric family; a scrape joins
+the stored lines family by family and caches the result until the next
+update. A scrape of many modems × hundreds of channel series costs a
+string join — no snapshot is walked at scrape time.
+
+Families:
+
+- ``cable_modem_{downstream,upstream}_*`` — one gauge per numeric
+  channel field (``power_dbmv``, ``snr_db``, ``frequency_hertz``, …),
+  codeword errors as counters, ``locked`` as 0/1. Labels
+  ``modem``, ``channel_type``, ``channel_id``, ``channel_number``.
+- ``cable_modem_system_*`` — numeric system_info fields
+  (``total_corrected``, ``downstream_channel_count``, …).
+- ``cable_modem`` (info) — ``connection_status``, ``docsis_status`` and
+  version strings as labels.
+- ``cable_modem_health_*`` — probe latencies in seconds, responsive 0/1.
+- ``cable_modem_orchestrator_*`` — ``OrchestratorDiagnostics`` streaks
+  and flags; per-resource fetch seconds and bytes.
+- ``cable_modem_poll_duration_seconds`` / ``..._queue_delay_seconds``
+  histograms and ``cable_modem_polls`` counter by connection status.
+
+See ORCHESTRATION_SPEC.md § Metrics Exporter.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import math
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any, Literal
+
+from .orchestration.signals import HealthStatus
+
+if TYPE_CHECKING:
+    from .orchestration.models import HealthInfo, ModemSnapshot, OrchestratorDiagnostics
+
+_logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+#: Poll duration and queueing delay histogram bucket bounds (seconds).
+DEFAULT_BUCKETS: tuple[float, ...] = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+MetricType = Literal["gauge", "counter", "histogram", "info"]
+
+# Channel field → (metric suffix, type). Numeric fields not listed here
+# export as a gauge named after the field.
+_CHANNEL_METRICS: dict[str, tuple[str, MetricType]] = {
+    "frequency": ("frequency_hertz", "gauge"),
+    "power": ("power_dbmv", "gauge"),
+    "snr": ("snr_db", "gauge"),
+    "corrected": ("corrected_codewords", "counter"),
+    "uncorrected": ("uncorrected_codewords", "counter"),
+}
+
+# Identity fields — labels, never samples
+_CHANNEL_LABEL_FIELDS = frozenset({"channel_id", "channel_number", "source_channel_number"})
+
+_INFO_FIELDS = ("software_version", "hardware_version")
+
+_DIAGNOSTIC_GAUGES = (
+    "auth_failure_streak",
+    "circuit_breaker_open",
+    "session_is_valid",
+    "connectivity_streak",
+    "connectivity_backoff_remaining",
+    "stale_session_recovery_streak",
+    "session_reuse_disabled",
+)
+
+_HEALTH_LATENCIES = ("icmp", "tcp", "http")
+
+
+@dataclass(frozen=True)
+class _Family:
+    """Metric family metadata."""
+
+    name: str
+    type: MetricType
+    help: str
+
+
+@dataclass
+class _Histogram:
+    """Cumulative histogram for one modem."""
+
+    bounds: tuple[float, ...]
+    counts: list[int] = field(default_factory=list)
+    total: float = 0.0
+    observations: int = 0
+
+    def __post_init__(self) -> None:
+        self.counts = [0] * len(self.bounds)
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.bounds, value)
+        for i in range(index, len(self.counts)):
+            self.counts[i] += 1
+        self.total += value
+        self.observations += 1
+
+    def lines(self, name: str, labels: str) -> list[str]:
+        out = [
+            f'{name}_bucket{{{labels},le="{_number(bound)}"}} {count}'
+            for bound, count in zip(self.bounds, self.counts, strict=True)
+        ]
+        out.append(f'{name}_bucket{{{labels},le="+Inf"}} {self.observations}')
+        out.append(f"{name}_count{{{labels}}} {self.observations}")
+        out.append(f"{name}_sum{{{labels}}} {_number(self.total)}")
+        return out
+
+
+@dataclass
+class _ModemSeries:
+    """Rendered sample lines for one modem, by family name."""
+
+    poll_duration: _Histogram
+    queue_delay: _Histogram
+    polls: Counter[str] = field(default_factory=Counter)
+    snapshot_lines: dict[str, list[str]] = field(default_factory=dict)
+    health_lines: dict[str, list[str]] = field(default_factory=dict)
+
+
+class OpenMetricsExporter:
+    """Latest-value store for many modems, rendered as OpenMetrics text.
+
+    Thread-safe: fleet callbacks update from worker threads while the
+    HTTP server renders from its own.
+
+    Args:
+        buckets: Histogram bucket upper bounds in seconds.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self._buckets = tuple(sorted(buckets))
+        # Insertion-ordered; channel families are registered on first sight
+        self._families: dict[str, _Family] = {}
+        self._modems: dict[str, _ModemSeries] = {}
+        self._lock = threading.Lock()
+        self._rendered: str | None = None
+
+    def update_snapshot(
+        self,
+        modem: str,
+        snapshot: ModemSnapshot,
+        diagnostics: OrchestratorDiagnostics | None = None,
+        *,
+        queue_delay: float | None = None,
+    ) -> None:
+        """Replace a modem's snapshot-derived series and record poll timing.
+
+        Args:
+            modem: Modem name (``modem`` label).
+            snapshot: The poll result.
+            diagnostics: ``orchestrator.diagnostics()`` taken after the
+                poll — streaks, flags, resource timings, and the poll
+                duration observed into the histogram.
+            queue_delay: Seconds the poll waited for a worker.
+        """
+        base = f'modem="{_escape(modem)}"'
+        lines: dict[str, list[str]] = {}
+        self._render_info(lines, base, snapshot)
+        if snapshot.modem_data:
+            self._render_channels(lines, base, snapshot.modem_data)
+            self._render_system_info(lines, base, snapshot.modem_data.get("system_info") or {})
+        if diagnostics is not None:
+            self._render_diagnostics(lines, base, diagnostics)
+
+        with self._lock:
+            series = self._series(modem)
+            series.polls[snapshot.connection_status.value] += 1
+            if diagnostics is not None and diagnostics.poll_duration is not None:
+                series.poll_duration.observe(diagnostics.poll_duration)
+            if queue_delay is not None:
+                series.queue_delay.observe(queue_delay)
+            self._render_poll_stats(lines, base, series)
+            series.snapshot_lines = lines
+            self._rendered = None
+        if snapshot.health_info is not None:
+            self.update_health(modem, snapshot.health_info)
+
+    def update_health(self, modem: str, info: HealthInfo) -> None:
+        """Replace a modem's health series."""
+        base = f'modem="{_escape(modem)}"'
+        lines: dict[str, list[str]] = {}
+        self._add(
+            lines,
+            _Family("cable_modem_health_responsive", "gauge", "1 if the last health probe found the modem responsive."),
+            f"cable_modem_health_responsive{{{base}}} {int(info.health_status is HealthStatus.RESPONSIVE)}",
+        )
+        for probe in _HEALTH_LATENCIES:
+            latency_ms = getattr(info, f"{probe}_latency_ms")
+            if latency_ms is None:
+                continue
+            name = f"cable_modem_health_{probe}_latency_seconds"
+            self._add(
+                lines,
+                _Family(name, "gauge", f"{probe.upper()} probe latency."),
+                f"{name}{{{base}}} {_number(latency_ms / 1000.0)}",
+            )
+        with self._lock:
+            self._series(modem).health_lines = lines
+            self._rendered = None
+
+    def remove(self, modem: str) -> None:
+        """Drop every series for a modem."""
+        with self._lock:
+            self._modems.pop(modem, None)
+            self._rendered = None
+
+    def render(self) -> str:
+        """Full exposition, ending in ``# EOF``. Cached until the next update."""
+        with self._lock:
+            if self._rendered is None:
+                self._rendered = self._render_locked()
+            return self._rendered
+
+    # ------------------------------------------------------------------
+    # Rendering — per modem, at update time
+    # ------------------------------------------------------------------
+
+    def _render_info(self, lines: dict[str, list[str]], base: str, snapshot: ModemSnapshot) -> None:
+        system_info = (snapshot.modem_data or {}).get("system_info") or {}
+        labels = [
+            base,
+            f'connection_status="{snapshot.connection_status.value}"',
+            f'docsis_status="{_escape(snapshot.docsis_status)}"',
+        ]
+        labels += [f'{key}="{_escape(str(system_info[key]))}"' for key in _INFO_FIELDS if system_info.get(key)]
+        self._add(
+            lines,
+            _Family("cable_modem", "info", "Modem connection state and firmware."),
+            f"cable_modem_info{{{','.join(labels)}}} 1",
+        )
+
+    def _render_channels(self, lines: dict[str, list[str]], base: str, modem_data: dict[str, Any]) -> None:
+        for direction in ("downstream", "upstream"):
+            for channel in modem_data.get(direction) or []:
+                # Unlocked channels keep only channel_number — it is the
+                # label that tells them apart. A channel with neither
+                # identity would duplicate another's series, so skip it.
+                if channel.get("channel_id") is None and channel.get("channel_number") is None:
+                    continue
+                labels = (
+                    f'{base},channel_type="{_escape(str(channel.get("channel_type", "")))}"'
+                    f',channel_id="{_escape(str(channel.get("channel_id", "")))}"'
+                    f',channel_number="{_escape(str(channel.get("channel_number", "")))}"'
+                )
+                for key, value in channel.items():
+                    self._render_channel_field(lines, direction, labels, key, value)
+
+    def _render_channel_field(
+        self,
+        lines: dict[str, list[str]],
+        direction: str,
+        labels: str,
+        key: str,
+        value: Any,
+    ) -> None:
+        if key == "lock_status":
+            name = f"cable_modem_{direction}_locked"
+            family = _Family(name, "gauge", f"1 if the {direction} channel is locked.")
+            self._add(lines, family, f"{name}{{{labels}}} {int(value == 'locked')}")
+            return
+        if key in _CHANNEL_LABEL_FIELDS or not _is_number(value):
+            return
+        suffix, metric_type = _CHANNEL_METRICS.get(key, (key, "gauge"))
+        name = f"cable_modem_{direction}_{suffix}"
+        sample = f"{name}_total" if metric_type == "counter" else name
+        family = _Family(name, metric_type, f"{direction.capitalize()} channel {key}.")
+        self._add(lines, family, f"{sample}{{{labels}}} {_number(value)}")
+
+    def _render_system_info(self, lines: dict[str, list[str]], base: str, system_info: dict[str, Any]) -> None:
+        for key, value in system_info.items():
+            if not _is_number(value):
+                continue
+            name = f"cable_modem_system_{key}"
+            self._add(lines, _Family(name, "gauge", f"system_info {key}."), f"{name}{{{base}}} {_number(value)}")
+
+    def _render_diagnostics(self, lines: dict[str, list[str]], base: str, diagnostics: OrchestratorDiagnostics) -> None:
+        for key in _DIAGNOSTIC_GAUGES:
+            name = f"cable_modem_orchestrator_{key}"
+            value = int(getattr(diagnostics, key))
+            self._add(lines, _Family(name, "gauge", f"Orchestrator {key}."), f"{name}{{{base}}} {value}")
+        for fetch in diagnostics.resource_fetches:
+            labels = f'{base},path="{_escape(fetch.path)}"'
+            self._add(
+                lines,
+                _Family("cable_modem_resource_fetch_seconds", "gauge", "Last fetch time per resource."),
+                f"cable_modem_resource_fetch_seconds{{{labels}}} {_number(fetch.duration_ms / 1000.0)}",
+            )
+            self._add(
+                lines,
+                _Family("cable_modem_resource_size_bytes", "gauge", "Last response size per resource."),
+                f"cable_modem_resource_size_bytes{{{labels}}} {fetch.size_bytes}",
+            )
+
+    def _render_poll_stats(self, lines: dict[str, list[str]], base: str, series: _ModemSeries) -> None:
+        """Counters and histograms. Caller holds the lock."""
+        family = _Family("cable_modem_polls", "counter", "Polls completed, by connection status.")
+        for status, count in sorted(series.polls.items()):
+            self._add(lines, family, f'cable_modem_polls_total{{{base},connection_status="{status}"}} {count}')
+        for name, histogram, help_text in (
+            ("cable_modem_poll_duration_seconds", series.poll_duration, "get_modem_data() wall time."),
+            ("cable_modem_poll_queue_delay_seconds", series.queue_delay, "Wait from due to start."),
+        ):
+            if histogram.observations:
+                lines.setdefault(name, []).extend(histogram.lines(name, base))
+                self._register(_Family(name, "histogram", help_text))
+
+    def _add(self, lines: dict[str, list[str]], family: _Family, sample: str) -> None:
+        lines.setdefault(family.name, []).append(sample)
+        self._register(family)
+
+    def _register(self, family: _Family) -> None:
+        # dict.setdefault is atomic under the GIL; first registration wins
+        self._families.setdefault(family.name, family)
+
+    # ------------------------------------------------------------------
+    # Rendering — at scrape time
+    # ------------------------------------------------------------------
+
+    def _series(self, modem: str) -> _ModemSeries:
+        series = self._modems.get(modem)
+        if series is None:
+            series = _ModemSeries(_Histogram(self._buckets), _Histogram(self._buckets))
+            self._modems[modem] = series
+        return series
+
+    def _render_locked(self) -> str:
+        out: list[str] = []
+        for name, family in list(self._families.items()):
+            samples: list[str] = []
+            for series in self._modems.values():
+                samples.extend(series.snapshot_lines.get(name, ()))
+                samples.extend(series.health_lines.get(name, ()))
+            if not samples:
+                continue
+            out.append(f"# TYPE {name} {family.type}")
+            out.append(f"# HELP {name} {family.help}")
+            out.extend(samples)
+        out.append("# EOF")
+        return "\n".join(out) + "\n"
+
+
+class MetricsServer(ThreadingHTTPServer):
+    """Serve ``exporter.render()`` at ``/metrics``.
+
+    Args:
+        exporter: Metrics source.
+        host: Bind address. Defaults to loopback — expose deliberately.
+        port: Bind port. 0 picks an ephemeral port.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, exporter: OpenMetricsExporter, host: str = "127.0.0.1", port: int = 9464) -> None:
+        self.exporter = exporter
+        super().__init__((host, port), _MetricsHandler)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        """``http://host:port`` of the bound socket."""
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def start(self) -> None:
+        """Serve on a daemon thread."""
+        self._thread = threading.Thread(target=self.serve_forever, name="cmm-metrics", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop serving and release the socket."""
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    server: MetricsServer
+
+    def do_GET(self) -> None:  # noqa: N802 — http.server naming
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.server.exporter.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 — base class signature
+        _logger.debug("metrics %s", format % args)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+def _number(value: float) -> str:
+    """OpenMetrics number: integers without a trailing ``.0``."""
+    if not isinstance(value, float):
+        return str(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def _escape(value: str) -> str:
+    """Escape a label value (backslash, double quote, newline)."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -7,17 +7,67 @@ resource loaders request, and what the parser coordinator expects to
 find in the resource dict — it sits above both rather than inside
 either, so the two cannot disagree about what was asked for.
 
+A consumer may narrow the list with a ``FetchMask`` — the sections
+and system_info fields it still reads. Sections and sources that feed
+nothing are pruned from the config before derivation, so the same
+pruned view drives both fetching and parsing.
+
 See RESOURCE_LOADING_SPEC.md Fetch List Derivation section.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from .models.parser_config.system_info import CORE_SYSTEM_INFO_FIELDS, source_field_names
 
 if TYPE_CHECKING:
     from .models.parser_config import ParserConfig
 
+# Section names a mask can select.
+CHANNEL_SECTIONS = ("downstream", "upstream")
+ALL_SECTIONS: frozenset[str] = frozenset({*CHANNEL_SECTIONS, "system_info"})
+
+# Sections Core itself reads on every poll, whatever the consumer
+# shows. Downstream channels drive connection status, docsis_status
+# enrichment, and the SC-QAM error aggregates behind the reboot vote.
+_CORE_SECTIONS: frozenset[str] = frozenset({"downstream"})
+
+# parser.py hook method per section — a hook only runs when its
+# section is needed.
+_HOOK_SECTIONS = {
+    "parse_downstream": "downstream",
+    "parse_upstream": "upstream",
+    "parse_system_info": "system_info",
+}
+
+
+@dataclass(frozen=True)
+class FetchMask:
+    """What a consumer still reads from a poll.
+
+    The HA adapter derives one from the entity registry: a section or
+    field whose entities are all disabled feeds nothing. Core widens
+    the mask with its own needs (see ``resolve_fetch_mask``), so a
+    consumer cannot prune data the orchestrator depends on.
+
+    Attributes:
+        sections: Needed sections — any of ``downstream``,
+            ``upstream``, ``system_info``. Defaults to all.
+        ignored_system_info_fields: system_info fields nothing reads.
+            A source whose every mapped field is ignored is not
+            fetched.
+    """
+
+    sections: frozenset[str] = ALL_SECTIONS
+    ignored_system_info_fields: frozenset[str] = field(default_factory=frozenset)
+
+    @property
+    def is_full(self) -> bool:
+        """True when the mask prunes nothing."""
+        return self.sections >= ALL_SECTIONS and not self.ignored_system_info_fields
+
 
 @dataclass(frozen=True)
 class ResourceTarget:
@@ -40,6 +90,7 @@ class ResourceTarget:
 def collect_fetch_targets(
     config: ParserConfig,
     post_processor: object | None = None,
+    mask: FetchMask | None = None,
 ) -> list[ResourceTarget]:
     """Collect unique fetch targets from parser.yaml and parser.py.
 
@@ -58,12 +109,21 @@ def collect_fetch_targets(
             declares the resources its hooks read, merged into the
             fetch list. See PARSING_SPEC § parser.py — Post-Processing
             Hooks.
+        mask: Optional ``FetchMask``. Sections and sources that feed
+            nothing are pruned before derivation; parser.py resources
+            are dropped when every section it hooks is pruned.
 
     Returns:
         List of unique ``ResourceTarget`` objects to fetch.
     """
     seen_paths: dict[str, ResourceTarget] = {}
 
+    if mask is not None:
+        mask = resolve_fetch_mask(config, mask)
+        config = prune_parser_config(config, mask)
+        if not _post_processor_needed(post_processor, mask):
+            post_processor = None
+
     # Channel sections (downstream, upstream)
     for section_name in ("downstream", "upstream"):
         section = getattr(config, section_name, None)
@@ -79,6 +139,17 @@ def collect_fetch_targets(
     return list(seen_paths.values())
 
 
+def section_resources(section: object | None) -> list[str]:
+    """Resource paths one section or system_info source reads.
+
+    Same derivation as ``collect_fetch_targets``. Empty for HNAP, whose
+    sections read the batched response rather than a path.
+    """
+    seen_paths: dict[str, ResourceTarget] = {}
+    _add_section_target(section, seen_paths)
+    return list(seen_paths)
+
+
 def _add_post_processor_resources(
     post_processor: object | None,
     seen_paths: dict[str, ResourceTarget],
@@ -151,3 +222,92 @@ def _add_child_targets(
                 format=fmt,
                 encoding=encoding,
             )
+
+
+# ---------------------------------------------------------------------------
+# Fetch mask — pruning sections and sources nothing reads
+# ---------------------------------------------------------------------------
+
+
+def resolve_fetch_mask(config: ParserConfig, mask: FetchMask) -> FetchMask:
+    """Widen a consumer mask with Core's own and derived dependencies.
+
+    Adds the sections and fields Core reads every poll, the channel
+    direction behind every aggregate that is still needed, and the
+    inputs of every computed field that is still needed. The result
+    is what ``prune_parser_config`` and the parser coordinator act on.
+    """
+    sections = set(mask.sections) | _CORE_SECTIONS
+    ignored = set(mask.ignored_system_info_fields) - CORE_SYSTEM_INFO_FIELDS
+
+    for name, computed in config.computed.items():
+        if name not in ignored:
+            ignored -= set(computed.inputs.values())
+
+    for name, aggregate in config.aggregate.items():
+        if name not in ignored:
+            sections.add(aggregate.channels.split(".", 1)[0])
+
+    return FetchMask(sections=frozenset(sections), ignored_system_info_fields=frozenset(ignored))
+
+
+def prune_parser_config(config: ParserConfig, mask: FetchMask) -> ParserConfig:
+    """Return a copy of ``config`` without the sections ``mask`` prunes.
+
+    Channel sections outside ``mask.sections`` are dropped. system_info
+    sources are dropped when the section is not needed, or when every
+    field the source maps is ignored. Sources mapping underscore
+    fields are kept — those feed parser.py hooks, whose outputs the
+    mask cannot see. The input config is not modified.
+
+    Args:
+        config: Validated ``ParserConfig`` instance.
+        mask: A mask already widened by ``resolve_fetch_mask``.
+
+    Returns:
+        The original config when nothing is pruned, otherwise a
+        shallow copy with pruned sections set to ``None``.
+    """
+    if mask.is_full:
+        return config
+
+    update: dict[str, Any] = {}
+    for section_name in CHANNEL_SECTIONS:
+        if section_name not in mask.sections and getattr(config, section_name) is not None:
+            update[section_name] = None
+
+    if config.system_info is not None:
+        if "system_info" not in mask.sections:
+            update["system_info"] = None
+        else:
+            kept = [s for s in config.system_info.sources if _source_needed(s, mask.ignored_system_info_fields)]
+            if not kept:
+                update["system_info"] = None
+            elif len(kept) != len(config.system_info.sources):
+                update["system_info"] = config.system_info.model_copy(update={"sources": kept})
+
+    if not update:
+        return config
+    return config.model_copy(update=update)
+
+
+def _source_needed(source: object, ignored: frozenset[str]) -> bool:
+    """Whether a system_info source maps any field still read."""
+    names = source_field_names(source)
+    if not names:
+        return True
+    return any(name.startswith("_") or name not in ignored for name in names)
+
+
+def _post_processor_needed(post_processor: object | None, mask: FetchMask) -> bool:
+    """Whether any parser.py hook still runs under ``mask``.
+
+    A PostProcessor with no hooks (resources only) is kept — nothing
+    says which section its resources feed.
+    """
+    if post_processor is None:
+        return False
+    hooked = {section for hook, section in _HOOK_SECTIONS.items() if hasattr(post_processor, hook)}
+    if not hooked:
+        return True
+    return bool(hooked & mask.sections)
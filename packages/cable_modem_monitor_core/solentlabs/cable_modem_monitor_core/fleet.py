@@ -0,0 +1,439 @@
+"""FleetScheduler — drive many Orchestrators from one bounded worker pool.
+
+The Orchestrator owns no scheduling or threads; every consumer brings
+its own cadence. One consumer per modem is fine until a host monitors
+dozens of them: independent timers drift into alignment and every poll
+lands on the executor at once. The fleet scheduler is the shared
+consumer for that case:
+
+- **Staggered starts with jitter.** Each member's first poll and first
+  health probe are spread over ``startup_spread`` seconds, and every
+  reschedule adds ``±jitter`` of the interval, so timers never lock
+  into step.
+- **Global concurrency cap.** At most ``max_workers`` jobs run at a
+  time. Due jobs wait in the scheduler — oldest first — not in the
+  executor queue, so the wait is observable.
+- **Per-host mutual exclusion.** A data poll, a health probe, and a
+  restart for the same host never overlap. Single-session firmware
+  sees one client at a time.
+- **Queueing delay per modem.** The gap between a job falling due and
+  starting is recorded in ``FleetMemberStats``.
+- **Recovery cadence.** While an orchestrator reports
+  ``recovery_active``, its polls are rescheduled at
+  ``recovery_interval`` instead of the configured interval — the same
+  contract the HA adapter implements with its cadence listener.
+
+Everything Core-specific (backoff, circuit breaker, status) stays in
+the Orchestrator — the scheduler only decides *when* to call it.
+
+See RUNTIME_POLLING_SPEC.md § Fleet Scheduling.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .orchestration.models import HealthInfo, ModemSnapshot, RestartResult
+    from .orchestration.modem_health import HealthMonitor
+    from .orchestration.orchestrator import Orchestrator
+
+_logger = logging.getLogger(__name__)
+
+
+class FleetJob(StrEnum):
+    """Kinds of work the scheduler serializes per host."""
+
+    POLL = "poll"
+    HEALTH = "health"
+    RESTART = "restart"
+
+
+@dataclass(frozen=True)
+class FleetMemberStats:
+    """Per-modem scheduling counters.
+
+    Attributes:
+        polls: Data polls completed.
+        health_checks: Health probes completed.
+        last_queue_delay: Seconds the most recent job waited between
+            falling due and starting. None before the first job.
+        max_queue_delay: Longest wait observed.
+        total_queue_delay: Sum of all waits — divide by
+            ``polls + health_checks`` for the mean.
+        last_poll_duration: Wall time of the most recent data poll.
+        last_health_duration: Wall time of the most recent probe.
+    """
+
+    polls: int = 0
+    health_checks: int = 0
+    last_queue_delay: float | None = None
+    max_queue_delay: float = 0.0
+    total_queue_delay: float = 0.0
+    last_poll_duration: float | None = None
+    last_health_duration: float | None = None
+
+
+@dataclass
+class _Member:
+    """Scheduling state for one modem."""
+
+    name: str
+    orchestrator: Orchestrator
+    host: str
+    poll_interval: float
+    health_monitor: HealthMonitor | None
+    health_interval: float | None
+    next_poll: float
+    next_health: float | None
+    stats: FleetMemberStats = field(default_factory=FleetMemberStats)
+    removed: bool = False
+
+
+class FleetScheduler:
+    """Poll many modems from one bounded pool with per-host exclusion.
+
+    Args:
+        max_workers: Global cap on concurrently running jobs.
+        jitter: Fraction of the interval added or subtracted at random
+            on every reschedule (0.1 → ±10%).
+        startup_spread: Seconds over which a new member's first poll
+            and probe are spread. Capped at the member's interval.
+        recovery_interval: Poll interval used while the member's
+            orchestrator reports ``recovery_active``.
+        on_snapshot: Called with ``(name, snapshot)`` after every poll,
+            on the worker thread.
+        on_health: Called with ``(name, health_info)`` after every
+            probe, on the worker thread.
+        clock: Monotonic clock — injectable for tests.
+        rng: Random source for stagger and jitter — injectable for tests.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = 4,
+        jitter: float = 0.1,
+        startup_spread: float = 60.0,
+        recovery_interval: float = 30.0,
+        on_snapshot: Callable[[str, ModemSnapshot], None] | None = None,
+        on_health: Callable[[str, HealthInfo], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        rng: random.Random | None = None,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        self._max_workers = max_workers
+        self._jitter = jitter
+        self._startup_spread = startup_spread
+        self._recovery_interval = recovery_interval
+        self._on_snapshot = on_snapshot
+        self._on_health = on_health
+        self._clock = clock
+        self._rng = rng or random.Random()
+
+        self._members: dict[str, _Member] = {}
+        self._busy_hosts: set[str] = set()
+        self._in_flight = 0
+        # Guards every field above; notified whenever a host frees up
+        # so restart() and drain() waiters re-check.
+        self._cond = threading.Condition()
+
+        self._executor: ThreadPoolExecutor | None = None
+        self._thread: threading.Thread | None = None
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+
+    # ------------------------------------------------------------------
+    # Membership
+    # ------------------------------------------------------------------
+
+    def add(
+        self,
+        name: str,
+        orchestrator: Orchestrator,
+        *,
+        host: str,
+        poll_interval: float,
+        health_monitor: HealthMonitor | None = None,
+        health_interval: float | None = None,
+    ) -> None:
+        """Register a modem. Its first poll and probe are staggered.
+
+        Args:
+            name: Unique key for this member (stats, callbacks).
+            orchestrator: The modem's Orchestrator.
+            host: Exclusion key — jobs for the same host never overlap.
+            poll_interval: Seconds between data polls.
+            health_monitor: Optional HealthMonitor to probe.
+            health_interval: Seconds between probes. Required with
+                ``health_monitor``.
+
+        Raises:
+            ValueError: Duplicate name, or a health monitor without an
+                interval.
+        """
+        if health_monitor is not None and health_interval is None:
+            raise ValueError(f"{name}: health_monitor requires health_interval")
+        now = self._clock()
+        with self._cond:
+            if name in self._members:
+                raise ValueError(f"{name}: already in the fleet")
+            self._members[name] = _Member(
+                name=name,
+                orchestrator=orchestrator,
+                host=host,
+                poll_interval=poll_interval,
+                health_monitor=health_monitor,
+                health_interval=health_interval,
+                next_poll=now + self._stagger(poll_interval),
+                next_health=(
+                    now + self._stagger(health_interval)
+                    if health_monitor is not None and health_interval is not None
+                    else None
+                ),
+            )
+        self._wake.set()
+
+    def remove(self, name: str) -> None:
+        """Drop a modem. A job already running finishes but is not rescheduled."""
+        with self._cond:
+            member = self._members.pop(name, None)
+            if member is not None:
+                member.removed = True
+        self._wake.set()
+
+    def request_refresh(self, name: str) -> None:
+        """Make a member's data poll due now (manual refresh)."""
+        with self._cond:
+            self._members[name].next_poll = self._clock()
+        self._wake.set()
+
+    def stats(self) -> dict[str, FleetMemberStats]:
+        """Per-member counters, keyed by name."""
+        with self._cond:
+            return {name: m.stats for name, m in self._members.items()}
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+
+    def run_pending(self) -> int:
+        """Start every due job the cap and host exclusion allow.
+
+        Due jobs start oldest-first. A job whose host is busy stays due
+        and is retried when that host frees up; its queueing delay keeps
+        growing meanwhile.
+
+        Returns:
+            Number of jobs started.
+        """
+        now = self._clock()
+        started = 0
+        with self._cond:
+            for due, member, kind in self._due_jobs(now):
+                if self._in_flight >= self._max_workers:
+                    break
+                if member.host in self._busy_hosts:
+                    continue
+                self._claim(member, kind)
+                self._ensure_executor().submit(self._run, member, kind, due)
+                started += 1
+        return started
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """Block until no job is running.
+
+        Returns:
+            False if ``timeout`` elapsed first.
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: self._in_flight == 0, timeout)
+
+    def restart(self, name: str, timeout: float | None = None) -> RestartResult:
+        """Run the member's restart on the calling thread, exclusive per host.
+
+        Waits for any poll or probe on the same host to finish first,
+        and holds the host until the restart command returns. Does not
+        count against ``max_workers`` — the caller's thread does the
+        work.
+
+        Raises:
+            KeyError: Unknown member.
+            TimeoutError: The host stayed busy past ``timeout``.
+        """
+        with self._cond:
+            member = self._members[name]
+            if not self._cond.wait_for(lambda: member.host not in self._busy_hosts, timeout):
+                raise TimeoutError(f"{name}: host {member.host} busy for {timeout}s")
+            self._busy_hosts.add(member.host)
+        try:
+            return member.orchestrator.restart()
+        finally:
+            with self._cond:
+                self._busy_hosts.discard(member.host)
+                # Recovery is now active — pull the next poll in to the
+                # recovery cadence rather than waiting a full interval.
+                member.next_poll = min(member.next_poll, self._clock() + self._recovery_interval)
+                self._cond.notify_all()
+            self._wake.set()
+
+    # ------------------------------------------------------------------
+    # Background loop
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Run the dispatch loop on a daemon thread."""
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._loop, name="cmm-fleet-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop dispatching, wait for running jobs, and release the pool."""
+        self._stopping.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.drain(timeout)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def seconds_until_next_due(self) -> float | None:
+        """Seconds until the earliest startable job, 0 if overdue, None if idle.
+
+        Jobs that cannot start — every worker busy, or their host busy —
+        are left out: they wait for a running job to finish, which wakes
+        the loop, not for a clock tick. Counting them would return 0 and
+        spin the loop until the slot frees up.
+        """
+        with self._cond:
+            if self._in_flight >= self._max_workers:
+                return None
+            dues = [
+                due
+                for m in self._members.values()
+                if m.host not in self._busy_hosts
+                for due in (m.next_poll, m.next_health)
+                if due is not None
+            ]
+        if not dues:
+            return None
+        return max(0.0, min(dues) - self._clock())
+
+    def _loop(self) -> None:
+        while not self._stopping.is_set():
+            self.run_pending()
+            self._wake.wait(self.seconds_until_next_due())
+            self._wake.clear()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _stagger(self, interval: float) -> float:
+        return self._rng.uniform(0.0, min(self._startup_spread, interval))
+
+    def _jittered(self, interval: float) -> float:
+        return interval * (1.0 + self._rng.uniform(-self._jitter, self._jitter))
+
+    def _due_jobs(self, now: float) -> list[tuple[float, _Member, FleetJob]]:
+        """Due (time, member, kind) triples, oldest first. Caller holds the lock."""
+        jobs: list[tuple[float, _Member, FleetJob]] = []
+        for member in self._members.values():
+            if member.next_poll <= now:
+                jobs.append((member.next_poll, member, FleetJob.POLL))
+            if member.next_health is not None and member.next_health <= now:
+                jobs.append((member.next_health, member, FleetJob.HEALTH))
+        jobs.sort(key=lambda job: job[0])
+        return jobs
+
+    def _claim(self, member: _Member, kind: FleetJob) -> None:
+        """Mark the host busy and park the job's due time. Caller holds the lock."""
+        self._busy_hosts.add(member.host)
+        self._in_flight += 1
+        # Parked at +inf so the job is not dispatched twice; _finish()
+        # sets the real next due time.
+        if kind is FleetJob.POLL:
+            member.next_poll = float("inf")
+        else:
+            member.next_health = float("inf")
+
+    def _ensure_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="cmm-fleet")
+        return self._executor
+
+    def _run(self, member: _Member, kind: FleetJob, due: float) -> None:
+        started = self._clock()
+        # Recorded before the job runs so callbacks see this job's delay
+        with self._cond:
+            member.stats = _record_start(member.stats, started - due)
+        try:
+            if kind is FleetJob.POLL:
+                snapshot = member.orchestrator.get_modem_data()
+                if self._on_snapshot is not None:
+                    self._on_snapshot(member.name, snapshot)
+            elif member.health_monitor is not None:
+                info = member.health_monitor.ping()
+                if self._on_health is not None:
+                    self._on_health(member.name, info)
+        except Exception:
+            # The orchestrator never raises; this is consumer callback
+            # code. Log and keep the schedule alive.
+            _logger.exception("Fleet %s job failed [%s]", kind.value, member.name)
+        finally:
+            self._finish(member, kind, duration=self._clock() - started)
+
+    def _finish(self, member: _Member, kind: FleetJob, *, duration: float) -> None:
+        now = self._clock()
+        with self._cond:
+            self._busy_hosts.discard(member.host)
+            self._in_flight -= 1
+            member.stats = _record_finish(member.stats, kind, duration)
+            if not member.removed:
+                self._reschedule(member, kind, now)
+            self._cond.notify_all()
+        self._wake.set()
+
+    def _reschedule(self, member: _Member, kind: FleetJob, now: float) -> None:
+        """Set the next due time from completion. Caller holds the lock."""
+        if kind is FleetJob.POLL:
+            interval = member.poll_interval
+            if member.orchestrator.recovery_active:
+                interval = min(interval, self._recovery_interval)
+            # request_refresh() may have pulled the poll in while it ran
+            if member.next_poll == float("inf"):
+                member.next_poll = now + self._jittered(interval)
+        elif member.health_interval is not None:
+            member.next_health = now + self._jittered(member.health_interval)
+
+
+def _record_start(stats: FleetMemberStats, queue_delay: float) -> FleetMemberStats:
+    """Fold a job's queueing delay into the member's counters."""
+    queue_delay = max(0.0, queue_delay)
+    return replace(
+        stats,
+        last_queue_delay=queue_delay,
+        max_queue_delay=max(stats.max_queue_delay, queue_delay),
+        total_queue_delay=stats.total_queue_delay + queue_delay,
+    )
+
+
+def _record_finish(stats: FleetMemberStats, kind: FleetJob, duration: float) -> FleetMemberStats:
+    """Count a finished job and its wall time."""
+    if kind is FleetJob.POLL:
+        return replace(stats, polls=stats.polls + 1, last_poll_duration=duration)
+    return replace(stats, health_checks=stats.health_checks + 1, last_health_duration=duration)
@@ -10,27 +10,52 @@ point used across Core, Catalog, and tooling.  Detects Git LFS
 pointers and attempts auto-recovery so tests and tooling fail
 with actionable guidance instead of opaque ``JSONDecodeError``.
 
+HAR files are read as a stream — one entry decoded at a time — so a
+multi-hundred-MB capture never sits in memory as text and as parsed
+objects at once.  gzip and zstd fixtures (``.har.gz``, ``.har.zst``)
+are detected by magic bytes.  :func:`load_har_json` memoizes parsed
+documents per (path, mtime, size), so validation, analysis, golden
+file generation and the test harness share one read per HAR;
+:func:`iter_har_entries` streams without retaining anything.
+
 Candidate for future extraction to the ``har-capture`` package.
 """
 
 from __future__ import annotations
 
 import base64
+import gzip
+import io
 import json
 import logging
 import subprocess
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup
-
+from .json_codec import decode_json
 from .loaders.html_normalize import normalize_html
 
 _logger = logging.getLogger(__name__)
 
 _LFS_POINTER_PREFIX = "version https://git-lfs.github.com/spec/v1"
 
+# Recognised fixture names, longest suffix first.
+HAR_SUFFIXES = (".har.gz", ".har.zst", ".har")
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Initial read size; a value larger than the buffer doubles the read.
+_CHUNK_CHARS = 1 << 20
+
+# Parsed documents kept for reuse.  Intake touches one HAR several
+# times in a row; the test harness walks fixtures one modem at a time.
+_HAR_CACHE_SIZE = 4
+
 
 # ---------------------------------------------------------------------------
 # HAR loading with LFS detection
@@ -41,15 +66,25 @@ class LfsPointerError(RuntimeError):
     """A HAR file is a Git LFS pointer instead of actual content."""
 
 
-def load_har_json(path: Path | str) -> dict[str, Any]:
+_har_cache: OrderedDict[Path, tuple[tuple[int, int], dict[str, Any]]] = OrderedDict()
+_har_cache_lock = threading.Lock()
+
+
+def load_har_json(path: Path | str, *, resolve_lfs: bool = True) -> dict[str, Any]:
     """Read and parse a HAR file, detecting Git LFS pointers.
 
     If the file is an LFS pointer, attempts ``git lfs pull`` to
     fetch the real content.  Raises :class:`LfsPointerError` with
     install/fix instructions if auto-recovery fails.
 
+    The document is parsed as a stream and memoized per (path,
+    mtime, size); a later call for an unchanged file returns the same
+    object.  Callers must treat the result as read-only.
+
     Args:
-        path: Path to the HAR file.
+        path: Path to the HAR file (plain, gzip or zstd).
+        resolve_lfs: Attempt ``git lfs pull`` on a pointer.  When
+            ``False`` a pointer raises immediately.
 
     Returns:
         Parsed HAR JSON as a dict.
@@ -60,13 +95,290 @@ def load_har_json(path: Path | str) -> dict[str, Any]:
         json.JSONDecodeError: If the file is not valid JSON.
     """
     path = Path(path)
-    content = path.read_text(encoding="utf-8")
+    key = path.resolve()
+    stamp = _file_stamp(path)
+    with _har_cache_lock:
+        cached = _har_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            _har_cache.move_to_end(key)
+            return cached[1]
+
+    with _open_har(path, resolve_lfs=resolve_lfs) as stream:
+        result = _read_document(stream)
+
+    with _har_cache_lock:
+        # Re-stat: an LFS pull replaces the file while we read it.
+        _har_cache[key] = (_file_stamp(path), result)
+        _har_cache.move_to_end(key)
+        while len(_har_cache) > _HAR_CACHE_SIZE:
+            _har_cache.popitem(last=False)
+    return result
 
-    if content.startswith(_LFS_POINTER_PREFIX):
-        content = _resolve_lfs_pointer(path)
 
-    result: dict[str, Any] = json.loads(content)
-    return result
+def iter_har_entries(path: Path | str, *, resolve_lfs: bool = True) -> Iterator[dict[str, Any]]:
+    """Yield ``log.entries`` one at a time without loading the whole file.
+
+    Memory use is bounded by the largest single entry.  Nothing is
+    cached — use :func:`load_har_json` when the same HAR is read again.
+
+    Args:
+        path: Path to the HAR file (plain, gzip or zstd).
+        resolve_lfs: As for :func:`load_har_json`.
+
+    Yields:
+        Each entry dict, in file order.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        LfsPointerError: If the file is an unresolvable LFS pointer.
+        json.JSONDecodeError: If the file is not valid JSON.
+    """
+    path = Path(path)
+    with _open_har(path, resolve_lfs=resolve_lfs) as stream:
+        for scope, _key, value in _iter_har_events(stream):
+            if scope == "entry":
+                yield value
+
+
+def clear_har_cache() -> None:
+    """Drop every memoized HAR document."""
+    with _har_cache_lock:
+        _har_cache.clear()
+
+
+def is_har_file(path: Path) -> bool:
+    """Whether *path* is named like a HAR fixture (``.har``, ``.har.gz``, ``.har.zst``)."""
+    return path.name.endswith(HAR_SUFFIXES)
+
+
+def har_stem(path: Path) -> str:
+    """File name without the HAR suffix (``modem-v2.har.gz`` → ``modem-v2``)."""
+    for suffix in HAR_SUFFIXES:
+        if path.name.endswith(suffix):
+            return path.name[: -len(suffix)]
+    return path.stem
+
+
+def find_har_files(directory: Path) -> list[Path]:
+    """HAR fixtures in *directory* (not recursive), sorted by name."""
+    if not directory.is_dir():
+        return []
+    return sorted(p for p in directory.iterdir() if p.is_file() and is_har_file(p))
+
+
+def _file_stamp(path: Path) -> tuple[int, int]:
+    stat = path.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+# ---------------------------------------------------------------------------
+# Streaming reader
+# ---------------------------------------------------------------------------
+
+
+def _open_har(path: Path, *, resolve_lfs: bool) -> _JsonStream:
+    """Open a HAR file for streaming, decompressing and resolving LFS pointers."""
+    handle = _open_text(path)
+    head = handle.read(len(_LFS_POINTER_PREFIX))
+    if not head.startswith(_LFS_POINTER_PREFIX):
+        return _JsonStream(handle, head)
+    handle.close()
+    if not resolve_lfs:
+        raise LfsPointerError(_lfs_error_message(path))
+    _resolve_lfs_pointer(path)
+    return _JsonStream(_open_text(path))
+
+
+def _open_text(path: Path) -> IO[str]:
+    """Open *path* as UTF-8 text, choosing the decompressor by magic bytes."""
+    with path.open("rb") as raw:
+        magic = raw.read(4)
+    binary: IO[bytes] | gzip.GzipFile
+    if magic.startswith(_GZIP_MAGIC):
+        binary = gzip.open(path, "rb")  # noqa: SIM115 — closed with the returned wrapper
+    elif magic == _ZSTD_MAGIC:
+        binary = _zstd_reader(path)
+    else:
+        binary = path.open("rb")
+    return io.TextIOWrapper(binary, encoding="utf-8")
+
+
+def _zstd_reader(path: Path) -> IO[bytes]:
+    """Open a zstd-compressed file (stdlib on 3.14+, else ``zstandard``)."""
+    try:
+        from compression import zstd  # type: ignore[import-not-found]  # stdlib only on 3.14+, absent from older typeshed
+
+        reader: IO[bytes] = zstd.open(path, "rb")
+        return reader
+    except ImportError:
+        pass
+    try:
+        import zstandard  # type: ignore[import-not-found]  # optional [zstd] extra, may be absent
+    except ImportError:
+        raise ImportError(
+            "zstandard package required for .har.zst files. "
+            "Install with: pip install solentlabs-cable-modem-monitor-core[zstd]"
+        ) from None
+    return io.BufferedReader(zstandard.open(path, "rb"))
+
+
+class _JsonStream:
+    """Incremental JSON tokenizer over a text stream.
+
+    Only the structural tokens of the HAR envelope are tokenized here;
+    each value (an entry, ``pages``, ``creator``) is handed whole to
+    :meth:`json.JSONDecoder.raw_decode`.  A value that runs past the
+    buffered text is retried with at least double the text, so each
+    value is decoded O(log size) times, not once per chunk.
+    """
+
+    def __init__(self, handle: IO[str], head: str = "") -> None:
+        self._handle = handle
+        self._buf = head
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Append more text (at least as much as is pending); False at EOF."""
+        if self._eof:
+            return False
+        pending = self._buf[self._pos :]
+        chunk = self._handle.read(max(_CHUNK_CHARS, len(pending)))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = pending + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character, or ``""`` at end of input."""
+        while True:
+            buf, pos = self._buf, self._pos
+            while pos < len(buf) and buf[pos] in " \t\n\r":
+                pos += 1
+            self._pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume *char* or raise ``JSONDecodeError``."""
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Expecting {char!r}", self._buf, self._pos)
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A bare number at the buffer edge may continue in the next chunk.
+            if end == len(self._buf) and isinstance(value, int | float) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def __enter__(self) -> _JsonStream:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._handle.close()
+
+    def expect_end(self) -> None:
+        """Raise ``JSONDecodeError`` if anything but whitespace remains."""
+        if self.peek():
+            raise json.JSONDecodeError("Extra data", self._buf, self._pos)
+
+    def next_member(self, close: str) -> bool:
+        """After a value: consume ``,`` and return True, or consume *close* and return False."""
+        char = self.peek()
+        if char == ",":
+            self._pos += 1
+            return True
+        self.expect(close)
+        return False
+
+
+def _iter_har_events(stream: _JsonStream) -> Iterator[tuple[str, str, Any]]:
+    """Walk a HAR document, yielding ``(scope, key, value)`` triples.
+
+    Scopes: ``"top"`` for top-level members other than ``log``,
+    ``"log"`` for ``log`` members other than ``entries``, and
+    ``"entry"`` (key ``""``) for each element of ``log.entries``.
+    A document that is not shaped like a HAR is yielded whole as
+    ``("top", "", value)``.
+    """
+    if stream.peek() != "{":
+        yield ("top", "", stream.value())
+        stream.expect_end()
+        return
+    stream.expect("{")
+    if stream.peek() == "}":
+        stream.expect("}")
+    else:
+        while True:
+            key = stream.value()
+            stream.expect(":")
+            if key == "log" and stream.peek() == "{":
+                yield from _iter_log_events(stream)
+            else:
+                yield ("top", key, stream.value())
+            if not stream.next_member("}"):
+                break
+    stream.expect_end()
+
+
+def _iter_log_events(stream: _JsonStream) -> Iterator[tuple[str, str, Any]]:
+    """Walk the ``log`` object, streaming ``entries``."""
+    stream.expect("{")
+    if stream.peek() == "}":
+        stream.expect("}")
+        yield ("top", "log", {})
+        return
+    while True:
+        key = stream.value()
+        stream.expect(":")
+        if key == "entries" and stream.peek() == "[":
+            stream.expect("[")
+            yield ("log", "entries", [])
+            if stream.peek() == "]":
+                stream.expect("]")
+            else:
+                while True:
+                    yield ("entry", "", stream.value())
+                    if not stream.next_member("]"):
+                        break
+        else:
+            yield ("log", key, stream.value())
+        if not stream.next_member("}"):
+            break
+
+
+def _read_document(stream: _JsonStream) -> dict[str, Any]:
+    """Assemble the full HAR dict from :func:`_iter_har_events`."""
+    document: dict[str, Any] = {}
+    log: dict[str, Any] = {}
+    for scope, key, value in _iter_har_events(stream):
+        if scope != "top":
+            # First log member: place "log" where it sits among top-level keys.
+            document.setdefault("log", log)
+        if scope == "entry":
+            log["entries"].append(value)
+        elif scope == "log":
+            log[key] = value
+        elif key == "":
+            document = value  # not shaped like a HAR; returned as parsed
+        else:
+            document[key] = value
+    return document
 
 
 def _resolve_lfs_pointer(path: Path) -> str:
@@ -163,7 +475,7 @@ def merge_hnap_har_responses(
             continue
 
         try:
-            data = json.loads(body_text)
+            data = decode_json(body_text)
         except (ValueError, TypeError):
             continue
 
@@ -272,16 +584,18 @@ def _decode_har_entry(text: str, mime_type: str, url_path: str) -> Any:
     ``text/html`` (common with ``.asp`` endpoints on GoAhead-Webs
     firmware).
     """
+    from bs4 import BeautifulSoup
+
     if _is_json_content(mime_type):
         try:
-            return _wrap_json(json.loads(text))
+            return _wrap_json(decode_json(text))
         except (ValueError, TypeError):
             _logger.debug("Failed to parse JSON for %s", url_path)
             return None
 
     if _is_json_body(text):
         try:
-            return _wrap_json(json.loads(text))
+            return _wrap_json(decode_json(text))
         except (ValueError, TypeError):
             return BeautifulSoup(normalize_html(text), "html.parser")
 
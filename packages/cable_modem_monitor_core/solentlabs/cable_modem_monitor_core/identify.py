@@ -0,0 +1,561 @@
+"""Modem auto-identification from unauthenticated responses.
+
+The config flow asks the user for manufacturer, model and variant, and
+validation then tries that one config. This module turns the catalog
+into a fingerprint index and ranks candidate models from one or two
+unauthenticated GETs — no login attempts, no trial polls.
+
+A fingerprint is the set of observable markers a catalog variant
+implies before login:
+
+- identity: model name, aliases, manufacturer
+- auth surface: login page and form action paths, form field names,
+  session cookie names, protocol endpoints (``/HNAP1/``,
+  ``/xml/getter.xml``)
+- parser surface: data page paths, table header text, field labels,
+  JS function and variable names
+- HAR fixtures, when present: page titles and Basic auth realms
+
+Each marker is weighted by kind and by rarity across the catalog
+(inverse document frequency), so a marker shared by a dozen modems
+barely moves the ranking while a unique JS function name decides it.
+
+See ORCHESTRATION_SPEC.md § Modem Identification.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+import time
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from enum import StrEnum
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+import yaml
+from pydantic import ValidationError
+
+from .catalog_manager import list_modems, list_variants
+from .config_loader import load_modem_config, load_parser_config
+from .connectivity import create_session
+from .har import LfsPointerError, find_har_files, har_stem, iter_har_entries
+from .models.modem_config import ModemConfig
+from .models.parser_config import ParserConfig
+
+_logger = logging.getLogger(__name__)
+
+_DEFAULT_TIMEOUT = 5.0
+
+# A runner-up within this fraction of the leader counts as ambiguous
+# and earns a second request to a page that tells them apart.
+_AMBIGUITY_RATIO = 0.8
+
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+_REALM_RE = re.compile(r'realm="([^"]*)"', re.IGNORECASE)
+
+
+class MarkerKind(StrEnum):
+    """Kind of observable evidence a marker represents."""
+
+    MODEL = "model"
+    MANUFACTURER = "manufacturer"
+    TITLE = "title"
+    REALM = "realm"
+    JS_FUNCTION = "js_function"
+    JS_VARIABLE = "js_variable"
+    PATH = "path"
+    ENDPOINT = "endpoint"
+    LOGIN_FIELD = "login_field"
+    COOKIE = "cookie"
+    TEXT = "text"
+
+
+# Base weight per kind, before rarity scaling. Identity strings and
+# exact titles are near-conclusive; shared page structure is not.
+_KIND_WEIGHTS: dict[MarkerKind, float] = {
+    MarkerKind.MODEL: 6.0,
+    MarkerKind.TITLE: 5.0,
+    MarkerKind.REALM: 5.0,
+    MarkerKind.JS_FUNCTION: 3.0,
+    MarkerKind.JS_VARIABLE: 3.0,
+    MarkerKind.PATH: 2.0,
+    MarkerKind.ENDPOINT: 2.0,
+    MarkerKind.LOGIN_FIELD: 2.0,
+    MarkerKind.COOKIE: 2.0,
+    MarkerKind.TEXT: 1.5,
+    MarkerKind.MANUFACTURER: 1.0,
+}
+
+
+@dataclass(frozen=True)
+class Marker:
+    """One piece of evidence. Matching is case-insensitive."""
+
+    kind: MarkerKind
+    value: str
+
+
+@dataclass(frozen=True)
+class Fingerprint:
+    """Markers for one catalog variant.
+
+    Attributes:
+        modem_dir: Catalog-relative modem directory (e.g., ``arris/sb8200``).
+        variant: Variant name (``modem-{variant}.yaml``), or None for
+            the default ``modem.yaml``.
+        manufacturer: Manufacturer from modem.yaml.
+        model: Model from modem.yaml.
+        transport: ``http``, ``hnap`` or ``cbn``.
+        status: Verification status from modem.yaml.
+        markers: Observable markers for this variant.
+    """
+
+    modem_dir: str
+    variant: str | None
+    manufacturer: str
+    model: str
+    transport: str
+    status: str
+    markers: frozenset[Marker]
+
+
+@dataclass
+class FingerprintIndex:
+    """All catalog fingerprints plus marker rarity."""
+
+    fingerprints: list[Fingerprint]
+    _document_frequency: Counter[tuple[MarkerKind, str]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._document_frequency = Counter((m.kind, m.value.lower()) for fp in self.fingerprints for m in fp.markers)
+
+    def weight(self, marker: Marker) -> float:
+        """Kind weight scaled by how few fingerprints share *marker*."""
+        df = self._document_frequency.get((marker.kind, marker.value.lower()), 0) or 1
+        return _KIND_WEIGHTS[marker.kind] * math.log(1 + len(self.fingerprints) / df)
+
+    def common_paths(self) -> list[str]:
+        """Data page paths ordered by how many fingerprints declare them."""
+        paths = Counter(m.value for fp in self.fingerprints for m in fp.markers if m.kind is MarkerKind.PATH)
+        return [path for path, _ in paths.most_common()]
+
+
+@dataclass(frozen=True)
+class ObservedPage:
+    """One unauthenticated response.
+
+    Attributes:
+        path: Path that was requested.
+        final_path: Path after redirects.
+        status_code: HTTP status of the final response.
+        headers: Response headers, keys lowercased.
+        text: Response body.
+    """
+
+    path: str
+    final_path: str
+    status_code: int
+    headers: dict[str, str]
+    text: str
+
+
+@dataclass(frozen=True)
+class Candidate:
+    """A ranked identification result.
+
+    Attributes:
+        modem_dir: Catalog-relative modem directory.
+        variant: Variant name, or None for the default variant.
+        manufacturer: Manufacturer.
+        model: Model.
+        score: Sum of matched marker weights.
+        matched: Matched markers as ``"kind:value"`` strings.
+    """
+
+    modem_dir: str
+    variant: str | None
+    manufacturer: str
+    model: str
+    score: float
+    matched: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class Identification:
+    """Outcome of :func:`identify_modem`.
+
+    Attributes:
+        candidates: Best first. Empty when nothing matched.
+        pages: Paths requested, in order.
+        elapsed: Wall time in seconds, including requests.
+    """
+
+    candidates: list[Candidate]
+    pages: list[str]
+    elapsed: float
+
+
+# ------------------------------------------------------------------
+# Index
+# ------------------------------------------------------------------
+
+
+def build_fingerprint_index(catalog_path: Path) -> FingerprintIndex:
+    """Build (or return the cached) fingerprint index for a catalog.
+
+    Walks every modem and variant via the catalog manager and loads
+    configs through the validated-config cache. The result is cached
+    per catalog path for the life of the process; the installed
+    catalog does not change at runtime.
+
+    Args:
+        catalog_path: Root of the catalog modems directory.
+
+    Returns:
+        FingerprintIndex over every loadable variant.
+    """
+    return _cached_index(catalog_path.resolve())
+
+
+@lru_cache(maxsize=4)
+def _cached_index(catalog_path: Path) -> FingerprintIndex:
+    fingerprints: list[Fingerprint] = []
+    for summary in list_modems(catalog_path):
+        for variant in list_variants(summary.path, summary.sibling_dirs):
+            fingerprint = _load_fingerprint(variant.path, variant.name, catalog_path)
+            if fingerprint is not None:
+                fingerprints.append(fingerprint)
+    _logger.info("Fingerprint index: %d variants from %s", len(fingerprints), catalog_path)
+    return FingerprintIndex(fingerprints)
+
+
+def _load_fingerprint(modem_yaml: Path, variant: str | None, catalog_path: Path) -> Fingerprint | None:
+    modem_dir = modem_yaml.parent
+    try:
+        modem_config = load_modem_config(modem_yaml)
+        parser_yaml = modem_dir / "parser.yaml"
+        parser_config = load_parser_config(parser_yaml) if parser_yaml.exists() else None
+    except (OSError, ValueError, ValidationError, yaml.YAMLError) as e:
+        _logger.warning("Skipping %s in fingerprint index: %s", modem_yaml, e)
+        return None
+
+    fixtures = [p for p in find_har_files(modem_dir / "test_data") if har_stem(p) == modem_yaml.stem]
+    return fingerprint_variant(
+        modem_config,
+        parser_config,
+        modem_dir=modem_dir.relative_to(catalog_path).as_posix(),
+        variant=variant,
+        har_path=fixtures[0] if fixtures else None,
+    )
+
+
+def fingerprint_variant(
+    modem_config: ModemConfig,
+    parser_config: ParserConfig | None,
+    *,
+    modem_dir: str,
+    variant: str | None = None,
+    har_path: Path | None = None,
+) -> Fingerprint:
+    """Collect the pre-login markers one variant implies.
+
+    Args:
+        modem_config: Validated modem config.
+        parser_config: Validated parser config, if the modem has one.
+        modem_dir: Catalog-relative directory, used to label candidates.
+        variant: Variant name, or None for the default variant.
+        har_path: Optional HAR fixture for title and realm markers.
+
+    Returns:
+        Fingerprint for the variant.
+    """
+    markers: set[Marker] = set()
+    for name in [modem_config.model, *modem_config.model_aliases]:
+        _add(markers, MarkerKind.MODEL, name)
+    _add(markers, MarkerKind.MANUFACTURER, modem_config.manufacturer)
+
+    if modem_config.transport == "hnap":
+        _add(markers, MarkerKind.ENDPOINT, "/HNAP1/")
+    if modem_config.auth is not None:
+        markers.update(_auth_markers(modem_config.auth.model_dump()))
+    if parser_config is not None:
+        markers.update(_parser_markers(parser_config.model_dump(exclude_none=True)))
+    if har_path is not None:
+        markers.update(_har_markers(har_path))
+
+    return Fingerprint(
+        modem_dir=modem_dir,
+        variant=variant,
+        manufacturer=modem_config.manufacturer,
+        model=modem_config.model,
+        transport=modem_config.transport,
+        status=str(modem_config.status),
+        markers=frozenset(markers),
+    )
+
+
+def _add(markers: set[Marker], kind: MarkerKind, value: Any) -> None:
+    if isinstance(value, str) and value.strip():
+        markers.add(Marker(kind, value.strip()))
+
+
+def _auth_markers(auth: dict[str, Any]) -> set[Marker]:
+    """Markers from auth config fields, dispatched on field-name suffix."""
+    markers: set[Marker] = set()
+    for name, value in auth.items():
+        values = value if isinstance(value, list) else [value]
+        for item in values:
+            if name in ("action", "login_page") and item != "/":
+                _add(markers, MarkerKind.PATH, item)
+            elif name.endswith("_endpoint"):
+                _add(markers, MarkerKind.ENDPOINT, item)
+            elif name.endswith("_field"):
+                _add(markers, MarkerKind.LOGIN_FIELD, item)
+            elif name.endswith("cookie_name"):
+                _add(markers, MarkerKind.COOKIE, item)
+        if name == "hidden_fields" and isinstance(value, dict):
+            for hidden in value:
+                _add(markers, MarkerKind.LOGIN_FIELD, hidden)
+    return markers
+
+
+def _parser_markers(node: Any) -> set[Marker]:
+    """Markers from a dumped parser config, found by key shape."""
+    markers: set[Marker] = set()
+    for item in _walk(node):
+        resource = item.get("resource")
+        if isinstance(resource, str) and resource.startswith("/"):
+            _add(markers, MarkerKind.PATH, resource)
+        for function in item.get("functions") or []:
+            if isinstance(function, dict):
+                _add(markers, MarkerKind.JS_FUNCTION, function.get("name"))
+        _add(markers, MarkerKind.JS_VARIABLE, item.get("variable"))
+        if item.get("format") == "javascript_vars":
+            for mapping in item.get("fields") or []:
+                _add(markers, MarkerKind.JS_VARIABLE, mapping.get("source"))
+        if item.get("type") == "header_text":
+            _add(markers, MarkerKind.TEXT, item.get("match"))
+        _add(markers, MarkerKind.TEXT, item.get("label"))
+    return markers
+
+
+def _walk(node: Any) -> Iterator[dict[str, Any]]:
+    if isinstance(node, dict):
+        yield node
+        for value in node.values():
+            yield from _walk(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _walk(value)
+
+
+def _har_markers(har_path: Path) -> set[Marker]:
+    """Page titles and Basic auth realms recorded in a HAR fixture."""
+    markers: set[Marker] = set()
+    try:
+        for entry in iter_har_entries(har_path, resolve_lfs=False):
+            response = entry.get("response", {})
+            for header in response.get("headers", []):
+                if header.get("name", "").lower() == "www-authenticate":
+                    for realm in _REALM_RE.findall(header.get("value", "")):
+                        _add(markers, MarkerKind.REALM, realm)
+            body = response.get("content", {}).get("text") or ""
+            title = _TITLE_RE.search(body)
+            if title:
+                _add(markers, MarkerKind.TITLE, " ".join(title.group(1).split()))
+    except LfsPointerError:
+        return set()
+    except (OSError, ValueError, AttributeError) as e:
+        _logger.debug("Unreadable HAR fixture %s: %s", har_path, e)
+        return set()
+    return markers
+
+
+# ------------------------------------------------------------------
+# Ranking
+# ------------------------------------------------------------------
+
+
+class _PageView:
+    """Lowercased views of a page, computed once per ranking."""
+
+    def __init__(self, page: ObservedPage) -> None:
+        self.paths = {page.path.lower(), page.final_path.lower()} if page.status_code < 400 else set()
+        self.text = page.text.lower()
+        title = _TITLE_RE.search(page.text)
+        self.title = " ".join(title.group(1).split()).lower() if title else ""
+        self.realms = {r.lower() for r in _REALM_RE.findall(page.headers.get("www-authenticate", ""))}
+        self.cookies = {c.split("=", 1)[0].strip().lower() for c in page.headers.get("set-cookie", "").split(",")}
+
+    def matches(self, marker: Marker) -> bool:
+        kind, value = marker.kind, marker.value.lower()
+        if kind is MarkerKind.TITLE:
+            return bool(self.title) and (value == self.title or value in self.title)
+        if kind is MarkerKind.REALM:
+            return value in self.realms
+        if kind is MarkerKind.COOKIE:
+            return value in self.cookies
+        if kind in (MarkerKind.PATH, MarkerKind.ENDPOINT):
+            return value in self.paths or value in self.text
+        if kind is MarkerKind.JS_FUNCTION:
+            return re.search(rf"function\s+{re.escape(value)}\s*\(", self.text) is not None
+        if kind is MarkerKind.JS_VARIABLE:
+            return re.search(rf"\b{re.escape(value)}\s*=", self.text) is not None
+        if kind is MarkerKind.LOGIN_FIELD:
+            return re.search(rf"""(?:name|id)\s*=\s*["']?{re.escape(value)}\b""", self.text) is not None
+        if kind in (MarkerKind.MODEL, MarkerKind.MANUFACTURER):
+            return re.search(rf"(?<![a-z0-9]){re.escape(value)}(?![a-z0-9])", self.text) is not None
+        return value in self.text
+
+
+def rank_candidates(index: FingerprintIndex, pages: Iterable[ObservedPage], *, limit: int = 5) -> list[Candidate]:
+    """Score every fingerprint against observed pages.
+
+    A marker counts once however many pages show it.
+
+    Args:
+        index: Fingerprint index.
+        pages: Unauthenticated responses from the modem.
+        limit: Maximum candidates to return.
+
+    Returns:
+        Candidates with a positive score, best first.
+    """
+    views = [_PageView(page) for page in pages]
+    seen: dict[Marker, bool] = {}
+    candidates: list[Candidate] = []
+    for fp in index.fingerprints:
+        matched = []
+        for marker in fp.markers:
+            hit = seen.get(marker)
+            if hit is None:
+                hit = seen[marker] = any(view.matches(marker) for view in views)
+            if hit:
+                matched.append(marker)
+        if not matched:
+            continue
+        candidates.append(
+            Candidate(
+                modem_dir=fp.modem_dir,
+                variant=fp.variant,
+                manufacturer=fp.manufacturer,
+                model=fp.model,
+                score=round(sum(index.weight(m) for m in matched), 3),
+                matched=tuple(sorted(f"{m.kind}:{m.value}" for m in matched)),
+            )
+        )
+    candidates.sort(key=lambda c: (-c.score, c.modem_dir, c.variant or ""))
+    return candidates[:limit]
+
+
+# ------------------------------------------------------------------
+# Detection
+# ------------------------------------------------------------------
+
+
+def identify_modem(
+    base_url: str,
+    catalog_path: Path,
+    *,
+    session: requests.Session | None = None,
+    legacy_ssl: bool = False,
+    timeout: float = _DEFAULT_TIMEOUT,
+    max_requests: int = 2,
+    limit: int = 5,
+) -> Identification:
+    """Rank catalog models for the modem at *base_url*.
+
+    Fetches ``/`` without credentials and ranks fingerprints against
+    it. When *max_requests* allows and the result is empty or the top
+    two are within 20%, fetches one more page — a data page the
+    leader declares and the runner-up does not, or the catalog's most
+    common data page when nothing matched — and re-ranks.
+
+    Args:
+        base_url: Modem URL including scheme (e.g., ``http://192.168.100.1``).
+        catalog_path: Root of the catalog modems directory.
+        session: Optional session; a fresh one is created otherwise.
+        legacy_ssl: Use legacy TLS ciphers for a new session.
+        timeout: Per-request timeout in seconds.
+        max_requests: 1 or 2.
+        limit: Maximum candidates to return.
+
+    Returns:
+        Identification with ranked candidates.
+
+    Raises:
+        ConnectionError: If the first request fails.
+    """
+    start = time.monotonic()
+    index = build_fingerprint_index(catalog_path)
+    own_session = session is None
+    http = session or create_session(legacy_ssl=legacy_ssl)
+    base_url = base_url.rstrip("/")
+    pages: list[ObservedPage] = []
+    try:
+        first = _fetch(http, base_url, "/", timeout)
+        if first is None:
+            raise ConnectionError(f"Cannot reach {base_url}")
+        pages.append(first)
+        candidates = rank_candidates(index, pages, limit=limit)
+
+        if max_requests > 1:
+            probe = _next_probe(index, candidates, {first.path, first.final_path})
+            second = _fetch(http, base_url, probe, timeout) if probe else None
+            if second is not None:
+                pages.append(second)
+                candidates = rank_candidates(index, pages, limit=limit)
+    finally:
+        if own_session:
+            http.close()
+
+    elapsed = time.monotonic() - start
+    _logger.info(
+        "Identified %s in %.0f ms over %d request(s): %s",
+        base_url,
+        elapsed * 1000,
+        len(pages),
+        ", ".join(f"{c.model} ({c.score})" for c in candidates[:3]) or "no match",
+    )
+    return Identification(candidates=candidates, pages=[p.path for p in pages], elapsed=elapsed)
+
+
+def _next_probe(index: FingerprintIndex, candidates: list[Candidate], fetched: set[str]) -> str | None:
+    """Pick the page most likely to separate the top candidates."""
+    if not candidates:
+        return next((p for p in index.common_paths() if p not in fetched), None)
+    if len(candidates) < 2 or candidates[1].score < candidates[0].score * _AMBIGUITY_RATIO:
+        return None
+
+    paths = {
+        (fp.modem_dir, fp.variant): {m.value for m in fp.markers if m.kind is MarkerKind.PATH}
+        for fp in index.fingerprints
+    }
+    leader = paths.get((candidates[0].modem_dir, candidates[0].variant), set())
+    runner_up = paths.get((candidates[1].modem_dir, candidates[1].variant), set())
+    for path in sorted(leader ^ runner_up):
+        if path not in fetched:
+            return path
+    return None
+
+
+def _fetch(session: requests.Session, base_url: str, path: str, timeout: float) -> ObservedPage | None:
+    try:
+        resp = session.get(f"{base_url}{path}", timeout=timeout, verify=False, allow_redirects=True)
+    except requests.RequestException as e:
+        _logger.debug("Identification request %s failed: %s", path, e)
+        return None
+    return ObservedPage(
+        path=path,
+        final_path=urlsplit(resp.url).path or "/",
+        status_code=resp.status_code,
+        headers={k.lower(): v for k, v in resp.headers.items()},
+        text=resp.text,
+    )
@@ -0,0 +1,60 @@
+"""JSON decoding — orjson when installed, stdlib otherwise.
+
+JSON-transport modems return sizable documents on every poll. ``orjson``
+parses them several times faster than the stdlib; it is an optional
+extra (``pip install solentlabs-cable-modem-monitor-core[orjson]``).
+
+Decoding is exact: any document orjson rejects — NaN/Infinity
+literals, lone surrogates, non-UTF-8 bytes, nesting deeper than 1024 —
+is re-parsed by ``json.loads``, so the result (or the
+``json.JSONDecodeError``) is what the stdlib gives. orjson reads
+integers beyond 64 bits as floats instead of rejecting them, so a
+document with a run of 19 or more digits goes to the stdlib directly.
+
+Encoding stays on ``json.dumps``: orjson's output differs (UTF-8 rather
+than ``\\u`` escapes, ``null`` for NaN), and what the poller writes must
+not depend on an optional extra.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+try:
+    import orjson  # type: ignore[import-not-found]  # optional [orjson] extra, may be absent
+except ImportError:
+    orjson = None
+
+# Shortest digit run that can exceed a 64-bit integer. Also matches long
+# digit strings and float mantissas, which only cost the fast path.
+_LONG_DIGITS_TEXT_RE = re.compile("[0-9]{19}")
+_LONG_DIGITS_BYTES_RE = re.compile(b"[0-9]{19}")
+
+
+def decode_json(data: str | bytes) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: Document text, or bytes in UTF-8, UTF-16 or UTF-32 as
+            accepted by ``json.loads``.
+
+    Returns:
+        The decoded value.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+    """
+    if orjson is not None and not _has_long_digits(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _has_long_digits(data: str | bytes) -> bool:
+    if isinstance(data, str):
+        return _LONG_DIGITS_TEXT_RE.search(data) is not None
+    return _LONG_DIGITS_BYTES_RE.search(data) is not None
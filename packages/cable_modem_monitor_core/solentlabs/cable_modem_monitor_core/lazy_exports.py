@@ -0,0 +1,50 @@
+"""Deferred module attributes (PEP 562).
+
+Core is imported on Home Assistant's event loop when the integration
+loads, but one config entry uses one auth strategy and one or two
+parser formats. Packages that re-export every implementation
+(``auth``, ``parsers``) and the parser registry resolve those names
+on first attribute access instead, so bs4, lxml and unused strategies
+load in the executor the first time they are needed.
+
+The import-time budget is enforced by ``tests/test_import_budget.py``.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def lazy_exports(package: str, exports: Mapping[str, str]) -> Callable[[str], Any]:
+    """Build a module-level ``__getattr__`` that imports names on demand.
+
+    The resolved value is stored on the module, so later lookups are
+    plain attribute reads and ``unittest.mock.patch`` works as usual.
+
+    Args:
+        package: ``__name__`` of the module installing the hook.
+        exports: Attribute name → module path, relative to *package*'s
+            package (e.g., ``{"FormAuthManager": ".form"}``).
+
+    Returns:
+        A function to assign to the module's ``__getattr__``.
+    """
+    anchor = package if _is_package(package) else package.rpartition(".")[0]
+
+    def __getattr__(name: str) -> Any:  # noqa: N807 — installed as the module hook
+        module_path = exports.get(name)
+        if module_path is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_path, anchor), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
+
+
+def _is_package(name: str) -> bool:
+    module = sys.modules.get(name)
+    return module is not None and hasattr(module, "__path__")
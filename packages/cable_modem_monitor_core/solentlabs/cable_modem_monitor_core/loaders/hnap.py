@@ -16,6 +16,7 @@ from typing import TYPE_CHECKING, Any
 
 import requests
 
+from ..json_codec import decode_json
 from ..protocol.hnap import HNAP_ENDPOINT, HNAP_NAMESPACE, compute_auth_header
 from .diagnostics import describe_request
 
@@ -147,7 +148,7 @@ class HNAPLoader:
             )
 
         try:
-            data = response.json()
+            data = decode_json(_json_body(response))
         except (ValueError, TypeError) as e:
             raise HNAPLoadError(
                 f"HNAP response is not valid JSON: {e}",
@@ -229,3 +230,12 @@ def _strip_response_suffix(response_key: str) -> str:
     if response_key.endswith("Response"):
         return response_key[: -len("Response")]
     return response_key
+
+
+def _json_body(response: requests.Response) -> str | bytes:
+    """Return the body as ``response.json()`` would decode it.
+
+    The raw bytes when no charset is known (the decoder detects UTF-8,
+    -16 or -32), else the text in the declared charset.
+    """
+    return response.content if response.encoding is None else response.text
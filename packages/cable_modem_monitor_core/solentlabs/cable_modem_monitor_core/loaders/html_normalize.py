@@ -3,11 +3,16 @@
 Applied at the input boundary (loaders and HAR extraction) so all parsers
 receive normalized HTML. Centralizing normalization here means parser-level
 workarounds stay out of format-specific code.
+
+``normalize_html_chunks`` applies the same normalization to a body that
+arrives in pieces (streaming loads), with output identical to
+``normalize_html`` of the whole body.
 """
 
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable, Iterator
 
 # Firmware emits <th>Label</td><td>val</td>... where <th> is closed with
 # </td> instead of </th>. html.parser (via BS4) nests the following <td>
@@ -18,7 +23,59 @@ import re
 # well-formed tables.
 _UNCLOSED_TH_RE = re.compile(r"(<th\b[^>]*>)([^<]*)(</td>)", re.IGNORECASE)
 
+# Where a ``_UNCLOSED_TH_RE`` match can start.
+_TH_OPEN_RE = re.compile(r"<th\b", re.IGNORECASE)
+
 
 def normalize_html(text: str) -> str:
     """Normalize known malformed HTML patterns before passing to BS4."""
     return _UNCLOSED_TH_RE.sub(r"\1\2</th>", text)
+
+
+def normalize_html_chunks(chunks: Iterable[str]) -> Iterator[str]:
+    """Normalize HTML that arrives in pieces.
+
+    Text is held back only from the first ``<th`` whose match cannot
+    be decided yet; everything before it is normalized and yielded.
+    The yielded pieces join to ``normalize_html("".join(chunks))``.
+
+    Args:
+        chunks: Consecutive pieces of the HTML text.
+
+    Yields:
+        Consecutive pieces of the normalized text.
+    """
+    pending = ""
+    for chunk in chunks:
+        pending += chunk
+        settled = _settled_length(pending)
+        if settled:
+            yield normalize_html(pending[:settled])
+            pending = pending[settled:]
+    if pending:
+        yield normalize_html(pending)
+
+
+def _settled_length(text: str) -> int:
+    """Length of the prefix of *text* whose normalization more text cannot change.
+
+    A match is fixed by the first ``>`` after its ``<th`` and the first
+    ``<`` after that, which must open ``</td>``. Once both are present
+    and that tag is complete (or already not ``</td>``), the attempt is
+    decided either way. The prefix ends at the first undecided attempt,
+    or at a trailing ``<`` / ``<t`` that may still become one.
+    """
+    for match in _TH_OPEN_RE.finditer(text):
+        start = match.start()
+        tag_end = text.find(">", start)
+        if tag_end < 0:
+            return start
+        closing = text.find("<", tag_end)
+        if closing < 0:
+            return start
+        if len(text) - closing < len("</td>") and "</td>".startswith(text[closing:].lower()):
+            return start
+    for partial in ("<t", "<"):
+        if text[-len(partial) :].lower() == partial:
+            return len(text) - len(partial)
+    return len(text)
@@ -0,0 +1,200 @@
+"""Streaming HTML parsing — build the soup while the body downloads.
+
+The buffered loader waits for the whole body, decodes it, normalizes
+it and only then hands it to html.parser. For a streaming load the
+decoded text arrives in pieces; ``parse_html_chunks`` normalizes each
+piece (``normalize_html_chunks``) and feeds it straight into
+html.parser, which builds the tree incrementally. Tree construction
+overlaps the transfer.
+
+html.parser is incremental, but its recovery from some malformed
+markup depends on where its buffer ends. Pieces are therefore re-cut
+at boundaries where it is not (``_feed_pieces``), so the soup is the
+one ``BeautifulSoup(normalize_html(text), "html.parser")`` builds from
+the joined text.
+
+Feeding one parser in pieces relies on bs4 4.14.3+, whose html.parser
+tree builder accepts a parser subclass (the private ``_parser_class``
+argument); pyproject pins that lower bound. Should a release drop it,
+the pieces are joined and parsed once, as the buffered path does.
+
+See RESOURCE_LOADING_SPEC.md Streaming HTML section.
+"""
+
+from __future__ import annotations
+
+import inspect
+import re
+from collections.abc import Iterable, Iterator
+from typing import cast
+
+from bs4 import BeautifulSoup
+from bs4.builder._htmlparser import BeautifulSoupHTMLParser, HTMLParserTreeBuilder
+
+from .html_normalize import normalize_html_chunks
+
+# A character reference as html.parser matches it (``charref``).
+_CHARREF_RE = re.compile(r"&#(?:[0-9]+|[xX][0-9a-fA-F]+)[^0-9a-fA-F]")
+
+# The start of any entity or character reference, up to its terminator.
+_REFERENCE_RE = re.compile(r"&[#a-zA-Z][-.a-zA-Z0-9]*")
+
+_WHITESPACE = frozenset(" \t\n\r\f")
+
+# bs4 4.14.3+ builds html.parser trees with a caller-supplied parser class.
+_FEEDS_IN_PIECES = "_parser_class" in inspect.signature(HTMLParserTreeBuilder.feed).parameters
+
+
+def parse_html_chunks(chunks: Iterable[str]) -> BeautifulSoup:
+    """Parse HTML text arriving in pieces into a ``BeautifulSoup``.
+
+    *chunks* is consumed as the tree is built, so a lazy iterator over
+    a response body overlaps parsing with the download.
+
+    Args:
+        chunks: Consecutive pieces of the (un-normalized) HTML text.
+
+    Returns:
+        The soup ``normalize_html`` plus html.parser would build from
+        the joined text.
+    """
+    normalized = normalize_html_chunks(chunks)
+    if not _FEEDS_IN_PIECES:
+        return BeautifulSoup("".join(normalized), "html.parser")
+    return BeautifulSoup("", builder=_ChunkTreeBuilder(_feed_pieces(normalized)))
+
+
+def _feed_pieces(chunks: Iterable[str]) -> Iterator[str]:
+    """Re-cut *chunks* into pieces html.parser parses as it would the whole.
+
+    Each piece ends just before a ``<``. A tag, comment or script cut
+    off there is incomplete, and html.parser waits for the rest; a cut
+    anywhere else can be decided early and differently — a ``>``
+    inside a quoted attribute value can end the tag, and a reference
+    at the end of the buffer (``&nbsp-`` | ``->``) is terminated there.
+    Text from that ``<`` on waits for the next chunk.
+
+    A ``&#`` that starts no character reference makes html.parser stop
+    the pass it is in; a one-shot parse resumes once, at ``close()``,
+    while every further ``feed()`` would resume it again. Everything
+    from the first such ``&#`` is therefore fed as one final piece.
+    """
+    chunks = iter(chunks)
+    pending = ""
+    for chunk in chunks:
+        pending += chunk
+        cut = _piece_end(pending, len(pending))
+        stall = _first_bare_charref(pending, cut)
+        if stall >= 0:
+            cut = _piece_end(pending, stall)
+            if cut > 0:
+                yield pending[:cut]
+            yield "".join([pending[max(cut, 0) :], *chunks])
+            return
+        if cut > 0:
+            yield pending[:cut]
+            pending = pending[cut:]
+    if pending:
+        yield pending
+
+
+def _piece_end(text: str, end: int) -> int:
+    """Index of the last ``<`` before *end* a piece can end at, or -1.
+
+    Reference names may contain ``.`` and ``-``, so html.parser would
+    end ``&nbsp.`` at the ``.`` if the buffer stopped there. A quoted
+    value may span the ``<`` (``b= '...>...<...'``); cut off inside it,
+    html.parser can read the quote as an attribute name and end the
+    tag at the first ``>`` in the value.
+    """
+    cut = text.rfind("<", 0, end)
+    while cut > 0:
+        amp = text.rfind("&", 0, cut)
+        if amp >= 0 and _REFERENCE_RE.fullmatch(text, amp, cut):
+            cut = text.rfind("<", 0, amp)
+            continue
+        quote = _open_quote(text, cut)
+        if quote >= 0:
+            cut = text.rfind("<", 0, quote)
+            continue
+        break
+    return cut
+
+
+def _open_quote(text: str, end: int) -> int:
+    """Index of a quote before *end* that may still be open, or -1.
+
+    Only the last quote of each kind can be open, and only if it opens
+    an attribute value (``_opens_value``). Quotes in text, scripts and
+    closed values (``class=""``) leave the cut where it is.
+    """
+    candidates = [at for at in (text.rfind("'", 0, end), text.rfind('"', 0, end)) if _opens_value(text, at)]
+    return min(candidates, default=-1)
+
+
+def _opens_value(text: str, quote: int) -> bool:
+    """True if the quote at *quote* opens an attribute value.
+
+    It must follow ``=`` (and optional whitespace) inside the start tag
+    that begins at the last ``<`` + letter before it: no ``>`` outside
+    a quoted value between that tag's start and the quote, and the
+    quote not inside another value.
+    """
+    if quote <= 0 or not _follows_equals(text, quote):
+        return False
+    tag = text.rfind("<", 0, quote)
+    while tag >= 0 and not text[tag + 1 : tag + 2].isalpha():
+        tag = text.rfind("<", 0, tag)
+    if tag < 0:
+        return False
+    in_value = ""
+    for at in range(tag + 1, quote):
+        char = text[at]
+        if in_value:
+            if char == in_value:
+                in_value = ""
+        elif char == ">":
+            return False
+        elif char in "'\"" and _follows_equals(text, at):
+            in_value = char
+    return not in_value
+
+
+def _follows_equals(text: str, at: int) -> bool:
+    """True if ``=`` and optional whitespace precede *at*."""
+    at -= 1
+    while at >= 0 and text[at] in _WHITESPACE:
+        at -= 1
+    return at >= 0 and text[at] == "="
+
+
+def _first_bare_charref(text: str, end: int) -> int:
+    """Index of the first ``&#`` before *end* that starts no character reference, or -1."""
+    at = text.find("&#", 0, end)
+    while at >= 0:
+        if not _CHARREF_RE.match(text, at):
+            return at
+        at = text.find("&#", at + 2, end)
+    return -1
+
+
+class _ChunkParser(BeautifulSoupHTMLParser):
+    """Feeds every piece from its builder's iterator to html.parser."""
+
+    def feed(self, data: str) -> None:
+        """Feed the builder's pieces in order; *data* is the empty placeholder."""
+        builder = cast("_ChunkTreeBuilder", self.soup.builder)
+        for chunk in builder.chunks:
+            super().feed(chunk)
+
+
+class _ChunkTreeBuilder(HTMLParserTreeBuilder):
+    """html.parser tree builder fed from an iterator instead of one string."""
+
+    def __init__(self, chunks: Iterator[str]) -> None:
+        super().__init__()
+        self.chunks = chunks
+
+    def feed(self, markup: str | bytes, _parser_class: type[BeautifulSoupHTMLParser] = _ChunkParser) -> None:
+        """Build the tree from ``chunks``; *markup* is the empty placeholder."""
+        super().feed(markup, _parser_class=_parser_class)
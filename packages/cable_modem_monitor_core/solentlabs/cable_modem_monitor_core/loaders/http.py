@@ -10,16 +10,19 @@ See RESOURCE_LOADING_SPEC.md.
 from __future__ import annotations
 
 import base64
+import codecs
 import json
 import logging
+import re
 import time
+from collections.abc import Iterator
 from typing import Any
 
 import requests
-from bs4 import BeautifulSoup
 
 from ..auth.base import AuthResult
 from ..fetch_list import ResourceTarget
+from ..json_codec import decode_json
 from ..models.parser_config.config import ALL_FORMAT_MODELS
 from ..models.parser_config.format_registry import lookup_decode_kind
 from .diagnostics import describe_request
@@ -27,6 +30,18 @@ from .html_normalize import normalize_html
 
 _logger = logging.getLogger(__name__)
 
+# Characters of a 401/403 body kept on ResourceLoadError. The collector
+# logs at most 500; the rest only has to show that truncation happened.
+_ERROR_BODY_MAX = 4096
+
+# Bytes read per chunk when streaming an HTML body into the parser.
+_STREAM_CHUNK_SIZE = 16 * 1024
+
+# Codecs (``codecs.lookup`` names) whose incremental decoder yields
+# exactly what ``Response.text`` decodes in one go. BOM-sniffing codecs
+# (UTF-16/32) and stateful ones (ISO-2022) are read whole instead.
+_STREAMED_CODECS = frozenset({"utf-8", "utf-8-sig", "iso8859-1", "cp1252", "ascii"})
+
 
 def _decode_kind(fmt: str) -> str:
     """Return the loader's decode_kind for a format tag, or empty string."""
@@ -55,6 +70,13 @@ class HTTPResourceLoader:
             ``LoginPageDetectedError`` if detected. Enable for
             form-based auth strategies where the modem silently serves
             a login page at data URLs when the session expires.
+        stream_html: When True, HTML resources are parsed while they
+            download: the body is decoded and fed to html.parser chunk
+            by chunk, so tree construction overlaps the transfer. The
+            tree is the one the buffered path builds. Base64 bodies,
+            and bodies whose charset the server does not declare or
+            is not UTF-8/Latin-1, are read whole as usual. The recorded
+            duration then includes the parse.
     """
 
     def __init__(
@@ -68,6 +90,8 @@ class HTTPResourceLoader:
         model: str = "",
         query_params: dict[str, str] | None = None,
         headers: frozenset[str] = frozenset(),
+        *,
+        stream_html: bool = False,
     ) -> None:
         self._session = session
         self._base_url = base_url.rstrip("/")
@@ -78,6 +102,7 @@ class HTTPResourceLoader:
         self._model = model
         self._query_params = query_params or {}
         self._headers = headers
+        self._stream_html = stream_html
         self.resource_fetches: list[tuple[str, float, int, int, str]] = []
         self.decode_errors: list[tuple[str, str, str]] = []  # (path, fmt, reason)
 
@@ -127,9 +152,11 @@ class HTTPResourceLoader:
 
             # Fetch the page
             url = self._build_url(target.path)
+            stream = self._stream_html and target.encoding != "base64" and _decode_kind(target.format) == "html"
             start = time.monotonic()
             try:
-                response = self._session.get(url, timeout=self._timeout)
+                response = self._get(url, stream)
+                text, size, soup = _read_body(response, stream)
             except requests.RequestException as e:
                 raise ResourceLoadError(
                     f"Failed to fetch {target.path}: {type(e).__name__}: {e}",
@@ -151,7 +178,7 @@ class HTTPResourceLoader:
                 target.path,
                 self._model,
                 response.status_code,
-                len(response.content),
+                size,
                 elapsed_ms,
             )
             content_type = response.headers.get("Content-Type", "")
@@ -159,7 +186,7 @@ class HTTPResourceLoader:
                 (
                     target.path,
                     round(elapsed_ms, 1),
-                    len(response.content),
+                    size,
                     response.status_code,
                     content_type,
                 )
@@ -171,7 +198,7 @@ class HTTPResourceLoader:
                     status_code=response.status_code,
                     path=target.path,
                     request_line=describe_request(response.request, headers=self._headers),
-                    response_body=response.text,
+                    response_body=text[:_ERROR_BODY_MAX],
                     content_type=content_type,
                 )
 
@@ -191,7 +218,7 @@ class HTTPResourceLoader:
                 self._detect_login_pages
                 and response.status_code == 200
                 and _decode_kind(target.format) == "html"
-                and _is_login_page(response.text)
+                and _is_login_page(text)
             ):
                 _logger.warning(
                     "Data page %s appears to be a login page" " — session: cookies=%s basic_auth=%s",
@@ -201,10 +228,19 @@ class HTTPResourceLoader:
                 )
                 raise LoginPageDetectedError(target.path)
 
-            self._store_decoded(resources, target.path, response.text, target.format, target.encoding)
+            if soup is not None:
+                resources[target.path] = soup
+            else:
+                self._store_decoded(resources, target.path, text, target.format, target.encoding)
 
         return resources
 
+    def _get(self, url: str, stream: bool) -> requests.Response:
+        """GET *url*; with *stream*, return once the headers are in."""
+        if stream:
+            return self._session.get(url, timeout=self._timeout, stream=True)
+        return self._session.get(url, timeout=self._timeout)
+
     def _store_decoded(
         self,
         resources: dict[str, Any],
@@ -244,7 +280,8 @@ class ResourceLoadError(Exception):
             None for connection/timeout errors.
         path: Resource path that failed (e.g., "/status.html").
         request_line: Sanitized description of the request we sent.
-        response_body: Raw response body; the caller scrubs it before logging.
+        response_body: Raw response body, at most ``_ERROR_BODY_MAX``
+            characters; the caller scrubs it before logging.
         content_type: Response Content-Type, for reading the body correctly.
     """
 
@@ -283,6 +320,61 @@ class LoginPageDetectedError(ResourceLoadError):
         )
 
 
+def _read_body(response: requests.Response, stream: bool) -> tuple[str, int, Any]:
+    """Read a response body as ``(text, size in bytes, soup or None)``.
+
+    A streamed success response with a declared charset is decoded
+    incrementally and parsed as it arrives (``parse_html_chunks``); the
+    soup is returned with the text, which login detection still needs.
+    Everything else is read whole and the soup is ``None``.
+    """
+    decoder = _incremental_decoder(response) if stream and response.status_code < 400 else None
+    if decoder is None:
+        # ``Response.text`` decodes the body on every access (and
+        # sniffs the charset when the server sent none), so decode
+        # once and hand the same string to detection and decoding.
+        return response.text, len(response.content), None
+
+    # Deferred: JSON/HNAP/XML modems never need bs4.
+    from .html_stream import parse_html_chunks
+
+    pieces: list[str] = []
+    size = 0
+
+    def decoded() -> Iterator[str]:
+        nonlocal size
+        for chunk in response.iter_content(_STREAM_CHUNK_SIZE):
+            size += len(chunk)
+            pieces.append(decoder.decode(chunk))
+            yield pieces[-1]
+        pieces.append(decoder.decode(b"", final=True))
+        yield pieces[-1]
+
+    try:
+        soup = parse_html_chunks(decoded())
+    finally:
+        response.close()
+    text = "".join(pieces)
+    return text, size, soup if text else None
+
+
+def _incremental_decoder(response: requests.Response) -> codecs.IncrementalDecoder | None:
+    """Decoder for the body's declared charset, as ``Response.text`` decodes it.
+
+    ``None`` when there is no declared charset — ``Response.text`` then
+    sniffs one from the whole body — or it is not in ``_STREAMED_CODECS``.
+    """
+    if response.encoding is None:
+        return None
+    try:
+        codec = codecs.lookup(response.encoding)
+    except LookupError:
+        return None
+    if codec.name not in _STREAMED_CODECS:
+        return None
+    return codec.incrementaldecoder(errors="replace")
+
+
 def _decode_response(
     text: str,
     fmt: str,
@@ -307,11 +399,14 @@ def _decode_response(
     kind = _decode_kind(fmt)
 
     if kind == "html":
+        # Deferred: JSON/HNAP/XML modems never need bs4.
+        from bs4 import BeautifulSoup
+
         return BeautifulSoup(normalize_html(text), "html.parser"), None
 
     if kind == "json":
         try:
-            data = json.loads(text)
+            data = decode_json(text)
         except json.JSONDecodeError:
             return None, "invalid JSON"
         if not isinstance(data, dict):
@@ -326,6 +421,11 @@ def _decode_response(
     return None, f"unsupported decode kind '{kind}' for format '{fmt}'"
 
 
+# ``type="password"`` or ``type='password'`` in any ASCII letter case.
+# Searched in place: no lowercased copy of the page is made.
+_PASSWORD_INPUT_RE = re.compile(r"""type=(?:"password"|'password')""", re.IGNORECASE | re.ASCII)
+
+
 def _is_login_page(text: str) -> bool:
     """Check if an HTML response contains login form indicators.
 
@@ -336,5 +436,4 @@ def _is_login_page(text: str) -> bool:
 
     See RESOURCE_LOADING_SPEC.md Login Page Detection section.
     """
-    lower = text.lower()
-    return 'type="password"' in lower or "type='password'" in lower
+    return _PASSWORD_INPUT_RE.search(text) is not None
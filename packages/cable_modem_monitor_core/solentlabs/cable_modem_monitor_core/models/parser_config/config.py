@@ -18,7 +18,12 @@ from .javascript import JSEmbeddedSection
 from .js_json import JSJsonSection
 from .json_format import JSONSection
 from .json_transposed import JSONTransposedSection
-from .system_info import SYSTEM_INFO_SOURCE_MODELS, SystemInfoSection
+from .system_info import (
+    CORE_SYSTEM_INFO_FIELDS,
+    SYSTEM_INFO_SOURCE_MODELS,
+    SystemInfoSection,
+    source_field_names,
+)
 from .table import HTMLTableSection
 from .transposed import HTMLTableTransposedSection
 from .xml_format import XMLSection
@@ -135,6 +140,11 @@ class ParserConfig(BaseModel):
 
     The ``aggregate`` section declares derived fields computed from
     channel data (e.g., error totals). See PARSING_SPEC.md § Aggregate.
+
+    ``refresh_every`` puts system_info resources that only change on
+    reboot (version pages, provisioning) on a slower tier: resource
+    path → number of polls between fetches. See PARSING_SPEC.md
+    § Refresh Tiers.
     """
 
     model_config = ConfigDict(extra="forbid")
@@ -144,6 +154,7 @@ class ParserConfig(BaseModel):
     system_info: SystemInfoSection | None = None
     aggregate: dict[str, AggregateField] = Field(default_factory=dict)
     computed: dict[str, ComputedField] = Field(default_factory=dict)
+    refresh_every: dict[str, int] = Field(default_factory=dict)
 
     @model_validator(mode="after")
     def validate_has_sections(self) -> ParserConfig:
@@ -151,3 +162,49 @@ class ParserConfig(BaseModel):
         if self.downstream is None and self.upstream is None and self.system_info is None:
             raise ValueError("parser.yaml must have at least one section " "(downstream, upstream, or system_info)")
         return self
+
+    @model_validator(mode="after")
+    def validate_refresh_every(self) -> ParserConfig:
+        """Ensure slow-tier resources are system_info-only and skip Core fields.
+
+        A resource a channel section reads changes every poll, and one
+        that feeds ``system_uptime`` or ``docsis_status`` (directly or
+        through a computed field) is read by Core on every poll.
+        """
+        if not self.refresh_every:
+            return self
+        channel_paths = {
+            getattr(section, "resource", "") for section in (self.downstream, self.upstream) if section is not None
+        }
+        fields_by_path = self._system_info_fields_by_path()
+        every_poll = self._every_poll_fields()
+        for path, polls in self.refresh_every.items():
+            if polls < 1:
+                raise ValueError(f"refresh_every[{path!r}] must be at least 1 poll, got {polls}")
+            if path in channel_paths:
+                raise ValueError(f"refresh_every[{path!r}]: resource is read by a channel section")
+            if path not in fields_by_path:
+                raise ValueError(f"refresh_every[{path!r}]: no system_info source reads this resource")
+            pinned = sorted(fields_by_path[path] & every_poll)
+            if pinned:
+                raise ValueError(f"refresh_every[{path!r}]: resource feeds {', '.join(pinned)}, read every poll")
+        return self
+
+    def _system_info_fields_by_path(self) -> dict[str, set[str]]:
+        """Map each system_info resource path to the fields its sources produce."""
+        fields_by_path: dict[str, set[str]] = {}
+        if self.system_info is None:
+            return fields_by_path
+        for source in self.system_info.sources:
+            path = getattr(source, "resource", "")
+            if path:
+                fields_by_path.setdefault(path, set()).update(source_field_names(source))
+        return fields_by_path
+
+    def _every_poll_fields(self) -> set[str]:
+        """Core fields plus the inputs of computed fields that produce them."""
+        fields = set(CORE_SYSTEM_INFO_FIELDS)
+        for name, computed in self.computed.items():
+            if name in CORE_SYSTEM_INFO_FIELDS:
+                fields.update(computed.inputs.values())
+        return fields
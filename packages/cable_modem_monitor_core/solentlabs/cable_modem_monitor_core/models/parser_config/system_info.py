@@ -389,8 +389,32 @@ else:
     ]
 
 
+# system_info fields Core itself reads on every poll — the Recovery
+# reboot vote (uptime) and status derivation (docsis_status). A
+# consumer's fetch mask cannot ignore them, and a resource feeding
+# them cannot be put on a slower refresh tier.
+CORE_SYSTEM_INFO_FIELDS: frozenset[str] = frozenset({"system_uptime", "docsis_status"})
+
+
 class SystemInfoSection(BaseModel):
     """system_info section config -- multi-source."""
 
     model_config = ConfigDict(extra="forbid")
     sources: list[SystemInfoSource]
+
+
+def source_field_names(source: object) -> set[str]:
+    """Field names a system_info source produces.
+
+    JS sources nest field mappings under functions; every other
+    format carries a flat ``fields`` list, optionally plus
+    ``child_aggregates`` that each produce one field.
+    """
+    names: set[str] = set()
+    functions = getattr(source, "functions", None)
+    if functions is not None:
+        for func in functions:
+            names.update(f.field for f in func.fields)
+    names.update(f.field for f in getattr(source, "fields", None) or [])
+    names.update(a.field for a in getattr(source, "child_aggregates", None) or [])
+    return names
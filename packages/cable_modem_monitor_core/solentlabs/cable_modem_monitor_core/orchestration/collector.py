@@ -12,6 +12,7 @@ from __future__ import annotations
 import contextlib
 import logging
 import time
+from collections.abc import Callable
 from typing import Any, Final
 
 import requests
@@ -19,7 +20,7 @@ import requests
 from ..auth.base import AuthContext, AuthResult, BaseAuthManager, LoginLockoutError
 from ..auth.factory import create_auth_manager
 from ..connectivity import create_session
-from ..fetch_list import collect_fetch_targets
+from ..fetch_list import FetchMask, ResourceTarget, collect_fetch_targets
 from ..loaders.hnap import HNAPLoadError
 from ..loaders.http import (
     HTTPResourceLoader,
@@ -59,11 +60,16 @@ from .events import (
 )
 from .logging import log_event
 from .models import ModemResult, ResourceFetch
+from .refresh_tier import RefreshTier
 from .signals import CollectorSignal
 
 _logger = logging.getLogger(__name__)
 _LOGOUT_LOG_LEVEL: Final[int] = logging.DEBUG
 _DEFAULT_AUTH_LOG_LEVEL: Final[int] = logging.DEBUG
+# Stub pages are login screens and error shells, far under this; the
+# cap keeps a full data page that lost its anchors from being held
+# (and downloaded with diagnostics) whole until the next stub event.
+_STUB_BODY_MAX: Final[int] = 64 * 1024
 
 
 class ModemDataCollector:
@@ -79,6 +85,7 @@ class ModemDataCollector:
         password: str,
         *,
         legacy_ssl: bool = False,
+        stream_html: bool = False,
     ) -> None:
         self._modem_config = modem_config
         self._parser_config = parser_config
@@ -86,6 +93,9 @@ class ModemDataCollector:
         self._username = username
         self._password = password
         self._legacy_ssl = legacy_ssl
+        # Opt-in: parse HTML resources while they download
+        # (RESOURCE_LOADING_SPEC § Streaming HTML).
+        self._stream_html = stream_html
 
         # Auth manager and context
         self._auth_manager: BaseAuthManager = create_auth_manager(modem_config)
@@ -115,13 +125,27 @@ class ModemDataCollector:
         # resources its hooks read via `resources` (PARSING_SPEC).
         self._post_processor = post_processor
 
+        # Consumer fetch mask. set_fetch_mask() parks the new mask here;
+        # execute() swaps it in at the top of the next poll so fetch and
+        # parse never see different masks within one collection.
+        self._fetch_mask: FetchMask | None = None
+        self._pending_fetch_mask: FetchMask | None = None
+        self._fetch_mask_pending = False
+
+        # Slow-tier resources (parser.yaml refresh_every). Resources
+        # fetched this poll are held until parse succeeds, then
+        # committed — a stub page never gets cached.
+        self._refresh_tier = RefreshTier(parser_config.refresh_every if parser_config is not None else {})
+        self._tier_fetched: dict[str, Any] = {}
+
         # Login page detection — enable for form-based auth strategies
         self._detect_login_pages = _should_detect_login_pages(modem_config)
 
         # Per-resource timing from last successful collection
         self._last_resource_fetches: list[ResourceFetch] = []
 
-        # Stub body from last LOAD_INTEGRITY failure — kept until next event
+        # Stub body from last LOAD_INTEGRITY failure — kept until next
+        # event, capped at _STUB_BODY_MAX characters per resource
         self._last_stub_bodies: dict[str, str] = {}
 
         # system_info field outcomes (PARSING_SPEC § Field Outcomes).
@@ -134,6 +158,7 @@ class ModemDataCollector:
     def execute(self) -> ModemResult:
         """Execute one data collection."""
         start = time.monotonic()
+        self._apply_pending_fetch_mask()
 
         # Phase 1: Auth
         try:
@@ -254,11 +279,16 @@ class ModemDataCollector:
 
         self._emit_resource_fetched_events(fetches)
 
-        # Phase 3: Parse + stub-page integrity check (UC-19a)
+        # Phase 3: Parse + stub-page integrity check (UC-19a). Parse
+        # releases each page once its sections are done; the rest go
+        # here, before logout and event construction.
         parse_outcome = self._run_parse_phase(resources)
+        del resources
+        tier_fetched, self._tier_fetched = self._tier_fetched, {}
         if isinstance(parse_outcome, ModemResult):
             return parse_outcome
         data = parse_outcome
+        self._refresh_tier.commit(tier_fetched)
 
         # Phase 4: Logout (best-effort, after successful collection)
         self._execute_logout_if_needed()
@@ -348,6 +378,29 @@ class ModemDataCollector:
         # handed-out reference would change under its consumer.
         return dict(self._sysinfo_failed)
 
+    @property
+    def fetch_mask(self) -> FetchMask | None:
+        """The fetch mask in effect for the most recent collection."""
+        return self._fetch_mask
+
+    def set_fetch_mask(self, mask: FetchMask | None) -> None:
+        """Narrow future collections to what the consumer still reads.
+
+        Takes effect at the start of the next ``execute()``. ``None``
+        restores the full fetch list. Safe to call from another thread
+        than the poll thread.
+        """
+        self._pending_fetch_mask = mask
+        self._fetch_mask_pending = True
+
+    def expire_refresh_tier(self) -> None:
+        """Re-fetch every slow-tier resource on the next collection.
+
+        Called by Recovery when a window opens — a reboot may have
+        changed what those pages report (e.g. a firmware update).
+        """
+        self._refresh_tier.expire()
+
     @property
     def session(self) -> requests.Session:
         """The underlying ``requests.Session`` used for auth and loading."""
@@ -376,6 +429,26 @@ class ModemDataCollector:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _apply_pending_fetch_mask(self) -> None:
+        """Swap in a mask parked by ``set_fetch_mask()``."""
+        if not self._fetch_mask_pending:
+            return
+        self._fetch_mask_pending = False
+        mask = self._pending_fetch_mask
+        if mask is not None and mask.is_full:
+            mask = None
+        if mask == self._fetch_mask:
+            return
+        self._fetch_mask = mask
+        if self._parser_config is not None:
+            self._coordinator = ModemParserCoordinator(self._parser_config, self._post_processor, mask)
+        _logger.debug(
+            "Fetch mask updated [%s] — sections: %s, ignored system_info fields: %d",
+            self._modem_config.model,
+            ", ".join(sorted(mask.sections)) if mask else "all",
+            len(mask.ignored_system_info_fields) if mask else 0,
+        )
+
     def _build_session(self) -> requests.Session:
         """Build the ``requests.Session`` for this modem's polling lifetime."""
         session = create_session(legacy_ssl=self._legacy_ssl)
@@ -500,7 +573,7 @@ class ModemDataCollector:
         auth_result: AuthResult,
     ) -> tuple[dict[str, Any], list[ResourceFetch]]:
         """Fetch HTTP resources."""
-        targets = collect_fetch_targets(self._parser_config, self._post_processor)
+        targets = collect_fetch_targets(self._parser_config, self._post_processor, self._fetch_mask)
 
         # Prefer body-derived token from auth_context; fall back to cookie
         url_token = ""
@@ -527,12 +600,13 @@ class ModemDataCollector:
             model=self._modem_config.model,
             query_params=query_params,
             headers=self._auth_manager.headers(),
+            stream_html=self._stream_html,
         )
 
         # On session reuse, don't pass auth_result — there's no
         # login response to reuse.
         effective_auth = auth_result if self._auth_context else None
-        resources = loader.fetch(targets, effective_auth)
+        resources = self._fetch_tiered(targets, lambda due: loader.fetch(due, effective_auth))
         for path, fmt, reason in loader.decode_errors:
             log_event(
                 _logger,
@@ -565,7 +639,8 @@ class ModemDataCollector:
             timeout=self._modem_config.timeout,
             headers=self._auth_manager.headers(),
         )
-        resources = loader.fetch(self._parser_config)
+        parser_config = self._coordinator.config if self._coordinator is not None else self._parser_config
+        resources = loader.fetch(parser_config)
         return resources, _to_resource_fetches(loader.resource_fetches)
 
     def _load_cbn_resources(self) -> tuple[dict[str, Any], list[ResourceFetch]]:
@@ -577,7 +652,7 @@ class ModemDataCollector:
         from ..loaders.cbn import CBNLoader
         from ..models.modem_config.auth import FormCbnAuth
 
-        targets = collect_fetch_targets(self._parser_config, self._post_processor)
+        targets = collect_fetch_targets(self._parser_config, self._post_processor, self._fetch_mask)
 
         auth = self._modem_config.auth
         assert isinstance(auth, FormCbnAuth)
@@ -591,9 +666,31 @@ class ModemDataCollector:
             model=self._modem_config.model,
             headers=self._auth_manager.headers(),
         )
-        resources = loader.fetch(targets)
+        resources = self._fetch_tiered(targets, loader.fetch)
         return resources, _to_resource_fetches(loader.resource_fetches)
 
+    def _fetch_tiered(
+        self,
+        targets: list[ResourceTarget],
+        fetch: Callable[[list[ResourceTarget]], dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Fetch the targets that are due and merge in cached slow-tier resources.
+
+        HNAP does not come through here — its single batched request
+        gains nothing from skipping actions.
+        """
+        due, cached = self._refresh_tier.split(targets)
+        fetched = fetch(due)
+        self._tier_fetched = self._refresh_tier.slow(fetched)
+        if cached:
+            _logger.debug(
+                "Refresh tier [%s] — %d slow resource(s) served from cache: %s",
+                self._modem_config.model,
+                len(cached),
+                ", ".join(sorted(cached)),
+            )
+        return {**fetched, **cached}
+
     def _classify_hnap_error(self, exc: HNAPLoadError) -> ModemResult:
         """Route an HNAP load failure to the correct signal."""
         cause = exc.__cause__
@@ -634,7 +731,7 @@ class ModemDataCollector:
         """Parse resources into ModemData with diagnostics."""
         if self._coordinator is None:
             raise RuntimeError("No parser coordinator configured")
-        return self._coordinator.parse(resources)
+        return self._coordinator.parse(resources, release=True)
 
     def _emit_resource_fetched_events(self, fetches: list[ResourceFetch]) -> None:
         """Emit one ResourceFetched event per successfully loaded page."""
@@ -684,7 +781,7 @@ class ModemDataCollector:
                     ),
                 )
         self._last_stub_bodies = {
-            path: str(body)
+            path: _stub_body_snippet(body)
             for path in diagnostics.zero_fulfillment_resources
             if (body := resources.get(path)) is not None
         }
@@ -759,3 +856,11 @@ def _to_resource_fetches(
         )
         for r in raw
     ]
+
+
+def _stub_body_snippet(body: Any) -> str:
+    """Serialize a stub page for diagnostics, truncated to ``_STUB_BODY_MAX``."""
+    text = str(body)
+    if len(text) <= _STUB_BODY_MAX:
+        return text
+    return text[:_STUB_BODY_MAX] + f"... (truncated, {len(text)} chars)"
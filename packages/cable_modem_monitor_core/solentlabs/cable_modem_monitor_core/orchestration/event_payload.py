@@ -14,6 +14,7 @@ from __future__ import annotations
 from typing import Any
 
 from pydantic import BaseModel
+from pydantic.dataclasses import dataclass
 
 # Increment when the payload shape changes in a breaking way.
 # Consumers branch on this field to handle migrations.
@@ -29,11 +30,17 @@ class HealthInfoPayload(BaseModel):
     http_latency_ms: float | None = None
 
 
-class ChannelPayload(BaseModel):
+@dataclass(slots=True)
+class ChannelPayload:
     """Single channel entry from the modem's channel table.
 
     Parsers emit sparse dicts — all fields except channel_number are
     optional. See FIELD_REGISTRY.md for canonical field definitions.
+
+    A slotted Pydantic dataclass rather than a ``BaseModel``: every poll
+    validates one entry per channel, and a fixed-slot record is a
+    fraction of the size of a model instance's ``__dict__`` and
+    fields-set. Validation and ``model_dump()`` output are the same.
     """
 
     channel_number: int
@@ -67,6 +67,7 @@ def create_collector(
     password: str = "",
     *,
     legacy_ssl: bool = False,
+    stream_html: bool = False,
 ) -> ModemDataCollector:
     """Create a ``ModemDataCollector`` for single-shot validation.
 
@@ -82,6 +83,8 @@ def create_collector(
         username: Login credential (empty string for no-auth).
         password: Login credential (empty string for no-auth).
         legacy_ssl: Whether to use legacy SSL ciphers.
+        stream_html: Parse HTML resources while they download
+            (RESOURCE_LOADING_SPEC § Streaming HTML).
 
     Returns:
         Configured ``ModemDataCollector`` ready for ``execute()``.
@@ -94,6 +97,7 @@ def create_collector(
         username=username,
         password=password,
         legacy_ssl=legacy_ssl,
+        stream_html=stream_html,
     )
 
 
@@ -110,6 +114,8 @@ def create_orchestrator(
     supports_head: bool = True,
     http_probe: bool = True,
     model: str = "",
+    profile_memory: bool = False,
+    stream_html: bool = False,
 ) -> tuple[Orchestrator, HealthMonitor | None, ModemIdentity]:
     """Create the full orchestration graph.
 
@@ -135,6 +141,10 @@ def create_orchestrator(
         http_probe: Whether HTTP probes are enabled (from
             modem.yaml ``health.http_probe``).
         model: Model name for log messages.
+        profile_memory: Measure each poll's traced allocations
+            (``OrchestratorDiagnostics.poll_memory``).
+        stream_html: Parse HTML resources while they download
+            (RESOURCE_LOADING_SPEC § Streaming HTML).
 
     Returns:
         3-tuple of ``(Orchestrator, HealthMonitor | None, ModemIdentity)``.
@@ -147,6 +157,7 @@ def create_orchestrator(
         username=username,
         password=password,
         legacy_ssl=legacy_ssl,
+        stream_html=stream_html,
     )
 
     health_monitor: HealthMonitor | None = None
@@ -164,6 +175,7 @@ def create_orchestrator(
         collector=collector,
         health_monitor=health_monitor,
         modem_config=modem_config,
+        profile_memory=profile_memory,
     )
 
     identity = _build_identity(modem_config)
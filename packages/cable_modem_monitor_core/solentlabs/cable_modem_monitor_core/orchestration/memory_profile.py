@@ -0,0 +1,102 @@
+"""Poll memory profile — traced allocation peak per poll.
+
+Opt-in per orchestrator (``profile_memory=True``). Tracing hooks every
+allocation in the process, which slows Python code noticeably, so it
+is for investigating a modem's footprint, not for steady-state polling.
+``tracemalloc`` starts with the first profiling orchestrator and stops
+when the last one closes, unless something else had already started it.
+
+``tracemalloc`` counts Python allocations, not RSS, and keeps a single
+process-wide peak. Polls of other modems that overlap this one are
+included in its figures — profile with one worker (``max_workers: 1``)
+for per-modem numbers.
+
+See ORCHESTRATION_SPEC.md § Result Types (OrchestratorDiagnostics).
+"""
+
+from __future__ import annotations
+
+import threading
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+_lock = threading.Lock()
+_profilers = 0
+_started_tracing = False
+
+
+@dataclass(frozen=True)
+class PollMemory:
+    """Traced allocations during one poll.
+
+    Attributes:
+        peak_bytes: Highest traced memory during the poll, above what
+            was traced when it started.
+        retained_bytes: Traced memory when the poll ended minus when
+            it started. Negative when the poll freed more than it kept
+            (e.g., the previous poll's data was replaced).
+    """
+
+    peak_bytes: int
+    retained_bytes: int
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a plain dict for diagnostics output."""
+        return {
+            "peak_bytes": self.peak_bytes,
+            "retained_bytes": self.retained_bytes,
+        }
+
+
+class PollMemoryProfiler:
+    """Measure each poll of one orchestrator with ``tracemalloc``."""
+
+    def __init__(self) -> None:
+        self._tracing = False
+        self._last: PollMemory | None = None
+
+    @property
+    def last(self) -> PollMemory | None:
+        """Profile of the most recent poll. None if never measured."""
+        return self._last
+
+    @contextmanager
+    def measure(self) -> Iterator[None]:
+        """Record the traced peak and retained bytes of the enclosed poll."""
+        if not self._tracing:
+            _acquire()
+            self._tracing = True
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            self._last = PollMemory(peak_bytes=max(peak - start, 0), retained_bytes=current - start)
+
+    def close(self) -> None:
+        """Stop tracing if this was the last profiler using it."""
+        if self._tracing:
+            self._tracing = False
+            _release()
+
+
+def _acquire() -> None:
+    global _profilers, _started_tracing
+    with _lock:
+        if _profilers == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _started_tracing = True
+        _profilers += 1
+
+
+def _release() -> None:
+    global _profilers, _started_tracing
+    with _lock:
+        _profilers -= 1
+        if _profilers == 0 and _started_tracing:
+            tracemalloc.stop()
+            _started_tracing = False
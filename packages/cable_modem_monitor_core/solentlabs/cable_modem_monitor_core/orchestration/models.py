@@ -20,6 +20,7 @@ from .signals import (
 
 if TYPE_CHECKING:
     from .event_payload import SnapshotEventPayload
+    from .memory_profile import PollMemory
 
 
 @dataclass
@@ -254,7 +255,7 @@ class OrchestratorDiagnostics:
             if no stub-page failure has occurred. Retained until the
             next LOAD_INTEGRITY event — survives successful polls so
             it is present in bug-report diagnostics downloads even after
-            the modem recovers. Full body stored; no truncation.
+            the modem recovers. Truncated past 64 KiB per resource.
         system_info_fields_missing: Mapped system_info fields no
             configured source produced on the most recent parse.
             Snapshot semantics — recomputed per parse, a healed field
@@ -264,6 +265,9 @@ class OrchestratorDiagnostics:
             once recorded so intermittent failures survive into
             diagnostics downloads. Diagnostics-only; never feeds
             signals or policy.
+        poll_memory: Traced allocation peak and retained bytes of the
+            last poll. None unless the orchestrator was built with
+            ``profile_memory=True``.
     """
 
     poll_duration: float | None
@@ -280,6 +284,7 @@ class OrchestratorDiagnostics:
     last_stub_body: dict[str, str] = field(default_factory=dict)
     system_info_fields_missing: list[str] = field(default_factory=list)
     system_info_fields_failed: dict[str, str] = field(default_factory=dict)
+    poll_memory: PollMemory | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to a plain dict for diagnostics output."""
@@ -298,6 +303,7 @@ class OrchestratorDiagnostics:
             "last_stub_body": self.last_stub_body,
             "system_info_fields_missing": self.system_info_fields_missing,
             "system_info_fields_failed": self.system_info_fields_failed,
+            "poll_memory": self.poll_memory.to_dict() if self.poll_memory is not None else None,
         }
 
 
@@ -14,6 +14,7 @@ RUNTIME_POLLING_SPEC.md for behavioral rules.
 
 from __future__ import annotations
 
+import contextlib
 import logging
 import time
 from dataclasses import dataclass
@@ -31,6 +32,7 @@ from .events import (
     SystemInfoFieldsChanged,
 )
 from .logging import log_event
+from .memory_profile import PollMemoryProfiler
 from .models import ModemSnapshot, OrchestratorDiagnostics, RestartResult
 from .policy import SignalPolicy
 from .recovery import Recovery
@@ -45,6 +47,7 @@ from .status import derive_connection_status, enrich_docsis_status
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from ..fetch_list import FetchMask
     from ..models.modem_config.config import ModemConfig
     from .collector import ModemDataCollector
     from .models import HealthInfo, ModemResult
@@ -81,6 +84,9 @@ class Orchestrator:
             modem doesn't support ICMP or HTTP HEAD probes.
         modem_config: Parsed modem.yaml config. Used for identity
             (model) and actions (restart, logout).
+        profile_memory: Measure each poll with ``tracemalloc`` and
+            report it as ``diagnostics().poll_memory``. Slows every
+            allocation in the process; see ``memory_profile``.
     """
 
     AUTH_FAILURE_THRESHOLD: int = 6
@@ -90,6 +96,8 @@ class Orchestrator:
         collector: ModemDataCollector,
         health_monitor: HealthMonitor | None,
         modem_config: ModemConfig,
+        *,
+        profile_memory: bool = False,
     ) -> None:
         self._collector = collector
         self._health_monitor = health_monitor
@@ -126,6 +134,7 @@ class Orchestrator:
         # Diagnostics state
         self._last_poll_duration: float | None = None
         self._last_poll_at: str | None = None
+        self._memory_profiler = PollMemoryProfiler() if profile_memory else None
 
         # Monotonic timestamp of the last CONNECTIVITY failure. Used
         # by the "health recovery clears connectivity backoff"
@@ -155,8 +164,10 @@ class Orchestrator:
         start = time.monotonic()
         self._last_poll_at = datetime.now(UTC).isoformat()
 
+        measure = self._memory_profiler.measure() if self._memory_profiler else contextlib.nullcontext()
         try:
-            snapshot = self._execute_poll()
+            with measure:
+                snapshot = self._execute_poll()
         finally:
             self._last_poll_duration = time.monotonic() - start
 
@@ -196,9 +207,22 @@ class Orchestrator:
         if was_backing_off:
             log_event(_logger, ConnectivityBackoffReset(model=self._modem_config.model))
 
+    def set_fetch_mask(self, mask: FetchMask | None) -> None:
+        """Narrow future polls to the sections and fields the consumer reads.
+
+        Resources that feed only pruned sections are not requested.
+        Core widens the mask with what it needs itself, so status,
+        error rates, and the reboot vote are unaffected. Takes effect
+        on the next ``get_modem_data()``; ``None`` restores the full
+        fetch list. See RESOURCE_LOADING_SPEC.md § Fetch List Derivation.
+        """
+        self._collector.set_fetch_mask(mask)
+
     def close(self) -> None:
         """Release held resources — logs out any live session, closes the collector's HTTP session."""
         self._collector.close()
+        if self._memory_profiler is not None:
+            self._memory_profiler.close()
 
     def diagnostics(self) -> OrchestratorDiagnostics:
         """Return a read-only snapshot of operational diagnostics.
@@ -221,6 +245,7 @@ class Orchestrator:
             last_stub_body=self._collector.last_stub_bodies,
             system_info_fields_missing=self._collector.last_system_info_fields_missing,
             system_info_fields_failed=self._collector.system_info_fields_failed,
+            poll_memory=self._memory_profiler.last if self._memory_profiler else None,
         )
 
     @property
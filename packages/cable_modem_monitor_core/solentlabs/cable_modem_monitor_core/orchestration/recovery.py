@@ -131,6 +131,9 @@ class Recovery:
         self._active = True
         self._started_at = time.monotonic()
         self._reason = reason
+        # Slow-tier pages (version, provisioning) may have changed
+        # across the disruption — re-read them on the next poll.
+        self._collector.expire_refresh_tier()
         log_event(
             _logger,
             RecoveryWindowOpened(
@@ -254,6 +257,7 @@ class Recovery:
         self._active = True
         self._started_at = time.monotonic()
         self._reason = reason
+        self._collector.expire_refresh_tier()
         log_event(
             _logger,
             RecoveryWindowOpened(
@@ -0,0 +1,90 @@
+"""RefreshTier — per-resource refresh intervals across polls.
+
+parser.yaml ``refresh_every`` puts system_info resources that only
+change on reboot (software version, provisioning pages) on a slower
+tier. The collector asks the tier which targets are due before each
+load, fetches only those, and merges the cached decoded resources for
+the rest back in before parse — the parser coordinator always sees a
+complete resource dict.
+
+The cache is committed only after a successful parse, so a stub page
+or a failed load never gets pinned for N polls. ``expire()`` drops
+everything; Recovery calls it when a window opens, so the first poll
+after a reboot re-reads every slow page.
+
+See PARSING_SPEC.md § Refresh Tiers.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ..fetch_list import ResourceTarget
+
+
+class RefreshTier:
+    """Slow-tier resource cache keyed by resource path.
+
+    Polls are counted in successful commits — a failed collection does
+    not age the cache, so "every N polls" means N polls that returned
+    data.
+    """
+
+    def __init__(self, intervals: dict[str, int]) -> None:
+        self._intervals = {path: polls for path, polls in intervals.items() if polls > 1}
+        self._poll = 0
+        # path → (poll index when fetched, decoded resource)
+        self._cache: dict[str, tuple[int, Any]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any resource is on a slow tier."""
+        return bool(self._intervals)
+
+    @property
+    def cached_paths(self) -> list[str]:
+        """Slow-tier paths currently served from cache."""
+        return sorted(self._cache)
+
+    def split(self, targets: list[ResourceTarget]) -> tuple[list[ResourceTarget], dict[str, Any]]:
+        """Partition targets into those to fetch now and cached resources.
+
+        Returns:
+            ``(due, cached)`` — targets to request this poll, and the
+            decoded resources to merge in for the ones skipped.
+        """
+        due: list[ResourceTarget] = []
+        cached: dict[str, Any] = {}
+        for target in targets:
+            entry = self._cache.get(target.path)
+            interval = self._intervals.get(target.path)
+            if entry is not None and interval is not None and self._poll - entry[0] < interval:
+                cached[target.path] = entry[1]
+            else:
+                due.append(target)
+        return due, cached
+
+    def slow(self, fetched: dict[str, Any]) -> dict[str, Any]:
+        """The slow-tier resources among *fetched* — all ``commit`` caches.
+
+        The collector holds only these until the parse outcome is known,
+        so fast-tier pages are freed with the parse.
+        """
+        return {path: fetched[path] for path in self._intervals if path in fetched}
+
+    def commit(self, fetched: dict[str, Any]) -> None:
+        """Record a successful collection and cache freshly fetched slow resources.
+
+        Args:
+            fetched: Resources actually requested this poll (cache hits
+                excluded, so their age is preserved).
+        """
+        for path in self._intervals:
+            if path in fetched:
+                self._cache[path] = (self._poll, fetched[path])
+        self._poll += 1
+
+    def expire(self) -> None:
+        """Drop every cached resource — the next poll fetches them all."""
+        self._cache.clear()
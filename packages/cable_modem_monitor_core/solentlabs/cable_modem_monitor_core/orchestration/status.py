@@ -61,7 +61,10 @@ def enrich_docsis_status(modem_data: dict[str, Any]) -> None:
         return  # parser provided it — don't overwrite
 
     downstream = modem_data.get("downstream", [])
-    upstream = modem_data.get("upstream", [])
+    # No upstream key means the fetch mask pruned the section — upstream
+    # was not read, so it cannot veto OPERATIONAL. An empty list is a
+    # read that found no channels.
+    upstream = modem_data.get("upstream")
 
     # Can't derive without downstream channels that have lock_status.
     # Same sparse-dict rule as other system_info fields: if the data
@@ -77,7 +80,7 @@ def enrich_docsis_status(modem_data: dict[str, Any]) -> None:
 
     if locked_count == 0:
         system_info["docsis_status"] = DocsisStatus.NOT_LOCKED
-    elif locked_count == len(downstream) and len(upstream) > 0:
+    elif locked_count == len(downstream) and (upstream is None or len(upstream) > 0):
         system_info["docsis_status"] = DocsisStatus.OPERATIONAL
     else:
         system_info["docsis_status"] = DocsisStatus.PARTIAL_LOCK
@@ -3,16 +3,31 @@
 BaseParser ABC and format-specific implementations. Each parser is
 parameterized by parser.yaml section config and extracts data from
 pre-fetched resources (no network calls).
+
+Format parsers (and bs4 behind them) are imported on first access.
 """
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+from ..lazy_exports import lazy_exports
 from .base import BaseParser
 from .coordinator import ModemParserCoordinator
-from .formats.html_fields import HTMLFieldsParser
-from .formats.html_table import HTMLTableParser
 from .type_conversion import convert_value, normalize_frequency
 
+if TYPE_CHECKING:
+    from .formats.html_fields import HTMLFieldsParser
+    from .formats.html_table import HTMLTableParser
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "HTMLFieldsParser": ".formats.html_fields",
+        "HTMLTableParser": ".formats.html_table",
+    },
+)
+
 __all__ = [
     "BaseParser",
     "HTMLFieldsParser",
@@ -18,7 +18,14 @@ import logging
 from collections import defaultdict
 from typing import Any, TypeVar
 
-from ..fetch_list import collect_fetch_targets
+from ..fetch_list import (
+    CHANNEL_SECTIONS,
+    FetchMask,
+    collect_fetch_targets,
+    prune_parser_config,
+    resolve_fetch_mask,
+    section_resources,
+)
 from ..models.parser_config.common import ChannelTypeDerive
 from ..models.parser_config.config import ParserConfig
 from ..spec_conformance import canonicalize_modulation, derive_channel_type_from_modulation
@@ -26,10 +33,13 @@ from .diagnostics import AnchorCount, ParseDiagnostics
 from .registries import CHANNEL_PARSERS, SYSINFO_PARSERS, resource_present
 
 _T = TypeVar("_T")
+
+# Presence count for a resource released mid-parse (see ``parse(release=True)``).
+_PRESENT = AnchorCount(expected=1, fulfilled=1)
 _logger = logging.getLogger(__name__)
 
 # Section names that contain channel data (list[dict] output).
-_CHANNEL_SECTIONS = ("downstream", "upstream")
+_CHANNEL_SECTIONS = CHANNEL_SECTIONS
 
 # Hook method names by section.
 _HOOK_NAMES = {
@@ -51,17 +61,38 @@ class ModemParserCoordinator:
         post_processor: Optional parser.py post-processor instance.
             Duck-typed: checked for ``parse_downstream``,
             ``parse_upstream``, ``parse_system_info`` methods via hasattr.
+        mask: Optional ``FetchMask`` from the consumer. Pruned sections
+            are neither extracted nor hooked, and are absent from the
+            assembled ModemData — see RESOURCE_LOADING_SPEC.md § Fetch
+            List Derivation.
     """
 
     def __init__(
         self,
         config: ParserConfig,
         post_processor: Any = None,
+        mask: FetchMask | None = None,
     ) -> None:
-        self._config = config
+        self._full_config = config
         self._post_processor = post_processor
+        self._mask = resolve_fetch_mask(config, mask) if mask is not None else None
+        self._config = prune_parser_config(config, self._mask) if self._mask is not None else config
+
+    @property
+    def config(self) -> ParserConfig:
+        """The effective config — parser.yaml with masked sections pruned."""
+        return self._config
+
+    def _section_needed(self, section_name: str) -> bool:
+        """Whether the consumer mask keeps this section."""
+        return self._mask is None or section_name in self._mask.sections
 
-    def parse(self, resources: dict[str, Any]) -> tuple[dict[str, Any], ParseDiagnostics]:
+    def parse(
+        self,
+        resources: dict[str, Any],
+        *,
+        release: bool = False,
+    ) -> tuple[dict[str, Any], ParseDiagnostics]:
         """Run the full extraction pipeline and assemble ModemData.
 
         Sequence: extract channels → extract system_info → apply hooks
@@ -70,6 +101,11 @@ class ModemParserCoordinator:
         Args:
             resources: Resource dict keyed by URL path. Values are
                 format-dependent (BeautifulSoup for HTML, dict for JSON).
+            release: The caller hands ``resources`` over. After each
+                channel section, documents no later section or hook
+                reads are deleted from it, so a decoded page does not
+                outlive its parsers. Pages of a resource with zero
+                anchor fulfillment are kept for the stub report.
 
         Returns:
             Tuple of (ModemData, ParseDiagnostics). ModemData has
@@ -81,30 +117,37 @@ class ModemParserCoordinator:
         result: dict[str, Any] = {}
         per_resource: dict[str, AnchorCount] = defaultdict(AnchorCount)
 
-        for section_name in _CHANNEL_SECTIONS:
+        sections = [name for name in _CHANNEL_SECTIONS if self._section_needed(name)]
+        phases = [*sections, "system_info"] if self._section_needed("system_info") else sections
+        phase_reads = self._phase_reads(phases) if release else []
+        released: set[str] = set()
+
+        for position, section_name in enumerate(sections):
             channels, count, resource = self._extract_channel_section(section_name, resources)
             result[section_name] = channels
             if resource is not None:
                 per_resource[resource] = per_resource[resource] + count
+            if release:
+                released |= _release_unread(resources, phase_reads[position + 1 :], per_resource)
 
         # Apply direction-aware channel_type derivation for sections
         # configured with ``channel_type: { derive: from_modulation }``.
         # Format parsers no-op on ChannelTypeDerive because they don't
         # know whether they're processing the DS or US section; the
         # coordinator does, so derivation lives here.
-        for section_name in _CHANNEL_SECTIONS:
+        for section_name in sections:
             section = getattr(self._config, section_name, None)
             if _section_uses_channel_type_derive(section):
                 _apply_derive_channel_type(result[section_name], section_name)
 
         # Null metrics on unlocked channels before aggregation.
         # See CHANNEL_IDENTIFICATION_SPEC.md §6.
-        for section_name in _CHANNEL_SECTIONS:
+        for section_name in sections:
             _null_unlocked_channels(result[section_name])
 
         # Strip fields that don't belong on OFDM/OFDMA channels.
         # See PARSING_SPEC.md § Output Contract.
-        for section_name in _CHANNEL_SECTIONS:
+        for section_name in sections:
             _strip_ofdm_fields(result[section_name])
 
         system_info, sysinfo_counts, sysinfo_failed = self._extract_system_info(resources)
@@ -113,7 +156,7 @@ class ModemParserCoordinator:
         for resource, count in sysinfo_counts.items():
             per_resource[resource] = per_resource[resource] + count
 
-        self._account_uncounted_resources(per_resource, resources)
+        self._account_uncounted_resources(per_resource, resources, released)
 
         self._enrich_derived_fields(result)
 
@@ -188,6 +231,9 @@ class ModemParserCoordinator:
         per_resource: dict[str, AnchorCount] = defaultdict(AnchorCount)
         failed: dict[str, str] = {}
 
+        if not self._section_needed("system_info"):
+            return {}, dict(per_resource), failed
+
         section = self._config.system_info
         if section is None:
             return self._apply_hook("system_info", {}, resources), dict(per_resource), failed
@@ -214,6 +260,7 @@ class ModemParserCoordinator:
         self,
         per_resource: dict[str, AnchorCount],
         resources: dict[str, Any],
+        released: set[str],
     ) -> None:
         """Add presence accounting for declared paths no format parser counted.
 
@@ -225,10 +272,35 @@ class ModemParserCoordinator:
 
         The expected set comes from ``collect_fetch_targets`` — the same
         derivation the collector fetches from, so the two cannot drift.
+        Paths in ``released`` were present when parse released them.
         """
-        for target in collect_fetch_targets(self._config, self._post_processor):
-            if target.path not in per_resource:
-                per_resource[target.path] = resource_present(resources, target.path)
+        for target in collect_fetch_targets(self._full_config, self._post_processor, self._mask):
+            if target.path in per_resource:
+                continue
+            per_resource[target.path] = (
+                _PRESENT if target.path in released else resource_present(resources, target.path)
+            )
+
+    def _phase_reads(self, phases: list[str]) -> list[frozenset[str] | None]:
+        """Resource paths each extraction phase reads.
+
+        ``None`` when a phase may read any resource: its parser.py hook
+        receives the whole dict, and HNAP sections read the batched
+        response rather than a path.
+        """
+        reads: list[frozenset[str] | None] = []
+        for name in phases:
+            hook = getattr(self._post_processor, _HOOK_NAMES[name], None) if self._post_processor else None
+            if name == "system_info":
+                sources = list(self._config.system_info.sources) if self._config.system_info else []
+            else:
+                section = getattr(self._config, name, None)
+                sources = [section] if section is not None else []
+            if hook is not None or any(getattr(source, "format", "") == "hnap" for source in sources):
+                reads.append(None)
+            else:
+                reads.append(frozenset(path for source in sources for path in section_resources(source)))
+        return reads
 
     def _configured_system_info_fields(self) -> set[str]:
         """Field names parser.yaml maps across all system_info sources.
@@ -287,11 +359,12 @@ class ModemParserCoordinator:
         """
         system_info = data.setdefault("system_info", {})
 
-        # Channel counts — locked channels only, native wins
-        downstream = data.get("downstream", [])
-        upstream = data.get("upstream", [])
-        system_info.setdefault("downstream_channel_count", _count_locked(downstream))
-        system_info.setdefault("upstream_channel_count", _count_locked(upstream))
+        # Channel counts — locked channels only, native wins. A section
+        # pruned by the fetch mask has no key and gets no count: zero
+        # would read as a lost bond rather than an unread table.
+        for section_name in _CHANNEL_SECTIONS:
+            if section_name in data:
+                system_info.setdefault(f"{section_name}_channel_count", _count_locked(data[section_name]))
 
         # Aggregate sums — from parser.yaml aggregate section
         for field_name, field_def in self._config.aggregate.items():
@@ -324,6 +397,31 @@ class ModemParserCoordinator:
 _UNLOCKED_KEEP_FIELDS = frozenset({"channel_number", "lock_status"})
 
 
+def _release_unread(
+    resources: dict[str, Any],
+    later_reads: list[frozenset[str] | None],
+    per_resource: dict[str, AnchorCount],
+) -> set[str]:
+    """Delete the documents no later phase reads; return their paths.
+
+    A page with zero anchor fulfillment so far stays — the collector
+    reports its body as a stub page. ``None`` values stay too: they
+    mark a resource that never decoded, which presence accounting
+    still has to see.
+    """
+    if any(reads is None for reads in later_reads):
+        return set()
+    needed = {path for reads in later_reads if reads is not None for path in reads}
+    released: set[str] = set()
+    for path in [p for p, document in resources.items() if p not in needed and document is not None]:
+        count = per_resource.get(path)
+        if count is not None and count.expected > 0 and count.fulfilled == 0:
+            continue
+        del resources[path]
+        released.add(path)
+    return released
+
+
 def _section_uses_channel_type_derive(section: Any) -> bool:
     """True if the section config carries a ``ChannelTypeDerive`` directive.
 
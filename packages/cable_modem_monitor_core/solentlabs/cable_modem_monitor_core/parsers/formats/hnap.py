@@ -20,7 +20,7 @@ from ...models.parser_config.common import (
 from ...models.parser_config.hnap import HNAPSection
 from ..base import BaseParser
 from ..filter import passes_filter
-from ..type_conversion import convert_value
+from ..type_conversion import convert_column
 
 _logger = logging.getLogger(__name__)
 
@@ -78,23 +78,23 @@ class HNAPParser(BaseParser):
         Algorithm:
         1. Split by ``record_delimiter`` → channel records
         2. For each record, split by ``field_delimiter`` → field values
-        3. Map fields by ``index`` using ``convert_value()``
+        3. Map fields by ``index`` using ``convert_column()``, one
+           field mapping across all records at a time
         4. Apply ``channel_type`` map detection
         5. Apply ``filter`` rules
         """
-        records = raw_data.split(self._config.record_delimiter)
-        channels: list[dict[str, Any]] = []
-
-        for raw_record in records:
+        records: list[list[str]] = []
+        for raw_record in raw_data.split(self._config.record_delimiter):
             record = raw_record.strip()
             if not record:
                 continue
 
             fields = record.split(self._config.field_delimiter)
-            channel = self._extract_channel(fields)
-            if channel is None:
-                continue
+            if self._is_complete(fields):
+                records.append(fields)
 
+        channels: list[dict[str, Any]] = []
+        for channel in self._extract_channels(records):
             _apply_channel_type(channel, self._config.channel_type)
 
             if not passes_filter(channel, self._config.filter):
@@ -104,17 +104,11 @@ class HNAPParser(BaseParser):
 
         return channels
 
-    def _extract_channel(
-        self,
-        fields: list[str],
-    ) -> dict[str, Any] | None:
-        """Extract field values from a split record.
+    def _is_complete(self, fields: list[str]) -> bool:
+        """Whether a split record has a field for every configured index.
 
-        Returns ``None`` if the record has fewer fields than any
-        configured index (malformed or truncated record).
+        Shorter records are malformed or truncated and are skipped.
         """
-        channel: dict[str, Any] = {}
-
         for mapping in self._config.fields:
             idx = mapping.index if mapping.index is not None else mapping.offset
             if idx is None or idx >= len(fields):
@@ -123,22 +117,38 @@ class HNAPParser(BaseParser):
                     idx,
                     len(fields),
                 )
-                return None
+                return False
+        return True
 
-            raw_value = fields[idx].strip()
-            value = convert_value(
-                raw_value,
+    def _extract_channels(
+        self,
+        records: list[list[str]],
+    ) -> list[dict[str, Any]]:
+        """Extract one channel dict per complete record, a field at a time.
+
+        Records where no field could be extracted yield no channel.
+        """
+        columns: list[tuple[str, list[Any]]] = []
+        for mapping in self._config.fields:
+            idx = mapping.index if mapping.index is not None else mapping.offset
+            assert idx is not None  # guaranteed by _is_complete
+            values = convert_column(
+                [fields[idx].strip() for fields in records],
                 mapping.type,
                 unit=mapping.unit,
                 map_config=mapping.map,
                 scale=mapping.scale,
                 input_format=mapping.format,
             )
+            columns.append((mapping.field, values))
 
-            if value is not None:
-                channel[mapping.field] = value
+        channels: list[dict[str, Any]] = []
+        for position in range(len(records)):
+            channel = {field: values[position] for field, values in columns if values[position] is not None}
+            if channel:
+                channels.append(channel)
 
-        return channel if channel else None
+        return channels
 
 
 def _apply_channel_type(
@@ -18,6 +18,7 @@ from bs4 import BeautifulSoup, Tag
 from ...models.parser_config.system_info import HTMLFieldMapping, HTMLFieldsSource
 from ..base import BaseParser
 from ..diagnostics import record_failed_field
+from ..soup_memo import soup_memo
 from ..type_conversion import convert_value
 
 _logger = logging.getLogger(__name__)
@@ -168,55 +169,92 @@ def _extract_by_label(soup: BeautifulSoup | Tag, label_text: str) -> str | None:
     4. ``<dt>label</dt><dd>value</dd>`` (definition list)
     5. ``<div>label</div>`` followed by sibling ``<div>``
     """
-    # Normalize label for matching
-    label_lower = label_text.lower().strip()
+    return label_index(soup).lookup(label_text)
 
-    # Search all text-containing elements
-    for element in soup.find_all(["td", "th", "span", "dt", "div", "label"]):
-        if not isinstance(element, Tag):
-            continue
 
-        # Skip wrapper elements — their get_text() includes all nested
-        # content, causing false matches on label text.
-        if element.find(_BLOCK_LEVEL_TAGS):
-            continue
+# Block-level tags that indicate a wrapper element when found as children.
+_BLOCK_LEVEL_TAGS = ["table", "div", "section", "article", "ul", "ol", "dl"]
 
-        text = element.get_text(strip=True)
-        if label_lower not in text.lower():
-            continue
+# Tags that participate in the label cascade — used to detect when a
+# parent element should defer to a more specific child match.
+_SEARCH_TAGS = frozenset({"td", "th", "span", "dt", "div", "label"})
 
-        # Prefer leaf matches: if a direct child is also a cascade-
-        # supported tag and contains the label text, skip this element
-        # and let the child match on a later iteration.
-        if _has_child_with_label(element, label_lower):
-            continue
 
-        # Try structural patterns based on element type
-        value = _try_label_cascade(element)
-        if value is not None:
-            return value
+class LabelIndex:
+    """Label-cascade candidates of one parsed document.
 
-    return None
+    Every field located by ``label`` used to walk the whole page, so a
+    source with a dozen label fields walked it a dozen times per poll.
+    The index walks it once: it keeps the non-wrapper cascade elements
+    in document order with their normalized text, plus the normalized
+    text of each one's cascade-tag children for the leaf-preference
+    check. Lookups scan those strings and are memoized per label, so
+    labels shared across sources on the same resource resolve once.
 
+    Args:
+        soup: Parsed HTML document or subtree.
+    """
 
-# Block-level tags that indicate a wrapper element when found as children.
-_BLOCK_LEVEL_TAGS = ["table", "div", "section", "article", "ul", "ol", "dl"]
+    def __init__(self, soup: BeautifulSoup | Tag) -> None:
+        # Skip wrapper elements — their get_text() includes all nested
+        # content, causing false matches on label text. One pass over
+        # the block-level elements marks every ancestor they make a
+        # wrapper, instead of a descendant search per element.
+        wrappers: set[int] = set()
+        for block in soup.find_all(_BLOCK_LEVEL_TAGS):
+            for ancestor in block.parents:
+                if ancestor.name in _SEARCH_TAGS:
+                    wrappers.add(id(ancestor))
+
+        self._candidates: list[tuple[str, Tag]] = [
+            (element.get_text(strip=True).lower(), element)
+            for element in soup.find_all(list(_SEARCH_TAGS))
+            if isinstance(element, Tag) and id(element) not in wrappers
+        ]
+        self._child_texts: dict[int, tuple[str, ...]] = {}
+        self._values: dict[str, str | None] = {}
+
+    def lookup(self, label_text: str) -> str | None:
+        """Value adjacent to the first element labelled *label_text*."""
+        label_lower = label_text.lower().strip()
+        if label_lower not in self._values:
+            self._values[label_lower] = self._find(label_lower)
+        return self._values[label_lower]
+
+    def _find(self, label_lower: str) -> str | None:
+        for text, element in self._candidates:
+            if label_lower not in text:
+                continue
+
+            # Prefer leaf matches: if a direct child is also a cascade-
+            # supported tag and contains the label text, skip this element
+            # and let the child match on a later iteration.
+            if any(label_lower in child for child in self._children_of(element)):
+                continue
+
+            # Try structural patterns based on element type
+            value = _try_label_cascade(element)
+            if value is not None:
+                return value
 
-# Tags that participate in the label cascade — used to detect when a
-# parent element should defer to a more specific child match.
-_SEARCH_TAGS = frozenset({"td", "th", "span", "dt", "div", "label"})
+        return None
+
+    def _children_of(self, element: Tag) -> tuple[str, ...]:
+        """Normalized text of *element*'s direct cascade-tag children."""
+        texts = self._child_texts.get(id(element))
+        if texts is None:
+            texts = tuple(
+                child.get_text(strip=True).lower()
+                for child in element.children
+                if isinstance(child, Tag) and child.name in _SEARCH_TAGS
+            )
+            self._child_texts[id(element)] = texts
+        return texts
 
 
-def _has_child_with_label(element: Tag, label_lower: str) -> bool:
-    """Check if a direct child (cascade-supported tag) contains the label text."""
-    for child in element.children:
-        if not isinstance(child, Tag):
-            continue
-        if child.name not in _SEARCH_TAGS:
-            continue
-        if label_lower in child.get_text(strip=True).lower():
-            return True
-    return False
+def label_index(soup: BeautifulSoup | Tag) -> LabelIndex:
+    """The ``LabelIndex`` of *soup*, created on first call."""
+    return soup_memo(soup, "label_index", lambda: LabelIndex(soup))
 
 
 _CascadeHandler = Callable[[Tag], str | None]
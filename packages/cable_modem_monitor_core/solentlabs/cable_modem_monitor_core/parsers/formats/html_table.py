@@ -24,7 +24,7 @@ from ...models.parser_config.table import TableDefinition
 from ..base import BaseParser
 from ..filter import passes_filter
 from ..table_selector import find_table
-from ..type_conversion import convert_value
+from ..type_conversion import convert_column
 
 _logger = logging.getLogger(__name__)
 
@@ -71,12 +71,7 @@ class HTMLTableParser(BaseParser):
         data_rows = rows[self._table.row_start :]
 
         channels: list[dict[str, Any]] = []
-        for row in data_rows:
-            cells = row.find_all(["td", "th"])
-            channel = _extract_row(cells, self._table.columns)
-            if channel is None:
-                continue
-
+        for channel in _extract_rows([row.find_all(["td", "th"]) for row in data_rows], self._table.columns):
             _apply_channel_type(channel, self._table.channel_type)
 
             if not passes_filter(channel, self._table.filter):
@@ -87,50 +82,56 @@ class HTMLTableParser(BaseParser):
         return channels
 
 
-def _extract_row(
-    cells: list[Tag],
+def _extract_rows(
+    rows: list[list[Tag]],
     columns: list[ColumnMapping],
-) -> dict[str, Any] | None:
-    """Extract field values from a table row's cells.
+) -> list[dict[str, Any]]:
+    """Extract one channel dict per table row, converting a column at a time.
 
-    Returns ``None`` if the row has fewer cells than any column index
-    (likely a header or malformed row), or if fewer than half the
+    Rows with fewer cells than any column index (likely a header or
+    malformed row) are skipped, as are rows where fewer than half the
     declared columns produced values (likely a footer/summary row).
     """
-    channel: dict[str, Any] = {}
-
-    for col in columns:
-        if col.index >= len(cells):
-            return None
-
-        raw_text = cells[col.index].get_text(strip=True)
+    width = max((col.index for col in columns), default=-1)
+    complete = [cells for cells in rows if len(cells) > width]
 
-        if col.pattern:
-            m = re.search(col.pattern, raw_text)
-            raw_text = m.group(1) if m else ""
-
-        value = convert_value(
-            raw_text,
+    converted = [
+        convert_column(
+            _column_text(complete, col),
             col.type,
             unit=col.unit,
             map_config=col.map,
             scale=col.scale,
             input_format=col.format,
         )
+        for col in columns
+    ]
+
+    channels: list[dict[str, Any]] = []
+    for position in range(len(complete)):
+        channel: dict[str, Any] = {}
+        for col, values in zip(columns, converted, strict=True):
+            value = values[position]
+            if value is not None:
+                channel[col.field] = value
+
+        # Sparse row detection: footer/summary rows typically have values
+        # in only a few columns (e.g., "Total" with corrected/uncorrected
+        # but no channel_id, frequency, lock_status).
+        if channel and len(channel) >= len(columns) // 2:
+            channels.append(channel)
 
-        if value is not None:
-            channel[col.field] = value
-
-    if not channel:
-        return None
+    return channels
 
-    # Sparse row detection: footer/summary rows typically have values
-    # in only a few columns (e.g., "Total" with corrected/uncorrected
-    # but no channel_id, frequency, lock_status).
-    if len(channel) < len(columns) // 2:
-        return None
 
-    return channel
+def _column_text(rows: list[list[Tag]], col: ColumnMapping) -> list[str]:
+    """Cell text of column *col* in every row, narrowed by ``col.pattern``."""
+    texts = [cells[col.index].get_text(strip=True) for cells in rows]
+    if not col.pattern:
+        return texts
+    pattern = re.compile(col.pattern)
+    matches = [pattern.search(text) for text in texts]
+    return [m.group(1) if m else "" for m in matches]
 
 
 def _apply_channel_type(
@@ -27,7 +27,7 @@ from ...models.parser_config.common import (
 from ...models.parser_config.transposed import TransposedTableDefinition
 from ..base import BaseParser
 from ..table_selector import find_table
-from ..type_conversion import convert_value
+from ..type_conversion import convert_column
 
 _logger = logging.getLogger(__name__)
 
@@ -83,11 +83,7 @@ class HTMLTableTransposedParser(BaseParser):
 
         # Pivot: for each column index, build one channel dict.
         channels: list[dict[str, Any]] = []
-        for col_idx in range(channel_count):
-            channel = _extract_channel(label_map, self._table.rows, col_idx)
-            if channel is None:
-                continue
-
+        for channel in _extract_channels(label_map, self._table.rows, channel_count):
             _apply_channel_type(channel, self._table.channel_type)
             channels.append(channel)
 
@@ -162,21 +158,19 @@ def _detect_channel_count(
     return 0
 
 
-def _extract_channel(
+def _extract_channels(
     label_map: dict[str, list[Tag]],
     rows: list[RowMapping],
-    col_idx: int,
-) -> dict[str, Any] | None:
-    """Extract one channel dict from column ``col_idx`` across all rows.
+    channel_count: int,
+) -> list[dict[str, Any]]:
+    """Extract one channel dict per column index, in column order.
 
     For each RowMapping, finds the matching row by label substring match
-    and extracts the cell at the given column index.
-
-    Returns:
-        Channel dict, or ``None`` if no fields could be extracted.
+    and converts its first ``channel_count`` cells in one batch
+    (``convert_column``). Columns where no field could be extracted
+    yield no channel.
     """
-    channel: dict[str, Any] = {}
-
+    fields: list[tuple[str, list[Any]]] = []
     for row_def in rows:
         label_lower = row_def.label.lower()
         matched_cells: list[Tag] | None = None
@@ -186,23 +180,29 @@ def _extract_channel(
                 matched_cells = cells
                 break
 
-        if matched_cells is None or col_idx >= len(matched_cells):
+        if matched_cells is None:
             continue
 
-        raw_text = matched_cells[col_idx].get_text(strip=True)
-        value = convert_value(
-            raw_text,
+        values = convert_column(
+            [cell.get_text(strip=True) for cell in matched_cells[:channel_count]],
             row_def.type,
             unit=row_def.unit,
             map_config=row_def.map,
             scale=row_def.scale,
             input_format=row_def.format,
         )
+        fields.append((row_def.field, values))
+
+    channels: list[dict[str, Any]] = []
+    for col_idx in range(channel_count):
+        channel: dict[str, Any] = {}
+        for field, values in fields:
+            if col_idx < len(values) and values[col_idx] is not None:
+                channel[field] = values[col_idx]
+        if channel:
+            channels.append(channel)
 
-        if value is not None:
-            channel[row_def.field] = value
-
-    return channel if channel else None
+    return channels
 
 
 def _apply_channel_type(
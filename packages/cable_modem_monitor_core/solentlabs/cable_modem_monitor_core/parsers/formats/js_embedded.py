@@ -13,9 +13,7 @@ See PARSING_SPEC.md JSEmbeddedParser section.
 
 from __future__ import annotations
 
-import functools
 import logging
-import re
 from typing import Any
 
 from bs4 import BeautifulSoup
@@ -23,43 +21,11 @@ from bs4 import BeautifulSoup
 from ...models.parser_config.javascript import JSFunction
 from ..base import BaseParser
 from ..filter import passes_filter
-from ..type_conversion import convert_value
+from ..script_index import script_index
+from ..type_conversion import convert_column
 
 _logger = logging.getLogger(__name__)
 
-# Regex to find ``var tagValueList = 'value'`` or ``"value"`` inside
-# a function body. Handles optional whitespace and both quote styles.
-_TAG_VALUE_RE = re.compile(
-    r"var\s+tagValueList\s*=\s*[\"']([^\"']*)[\"']",
-)
-
-# Regex to strip ``//``-style line comments. Matches ``//`` followed by
-# everything up to end-of-line. Applied after block-comment removal so
-# that commented-out example ``tagValueList`` lines don't shadow real ones.
-_LINE_COMMENT_RE = re.compile(r"//[^\n]*")
-
-# Regex to strip ``/* ... */`` block comments (including multi-line).
-_BLOCK_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
-
-
-def _strip_js_comments(text: str) -> str:
-    """Strip both block and line comments from JavaScript source text."""
-    text = _BLOCK_COMMENT_RE.sub("", text)
-    return _LINE_COMMENT_RE.sub("", text)
-
-
-@functools.cache
-def _get_func_body_re(func_name: str) -> re.Pattern[str]:
-    """Return a compiled regex for extracting a named function body.
-
-    Handles both ``\\n`` and ``\\r\\n`` line endings, and closing braces
-    at any indentation level (some firmware indents the entire function).
-    """
-    return re.compile(
-        rf"function\s+{re.escape(func_name)}\s*\([^)]*\)\s*\{{(.*?)\n\s*\}}",
-        re.DOTALL,
-    )
-
 
 class JSEmbeddedParser(BaseParser):
     """Extract channel data from a single JS function's tagValueList.
@@ -121,7 +87,7 @@ class JSEmbeddedParser(BaseParser):
             return []
 
         fpc = self._function.fields_per_channel
-        channels: list[dict[str, Any]] = []
+        segments: list[list[str]] = []
         idx = 1  # Start after channel count
 
         for i in range(channel_count):
@@ -135,13 +101,11 @@ class JSEmbeddedParser(BaseParser):
                 )
                 break
 
-            segment = values[idx : idx + fpc]
-            channel = self._extract_channel(segment)
+            segments.append(values[idx : idx + fpc])
             idx += fpc
 
-            if channel is None:
-                continue
-
+        channels: list[dict[str, Any]] = []
+        for channel in self._extract_channels(segments):
             _apply_channel_type(channel, self._function.channel_type)
 
             if not passes_filter(channel, self._function.filter):
@@ -151,40 +115,46 @@ class JSEmbeddedParser(BaseParser):
 
         return channels
 
-    def _extract_channel(
+    def _extract_channels(
         self,
-        segment: list[str],
-    ) -> dict[str, Any] | None:
-        """Extract field values from one channel's segment by offset.
+        segments: list[list[str]],
+    ) -> list[dict[str, Any]]:
+        """Extract one channel dict per segment, by offset, a field at a time.
 
-        Returns ``None`` if no fields could be extracted.
+        Each field mapping is converted across all segments in one batch
+        (``convert_column``). Segments where no field could be extracted
+        yield no channel.
         """
-        channel: dict[str, Any] = {}
+        fpc = self._function.fields_per_channel
+        columns: list[tuple[str, list[Any]]] = []
 
         for mapping in self._function.fields:
             offset = mapping.offset if mapping.offset is not None else mapping.index
-            if offset is None or offset >= len(segment):
+            if offset is None or offset >= fpc:
                 _logger.debug(
                     "Segment too short for offset %s (has %d fields)",
                     offset,
-                    len(segment),
+                    fpc,
                 )
                 continue
 
-            raw_value = segment[offset].strip()
-            value = convert_value(
-                raw_value,
+            values = convert_column(
+                [segment[offset].strip() for segment in segments],
                 mapping.type,
                 unit=mapping.unit,
                 map_config=mapping.map,
                 scale=mapping.scale,
                 input_format=mapping.format,
             )
+            columns.append((mapping.field, values))
 
-            if value is not None:
-                channel[mapping.field] = value
+        channels: list[dict[str, Any]] = []
+        for position in range(len(segments)):
+            channel = {field: values[position] for field, values in columns if values[position] is not None}
+            if channel:
+                channels.append(channel)
 
-        return channel if channel else None
+        return channels
 
 
 def _extract_tag_value_list(soup: BeautifulSoup, func_name: str) -> str | None:
@@ -193,6 +163,7 @@ def _extract_tag_value_list(soup: BeautifulSoup, func_name: str) -> str | None:
     When ``func_name`` is non-empty, searches for the variable inside a
     named function body.  When ``func_name`` is empty, searches the
     entire ``<script>`` text for a top-level variable assignment.
+    Answered from the page's ``ScriptIndex``.
 
     Args:
         soup: Parsed HTML page.
@@ -202,48 +173,7 @@ def _extract_tag_value_list(soup: BeautifulSoup, func_name: str) -> str | None:
     Returns:
         The tagValueList string, or ``None`` if not found.
     """
-    if not func_name:
-        return _extract_top_level_tag_value_list(soup)
-
-    func_re = _get_func_body_re(func_name)
-
-    for script in soup.find_all("script"):
-        text = script.string
-        if not text or func_name not in text:
-            continue
-
-        # Normalize CRLF → LF (some firmware serves \r\n line endings)
-        text = text.replace("\r\n", "\n")
-
-        func_match = func_re.search(text)
-        if not func_match:
-            continue
-
-        func_body = func_match.group(1)
-        func_body_clean = _strip_js_comments(func_body)
-
-        tag_match = _TAG_VALUE_RE.search(func_body_clean)
-        if tag_match:
-            return tag_match.group(1)
-
-    return None
-
-
-def _extract_top_level_tag_value_list(soup: BeautifulSoup) -> str | None:
-    """Find tagValueList as a top-level variable in any ``<script>`` tag.
-
-    Used when ``func_name`` is empty — the variable is assigned at script
-    scope rather than inside a function body.
-    """
-    for script in soup.find_all("script"):
-        text = script.string
-        if not text:
-            continue
-        clean = _strip_js_comments(text)
-        tag_match = _TAG_VALUE_RE.search(clean)
-        if tag_match:
-            return tag_match.group(1)
-    return None
+    return script_index(soup).tag_value_list(func_name)
 
 
 def _apply_channel_type(
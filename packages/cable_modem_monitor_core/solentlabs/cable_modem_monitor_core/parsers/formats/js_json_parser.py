@@ -15,9 +15,7 @@ creates one instance per js_json channel section.
 
 from __future__ import annotations
 
-import json
 import logging
-import re
 from typing import Any
 
 from bs4 import BeautifulSoup
@@ -25,7 +23,8 @@ from bs4 import BeautifulSoup
 from ...models.parser_config.js_json import JSJsonSection
 from ..base import BaseParser
 from ..filter import passes_filter
-from .json_parser import _apply_channel_type, _extract_channel
+from ..script_index import script_index
+from .json_parser import _apply_channel_type, _extract_channels
 
 _logger = logging.getLogger(__name__)
 
@@ -64,14 +63,7 @@ class JSJsonParser(BaseParser):
             return []
 
         channels: list[dict[str, Any]] = []
-        for item in raw:
-            if not isinstance(item, dict):
-                continue
-
-            channel = _extract_channel(item, self._config.mappings)
-            if channel is None:
-                continue
-
+        for channel in _extract_channels([item for item in raw if isinstance(item, dict)], self._config.mappings):
             _apply_channel_type(channel, self._config.channel_type)
 
             if not passes_filter(channel, self._config.filter):
@@ -96,28 +88,7 @@ def _extract_js_json_array(
         variable: JS variable name to search for.
 
     Returns:
-        Parsed JSON array, or empty list if not found.
+        Parsed JSON array, or empty list if not found. Shared with
+        every other reader of the page's ``ScriptIndex``; read-only.
     """
-    pattern = re.compile(
-        rf"{re.escape(variable)}\s*=\s*(\[.*?\])\s*;",
-        re.DOTALL,
-    )
-
-    for script in soup.find_all("script"):
-        text = script.string
-        if not text or variable not in text:
-            continue
-        match = pattern.search(text)
-        if match:
-            try:
-                data = json.loads(match.group(1))
-                if isinstance(data, list):
-                    return data
-            except json.JSONDecodeError:
-                _logger.debug(
-                    "JSON decode failed for variable '%s'",
-                    variable,
-                )
-                continue
-
-    return []
+    return script_index(soup).json_array(variable)
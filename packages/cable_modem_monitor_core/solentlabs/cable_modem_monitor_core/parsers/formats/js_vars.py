@@ -15,19 +15,16 @@ See PARSING_SPEC.md System Info section (javascript_vars source).
 from __future__ import annotations
 
 import logging
-import re
 from typing import Any
 
 from ...models.parser_config.system_info import JSVarsSystemInfoSource
 from ..base import BaseParser
 from ..diagnostics import record_failed_field
+from ..script_index import script_index
 from ..type_conversion import convert_value
 
 _logger = logging.getLogger(__name__)
 
-# Matches: var x = 'value'  or  x = 'value'  (single-quoted)
-_JS_VAR_RE = re.compile(r"(?:var\s+)?(\w+)\s*=\s*'([^']*)'")
-
 
 class JSVarsParser(BaseParser):
     """Extract key-value pairs from JS variable assignments.
@@ -61,25 +58,19 @@ class JSVarsParser(BaseParser):
 
         result: dict[str, Any] = {}
         self.failed_fields = {}
-        for script in soup.find_all("script"):
-            text = script.string
-            if not text:
-                continue
-            for match in _JS_VAR_RE.finditer(text):
-                var_name = match.group(1)
-                field_def = var_to_mapping.get(var_name)
-                if field_def is not None:
-                    raw_value = match.group(2)
-                    converted = convert_value(
-                        raw_value,
-                        field_def.type,
-                        map_config=field_def.map,
-                        input_format=field_def.format,
-                        scale=field_def.scale,
-                    )
-                    if converted is not None:
-                        result[field_def.field] = converted
-                    elif raw_value:
-                        record_failed_field(self.failed_fields, field_def.field, raw_value)
+        for var_name, raw_value in script_index(soup).assignments:
+            field_def = var_to_mapping.get(var_name)
+            if field_def is not None:
+                converted = convert_value(
+                    raw_value,
+                    field_def.type,
+                    map_config=field_def.map,
+                    input_format=field_def.format,
+                    scale=field_def.scale,
+                )
+                if converted is not None:
+                    result[field_def.field] = converted
+                elif raw_value:
+                    record_failed_field(self.failed_fields, field_def.field, raw_value)
 
         return result
@@ -29,7 +29,7 @@ from ...models.parser_config.common import (
 from ...models.parser_config.json_format import JSONSection
 from ..base import BaseParser
 from ..filter import passes_filter
-from ..type_conversion import convert_value
+from ..type_conversion import convert_column
 
 _logger = logging.getLogger(__name__)
 
@@ -167,14 +167,7 @@ def _extract_from_array(
         return []
 
     channels: list[dict[str, Any]] = []
-    for item in array:
-        if not isinstance(item, dict):
-            continue
-
-        channel = _extract_channel(item, mappings)
-        if channel is None:
-            continue
-
+    for channel in _extract_channels([item for item in array if isinstance(item, dict)], mappings):
         _apply_channel_type(channel, channel_type)
 
         for field_name, field_value in fixed_fields.items():
@@ -188,14 +181,16 @@ def _extract_from_array(
     return channels
 
 
-def _extract_channel(
-    item: dict[str, Any],
+def _extract_channels(
+    items: list[dict[str, Any]],
     mappings: list[JsonChannelMapping],
-) -> dict[str, Any] | None:
-    """Extract field values from one JSON object by key.
+) -> list[dict[str, Any]]:
+    """Extract field values from each JSON object by key.
 
     Tries the primary ``key`` first, then ``fallback_key`` if present.
-    Returns ``None`` if no fields could be extracted.
+    Each mapping's values are converted across all items in one batch
+    (``convert_column``). Items where no field could be extracted
+    yield no channel.
 
     Raw values that are absent, whitespace-only, or listed in the
     mapping's ``null_values`` are silently skipped (sparse-data
@@ -204,44 +199,37 @@ def _extract_channel(
     logs so catalog gaps don't go unnoticed when firmware introduces
     a novel shape.
     """
-    channel: dict[str, Any] = {}
+    channels: list[dict[str, Any]] = [{} for _ in items]
 
     for mapping in mappings:
-        original_raw = item.get(mapping.key)
+        pending: list[tuple[dict[str, Any], Any, Any]] = []
 
-        # Try fallback key if primary is missing
-        if original_raw is None and mapping.fallback_key:
-            original_raw = item.get(mapping.fallback_key)
+        for channel, item in zip(channels, items, strict=True):
+            original_raw = _lookup(item, mapping)
+            if original_raw is None:
+                continue
 
-        if original_raw is None:
-            continue
-        if isinstance(original_raw, str) and not original_raw.strip():
-            continue
-        # Declared no-value sentinels are sparse data, same as absent or
-        # whitespace-only; the cannot-coerce WARN below stays reserved
-        # for shapes the catalog has not seen.
-        if isinstance(original_raw, str) and original_raw.strip() in mapping.null_values:
-            continue
+            # Boolean truthy check: compare against declared truthy value
+            if mapping.truthy is not None:
+                channel[mapping.field] = original_raw == mapping.truthy
+                continue
 
-        # Boolean truthy check: compare against declared truthy value
-        if mapping.truthy is not None:
-            channel[mapping.field] = original_raw == mapping.truthy
-            continue
+            raw_value, transform_warned = _apply_transform(original_raw, mapping)
 
-        raw_value, transform_warned = _apply_transform(original_raw, mapping)
+            if raw_value is None:
+                if not transform_warned:
+                    _logger.warning(
+                        "Field '%s' (type=%s): transform produced no value for raw %r",
+                        mapping.field,
+                        mapping.type,
+                        original_raw,
+                    )
+                continue
 
-        if raw_value is None:
-            if not transform_warned:
-                _logger.warning(
-                    "Field '%s' (type=%s): transform produced no value for raw %r",
-                    mapping.field,
-                    mapping.type,
-                    original_raw,
-                )
-            continue
+            pending.append((channel, original_raw, raw_value))
 
-        value = convert_value(
-            raw_value,
+        values = convert_column(
+            [raw_value for _, _, raw_value in pending],
             mapping.type,
             unit=mapping.unit,
             map_config=mapping.map,
@@ -249,20 +237,41 @@ def _extract_channel(
             input_format=mapping.format,
         )
 
-        if value is None:
-            _logger.warning(
-                "Field '%s' (type=%s): cannot coerce raw value %r — "
-                "no extractor handled this shape. Declare a separator "
-                "or range in parser.yaml if firmware uses a compound format.",
-                mapping.field,
-                mapping.type,
-                original_raw,
-            )
-            continue
+        for (channel, original_raw, _), value in zip(pending, values, strict=True):
+            if value is None:
+                _logger.warning(
+                    "Field '%s' (type=%s): cannot coerce raw value %r — "
+                    "no extractor handled this shape. Declare a separator "
+                    "or range in parser.yaml if firmware uses a compound format.",
+                    mapping.field,
+                    mapping.type,
+                    original_raw,
+                )
+                continue
+
+            channel[mapping.field] = value
+
+    return [channel for channel in channels if channel]
+
+
+def _lookup(item: dict[str, Any], mapping: JsonChannelMapping) -> Any:
+    """Raw value of *mapping* in *item*, or ``None`` when it carries no data."""
+    original_raw = item.get(mapping.key)
 
-        channel[mapping.field] = value
+    # Try fallback key if primary is missing
+    if original_raw is None and mapping.fallback_key:
+        original_raw = item.get(mapping.fallback_key)
+
+    if isinstance(original_raw, str):
+        if not original_raw.strip():
+            return None
+        # Declared no-value sentinels are sparse data, same as absent or
+        # whitespace-only; the cannot-coerce WARN stays reserved for
+        # shapes the catalog has not seen.
+        if original_raw.strip() in mapping.null_values:
+            return None
 
-    return channel if channel else None
+    return original_raw
 
 
 def _apply_transform(
@@ -29,9 +29,11 @@ See PARSING_SPEC.md Parser Registry section.
 from __future__ import annotations
 
 import re
+import sys
 from collections.abc import Callable
 from typing import Any
 
+from ..lazy_exports import lazy_exports
 from ..models.parser_config.config import CHANNEL_SECTION_MODELS
 from ..models.parser_config.javascript import JSEmbeddedSection
 from ..models.parser_config.js_json import JSJsonSection
@@ -50,21 +52,38 @@ from ..models.parser_config.table import HTMLTableSection
 from ..models.parser_config.transposed import HTMLTableTransposedSection
 from ..models.parser_config.xml_format import XMLSection
 from .diagnostics import AnchorCount
-from .formats.hnap import HNAPParser
-from .formats.hnap_fields import HNAPFieldsParser
-from .formats.html_fields import HTMLFieldsParser
-from .formats.html_table import HTMLTableParser
-from .formats.html_table_transposed import HTMLTableTransposedParser
-from .formats.js_embedded import JSEmbeddedParser
-from .formats.js_json_parser import JSJsonParser
-from .formats.js_system_info import JSSystemInfoParser
-from .formats.js_vars import JSVarsParser
-from .formats.json_parser import JSONParser
-from .formats.json_system_info import JSONSystemInfoParser
-from .formats.json_transposed import JSONTransposedParser
-from .formats.xml_parser import XMLChannelParser
-from .formats.xml_system_info import XMLSystemInfoParser
-from .table_selector import find_table
+from .script_index import script_index
+
+# Format parser classes are module attributes resolved on first use
+# (PEP 562), so importing the registry — and the coordinator and
+# collector above it — does not import bs4 or every format module.
+# Wrappers look them up through ``_parser`` so tests can still patch
+# ``registries.<ParserClass>``.
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "HNAPParser": ".formats.hnap",
+        "HNAPFieldsParser": ".formats.hnap_fields",
+        "HTMLFieldsParser": ".formats.html_fields",
+        "HTMLTableParser": ".formats.html_table",
+        "HTMLTableTransposedParser": ".formats.html_table_transposed",
+        "JSEmbeddedParser": ".formats.js_embedded",
+        "JSJsonParser": ".formats.js_json_parser",
+        "JSSystemInfoParser": ".formats.js_system_info",
+        "JSVarsParser": ".formats.js_vars",
+        "JSONParser": ".formats.json_parser",
+        "JSONSystemInfoParser": ".formats.json_system_info",
+        "JSONTransposedParser": ".formats.json_transposed",
+        "XMLChannelParser": ".formats.xml_parser",
+        "XMLSystemInfoParser": ".formats.xml_system_info",
+    },
+)
+
+
+def _parser(name: str) -> Any:
+    """Return the format parser class registered under *name*."""
+    return getattr(sys.modules[__name__], name)
+
 
 # ---------------------------------------------------------------------------
 # Anchor presence detection
@@ -93,20 +112,36 @@ def _count_js_function_anchors(soup: Any, function_names: list[str]) -> AnchorCo
     (declaration syntax we don't recognize) is not observed in any
     catalog modem.
     """
-    if soup is None:
-        return AnchorCount(expected=len(function_names), fulfilled=0)
-    text = str(soup) if not isinstance(soup, str) else soup
-    fulfilled = sum(1 for name in function_names if re.search(rf"function\s+{re.escape(name)}\s*\(", text))
-    return AnchorCount(expected=len(function_names), fulfilled=fulfilled)
+    return _count_script_anchors(soup, function_names, function=True)
 
 
 def _count_js_variable_anchors(soup: Any, variable_names: list[str]) -> AnchorCount:
     """Count how many JS variable assignments are present in soup."""
+    return _count_script_anchors(soup, variable_names, function=False)
+
+
+def _count_script_anchors(soup: Any, names: list[str], *, function: bool) -> AnchorCount:
+    """Count names the page declares as functions, or assigns to.
+
+    Script contents are checked through the page's ``ScriptIndex``.
+    Names they lack are searched in the whole document, serialized at
+    most once per call, so present anchors never pay for ``str(soup)``.
+    """
     if soup is None:
-        return AnchorCount(expected=len(variable_names), fulfilled=0)
-    text = str(soup) if not isinstance(soup, str) else soup
-    fulfilled = sum(1 for name in variable_names if re.search(rf"{re.escape(name)}\s*=", text))
-    return AnchorCount(expected=len(variable_names), fulfilled=fulfilled)
+        return AnchorCount(expected=len(names), fulfilled=0)
+    index = None if isinstance(soup, str) or not hasattr(soup, "find_all") else script_index(soup)
+    document: str | None = None
+    fulfilled = 0
+    for name in names:
+        if index is not None and (index.declares_function(name) if function else index.assigns(name)):
+            fulfilled += 1
+            continue
+        if document is None:
+            document = str(soup)
+        pattern = rf"function\s+{re.escape(name)}\s*\(" if function else rf"{re.escape(name)}\s*="
+        if re.search(pattern, document) is not None:
+            fulfilled += 1
+    return AnchorCount(expected=len(names), fulfilled=fulfilled)
 
 
 def resource_present(resources: dict[str, Any], resource: str) -> AnchorCount:
@@ -138,7 +173,7 @@ def _parse_hnap_channels(
     caught earlier as LOAD_AUTH (stale session) or LOAD_ERROR (HTTP),
     so the wrapper reports trivially fulfilled.
     """
-    hnap_parser = HNAPParser(section)
+    hnap_parser = _parser("HNAPParser")(section)
     channels = hnap_parser.parse(resources)
     if not isinstance(channels, list):
         channels = []
@@ -153,11 +188,13 @@ def _parse_html_table_channels(
     primary_channels: list[dict[str, Any]] = []
     companion_tables: list[tuple[list[dict[str, Any]], list[str]]] = []
 
+    from .table_selector import find_table
+
     soup = resources.get(section.resource)
     fulfilled = 0
 
     for table_def in section.tables:
-        parser = HTMLTableParser(section.resource, table_def)
+        parser = _parser("HTMLTableParser")(section.resource, table_def)
         channels = parser.parse(resources)
         if not isinstance(channels, list):
             continue
@@ -208,7 +245,7 @@ def _parse_transposed_channels(
     companion_tables: list[tuple[list[dict[str, Any]], list[str]]] = []
 
     for table_def in tables:
-        parser = HTMLTableTransposedParser(section.resource, table_def)
+        parser = _parser("HTMLTableTransposedParser")(section.resource, table_def)
         channels = parser.parse(resources)
         if not isinstance(channels, list):
             continue
@@ -249,7 +286,7 @@ def _parse_js_embedded_channels(
     """
     function_results: list[list[dict[str, Any]]] = []
     for func in section.functions:
-        parser = JSEmbeddedParser(section.resource, func)
+        parser = _parser("JSEmbeddedParser")(section.resource, func)
         result = parser.parse(resources)
         if isinstance(result, list):
             function_results.append(result)
@@ -286,7 +323,7 @@ def _parse_json_channels(
     field, so each path reports trivially fulfilled when its resources
     are present.
     """
-    parser = JSONParser(section)
+    parser = _parser("JSONParser")(section)
     channels = parser.parse(resources)
     if not isinstance(channels, list):
         channels = []
@@ -321,7 +358,7 @@ def _parse_js_json_channels(
     See PARSING_SPEC.md § Parser Diagnostics, FORMAT_JAVASCRIPT_SPEC.md
     § Failure modes.
     """
-    parser = JSJsonParser(section)
+    parser = _parser("JSJsonParser")(section)
     channels = parser.parse(resources)
     if not isinstance(channels, list):
         channels = []
@@ -348,7 +385,7 @@ def _parse_xml_channels(
     the cbn transport hasn't exhibited the stub-page failure shape that
     drives UC-19a; opt in if the same pattern surfaces.
     """
-    parser = XMLChannelParser(section)
+    parser = _parser("XMLChannelParser")(section)
     channels = parser.parse(resources)
     if not isinstance(channels, list):
         channels = []
@@ -367,7 +404,7 @@ def _parse_json_transposed_channels(
     resources: dict[str, Any],
 ) -> tuple[list[dict[str, Any]], AnchorCount]:
     """Parse channels from a JSONTransposedParser section."""
-    parser = JSONTransposedParser(section)
+    parser = _parser("JSONTransposedParser")(section)
     channels = parser.parse(resources)
     if not isinstance(channels, list):
         channels = []
@@ -415,7 +452,7 @@ def _parse_html_fields_sysinfo(
     resources: dict[str, Any],
 ) -> tuple[dict[str, Any], AnchorCount, dict[str, str]]:
     """Parse system_info from HTML label/value pairs."""
-    html_si = HTMLFieldsParser(source)
+    html_si = _parser("HTMLFieldsParser")(source)
     result = html_si.parse(resources)
     if not isinstance(result, dict):
         result = {}
@@ -431,7 +468,7 @@ def _parse_hnap_sysinfo(
     See note on ``_parse_hnap_channels``: HNAP is not subject to the
     HTML stub-page failure mode that drives UC-19a.
     """
-    hnap_si = HNAPFieldsParser(source)
+    hnap_si = _parser("HNAPFieldsParser")(source)
     result = hnap_si.parse(resources)
     if not isinstance(result, dict):
         result = {}
@@ -450,7 +487,7 @@ def _parse_js_sysinfo(
     countable function anchor — they contribute to ``_resource_present``
     instead.
     """
-    js_si = JSSystemInfoParser(source)
+    js_si = _parser("JSSystemInfoParser")(source)
     result = js_si.parse(resources)
     if not isinstance(result, dict):
         result = {}
@@ -474,7 +511,7 @@ def _parse_js_vars_sysinfo(
     expected anchor. Fulfilled when the variable assignment is present
     in the soup.
     """
-    js_vars_si = JSVarsParser(source)
+    js_vars_si = _parser("JSVarsParser")(source)
     result = js_vars_si.parse(resources)
     if not isinstance(result, dict):
         result = {}
@@ -493,7 +530,7 @@ def _parse_json_sysinfo(
     resources: dict[str, Any],
 ) -> tuple[dict[str, Any], AnchorCount, dict[str, str]]:
     """Parse system_info from a JSON API response."""
-    json_si = JSONSystemInfoParser(source)
+    json_si = _parser("JSONSystemInfoParser")(source)
     result = json_si.parse(resources)
     if not isinstance(result, dict):
         result = {}
@@ -505,7 +542,7 @@ def _parse_xml_sysinfo(
     resources: dict[str, Any],
 ) -> tuple[dict[str, Any], AnchorCount, dict[str, str]]:
     """Parse system_info from XML element fields."""
-    xml_si = XMLSystemInfoParser(source)
+    xml_si = _parser("XMLSystemInfoParser")(source)
     result = xml_si.parse(resources)
     if not isinstance(result, dict):
         result = {}
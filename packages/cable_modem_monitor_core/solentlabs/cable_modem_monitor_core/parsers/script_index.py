@@ -0,0 +1,193 @@
+"""Script index — one scan of a page's ``<script>`` blocks for every JS format.
+
+``JSEmbeddedParser``, ``JSSystemInfoParser``, ``JSVarsParser``,
+``JSJsonParser`` and the coordinator's anchor counting all read the
+same scripts. Each used to walk ``find_all("script")`` and run its own
+regexes per function or per variable, and anchor counting serialized
+the whole soup with ``str(soup)`` for every section. ``ScriptIndex``
+collects the script texts once per parsed document and answers all of
+them:
+
+- **Function bodies** — every ``function name(...)`` declaration is
+  found in one scan per script, keyed by name. A body runs from its
+  opening ``{`` to the first line that starts with ``}`` (some firmware
+  indents the entire function), exactly as the per-function regex
+  this replaces delimited it. Those line positions are also collected
+  in one scan, so finding a body is a dictionary hit and a bisect.
+- **Variable assignments** — ``var x = '...'`` string assignments in
+  document order, for ``javascript_vars`` sources.
+- **JSON arrays** — ``name = [...];`` literals, parsed once per name.
+
+Every lookup is memoized, and the index lives on the soup (see
+``soup_memo``), so all sections and sources on one resource share it.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import re
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from ..json_codec import decode_json
+from .soup_memo import soup_memo
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, Tag
+
+_logger = logging.getLogger(__name__)
+
+# ``var tagValueList = 'value'`` or ``"value"`` inside a function body.
+# Handles optional whitespace and both quote styles.
+_TAG_VALUE_RE = re.compile(
+    r"var\s+tagValueList\s*=\s*[\"']([^\"']*)[\"']",
+)
+
+# ``//``-style line comments, up to end-of-line. Applied after
+# block-comment removal so that commented-out example ``tagValueList``
+# lines don't shadow real ones.
+_LINE_COMMENT_RE = re.compile(r"//[^\n]*")
+
+# ``/* ... */`` block comments (including multi-line).
+_BLOCK_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+
+# ``function name(`` — the declaration head. The parameter list and
+# opening brace are matched from the ``(`` by ``_FUNCTION_OPEN_RE``.
+_FUNCTION_DECL_RE = re.compile(r"function\s+([\w$]+)\s*\(")
+_FUNCTION_OPEN_RE = re.compile(r"\([^)]*\)\s*\{")
+
+# A newline whose next non-whitespace character is ``}`` — where a
+# function body ends.
+_BODY_CLOSE_RE = re.compile(r"\n(?=\s*\})")
+
+# ``var x = 'value'`` or ``x = 'value'`` (single-quoted).
+_JS_VAR_RE = re.compile(r"(?:var\s+)?(\w+)\s*=\s*'([^']*)'")
+
+
+def strip_js_comments(text: str) -> str:
+    """Strip both block and line comments from JavaScript source text."""
+    text = _BLOCK_COMMENT_RE.sub("", text)
+    return _LINE_COMMENT_RE.sub("", text)
+
+
+class _Script:
+    """Function declarations and body boundaries of one script."""
+
+    def __init__(self, text: str) -> None:
+        # Normalize CRLF → LF (some firmware serves \r\n line endings)
+        self.text = text.replace("\r\n", "\n")
+        self.declarations: dict[str, list[int]] = {}
+        for match in _FUNCTION_DECL_RE.finditer(self.text):
+            self.declarations.setdefault(match.group(1), []).append(match.end() - 1)
+        self._closers: list[int] | None = None
+
+    def body(self, name: str) -> str | None:
+        """Body of the first declaration of *name* that has one."""
+        for paren in self.declarations.get(name, ()):
+            opening = _FUNCTION_OPEN_RE.match(self.text, paren)
+            if opening is None:
+                continue
+            if self._closers is None:
+                self._closers = [m.start() for m in _BODY_CLOSE_RE.finditer(self.text)]
+            at = bisect.bisect_left(self._closers, opening.end())
+            if at == len(self._closers):
+                # No closing line after this one, nor after any later one.
+                return None
+            return self.text[opening.end() : self._closers[at]]
+        return None
+
+
+class ScriptIndex:
+    """``<script>`` contents of one parsed document, indexed for the JS formats.
+
+    Args:
+        soup: Parsed HTML document or subtree.
+    """
+
+    def __init__(self, soup: BeautifulSoup | Tag) -> None:
+        self.texts: list[str] = [str(script.string) for script in soup.find_all("script") if script.string]
+        self._tag_value_lists: dict[str, str | None] = {}
+        self._json_arrays: dict[str, list[Any]] = {}
+        self._assigned: dict[str, bool] = {}
+
+    @cached_property
+    def _scripts(self) -> list[_Script]:
+        return [_Script(text) for text in self.texts]
+
+    @cached_property
+    def assignments(self) -> list[tuple[str, str]]:
+        """``(name, value)`` of every single-quoted string assignment, in order."""
+        return [(m.group(1), m.group(2)) for text in self.texts for m in _JS_VAR_RE.finditer(text)]
+
+    def declares_function(self, name: str) -> bool:
+        """True if any script declares ``function name(``."""
+        return any(name in script.declarations for script in self._scripts)
+
+    def assigns(self, name: str) -> bool:
+        """True if any script contains ``name =``."""
+        if name not in self._assigned:
+            pattern = re.compile(rf"{re.escape(name)}\s*=")
+            self._assigned[name] = any(pattern.search(text) for text in self.texts)
+        return self._assigned[name]
+
+    def tag_value_list(self, func_name: str) -> str | None:
+        """``tagValueList`` of function *func_name*, or at script scope when empty.
+
+        Comments are stripped first, so commented-out examples don't
+        shadow the real assignment. Scripts are searched in document
+        order; the first one yielding a value wins.
+        """
+        if func_name not in self._tag_value_lists:
+            self._tag_value_lists[func_name] = (
+                self._function_tag_value_list(func_name) if func_name else self._top_level_tag_value_list()
+            )
+        return self._tag_value_lists[func_name]
+
+    def json_array(self, variable: str) -> list[Any]:
+        """JSON array assigned to *variable* (``variable = [...];``), or empty."""
+        if variable not in self._json_arrays:
+            self._json_arrays[variable] = self._find_json_array(variable)
+        return self._json_arrays[variable]
+
+    def _function_tag_value_list(self, func_name: str) -> str | None:
+        for script in self._scripts:
+            body = script.body(func_name)
+            if body is None:
+                continue
+            tag_match = _TAG_VALUE_RE.search(strip_js_comments(body))
+            if tag_match:
+                return tag_match.group(1)
+        return None
+
+    def _top_level_tag_value_list(self) -> str | None:
+        for text in self.texts:
+            tag_match = _TAG_VALUE_RE.search(strip_js_comments(text))
+            if tag_match:
+                return tag_match.group(1)
+        return None
+
+    def _find_json_array(self, variable: str) -> list[Any]:
+        pattern = re.compile(
+            rf"{re.escape(variable)}\s*=\s*(\[.*?\])\s*;",
+            re.DOTALL,
+        )
+        for text in self.texts:
+            if variable not in text:
+                continue
+            match = pattern.search(text)
+            if match:
+                try:
+                    data = decode_json(match.group(1))
+                except json.JSONDecodeError:
+                    _logger.debug("JSON decode failed for variable '%s'", variable)
+                    continue
+                if isinstance(data, list):
+                    return data
+        return []
+
+
+def script_index(soup: BeautifulSoup | Tag) -> ScriptIndex:
+    """The ``ScriptIndex`` of *soup*, created on first call."""
+    return soup_memo(soup, "script_index", lambda: ScriptIndex(soup))
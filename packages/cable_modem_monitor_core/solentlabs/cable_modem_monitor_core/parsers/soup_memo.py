@@ -0,0 +1,30 @@
+"""Per-document derived data stored on the parsed soup itself.
+
+Parsers that index a page (tables, labels) keep the index on the
+``BeautifulSoup`` it describes, so every parser reading the same
+resource in a poll shares one build and the index is freed with the
+page. Keying a side table by the soup instead would not work:
+``Tag.__hash__`` serializes the whole document.
+
+Entries are read through ``__dict__`` because bs4's ``Tag.__getattr__``
+turns unknown attribute names into child-tag searches. A soup with a
+memoized index must not be mutated afterwards.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, Tag
+
+
+def soup_memo[T](soup: BeautifulSoup | Tag, key: str, build: Callable[[], T]) -> T:
+    """Value stored on *soup* under *key*, built by *build* on first call."""
+    slot = f"_cmm_{key}"
+    value = soup.__dict__.get(slot)
+    if value is None:
+        value = build()
+        soup.__dict__[slot] = value
+    return value
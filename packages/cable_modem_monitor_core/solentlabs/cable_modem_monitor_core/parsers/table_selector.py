@@ -48,21 +48,137 @@ tried if the primary returns no match. Chain as many as needed::
         type: header_text
         match: "SNR"
 
+Table index
+-----------
+
+A page with downstream, upstream and OFDM tables is searched once per
+``TableDefinition``, per fallback, and again by the coordinator's
+fulfilment check. ``find_table`` answers all of them from one
+``TableIndex`` per parsed document: the ordered ``<table>`` list, the
+first element for each ``id`` and the normalized text of every leaf
+cell are each collected in a single walk, the first time a selector
+needs them, and every lookup's result is memoized. The index lives on
+the soup it describes, so it is built at most once per decoded
+resource and freed with it. Parsers must not mutate a soup after a
+table lookup (see ``soup_memo``).
+
 See PARSING_SPEC.md Table Selectors section.
 """
 
 from __future__ import annotations
 
 import logging
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
+from functools import cached_property
 
 from bs4 import BeautifulSoup, Tag
 
 from ..models.parser_config.common import TableSelector
+from .soup_memo import soup_memo
 
 _logger = logging.getLogger(__name__)
 
 
+class TableIndex:
+    """Tables of one parsed document, indexed for selector lookups.
+
+    Each part of the index is built on first use and every lookup is
+    memoized by selector type and match, so repeated and fallback
+    lookups against the same page cost a dict hit.
+
+    Args:
+        soup: Parsed HTML document or subtree.
+    """
+
+    def __init__(self, soup: BeautifulSoup | Tag) -> None:
+        self._soup = soup
+        self._results: dict[tuple[str, object], Tag | None] = {}
+
+    @cached_property
+    def tables(self) -> list[Tag]:
+        """Every ``<table>`` in document order (ordinal = list index)."""
+        return [t for t in self._soup.find_all("table") if isinstance(t, Tag)]
+
+    @cached_property
+    def _ids(self) -> dict[str, Tag]:
+        """First element carrying each ``id``, as ``soup.find(id=...)`` returns it."""
+        ids: dict[str, Tag] = {}
+        for element in self._soup.find_all(id=True):
+            if isinstance(element, Tag):
+                ids.setdefault(str(element.get("id")), element)
+        return ids
+
+    @cached_property
+    def _cells(self) -> list[tuple[str, Tag]]:
+        """``(lowercased text, owning table)`` per leaf cell, ``<th>`` before ``<td>``.
+
+        Cells with a nested ``<table>`` are layout wrappers and are left
+        out, as are cells outside any table.
+        """
+        wrappers: set[int] = set()
+        for table in self.tables:
+            for ancestor in table.parents:
+                if ancestor.name in ("td", "th"):
+                    wrappers.add(id(ancestor))
+
+        cells: list[tuple[str, Tag]] = []
+        for tag_name in ("th", "td"):
+            for cell in self._soup.find_all(tag_name):
+                if id(cell) in wrappers:
+                    continue
+                owner = cell.find_parent("table")
+                if owner is not None:
+                    cells.append((cell.get_text(strip=True).lower(), owner))
+        return cells
+
+    def by_header_text(self, text: str) -> Tag | None:
+        """Find table by header cell text content.
+
+        Searches ``<th>`` and then ``<td>`` cells for a case-insensitive
+        substring match and returns the owning ``<table>``. This finds
+        text that is **inside** the table — column headers, merged
+        heading rows, etc. Text in separate wrapper tables, preceding
+        headings, or sibling elements will match the *wrong* table.
+
+        Cells that contain nested ``<table>`` elements are skipped — they
+        are layout wrappers, not header or data cells, and their text
+        includes descendant text from the nested tables.
+
+        Use column header text unique to the target table. For example,
+        ``"SNR"`` matches ``"SNR (dB)"`` in a downstream table but does
+        not appear in upstream tables on the same page.
+        """
+        needle = text.lower()
+        return self._memo(("header_text", needle), lambda: next((t for c, t in self._cells if needle in c), None))
+
+    def by_id(self, element_id: str) -> Tag | None:
+        """Table with, or enclosing the element with, *element_id*."""
+        return self._memo(("id", element_id), lambda: _table_of(self._ids.get(element_id)))
+
+    def by_nth(self, index: int) -> Tag | None:
+        """The *index*-th table (0-based)."""
+        return self.tables[index] if 0 <= index < len(self.tables) else None
+
+    def by_css(self, css_selector: str) -> Tag | None:
+        """Table matched by, or enclosing the match of, *css_selector*."""
+        return self._memo(("css", css_selector), lambda: _table_of(self._soup.select_one(css_selector)))
+
+    def by_attribute(self, attrs: Mapping[str, str]) -> Tag | None:
+        """Table carrying, or enclosing the first element carrying, *attrs*."""
+        key = ("attribute", tuple(sorted(attrs.items())))
+        return self._memo(key, lambda: _table_of(self._soup.find(None, dict(attrs))))
+
+    def _memo(self, key: tuple[str, object], lookup: Callable[[], Tag | None]) -> Tag | None:
+        if key not in self._results:
+            self._results[key] = lookup()
+        return self._results[key]
+
+
+def table_index(soup: BeautifulSoup | Tag) -> TableIndex:
+    """The ``TableIndex`` of *soup*, created on first call."""
+    return soup_memo(soup, "table_index", lambda: TableIndex(soup))
+
+
 def find_table(soup: BeautifulSoup | Tag, selector: TableSelector) -> Tag | None:
     """Find a ``<table>`` element using the configured selector.
 
@@ -76,116 +192,42 @@ def find_table(soup: BeautifulSoup | Tag, selector: TableSelector) -> Tag | None
     Returns:
         The matched ``<table>`` element, or ``None``.
     """
-    table = _find_table_by_type(soup, selector)
-    if table is not None:
-        return table
-
-    if selector.fallback is not None:
-        return find_table(soup, selector.fallback)
-
+    index = table_index(soup)
+    current: TableSelector | None = selector
+    while current is not None:
+        table = _find_table_by_type(index, current)
+        if table is not None:
+            return table
+        current = current.fallback
     return None
 
 
-def _find_table_by_type(
-    soup: BeautifulSoup | Tag,
-    selector: TableSelector,
-) -> Tag | None:
-    """Dispatch to type-specific table finder."""
+def _find_table_by_type(index: TableIndex, selector: TableSelector) -> Tag | None:
+    """Dispatch to type-specific table lookup."""
     sel_type = selector.type
     match = selector.match
 
     if sel_type == "header_text":
-        return _find_by_header_text(soup, str(match))
+        return index.by_header_text(str(match))
     if sel_type == "css":
-        return _find_by_css(soup, str(match))
+        return index.by_css(str(match))
     if sel_type == "id":
-        return _find_by_id(soup, str(match))
+        return index.by_id(str(match))
     if sel_type == "nth":
-        return _find_by_nth(soup, int(str(match)))
+        return index.by_nth(int(str(match)))
     if sel_type == "attribute":
         if isinstance(match, dict):
-            return _find_by_attribute(soup, match)
+            return index.by_attribute(match)
         return None
 
     _logger.warning("Unknown selector type: %s", sel_type)
     return None
 
 
-def _find_by_header_text(soup: BeautifulSoup | Tag, text: str) -> Tag | None:
-    """Find table by header cell text content.
-
-    Searches ``<th>`` and ``<td>`` elements for a case-insensitive
-    substring match, then returns the parent ``<table>``. This finds
-    text that is **inside** the table — column headers, merged heading
-    rows, etc. Text in separate wrapper tables, preceding headings,
-    or sibling elements will match the *wrong* table.
-
-    Cells that contain nested ``<table>`` elements are skipped — they
-    are layout wrappers, not header or data cells. This prevents
-    matching on wrapper cells whose ``get_text()`` includes descendant
-    text from nested tables.
-
-    Use column header text unique to the target table. For example,
-    ``"SNR"`` matches ``"SNR (dB)"`` in a downstream table but does
-    not appear in upstream tables on the same page.
-    """
-    for tag_name in ("th", "td"):
-        for cell in soup.find_all(tag_name):
-            # Skip wrapper cells that contain nested tables
-            if cell.find("table") is not None:
-                continue
-            cell_text = cell.get_text(strip=True)
-            if text.lower() in cell_text.lower():
-                table = cell.find_parent("table")
-                if table is not None:
-                    return table
-    return None
-
-
-def _find_by_css(soup: BeautifulSoup | Tag, css_selector: str) -> Tag | None:
-    """Find table by CSS selector."""
-    result = soup.select_one(css_selector)
-    if result is not None and isinstance(result, Tag):
-        if result.name == "table":
-            return result
-        table = result.find_parent("table")
-        if table is not None:
-            return table
-    return None
-
-
-def _find_by_id(soup: BeautifulSoup | Tag, element_id: str) -> Tag | None:
-    """Find table by element id attribute."""
-    element = soup.find(id=element_id)
-    if element is None:
+def _table_of(element: object) -> Tag | None:
+    """*element* if it is a ``<table>``, else its nearest enclosing table."""
+    if not isinstance(element, Tag):
         return None
-    if isinstance(element, Tag) and element.name == "table":
+    if element.name == "table":
         return element
-    if isinstance(element, Tag):
-        return element.find_parent("table")
-    return None
-
-
-def _find_by_nth(soup: BeautifulSoup | Tag, index: int) -> Tag | None:
-    """Find the Nth table on the page (0-based)."""
-    tables = soup.find_all("table")
-    if 0 <= index < len(tables):
-        result = tables[index]
-        if isinstance(result, Tag):
-            return result
-    return None
-
-
-def _find_by_attribute(
-    soup: BeautifulSoup | Tag,
-    attrs: Mapping[str, str],
-) -> Tag | None:
-    """Find table by element attributes."""
-    element = soup.find(None, dict(attrs))
-    if element is None:
-        return None
-    if isinstance(element, Tag) and element.name == "table":
-        return element
-    if isinstance(element, Tag):
-        return element.find_parent("table")
-    return None
+    return element.find_parent("table")
@@ -4,6 +4,11 @@ Handles field type conversion (integer, float, string, frequency, boolean,
 lock_status, modulation, uptime_seconds), unit suffix stripping, value
 mapping, scale multiplication, and frequency normalization.
 
+``convert_value`` converts one value. Channel parsers convert whole
+columns — every raw value of one field mapping — with ``convert_column``,
+which resolves the type handler, lowercased unit and uptime pattern once
+per column instead of once per cell.
+
 See PARSING_SPEC.md Field Types for the authoritative type definitions.
 """
 
@@ -11,6 +16,7 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Callable, Iterable
 from typing import Any
 
 from ..spec_conformance import canonicalize_modulation
@@ -77,11 +83,12 @@ def normalize_frequency(raw: str | int | float) -> int:
         suffix_found = ""
     else:
         cleaned = raw.strip()
+        lowered = cleaned.lower()
         suffix_found = ""
         # Strip common frequency unit suffixes (longest first to avoid
         # "hz" matching the tail of "mhz")
         for suffix in ("ghz", "mhz", "khz", "hz"):
-            if cleaned.lower().endswith(suffix):
+            if lowered.endswith(suffix):
                 suffix_found = suffix
                 cleaned = cleaned[: -len(suffix)].strip()
                 break
@@ -103,7 +110,7 @@ def normalize_frequency(raw: str | int | float) -> int:
     return int(round(value))
 
 
-_TYPE_HANDLERS: dict[str, Any] = {}  # populated after handler definitions
+_TYPE_HANDLERS: dict[str, Callable[..., int | float | str | bool | None]] = {}  # populated after handler definitions
 
 
 def convert_value(
@@ -156,6 +163,7 @@ def convert_value(
 
     # Step 4: type conversion via dispatch table
     handler = _TYPE_HANDLERS.get(field_type)
+    result: int | float | str | bool | None
     if handler is None:
         _logger.warning("Unknown field type '%s', returning as string", field_type)
         result = value
@@ -166,13 +174,127 @@ def convert_value(
 
     # Step 5: scale multiplication (numeric types only)
     if result is not None and scale is not None and isinstance(result, int | float):
-        result = round(result * scale, 10)
-        if isinstance(result, float) and result == int(result):
-            result = int(result)
+        result = _apply_scale(result, scale)
 
     return result
 
 
+type Converter = Callable[[Any], int | float | str | bool | None]
+
+
+def column_converter(
+    field_type: str,
+    *,
+    unit: str = "",
+    map_config: dict[str, str] | None = None,
+    scale: int | float | None = None,
+    input_format: str = "",
+) -> Converter:
+    """Build a converter specialized for one field mapping.
+
+    The returned callable gives exactly what ``convert_value`` gives
+    for the same arguments, but the type handler, the lowercased unit
+    and the uptime pattern are resolved once, here, rather than on
+    every call.
+
+    Args:
+        field_type: Declared field type (see ``convert_value``).
+        unit: Unit suffix to strip before numeric conversion.
+        map_config: Optional value mapping.
+        scale: Optional multiplier applied after type conversion.
+        input_format: Sub-format selector (``uptime`` only).
+
+    Returns:
+        Callable converting one raw value.
+    """
+    handler = _specialize_handler(field_type, input_format)
+    unit_lower = unit.lower()
+    unit_len = len(unit)
+
+    def convert(raw: Any) -> int | float | str | bool | None:
+        value = str(raw).strip()
+        if not value:
+            return None
+        if map_config is not None and value in map_config:
+            value = map_config[value]
+        if unit:
+            value = value.strip()
+            if value.lower().endswith(unit_lower):
+                value = value[:-unit_len].strip()
+        result = handler(value)
+        if result is not None and scale is not None and isinstance(result, int | float):
+            result = _apply_scale(result, scale)
+        return result
+
+    return convert
+
+
+def convert_column(
+    raw_values: Iterable[Any],
+    field_type: str,
+    *,
+    unit: str = "",
+    map_config: dict[str, str] | None = None,
+    scale: int | float | None = None,
+    input_format: str = "",
+) -> list[int | float | str | bool | None]:
+    """Convert every raw value of one column to the declared field type.
+
+    Equivalent to calling ``convert_value`` on each value with the same
+    keyword arguments, with the per-call dispatch done once for the
+    column (see ``column_converter``).
+
+    Args:
+        raw_values: Raw values of one field mapping, e.g. the cell
+            text of one table column, in row order.
+        field_type: Declared field type (see ``convert_value``).
+        unit: Unit suffix to strip before numeric conversion.
+        map_config: Optional value mapping.
+        scale: Optional multiplier applied after type conversion.
+        input_format: Sub-format selector (``uptime`` only).
+
+    Returns:
+        Converted values in input order; ``None`` where a value is
+        empty or cannot be converted.
+    """
+    convert = column_converter(
+        field_type,
+        unit=unit,
+        map_config=map_config,
+        scale=scale,
+        input_format=input_format,
+    )
+    return [convert(raw) for raw in raw_values]
+
+
+def _apply_scale(result: int | float, scale: int | float) -> int | float:
+    """Multiply by *scale*, casting whole-number floats to int."""
+    result = round(result * scale, 10)
+    if isinstance(result, float) and result == int(result):
+        result = int(result)
+    return result
+
+
+def _specialize_handler(field_type: str, input_format: str) -> Callable[[str], int | float | str | bool | None]:
+    """Type handler for *field_type* with its sub-format already resolved."""
+    handler = _TYPE_HANDLERS.get(field_type)
+    if handler is None:
+
+        def unknown(value: str) -> str:
+            _logger.warning("Unknown field type '%s', returning as string", field_type)
+            return value
+
+        return unknown
+    if field_type != "uptime":
+        return handler
+    if input_format == "seconds":
+        return _uptime_from_seconds
+    if input_format and "{" in input_format:
+        pattern = _compile_uptime_pattern(input_format)
+        return lambda value: _uptime_from_match(pattern, value, input_format)
+    return lambda value: _to_uptime(value, input_format)
+
+
 def _to_integer(value: str) -> int | None:
     """Convert string to integer, stripping non-numeric characters."""
     try:
@@ -334,7 +456,11 @@ def _compile_uptime_segment(segment: str) -> str:
 
 def _uptime_from_pattern(value: str, format_str: str) -> str | None:
     """Parse uptime from a custom placeholder format string."""
-    pattern = _compile_uptime_pattern(format_str)
+    return _uptime_from_match(_compile_uptime_pattern(format_str), value, format_str)
+
+
+def _uptime_from_match(pattern: re.Pattern[str], value: str, format_str: str) -> str | None:
+    """Parse uptime with the compiled pattern of *format_str*."""
     m = pattern.search(value)
     if not m:
         _logger.debug("Uptime pattern '%s' did not match '%s'", format_str, value)
@@ -0,0 +1,467 @@
+"""Headless poller — run the Orchestrator outside Home Assistant.
+
+Loads modem configs from the catalog, builds one Orchestrator per
+modem through the Core factory, and drives them all from a
+``FleetScheduler``. Each poll is emitted as one JSON Lines record:
+
+.. code-block:: json
+
+    {"type": "snapshot", "modem": "office", "host": "192.168.100.1",
+     "model": "SB8200", "timestamp": "2026-01-01T00:00:00+00:00",
+     "timings": {"poll_duration_s": 1.2, "queue_delay_s": 0.0,
+                 "resources": [...]},
+     "snapshot": {...}}
+
+``snapshot`` is ``ModemSnapshot.to_event_payload()`` — the same schema
+the HA adapter fires on the event bus. In daemon mode, health probes
+are emitted as ``"type": "health"`` records between polls.
+
+Records fan out to any number of sinks: a stream (stdout), append-only
+files, and a Unix domain socket that broadcasts to every connected
+reader. An optional ``OpenMetricsExporter`` is fed the same updates.
+
+CLI: ``python -m solentlabs.cable_modem_monitor_core poll --help``.
+See ORCHESTRATION_SPEC.md § Headless Poller.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import IO, Any, Literal, Protocol
+
+import yaml
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from .config_loader import load_modem_config, load_parser_config
+from .exporter import OpenMetricsExporter
+from .fleet import FleetScheduler
+from .orchestration.factory import apply_credential_encoding, create_orchestrator
+from .orchestration.models import HealthInfo, ModemIdentity, ModemSnapshot
+from .orchestration.modem_health import HealthMonitor
+from .orchestration.orchestrator import Orchestrator
+from .post_processor import load_post_processor
+
+_logger = logging.getLogger(__name__)
+
+
+# ------------------------------------------------------------------
+# Configuration
+# ------------------------------------------------------------------
+
+
+class PollTarget(BaseModel):
+    """One modem to poll.
+
+    Mirrors the HA config entry fields the adapter passes to the Core
+    factory, so a target behaves exactly like an HA-configured modem.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    name: str
+    modem_dir: str = Field(description="Catalog-relative or absolute modem directory")
+    host: str
+    variant: str | None = None
+    protocol: Literal["http", "https"] = "http"
+    username: str = ""
+    password: str = ""
+    password_env: str = Field(default="", description="Read the password from this environment variable")
+    legacy_ssl: bool = False
+    credential_encoding: Literal["plain", "b64_packed"] = "plain"
+    credential_field: str = ""
+    supports_icmp: bool | None = None
+    supports_head: bool | None = None
+    scan_interval: float = Field(default=600.0, gt=0)
+    health_interval: float | None = Field(default=30.0, gt=0)
+    profile_memory: bool = Field(default=False, description="Report each poll's traced allocation peak")
+    stream_html: bool = Field(default=False, description="Parse HTML resources while they download")
+
+    def resolved_password(self) -> str:
+        """Password from ``password_env`` when set, else ``password``."""
+        if self.password_env:
+            return os.environ.get(self.password_env, "")
+        return self.password
+
+
+class PollerConfig(BaseModel):
+    """Fleet file for the headless poller (YAML)."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    catalog: str | None = None
+    max_workers: int = Field(default=4, ge=1)
+    jitter: float = Field(default=0.1, ge=0, lt=1)
+    modems: list[PollTarget] = Field(min_length=1)
+
+    @model_validator(mode="after")
+    def _unique_names(self) -> PollerConfig:
+        seen: set[str] = set()
+        for target in self.modems:
+            if target.name in seen:
+                raise ValueError(f"duplicate modem name '{target.name}'")
+            seen.add(target.name)
+        return self
+
+
+def load_poller_config(path: Path) -> PollerConfig:
+    """Load and validate a poller fleet file.
+
+    Raises:
+        FileNotFoundError: File does not exist.
+        pydantic.ValidationError: Invalid fleet file.
+    """
+    with open(path, encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+    return PollerConfig.model_validate(data)
+
+
+def resolve_catalog_path(explicit: str | Path | None) -> Path:
+    """Catalog root: the explicit path, else the installed catalog package.
+
+    Raises:
+        ValueError: No path given and the catalog package is not installed.
+    """
+    if explicit:
+        return Path(explicit)
+    try:
+        from solentlabs.cable_modem_monitor_catalog import CATALOG_PATH
+    except ImportError as e:
+        raise ValueError("no --catalog given and solentlabs-cable-modem-monitor-catalog is not installed") from e
+    return CATALOG_PATH
+
+
+def build_orchestrator(
+    target: PollTarget,
+    catalog_path: Path,
+) -> tuple[Orchestrator, HealthMonitor | None, ModemIdentity]:
+    """Load a target's configs from the catalog and assemble its components.
+
+    Same steps as the HA adapter's startup: load modem/parser configs
+    and ``parser.py``, re-apply credential encoding, resolve health
+    probe defaults from modem.yaml, then delegate to the Core factory.
+    """
+    modem_dir = catalog_path / target.modem_dir
+    modem_yaml = modem_dir / f"modem-{target.variant}.yaml" if target.variant else modem_dir / "modem.yaml"
+    parser_yaml = modem_dir / "parser.yaml"
+    parser_py = modem_dir / "parser.py"
+
+    modem_config = load_modem_config(modem_yaml)
+    parser_config = load_parser_config(parser_yaml) if parser_yaml.exists() else None
+    post_processor = load_post_processor(parser_py) if parser_py.exists() else None
+
+    apply_credential_encoding(
+        modem_config,
+        credential_encoding=target.credential_encoding,
+        credential_field=target.credential_field,
+    )
+
+    health_cfg = modem_config.health
+    http_probe = health_cfg.http_probe if health_cfg else True
+    default_icmp = health_cfg.supports_icmp if health_cfg else True
+    default_head = health_cfg.supports_head if health_cfg else True
+
+    return create_orchestrator(
+        modem_config=modem_config,
+        parser_config=parser_config,
+        post_processor=post_processor,
+        base_url=f"{target.protocol}://{target.host}",
+        username=target.username,
+        password=target.resolved_password(),
+        legacy_ssl=target.legacy_ssl,
+        supports_icmp=default_icmp if target.supports_icmp is None else target.supports_icmp,
+        supports_head=default_head if target.supports_head is None else target.supports_head,
+        http_probe=http_probe,
+        model=modem_config.model,
+        profile_memory=target.profile_memory,
+        stream_html=target.stream_html,
+    )
+
+
+# ------------------------------------------------------------------
+# Sinks
+# ------------------------------------------------------------------
+
+
+class Sink(Protocol):
+    """Destination for JSON Lines records."""
+
+    def write(self, line: str) -> None:
+        """Write one newline-terminated record."""
+
+    def close(self) -> None:
+        """Release the destination."""
+
+
+class StreamSink:
+    """Write records to an open text stream (e.g., stdout). Not closed."""
+
+    def __init__(self, stream: IO[str]) -> None:
+        self._stream = stream
+
+    def write(self, line: str) -> None:
+        self._stream.write(line)
+        self._stream.flush()
+
+    def close(self) -> None:
+        self._stream.flush()
+
+
+class FileSink:
+    """Append records to a file, flushing after every line."""
+
+    def __init__(self, path: Path) -> None:
+        self._file = open(path, "a", encoding="utf-8")  # noqa: SIM115 — owned until close()
+
+    def write(self, line: str) -> None:
+        self._file.write(line)
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class SocketSink:
+    """Broadcast records to every reader connected to a Unix socket.
+
+    Listens on ``path``; readers attach with e.g.
+    ``socat - UNIX-CONNECT:path``. Records are not buffered for late
+    readers. A reader that errors, or stops reading long enough that a
+    record cannot be sent within ``send_timeout`` seconds, is dropped —
+    writes run on fleet worker threads and must not wait on it.
+    """
+
+    def __init__(self, path: Path, *, send_timeout: float = 0.5) -> None:
+        if not hasattr(socket, "AF_UNIX"):
+            raise ValueError("Unix domain sockets are not available on this platform")
+        self._path = path
+        if path.exists():
+            path.unlink()
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(str(path))
+        self._server.listen()
+        self._server.settimeout(0.5)
+        self._send_timeout = send_timeout
+        self._clients: list[socket.socket] = []
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._accept_thread = threading.Thread(target=self._accept_loop, name="cmm-poller-socket", daemon=True)
+        self._accept_thread.start()
+
+    @property
+    def client_count(self) -> int:
+        """Readers currently connected."""
+        with self._lock:
+            return len(self._clients)
+
+    def write(self, line: str) -> None:
+        data = line.encode("utf-8")
+        with self._lock:
+            for client in list(self._clients):
+                try:
+                    client.sendall(data)
+                except OSError:
+                    self._clients.remove(client)
+                    client.close()
+
+    def close(self) -> None:
+        self._closed.set()
+        self._accept_thread.join()
+        self._server.close()
+        with self._lock:
+            for client in self._clients:
+                client.close()
+            self._clients.clear()
+        self._path.unlink(missing_ok=True)
+
+    def _accept_loop(self) -> None:
+        while not self._closed.is_set():
+            try:
+                client, _ = self._server.accept()
+            except TimeoutError:
+                continue
+            except OSError:
+                return
+            client.settimeout(self._send_timeout)
+            with self._lock:
+                self._clients.append(client)
+
+
+class JsonLinesWriter:
+    """Serialize records once and fan them out to every sink.
+
+    Thread-safe — fleet callbacks run on worker threads.
+    """
+
+    def __init__(self, sinks: list[Sink]) -> None:
+        self._sinks = sinks
+        self._lock = threading.Lock()
+
+    def write(self, record: dict[str, Any]) -> None:
+        line = json.dumps(record, default=str, separators=(",", ":")) + "\n"
+        with self._lock:
+            for sink in self._sinks:
+                sink.write(line)
+
+    def close(self) -> None:
+        with self._lock:
+            for sink in self._sinks:
+                sink.close()
+
+
+# ------------------------------------------------------------------
+# Poller
+# ------------------------------------------------------------------
+
+
+BuildFn = Callable[[PollTarget, Path], tuple[Orchestrator, HealthMonitor | None, ModemIdentity]]
+
+
+class Poller:
+    """Poll a set of modems and emit JSON Lines records.
+
+    Args:
+        targets: Modems to poll.
+        writer: Record destination.
+        catalog_path: Catalog root for ``PollTarget.modem_dir``.
+        max_workers: Fleet concurrency cap.
+        jitter: Fleet reschedule jitter.
+        exporter: Optional metrics store updated with every record.
+        build: Component factory — injectable for tests.
+    """
+
+    def __init__(
+        self,
+        targets: list[PollTarget],
+        writer: JsonLinesWriter,
+        *,
+        catalog_path: Path,
+        max_workers: int = 4,
+        jitter: float = 0.1,
+        exporter: OpenMetricsExporter | None = None,
+        build: BuildFn = build_orchestrator,
+    ) -> None:
+        self._targets = {t.name: t for t in targets}
+        self._writer = writer
+        self._catalog_path = catalog_path
+        self._max_workers = max_workers
+        self._jitter = jitter
+        self._exporter = exporter
+        self._build = build
+        self._components: dict[str, tuple[Orchestrator, HealthMonitor | None, ModemIdentity]] = {}
+        self._fleet: FleetScheduler | None = None
+
+    def run_once(self, timeout: float | None = None) -> int:
+        """Poll every modem once, concurrently, and return.
+
+        Health probes are not scheduled; each snapshot carries the
+        orchestrator's latest health result, if any.
+
+        Returns:
+            Number of snapshots emitted.
+
+        Raises:
+            TimeoutError: Polls were still running ``timeout`` seconds
+                after the call — one budget for the whole run.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        fleet = self._start_fleet(startup_spread=0.0, with_health=False)
+        try:
+            while not all(s.polls for s in fleet.stats().values()):
+                fleet.run_pending()
+                remaining = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+                if not fleet.drain(remaining):
+                    raise TimeoutError(f"polls still running after {timeout}s")
+            return sum(s.polls for s in fleet.stats().values())
+        finally:
+            self.close()
+
+    def run_forever(self, stop: threading.Event) -> None:
+        """Poll on each target's cadence until ``stop`` is set."""
+        fleet = self._start_fleet(startup_spread=min(t.scan_interval for t in self._targets.values()))
+        fleet.start()
+        try:
+            stop.wait()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stop the fleet and release every orchestrator's session."""
+        if self._fleet is not None:
+            self._fleet.stop()
+            self._fleet = None
+        for orchestrator, _, _ in self._components.values():
+            orchestrator.close()
+        self._components.clear()
+
+    # ------------------------------------------------------------------
+
+    def _start_fleet(self, *, startup_spread: float, with_health: bool = True) -> FleetScheduler:
+        fleet = FleetScheduler(
+            max_workers=self._max_workers,
+            jitter=self._jitter,
+            startup_spread=startup_spread,
+            on_snapshot=self._emit_snapshot,
+            on_health=self._emit_health,
+        )
+        for target in self._targets.values():
+            orchestrator, health_monitor, identity = self._build(target, self._catalog_path)
+            self._components[target.name] = (orchestrator, health_monitor, identity)
+            probe = health_monitor if with_health and target.health_interval is not None else None
+            fleet.add(
+                target.name,
+                orchestrator,
+                host=target.host,
+                poll_interval=target.scan_interval,
+                health_monitor=probe,
+                health_interval=target.health_interval if probe is not None else None,
+            )
+        _logger.info("Polling %d modem(s) [max_workers=%d]", len(self._targets), self._max_workers)
+        self._fleet = fleet
+        return fleet
+
+    def _header(self, kind: str, name: str) -> dict[str, Any]:
+        identity = self._components[name][2]
+        return {
+            "type": kind,
+            "modem": name,
+            "host": self._targets[name].host,
+            "model": identity.model,
+            "timestamp": datetime.now(UTC).isoformat(),
+        }
+
+    def _emit_snapshot(self, name: str, snapshot: ModemSnapshot) -> None:
+        orchestrator = self._components[name][0]
+        diagnostics = orchestrator.diagnostics()
+        queue_delay = self._fleet.stats()[name].last_queue_delay if self._fleet is not None else None
+        record = self._header("snapshot", name)
+        record["timings"] = {
+            "poll_duration_s": diagnostics.poll_duration,
+            "queue_delay_s": queue_delay,
+            "resources": [f.to_dict() for f in diagnostics.resource_fetches],
+        }
+        if diagnostics.poll_memory is not None:
+            record["timings"]["memory"] = diagnostics.poll_memory.to_dict()
+        record["snapshot"] = snapshot.to_event_payload().model_dump()
+        self._writer.write(record)
+        if self._exporter is not None:
+            self._exporter.update_snapshot(name, snapshot, diagnostics, queue_delay=queue_delay)
+
+    def _emit_health(self, name: str, info: HealthInfo) -> None:
+        record = self._header("health", name)
+        record["health"] = {
+            "health_status": info.health_status.value,
+            "icmp_latency_ms": info.icmp_latency_ms,
+            "tcp_latency_ms": info.tcp_latency_ms,
+            "http_latency_ms": info.http_latency_ms,
+        }
+        self._writer.write(record)
+        if self._exporter is not None:
+            self._exporter.update_health(name, info)
@@ -14,17 +14,28 @@ peer of ``config_loader.load_parser_config`` — both load per-modem
 artifacts during HA setup — and is consumed by both the runtime
 HA adapter (``custom_components/cable_modem_monitor``) and the
 test pipeline runner (``test_harness/runner.py``).
+
+Imported ``PostProcessor`` classes are cached by resolved path and
+content hash, so setting up or reloading several entries for the same
+model executes ``parser.py`` once. Each call still returns a fresh
+instance.
 """
 
 from __future__ import annotations
 
+import hashlib
 import importlib.util
+import threading
 from pathlib import Path
 from typing import Any
 
 # Fixed class name for parser.py post-processors.
 _POST_PROCESSOR_CLASS = "PostProcessor"
 
+# resolved path -> (content sha256, PostProcessor class or None)
+_class_cache: dict[Path, tuple[str, type | None]] = {}
+_class_cache_lock = threading.Lock()
+
 
 def load_post_processor(parser_py_path: Path) -> Any:
     """Dynamically import a PostProcessor from a parser.py file.
@@ -40,6 +51,27 @@ def load_post_processor(parser_py_path: Path) -> Any:
         An instance of ``PostProcessor``, or ``None`` if the class
         is not defined in the module.
     """
+    key = parser_py_path.resolve()
+    digest = hashlib.sha256(parser_py_path.read_bytes()).hexdigest()
+    with _class_cache_lock:
+        cached = _class_cache.get(key)
+    if cached is None or cached[0] != digest:
+        cached = (digest, _import_post_processor_class(parser_py_path))
+        with _class_cache_lock:
+            _class_cache[key] = cached
+
+    cls = cached[1]
+    return cls() if cls is not None else None
+
+
+def clear_post_processor_cache() -> None:
+    """Forget every imported ``PostProcessor`` class."""
+    with _class_cache_lock:
+        _class_cache.clear()
+
+
+def _import_post_processor_class(parser_py_path: Path) -> type | None:
+    """Execute *parser_py_path* and return its ``PostProcessor`` class."""
     spec = importlib.util.spec_from_file_location(
         f"parser_py_{parser_py_path.parent.name}",
         parser_py_path,
@@ -50,8 +82,4 @@ def load_post_processor(parser_py_path: Path) -> Any:
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
 
-    cls = getattr(module, _POST_PROCESSOR_CLASS, None)
-    if cls is None:
-        return None
-
-    return cls()
+    return getattr(module, _POST_PROCESSOR_CLASS, None)
@@ -1,12 +1,17 @@
 """Test harness — HAR replay server, golden file comparison, and pipeline runner.
 
-Two use cases share the same ``HARMockServer`` component:
+Three use cases share the same ``HARMockServer`` component:
 
 1. **Automated catalog regression testing** — ``run_modem_test()`` /
    ``run_modem_test_orchestrated()`` start an ephemeral server per test,
    run the pipeline, and compare output against golden files.
 
-2. **Manual integration testing** — ``python -m solentlabs.cable_modem_monitor_core.test_harness``
+2. **Soak testing** — ``run_soak()`` polls one test case for thousands
+   of cycles with injected auth expiry, timeouts and reboots, and fails
+   when memory, file descriptors, threads or poll latency grow past a
+   budget.
+
+3. **Manual integration testing** — ``python -m solentlabs.cable_modem_monitor_core.test_harness``
    starts a persistent server for testing against a real HA instance.
 
 See ARCHITECTURE.md § Test Harness for the replay and pass-criterion
@@ -34,15 +39,21 @@ from .discovery import (
 from .golden_file import ComparisonResult, compare_golden_file
 from .loader import ServerConfig, load_server_from_modem_dir
 from .runner import ActionTestResult, TestResult, run_modem_restart_test, run_modem_test, run_modem_test_orchestrated
-from .server import HARMockServer
+from .server import HARMockServer, ServerFault
+from .soak import FaultSchedule, SoakBudget, SoakResult, SoakSample, run_soak
 
 __all__ = [
     "ActionTestResult",
     "ComparisonResult",
+    "FaultSchedule",
     "HARMockServer",
     "ModemTestCase",
     "RestartTestCase",
     "ServerConfig",
+    "ServerFault",
+    "SoakBudget",
+    "SoakResult",
+    "SoakSample",
     "TestResult",
     "compare_golden_file",
     "discover_modem_tests",
@@ -52,4 +63,5 @@ __all__ = [
     "run_modem_restart_test",
     "run_modem_test",
     "run_modem_test_orchestrated",
+    "run_soak",
 ]
@@ -8,6 +8,9 @@ Config resolution follows MODEM_DIRECTORY_SPEC.md:
 - ``modem.har`` -> ``modem.yaml``
 - ``modem-{name}.har`` -> ``modem-{name}.yaml`` if exists, else ``modem.yaml``
 
+Fixtures may be gzip or zstd compressed (``modem.har.gz``,
+``modem.har.zst``); the stem is what pairs them with configs.
+
 Action test cases are discovered separately via ``discover_restart_tests``.
 Restart tests replay ``test_data/modem.har`` when ``modem.yaml`` declares
 ``actions.restart`` — one HAR per variant, so the restart click lives in
@@ -26,6 +29,8 @@ from pathlib import Path
 
 import yaml
 
+from ..har import find_har_files, har_stem
+
 _logger = logging.getLogger(__name__)
 
 
@@ -114,7 +119,7 @@ def _discover_from_modem_dir(
         )
         return
 
-    for har_path in sorted(tests_dir.glob("*.har")):
+    for har_path in find_har_files(tests_dir):
         case = _build_test_case(
             har_path,
             modem_dir,
@@ -137,8 +142,8 @@ def _build_test_case(
 
     Returns ``None`` if modem config cannot be resolved.
     """
-    stem = har_path.stem
-    golden_path = har_path.with_suffix("").with_suffix(".expected.json")
+    stem = har_stem(har_path)
+    golden_path = har_path.with_name(f"{stem}.expected.json")
 
     # Config resolution per MODEM_DIRECTORY_SPEC
     modem_config_path = resolve_modem_config(stem, modem_dir)
@@ -240,9 +245,10 @@ def _discover_restart_from_modem_dir(
         return
     if not (config.get("actions") or {}).get("restart"):
         return
-    har_path = modem_dir / "test_data" / "modem.har"
-    if not har_path.is_file():
+    fixtures = [p for p in find_har_files(modem_dir / "test_data") if har_stem(p) == "modem"]
+    if not fixtures:
         return
+    har_path = fixtures[0]
 
     try:
         relative = modem_dir.relative_to(root)
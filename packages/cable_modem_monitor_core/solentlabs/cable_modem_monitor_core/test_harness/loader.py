@@ -18,7 +18,7 @@ from pathlib import Path
 from typing import Any
 
 from ..config_loader import load_modem_config
-from ..har import load_har_json
+from ..har import find_har_files, har_stem, load_har_json
 from ..models.modem_config.config import ModemConfig
 from .discovery import resolve_modem_config
 
@@ -79,7 +79,7 @@ def load_server_from_modem_dir(
     har_path = _find_har(test_data_dir, har_name)
 
     # Resolve modem config using same logic as test discovery
-    modem_config_path = resolve_modem_config(har_path.stem, modem_dir)
+    modem_config_path = resolve_modem_config(har_stem(har_path), modem_dir)
     if modem_config_path is None:
         raise FileNotFoundError(f"No modem config found for {har_path.name} in {modem_dir}")
 
@@ -121,7 +121,7 @@ def _find_har(test_data_dir: Path, har_name: str | None) -> Path:
             raise FileNotFoundError(f"HAR file not found: {har_path}")
         return har_path
 
-    har_files = sorted(test_data_dir.glob("*.har"))
+    har_files = find_har_files(test_data_dir)
     if not har_files:
         raise FileNotFoundError(f"No .har files in {test_data_dir}")
 
@@ -173,7 +173,7 @@ def run_modem_test(test_case: ModemTestCase) -> TestResult:
         ``TestResult`` with pass/fail, error detail, or golden file diff.
         Never raises — all pipeline errors are captured in the result.
     """
-    loaded = _load_test_case(test_case)
+    loaded = load_test_case(test_case)
     if isinstance(loaded, TestResult):
         return loaded
 
@@ -211,7 +211,7 @@ def run_modem_test_orchestrated(test_case: ModemTestCase) -> TestResult:
         ``TestResult`` with pass/fail, error detail, or golden file diff.
         Never raises — all pipeline errors are captured in the result.
     """
-    loaded = _load_test_case(test_case)
+    loaded = load_test_case(test_case)
     if isinstance(loaded, TestResult):
         return loaded
 
@@ -259,15 +259,15 @@ def _compare_and_record(
     )
 
 
-def _load_test_case(
+def load_test_case(
     test_case: ModemTestCase,
 ) -> TestResult | tuple[list[dict[str, Any]], dict[str, Any], Any, Any, Any]:
     """Load and validate all inputs for a modem test case.
 
     Returns either a ``TestResult`` on load error or a tuple of
     (entries, expected, modem_config, parser_config, post_processor)
-    on success. Shared by both ``run_modem_test`` and
-    ``run_modem_test_orchestrated``.
+    on success. Shared by ``run_modem_test``,
+    ``run_modem_test_orchestrated`` and ``run_soak``.
     """
     name = test_case.name
 
@@ -339,7 +339,7 @@ def _load_test_case(
     return entries, expected, modem_config, parser_config, post_processor
 
 
-def _detect_form_nonce_encoding(
+def detect_form_nonce_encoding(
     modem_config: Any,
     base_url: str,
 ) -> None:
@@ -400,7 +400,7 @@ def _run_pipeline(
         base_url = server.base_url
 
         # Detect encoding via mock server GET (mirrors config flow)
-        _detect_form_nonce_encoding(modem_config, base_url)
+        detect_form_nonce_encoding(modem_config, base_url)
 
         session = requests.Session()
 
@@ -503,7 +503,7 @@ def _run_orchestrated(
     """
     with HARMockServer(entries, modem_config=modem_config) as server:
         # Detect encoding via mock server GET (mirrors config flow)
-        _detect_form_nonce_encoding(modem_config, server.base_url)
+        detect_form_nonce_encoding(modem_config, server.base_url)
 
         orchestrator, _, _ = create_orchestrator(
             modem_config=modem_config,
@@ -13,7 +13,9 @@ import gzip
 import logging
 import re
 import threading
+import time
 import zlib
+from enum import Enum
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from typing import TYPE_CHECKING, Any
 from urllib.parse import unquote, urlparse
@@ -37,6 +39,25 @@ _logger = logging.getLogger(__name__)
 _UNRESOLVED_PLACEHOLDER_RE = re.compile(r"\{(?:auth|cookie):[^}/{]+\}")
 
 
+class ServerFault(Enum):
+    """Failure the server plays back until cleared (``inject_fault``).
+
+    Soak runs use these to reach the recovery paths a clean replay
+    never does:
+
+    - ``AUTH_EXPIRY`` — the session is forgotten; data requests get the
+      auth challenge until the next login.
+    - ``TIMEOUT`` — each request stalls past the client timeout, then
+      the connection drops.
+    - ``DOWN`` — each connection drops without a response, as while
+      the modem reboots.
+    """
+
+    AUTH_EXPIRY = "auth_expiry"
+    TIMEOUT = "timeout"
+    DOWN = "down"
+
+
 class _MockHandler(BaseHTTPRequestHandler):
     """HTTP request handler for the mock server.
 
@@ -96,7 +117,7 @@ class _MockHandler(BaseHTTPRequestHandler):
         method = lookup_method
         auth = server.auth_handler
 
-        if self._reject_dishonest_request(server, method, path, body):
+        if self._play_fault(server, method, path) or self._reject_dishonest_request(server, method, path, body):
             return
 
         # Login request — handle auth and serve response
@@ -219,6 +240,24 @@ class _MockHandler(BaseHTTPRequestHandler):
             response_headers.append((name, value))
         self._send_response(route.status, response_headers, route.body)
 
+    def _play_fault(self, server: HARMockServer, method: str, path: str) -> bool:
+        """Answer with the injected fault, if any; True when the request was consumed."""
+        fault = server.fault
+        if fault is None:
+            return False
+        if fault is ServerFault.AUTH_EXPIRY:
+            if server.auth_handler.is_login_request(method, path):
+                # A fresh login ends the expiry, as on the modem.
+                server.fault = None
+                return False
+            challenge = server.auth_handler.get_challenge_response()
+            self._send_response(challenge.status, challenge.headers, challenge.body)
+            return True
+        if fault is ServerFault.TIMEOUT:
+            time.sleep(server.stall_seconds)
+        self.close_connection = True
+        return True
+
     def _reject_dishonest_request(
         self,
         server: HARMockServer,
@@ -507,6 +546,8 @@ class HARMockServer(HTTPServer):
         self.login_page = _extract_login_page(modem_config)
         self.token_prefix = _extract_token_prefix(modem_config)
         self.post_login_endpoints = _extract_post_login_endpoints(modem_config)
+        self.fault: ServerFault | None = None
+        self.stall_seconds = 0.0
         self._thread: threading.Thread | None = None
 
         super().__init__((host, port), _MockHandler)
@@ -518,6 +559,19 @@ class HARMockServer(HTTPServer):
         port = self.server_address[1]
         return f"http://{host}:{port}"
 
+    def inject_fault(self, fault: ServerFault | None, *, stall_seconds: float = 0.0) -> None:
+        """Fail subsequent requests with *fault*; ``None`` restores replay.
+
+        Args:
+            fault: Failure to play back, or ``None`` to clear.
+            stall_seconds: How long a ``TIMEOUT`` request stalls before
+                its connection drops. Set it past the client timeout.
+        """
+        if fault is ServerFault.AUTH_EXPIRY:
+            self.auth_handler.handle_logout()
+        self.stall_seconds = stall_seconds
+        self.fault = fault
+
     def __enter__(self) -> HARMockServer:
         """Start the server in a background thread."""
         self._thread = threading.Thread(target=self.serve_forever, daemon=True)
@@ -0,0 +1,544 @@
+"""Soak runner — poll one modem for thousands of cycles and watch for growth.
+
+A single replay cannot see what hurts an installation that runs for
+months: sessions, cookie jars, log records or caches that grow a
+little on every poll. ``run_soak`` drives ``Orchestrator.get_modem_data()``
+against a ``HARMockServer`` that periodically expires the session,
+stalls past the client timeout, or goes down as if rebooting, and
+samples the process as it goes:
+
+- RSS (from ``/proc``; ``None`` where it is unavailable)
+- traced Python memory, and the allocators that grew the most
+- open file descriptors (``None`` where they cannot be listed)
+- thread count
+- median latency of clean polls
+
+The server runs in a child process, so its own allocations, sockets
+and threads stay out of these figures. Tracing every allocation slows
+polls; latency is compared against the run's own baseline, not against
+production.
+
+Growth is measured from a baseline taken after the warm-up cycles to
+the end of the run, and the run fails when any figure exceeds its
+``SoakBudget``. The last cycles are always fault-free and the final
+poll must come back ONLINE, so a run that never recovers fails too.
+
+Usage::
+
+    python -m solentlabs.cable_modem_monitor_core.test_harness.soak \\
+        /path/to/modems/{manufacturer}/{model} --cycles 5000
+
+See ARCHITECTURE.md § Test Harness.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import gc
+import logging
+import multiprocessing
+import os
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+from ..orchestration.factory import create_orchestrator
+from ..orchestration.orchestrator import Orchestrator
+from ..orchestration.signals import ConnectionStatus
+from .discovery import ModemTestCase, discover_modem_tests
+from .runner import TestResult, detect_form_nonce_encoding, load_test_case
+from .server import HARMockServer, ServerFault
+
+# Fault-free cycles at the end of a run. Longer than the largest
+# connectivity backoff (6 polls), so the orchestrator polls again.
+_QUIET_CYCLES = 10
+
+# A stalled request outlasts the client timeout by this much.
+_STALL_MARGIN = 0.5
+
+# Allocations made directly by the soak's bookkeeping are not the pipeline's.
+_BOOKKEEPING_FILES = frozenset({tracemalloc.__file__, __file__})
+
+# Traced (size, count) per allocating (filename, lineno).
+_Usage = dict[tuple[str, int], tuple[int, int]]
+
+
+@dataclass(frozen=True)
+class FaultSchedule:
+    """When the mock server fails. A period of 0 disables that fault.
+
+    Attributes:
+        auth_expiry_every: Forget the session every N cycles.
+        timeout_every: Stall every N cycles past the client timeout.
+        reboot_every: Go down every N cycles.
+        reboot_cycles: Cycles a reboot keeps the server down. The
+            server comes back with no sessions.
+    """
+
+    auth_expiry_every: int = 25
+    timeout_every: int = 40
+    reboot_every: int = 150
+    reboot_cycles: int = 3
+
+    def fault_for(self, cycle: int) -> ServerFault | None:
+        """The fault to play back on *cycle* (1-based), if any."""
+        if self.reboot_every and cycle >= self.reboot_every and cycle % self.reboot_every < self.reboot_cycles:
+            return ServerFault.DOWN
+        if self.timeout_every and cycle % self.timeout_every == 0:
+            return ServerFault.TIMEOUT
+        if self.auth_expiry_every and cycle % self.auth_expiry_every == 0:
+            return ServerFault.AUTH_EXPIRY
+        return None
+
+
+@dataclass(frozen=True)
+class SoakBudget:
+    """Growth allowed between the baseline and the final sample.
+
+    Attributes:
+        rss_bytes: Resident set size. Loose — the allocator keeps
+            freed arenas, so RSS moves in steps.
+        traced_bytes: Memory traced by ``tracemalloc`` after a full
+            collection. The tight check for leaks.
+        open_fds: Open file descriptors (sockets, files).
+        threads: Live threads.
+        latency_ratio: Final median poll latency over the baseline's.
+        latency_slack_seconds: Added to the latency limit so a fast
+            baseline does not turn scheduler jitter into a failure.
+    """
+
+    rss_bytes: int = 32 * 1024 * 1024
+    traced_bytes: int = 2 * 1024 * 1024
+    open_fds: int = 4
+    threads: int = 2
+    latency_ratio: float = 2.0
+    latency_slack_seconds: float = 0.05
+
+
+@dataclass(frozen=True)
+class SoakSample:
+    """Process state after one cycle.
+
+    Attributes:
+        cycle: Cycles completed when the sample was taken.
+        rss_bytes: Resident set size, or ``None`` if unavailable.
+        traced_bytes: Memory traced by ``tracemalloc`` on the polling
+            side — the mock server's allocations are excluded.
+        open_fds: Open file descriptors, or ``None`` if unavailable.
+        threads: Live threads.
+        poll_seconds: Median latency of the clean ONLINE polls since
+            the previous sample. ``None`` if there were none.
+    """
+
+    cycle: int
+    rss_bytes: int | None
+    traced_bytes: int
+    open_fds: int | None
+    threads: int
+    poll_seconds: float | None
+
+
+@dataclass
+class SoakResult:
+    """Result of a soak run.
+
+    Attributes:
+        test_name: Human-readable test ID from ``ModemTestCase.name``.
+        passed: ``True`` if the run completed, stayed within budget and
+            recovered by the final poll.
+        error: Load or run error. Empty string when the run completed.
+        samples: Baseline sample, one per ``sample_every`` cycles, and
+            the final sample.
+        statuses: Poll count per ``ConnectionStatus`` value.
+        top_allocators: Source lines whose traced memory grew most
+            between the baseline and the end of the run.
+        violations: Budget and recovery failures, one line each.
+    """
+
+    test_name: str
+    passed: bool
+    error: str = ""
+    samples: list[SoakSample] = field(default_factory=list)
+    statuses: dict[str, int] = field(default_factory=dict)
+    top_allocators: list[str] = field(default_factory=list)
+    violations: list[str] = field(default_factory=list)
+
+
+def run_soak(
+    test_case: ModemTestCase,
+    *,
+    cycles: int = 1000,
+    warmup: int = 100,
+    sample_every: int = 100,
+    faults: FaultSchedule | None = None,
+    budget: SoakBudget | None = None,
+    timeout: int = 1,
+    top: int = 10,
+) -> SoakResult:
+    """Poll *test_case* for *cycles* cycles with injected faults.
+
+    Args:
+        test_case: Discovered test case. Its golden file is not
+            compared, but must exist, as for the other runners.
+        cycles: Polls to run.
+        warmup: Polls before the baseline sample, so one-time
+            allocations (imports, caches, first login) are excluded.
+        sample_every: Polls between samples.
+        faults: Fault schedule. Defaults to ``FaultSchedule()``.
+        budget: Growth budget. Defaults to ``SoakBudget()``.
+        timeout: Client timeout in seconds, replacing modem.yaml's so
+            injected timeouts stay short.
+        top: Number of allocators to report.
+
+    Returns:
+        ``SoakResult`` with samples, allocators and violations.
+        Load and run errors are captured in the result.
+
+    Raises:
+        ValueError: If the cycle counts leave no measured window.
+    """
+    if warmup < 1 or sample_every < 1 or cycles <= warmup + _QUIET_CYCLES:
+        raise ValueError(
+            f"need warmup >= 1, sample_every >= 1 and cycles > warmup + {_QUIET_CYCLES}; "
+            f"got cycles={cycles}, warmup={warmup}, sample_every={sample_every}"
+        )
+
+    loaded = load_test_case(test_case)
+    if isinstance(loaded, TestResult):
+        return SoakResult(test_name=test_case.name, passed=False, error=loaded.error)
+    entries, _, modem_config, parser_config, post_processor = loaded
+    modem_config.timeout = timeout
+
+    started_tracing = False
+    try:
+        with _ServerProcess(entries, modem_config) as server:
+            detect_form_nonce_encoding(modem_config, server.base_url)
+            started_tracing = not tracemalloc.is_tracing()
+            if started_tracing:
+                tracemalloc.start()
+            orchestrator, _, _ = create_orchestrator(
+                modem_config=modem_config,
+                parser_config=parser_config,
+                post_processor=post_processor,
+                base_url=server.base_url,
+                username="admin",
+                password="pw",
+                supports_icmp=False,
+                http_probe=False,
+            )
+            soak = _Soak(
+                orchestrator,
+                server,
+                faults=faults or FaultSchedule(),
+                stall_seconds=timeout + _STALL_MARGIN,
+            )
+            try:
+                soak.run(cycles, warmup, sample_every)
+            finally:
+                orchestrator.close()
+    except Exception as e:
+        return SoakResult(test_name=test_case.name, passed=False, error=f"Soak error: {e}")
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+    violations = soak.violations(budget or SoakBudget())
+    return SoakResult(
+        test_name=test_case.name,
+        passed=not violations,
+        samples=soak.samples,
+        statuses=dict(soak.statuses),
+        top_allocators=soak.top_allocators(top),
+        violations=violations,
+    )
+
+
+class _ServerProcess:
+    """``HARMockServer`` in a child process, driven over a pipe.
+
+    Out of process, the server's own allocations, sockets and threads
+    are not counted against the polling side.
+    """
+
+    def __init__(self, entries: list[dict[str, Any]], modem_config: Any) -> None:
+        context = multiprocessing.get_context("spawn")
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(target=_serve, args=(child_conn, entries, modem_config), daemon=True)
+        self._process.start()
+        child_conn.close()
+        self.base_url: str = self._conn.recv()
+
+    def inject_fault(self, fault: ServerFault | None, *, stall_seconds: float = 0.0) -> None:
+        """``HARMockServer.inject_fault`` in the child; returns once applied."""
+        self._call("inject_fault", fault, stall_seconds)
+
+    def restart(self) -> None:
+        """Drop every session, as a rebooted modem does."""
+        self._call("restart")
+
+    def _call(self, command: str, *args: Any) -> None:
+        self._conn.send((command, args))
+        self._conn.recv()
+
+    def __enter__(self) -> _ServerProcess:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Stop the server and reap the child."""
+        with contextlib.suppress(OSError):
+            self._conn.send(("close", ()))
+        self._process.join(timeout=5)
+        if self._process.is_alive():
+            self._process.kill()
+            self._process.join()
+        self._conn.close()
+
+
+def _serve(conn: Any, entries: list[dict[str, Any]], modem_config: Any) -> None:
+    """Child process body: run the server and apply commands until closed."""
+    with HARMockServer(entries, modem_config=modem_config) as server:
+        conn.send(server.base_url)
+        for command, args in iter(conn.recv, ("close", ())):
+            if command == "inject_fault":
+                server.inject_fault(args[0], stall_seconds=args[1])
+            elif command == "restart":
+                server.auth_handler.handle_restart()
+            conn.send(None)
+
+
+class _Soak:
+    """Poll loop and sampling state for one run."""
+
+    def __init__(
+        self,
+        orchestrator: Orchestrator,
+        server: _ServerProcess,
+        *,
+        faults: FaultSchedule,
+        stall_seconds: float,
+    ) -> None:
+        self._orchestrator = orchestrator
+        self._server = server
+        self._faults = faults
+        self._stall_seconds = stall_seconds
+        self._latencies: list[float] = []
+        self._baseline_usage: _Usage = {}
+        self._latest_usage: _Usage = {}
+        self._last_status: ConnectionStatus | None = None
+        self.samples: list[SoakSample] = []
+        self.statuses: Counter[str] = Counter()
+
+    def run(self, cycles: int, warmup: int, sample_every: int) -> None:
+        """Poll *cycles* times, sampling at the baseline, the period and the end."""
+        previous: ServerFault | None = None
+        for cycle in range(1, cycles + 1):
+            fault = None if cycle > cycles - _QUIET_CYCLES else self._faults.fault_for(cycle)
+            if previous is ServerFault.DOWN and fault is not ServerFault.DOWN:
+                # The modem comes back from a reboot with no sessions.
+                self._server.restart()
+            self._poll(fault)
+            previous = fault
+
+            if cycle in (warmup, cycles) or (cycle > warmup and cycle % sample_every == 0):
+                self.samples.append(self._sample(cycle))
+
+    def _poll(self, fault: ServerFault | None) -> None:
+        """Run one poll with *fault* injected; record status and clean latency."""
+        self._server.inject_fault(fault, stall_seconds=self._stall_seconds)
+        started = time.monotonic()
+        snapshot = self._orchestrator.get_modem_data()
+        elapsed = time.monotonic() - started
+        self._server.inject_fault(None)
+
+        self._last_status = snapshot.connection_status
+        self.statuses[snapshot.connection_status.value] += 1
+        if fault is None and snapshot.connection_status is ConnectionStatus.ONLINE:
+            self._latencies.append(elapsed)
+
+    def _sample(self, cycle: int) -> SoakSample:
+        """Collect garbage, then record process state and the latency window."""
+        gc.collect()
+        usage = _traced_usage()
+        if not self.samples:
+            self._baseline_usage = usage
+        self._latest_usage = usage
+        latency = statistics.median(self._latencies) if self._latencies else None
+        self._latencies = []
+        return SoakSample(
+            cycle=cycle,
+            rss_bytes=_rss_bytes(),
+            traced_bytes=sum(size for size, _ in usage.values()),
+            open_fds=_open_fds(),
+            threads=threading.active_count(),
+            poll_seconds=latency,
+        )
+
+    def violations(self, budget: SoakBudget) -> list[str]:
+        """Budget and recovery failures between the first and last sample."""
+        baseline, final = self.samples[0], self.samples[-1]
+        found: list[str] = []
+        for label, start, end, limit in (
+            ("RSS", baseline.rss_bytes, final.rss_bytes, budget.rss_bytes),
+            ("traced memory", baseline.traced_bytes, final.traced_bytes, budget.traced_bytes),
+            ("open file descriptors", baseline.open_fds, final.open_fds, budget.open_fds),
+            ("threads", baseline.threads, final.threads, budget.threads),
+        ):
+            if start is not None and end is not None and end - start > limit:
+                found.append(f"{label} grew by {end - start} (budget {limit})")
+
+        if baseline.poll_seconds is not None and final.poll_seconds is not None:
+            limit_s = baseline.poll_seconds * budget.latency_ratio + budget.latency_slack_seconds
+            if final.poll_seconds > limit_s:
+                found.append(
+                    f"median poll latency rose from {baseline.poll_seconds:.3f}s "
+                    f"to {final.poll_seconds:.3f}s (limit {limit_s:.3f}s)"
+                )
+
+        if self._last_status is not ConnectionStatus.ONLINE:
+            status = self._last_status.value if self._last_status is not None else "none"
+            found.append(f"final poll was {status}, not online — did not recover from injected faults")
+        return found
+
+    def top_allocators(self, top: int) -> list[str]:
+        """Source lines with the largest traced growth over the measured window."""
+        growth = []
+        for line, (size, count) in self._latest_usage.items():
+            base_size, base_count = self._baseline_usage.get(line, (0, 0))
+            if size > base_size:
+                growth.append((size - base_size, count - base_count, size, line))
+        growth.sort(reverse=True)
+        return [
+            f"{filename}:{lineno}: +{size_diff} B, {count_diff:+} blocks (now {size} B)"
+            for size_diff, count_diff, size, (filename, lineno) in growth[:top]
+        ]
+
+
+def _traced_usage() -> _Usage:
+    """Group live traced allocations by the line that made them."""
+    usage: _Usage = {}
+    for trace in tracemalloc.take_snapshot().traces:
+        latest = trace.traceback[-1]
+        if latest.filename in _BOOKKEEPING_FILES:
+            continue
+        key = (latest.filename, latest.lineno)
+        size, count = usage.get(key, (0, 0))
+        usage[key] = (size + trace.size, count + 1)
+    return usage
+
+
+def _rss_bytes() -> int | None:
+    """Resident set size from ``/proc/self/statm``; ``None`` off Linux."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            pages = int(statm.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def _open_fds() -> int | None:
+    """Open file descriptors, or ``None`` where they cannot be listed."""
+    for fd_dir in ("/proc/self/fd", "/dev/fd"):
+        try:
+            return len(os.listdir(fd_dir))
+        except OSError:
+            continue
+    return None
+
+
+def _print_result(result: SoakResult) -> None:
+    """Print the samples table, allocators and verdict for one run."""
+    print(f"\n{result.test_name}")
+    if result.error:
+        print(f"  ERROR  {result.error}")
+        return
+    print(f"  {'cycle':>7} {'rss MiB':>9} {'traced MiB':>11} {'fds':>5} {'threads':>8} {'poll ms':>8}")
+    for s in result.samples:
+        rss = f"{s.rss_bytes / 2**20:.1f}" if s.rss_bytes is not None else "-"
+        fds = str(s.open_fds) if s.open_fds is not None else "-"
+        poll = f"{s.poll_seconds * 1000:.1f}" if s.poll_seconds is not None else "-"
+        print(f"  {s.cycle:>7} {rss:>9} {s.traced_bytes / 2**20:>11.2f} {fds:>5} {s.threads:>8} {poll:>8}")
+    print("  statuses: " + ", ".join(f"{k}={v}" for k, v in sorted(result.statuses.items())))
+    if result.top_allocators:
+        print("  top allocators:")
+        for line in result.top_allocators:
+            print(f"    {line}")
+    for violation in result.violations:
+        print(f"  FAIL   {violation}")
+    print(f"  {'PASS' if result.passed else 'FAIL'}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for soak runs.
+
+    Args:
+        argv: Command-line arguments. Defaults to ``sys.argv[1:]``.
+
+    Returns:
+        Exit code (0 when every run passed, 1 otherwise).
+    """
+    defaults = FaultSchedule()
+    parser = argparse.ArgumentParser(
+        prog="python -m solentlabs.cable_modem_monitor_core.test_harness.soak",
+        description="Poll a modem's HAR replay for many cycles and fail on resource growth.",
+    )
+    parser.add_argument("modem_dir", type=Path, help="Modem directory or modems root")
+    parser.add_argument("--har", dest="har_name", default=None, help="Only the HAR file with this name")
+    parser.add_argument("--cycles", type=int, default=1000, help="Polls per run (default: 1000)")
+    parser.add_argument("--warmup", type=int, default=100, help="Polls before the baseline (default: 100)")
+    parser.add_argument("--sample-every", type=int, default=100, help="Polls between samples (default: 100)")
+    parser.add_argument("--timeout", type=int, default=1, help="Client timeout in seconds (default: 1)")
+    parser.add_argument("--auth-expiry-every", type=int, default=defaults.auth_expiry_every, help="0 disables")
+    parser.add_argument("--timeout-every", type=int, default=defaults.timeout_every, help="0 disables")
+    parser.add_argument("--reboot-every", type=int, default=defaults.reboot_every, help="0 disables")
+    parser.add_argument("--top", type=int, default=10, help="Allocators to report (default: 10)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.ERROR, stream=sys.stderr)
+
+    cases = [c for c in discover_modem_tests(args.modem_dir) if args.har_name in (None, c.har_path.name)]
+    if not cases:
+        print(f"Error: no test cases under {args.modem_dir}", file=sys.stderr)
+        return 1
+
+    faults = FaultSchedule(
+        auth_expiry_every=args.auth_expiry_every,
+        timeout_every=args.timeout_every,
+        reboot_every=args.reboot_every,
+    )
+    results: list[SoakResult] = []
+    for case in cases:
+        try:
+            result = run_soak(
+                case,
+                cycles=args.cycles,
+                warmup=args.warmup,
+                sample_every=args.sample_every,
+                faults=faults,
+                timeout=args.timeout,
+                top=args.top,
+            )
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        _print_result(result)
+        results.append(result)
+
+    return 0 if all(r.passed for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -372,8 +372,8 @@ class TestErrors:
 
         resp = MagicMock()
         resp.status_code = 200
-        resp.content = b"[]"
-        resp.json.return_value = json_value
+        resp.encoding = None
+        resp.content = json.dumps(json_value).encode()
 
         with (
             patch.object(session, "post", return_value=resp),
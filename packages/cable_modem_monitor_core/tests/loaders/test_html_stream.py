@@ -0,0 +1,118 @@
+"""Tests for streaming HTML normalization and parsing.
+
+Table-driven tests split each document at every position and check the
+result against the buffered path; inline tests for incremental feeding.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from html.parser import HTMLParser
+from unittest.mock import patch
+
+import pytest
+from bs4 import BeautifulSoup
+from solentlabs.cable_modem_monitor_core.loaders import html_stream
+from solentlabs.cable_modem_monitor_core.loaders.html_normalize import (
+    normalize_html,
+    normalize_html_chunks,
+)
+from solentlabs.cable_modem_monitor_core.loaders.html_stream import parse_html_chunks
+
+
+def _splits(text: str) -> list[list[str]]:
+    """*text* cut in two at every position, plus one character at a time."""
+    return [[text[:at], text[at:]] for at in range(len(text) + 1)] + [list(text)]
+
+
+# ┌──────────────────┬──────────────────────────────────────────────────┐
+# │ id               │ document                                         │
+# ├──────────────────┼──────────────────────────────────────────────────┤
+# │ unclosed-th      │ <th>Label</td> rewritten across the split        │
+# │ unclosed-th-attr │ same, <TH> with attributes                       │
+# │ quoted-gt        │ > and < inside a quoted attribute value          │
+# │ spaced-quote     │ quoted value after "= " holding ><               │
+# │ unterminated-tag │ document ends inside a tag                       │
+# │ empty-value      │ closed values: class="" and ''                   │
+# │ earlier-gt-value │ > in an earlier value, then an open value        │
+# │ text-quote       │ = ' in text, not in a tag                        │
+# │ reference-dot    │ &nbsp. — reference names may contain . and -     │
+# │ reference-dash   │ &nbsp-- before a tag                             │
+# │ bare-charref     │ &# that starts no character reference            │
+# │ script           │ < and </ inside a script                         │
+# │ comment          │ < and > inside a comment                         │
+# └──────────────────┴──────────────────────────────────────────────────┘
+#
+# fmt: off
+_DOCUMENT_CASES = [
+    ("unclosed-th",      "<table><tr><th>Lbl</td><td>1</td></tr></table>"),
+    ("unclosed-th-attr", "<tr><TH class='h'>Lbl</TD><td>1</td></tr>"),
+    ("quoted-gt",        "<a onclick='if(a>b&&c<d)'>x</a><p>y</p>"),
+    ("spaced-quote",     "<t b=\n'><'>x</t><p>y</p>"),
+    ("unterminated-tag", "<p>x</p><p e ='>'"),
+    ("empty-value",      "<p class=\"\">a<b x=''>y</b></p>"),
+    ("earlier-gt-value", "<a x='>' y='<b>'>z</a><p>y</p>"),
+    ("text-quote",       "<p>a = 'b<i>c</i></p>"),
+    ("reference-dot",    "<p>&nbsp.<b>x</b></p>"),
+    ("reference-dash",   "<p>a&nbsp--><b>x</b></p>"),
+    ("bare-charref",     "<p>&#&#;><a>x</a><b>y</b></p>"),
+    ("script",           "<script>if (a<b) x='</scr'+'ipt>';</script><p>y</p>"),
+    ("comment",          "<!-- a > b < c --><p>&amp;y</p>"),
+]
+# fmt: on
+
+
+@pytest.mark.parametrize(
+    "document",
+    [c[1] for c in _DOCUMENT_CASES],
+    ids=[c[0] for c in _DOCUMENT_CASES],
+)
+def test_normalize_chunks_matches_whole(document: str) -> None:
+    expected = normalize_html(document)
+    for pieces in _splits(document):
+        assert "".join(normalize_html_chunks(pieces)) == expected
+
+
+@pytest.mark.parametrize(
+    "document",
+    [c[1] for c in _DOCUMENT_CASES],
+    ids=[c[0] for c in _DOCUMENT_CASES],
+)
+def test_parse_chunks_matches_buffered(document: str) -> None:
+    expected = BeautifulSoup(normalize_html(document), "html.parser").decode()
+    for pieces in _splits(document):
+        assert parse_html_chunks(iter(pieces)).decode() == expected
+
+
+class TestParseHTMLChunks:
+    """Pieces reach html.parser as they arrive."""
+
+    def test_bs4_feeds_in_pieces(self) -> None:
+        """The installed bs4 still has the private hook streaming relies on."""
+        assert html_stream._FEEDS_IN_PIECES, "bs4 dropped _parser_class; streamed HTML is silently parsed whole"
+
+    def test_parsed_before_last_chunk(self) -> None:
+        fed_before_last: list[int] = []
+
+        def chunks() -> Iterator[str]:
+            yield "<table><tr><td>1</td>"
+            yield "<td>2</td></tr>"
+            fed_before_last.append(feed.call_count)
+            yield "<tr><td>3</td></tr></table>"
+
+        with patch.object(HTMLParser, "feed", autospec=True, side_effect=HTMLParser.feed) as feed:
+            soup = parse_html_chunks(chunks())
+        assert fed_before_last[0] >= 1
+        assert [td.get_text() for td in soup.find_all("td")] == ["1", "2", "3"]
+
+    def test_empty_values_do_not_hold_pieces(self) -> None:
+        """A closed ``class=""`` does not hold the rest of the body back."""
+        rows = [f'<tr><td class="">{i}</td></tr>' for i in range(50)]
+
+        with patch.object(HTMLParser, "feed", autospec=True, side_effect=HTMLParser.feed) as feed:
+            soup = parse_html_chunks(iter(["<table>", *rows, "</table>"]))
+        assert feed.call_count >= 50
+        assert len(soup.find_all("td")) == 50
+
+    def test_empty_document(self) -> None:
+        assert parse_html_chunks(iter([])).decode() == ""
@@ -5,17 +5,20 @@ from __future__ import annotations
 import base64 as b64mod
 from pathlib import Path
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 import requests
 from bs4 import BeautifulSoup
 from solentlabs.cable_modem_monitor_core.auth.base import AuthResult
 from solentlabs.cable_modem_monitor_core.fetch_list import ResourceTarget
+from solentlabs.cable_modem_monitor_core.loaders.html_stream import parse_html_chunks
 from solentlabs.cable_modem_monitor_core.loaders.http import (
     HTTPResourceLoader,
     LoginPageDetectedError,
     ResourceLoadError,
     _decode_response,
+    _is_login_page,
 )
 from solentlabs.cable_modem_monitor_core.test_harness import HARMockServer
 
@@ -109,6 +112,42 @@ def test_decode_response(text: str, fmt: str, encoding: str, exp_type: str | Non
         assert isinstance(value, dict)
 
 
+# ---------------------------------------------------------------------------
+# _is_login_page — table-driven
+# ---------------------------------------------------------------------------
+
+# ┌────────────────────────────────────┬──────────┬──────────────────────────────┐
+# │ text                               │ expected │ description                  │
+# ├────────────────────────────────────┼──────────┼──────────────────────────────┤
+# │ <input type="password">            │ True     │ double-quoted                │
+# │ <input type='password'>            │ True     │ single-quoted                │
+# │ <INPUT TYPE="PassWord">            │ True     │ any letter case              │
+# │ <input type="password'>            │ False    │ mismatched quotes            │
+# │ <input type=password>              │ False    │ unquoted                     │
+# │ <input type="paſſword">            │ False    │ non-ASCII look-alike         │
+# │ <input type="text">                │ False    │ no password input            │
+# └────────────────────────────────────┴──────────┴──────────────────────────────┘
+
+# fmt: off
+_LOGIN_PAGE_CASES: list[tuple[str, bool, str]] = [
+    # (text,                            expected, description)
+    ('<input type="password">',         True,     "double-quoted"),
+    ("<input type='password'>",         True,     "single-quoted"),
+    ('<INPUT TYPE="PassWord">',         True,     "any letter case"),
+    ("<input type=\"password'>",        False,    "mismatched quotes"),
+    ("<input type=password>",           False,    "unquoted"),
+    ('<input type="paſſword">',         False,    "non-ASCII look-alike"),
+    ('<input type="text">',             False,    "no password input"),
+]
+# fmt: on
+
+
+@pytest.mark.parametrize("text,expected,desc", _LOGIN_PAGE_CASES, ids=[c[2] for c in _LOGIN_PAGE_CASES])
+def test_is_login_page(text: str, expected: bool, desc: str) -> None:
+    """_is_login_page: {desc}."""
+    assert _is_login_page(text) is expected
+
+
 class TestDecodeResponseBehaviors:
     """Behavioral assertions beyond type checking."""
 
@@ -598,3 +637,71 @@ class TestHTTPResourceLoader:
             assert size_bytes > 0
             assert status_code == 200
             assert "text/html" in content_type
+
+    def test_body_decoded_once(self) -> None:
+        """Login detection and decoding share one decode of the body."""
+        entries = _build_entries({"/status.html": ("text/html", "<html><table></table></html>")})
+        decodes = 0
+        original = vars(requests.Response)["text"]
+
+        def counting_text(response: requests.Response) -> str:
+            nonlocal decodes
+            decodes += 1
+            text: str = original.fget(response)
+            return text
+
+        with HARMockServer(entries) as server, patch.object(requests.Response, "text", property(counting_text)):
+            session = requests.Session()
+            loader = HTTPResourceLoader(session, server.base_url, timeout=10, detect_login_pages=True)
+            resources = loader.fetch([ResourceTarget(path="/status.html", format="table")])
+
+        assert "/status.html" in resources
+        assert decodes == 1
+
+    def test_stream_html_matches_buffered(self) -> None:
+        """A streamed page yields the soup, size and text of a buffered one."""
+        body = "<table><tr><th>Pwr</td><td>3.1 dBmV</td><td>é</td></tr></table>" * 2000
+        entries = _build_entries({"/status.html": ("text/html; charset=utf-8", body)})
+        targets = [ResourceTarget(path="/status.html", format="table")]
+
+        with HARMockServer(entries) as server:
+            buffered = HTTPResourceLoader(requests.Session(), server.base_url, timeout=10)
+            streamed = HTTPResourceLoader(requests.Session(), server.base_url, timeout=10, stream_html=True)
+            expected = buffered.fetch(targets)
+            with patch(
+                "solentlabs.cable_modem_monitor_core.loaders.html_stream.parse_html_chunks",
+                wraps=parse_html_chunks,
+            ) as parse:
+                resources = streamed.fetch(targets)
+
+        parse.assert_called_once()
+        assert resources["/status.html"].decode() == expected["/status.html"].decode()
+        assert streamed.resource_fetches[0][2] == buffered.resource_fetches[0][2] == len(body.encode())
+
+    def test_stream_html_without_charset_reads_whole_body(self) -> None:
+        """No declared charset: the body is read whole and sniffed as usual."""
+        entries = _build_entries({"/status.html": ("application/xhtml+xml", "<html><table></table></html>")})
+
+        with HARMockServer(entries) as server:
+            loader = HTTPResourceLoader(requests.Session(), server.base_url, timeout=10, stream_html=True)
+            with patch("solentlabs.cable_modem_monitor_core.loaders.html_stream.parse_html_chunks") as parse:
+                resources = loader.fetch([ResourceTarget(path="/status.html", format="table")])
+
+        parse.assert_not_called()
+        assert isinstance(resources["/status.html"], BeautifulSoup)
+
+    def test_stream_html_login_page_detected(self) -> None:
+        """Login detection still sees the full text of a streamed page."""
+        login_html = '<html><form><input type="password" name="pw"></form></html>'
+        entries = _build_entries({"/status.html": ("text/html", login_html)})
+
+        with HARMockServer(entries) as server:
+            loader = HTTPResourceLoader(
+                requests.Session(),
+                server.base_url,
+                timeout=10,
+                detect_login_pages=True,
+                stream_html=True,
+            )
+            with pytest.raises(LoginPageDetectedError):
+                loader.fetch([ResourceTarget(path="/status.html", format="table")])
@@ -46,6 +46,7 @@ from solentlabs.cable_modem_monitor_core.models.modem_config.auth import (
 )
 from solentlabs.cable_modem_monitor_core.orchestration.actions.base import ActionResult
 from solentlabs.cable_modem_monitor_core.orchestration.collector import (
+    _STUB_BODY_MAX,
     LoginLockoutError,
     ModemDataCollector,
 )
@@ -718,6 +719,143 @@ class TestPostProcessorResourcesFetch:
         assert len(paths) == 2
 
 
+class TestFetchMask:
+    """set_fetch_mask() narrows the fetch list from the next execute()."""
+
+    def _collector(self) -> ModemDataCollector:
+        from solentlabs.cable_modem_monitor_core.models.parser_config import ParserConfig
+
+        fixture = Path(__file__).parent.parent / "fixtures" / "parser_config_split_pages.json"
+        parser_config = ParserConfig.model_validate(load_fixture(fixture))
+        return ModemDataCollector(_make_config(auth_type="none"), parser_config, None, "http://localhost", "", "")
+
+    def _fetched_paths(self, collector: ModemDataCollector) -> set[str]:
+        with patch("solentlabs.cable_modem_monitor_core.orchestration.collector.HTTPResourceLoader") as loader_cls:
+            loader = loader_cls.return_value
+            loader.fetch.return_value = {}
+            loader.decode_errors = []
+            loader.resource_fetches = []
+            collector.execute()
+        return {t.path for t in loader.fetch.call_args[0][0]}
+
+    def test_mask_applies_at_next_execute(self) -> None:
+        """A parked mask prunes the next collection's fetch list."""
+        from solentlabs.cable_modem_monitor_core.fetch_list import FetchMask
+
+        collector = self._collector()
+        collector.set_fetch_mask(
+            FetchMask(sections=frozenset({"downstream"}), ignored_system_info_fields=frozenset({"upstream_total"}))
+        )
+        assert collector.fetch_mask is None
+
+        paths = self._fetched_paths(collector)
+
+        assert paths == {"/downstream.html"}
+        assert collector.fetch_mask is not None
+
+    def test_clearing_mask_restores_full_fetch(self) -> None:
+        """set_fetch_mask(None) brings every page back."""
+        from solentlabs.cable_modem_monitor_core.fetch_list import FetchMask
+
+        collector = self._collector()
+        collector.set_fetch_mask(FetchMask(sections=frozenset({"downstream"})))
+        self._fetched_paths(collector)
+        collector.set_fetch_mask(None)
+
+        paths = self._fetched_paths(collector)
+
+        assert len(paths) == 5
+        assert collector.fetch_mask is None
+
+
+class TestRefreshTier:
+    """parser.yaml refresh_every skips slow resources between refreshes."""
+
+    _VERSION = "/version.html"
+
+    def _collector(self, polls: int = 3) -> ModemDataCollector:
+        from solentlabs.cable_modem_monitor_core.models.parser_config import ParserConfig
+
+        raw = load_fixture(Path(__file__).parent.parent / "fixtures" / "parser_config_split_pages.json")
+        raw["refresh_every"] = {self._VERSION: polls}
+        parser_config = ParserConfig.model_validate(raw)
+        return ModemDataCollector(_make_config(auth_type="none"), parser_config, None, "http://localhost", "", "")
+
+    def _poll(self, collector: ModemDataCollector, *, anchors_found: int = 1) -> tuple[set[str], dict[str, Any]]:
+        """Run one collection; return the paths requested and the dict handed to parse."""
+        anchors = AnchorCount(expected=1, fulfilled=anchors_found)
+        diagnostics = ParseDiagnostics(by_resource={"/downstream.html": anchors})
+        with (
+            patch("solentlabs.cable_modem_monitor_core.orchestration.collector.HTTPResourceLoader") as loader_cls,
+            patch.object(collector, "_parse", return_value=({"downstream": []}, diagnostics)) as parse,
+        ):
+            loader = loader_cls.return_value
+            loader.fetch.side_effect = lambda targets, _auth: {t.path: f"body:{t.path}" for t in targets}
+            loader.decode_errors = []
+            loader.resource_fetches = []
+            collector.execute()
+        return {t.path for t in loader.fetch.call_args[0][0]}, parse.call_args[0][0]
+
+    def test_slow_resource_fetched_every_n_polls(self) -> None:
+        """A slow page is requested on the first poll, then every N polls."""
+        collector = self._collector(polls=3)
+
+        fetched = [self._VERSION in self._poll(collector)[0] for _ in range(5)]
+
+        assert fetched == [True, False, False, True, False]
+
+    def test_cached_resource_merged_into_parse(self) -> None:
+        """Skipped slow pages still reach the parser from cache."""
+        collector = self._collector()
+        self._poll(collector)
+
+        paths, resources = self._poll(collector)
+
+        assert self._VERSION not in paths
+        assert resources[self._VERSION] == f"body:{self._VERSION}"
+        assert len(resources) == 5
+
+    def test_expire_refetches_next_poll(self) -> None:
+        """expire_refresh_tier() (Recovery window open) forces a re-read."""
+        collector = self._collector()
+        self._poll(collector)
+
+        collector.expire_refresh_tier()
+
+        assert self._VERSION in self._poll(collector)[0]
+
+    def test_failed_parse_not_cached(self) -> None:
+        """A stub-page collection never pins the slow page in cache."""
+        collector = self._collector()
+        self._poll(collector, anchors_found=0)
+
+        assert self._VERSION in self._poll(collector)[0]
+
+    def test_only_slow_pages_held_for_commit(self) -> None:
+        """Fast pages are not pinned by the collector during or after parse."""
+        collector = self._collector()
+        held: list[list[str]] = []
+        diagnostics = ParseDiagnostics(by_resource={"/downstream.html": AnchorCount(expected=1, fulfilled=1)})
+
+        def _parse(_resources: dict[str, Any]) -> tuple[dict[str, Any], ParseDiagnostics]:
+            held.append(list(collector._tier_fetched))
+            return {"downstream": []}, diagnostics
+
+        with (
+            patch("solentlabs.cable_modem_monitor_core.orchestration.collector.HTTPResourceLoader") as loader_cls,
+            patch.object(collector, "_parse", side_effect=_parse),
+        ):
+            loader = loader_cls.return_value
+            loader.fetch.side_effect = lambda targets, _auth: {t.path: f"body:{t.path}" for t in targets}
+            loader.decode_errors = []
+            loader.resource_fetches = []
+            collector.execute()
+
+        assert held == [[self._VERSION]]
+        assert collector._tier_fetched == {}
+        assert collector._refresh_tier.cached_paths == [self._VERSION]
+
+
 # ------------------------------------------------------------------
 # Tests — UC-19a stub-page detection (LOAD_INTEGRITY signal)
 # ------------------------------------------------------------------
@@ -802,6 +940,23 @@ class TestStubPageDetection:
         # Resource with full fulfillment must NOT appear in error
         assert "/data.html" not in result.error
 
+    def test_stub_body_truncated(self) -> None:
+        """A large stub page is kept for diagnostics only up to the cap."""
+        config = _make_config(auth_type="none")
+        collector = ModemDataCollector(config, MagicMock(), None, "http://localhost", "", "")
+        body = "x" * (_STUB_BODY_MAX + 10)
+        diagnostics = ParseDiagnostics(by_resource={"/status.html": AnchorCount(expected=4, fulfilled=0)})
+        with (
+            patch.object(collector, "authenticate", return_value=MagicMock(success=True)),
+            patch.object(collector, "_load_resources", return_value=({"/status.html": body}, [])),
+            patch.object(collector, "_parse", return_value=({"downstream": []}, diagnostics)),
+        ):
+            collector.execute()
+
+        snippet = collector.last_stub_bodies["/status.html"]
+        assert snippet.startswith("x" * _STUB_BODY_MAX)
+        assert snippet.endswith(f"... (truncated, {len(body)} chars)")
+
 
 # ------------------------------------------------------------------
 # Tests — logout (behavioral, inline)
@@ -1,7 +1,7 @@
 """Tests for ``orchestration/factory.py`` entry points.
 
-Covers ``apply_credential_encoding`` and ``create_orchestrator``'s
-HealthMonitor wiring.
+Covers ``apply_credential_encoding``, ``create_orchestrator``'s
+HealthMonitor wiring, and the collector options both factories pass on.
 """
 
 from __future__ import annotations
@@ -9,12 +9,14 @@ from __future__ import annotations
 from typing import Any
 from unittest.mock import MagicMock
 
+import pytest
 from solentlabs.cable_modem_monitor_core.models.modem_config.auth import (
     FormNonceAuth,
     NoneAuth,
 )
 from solentlabs.cable_modem_monitor_core.orchestration.factory import (
     apply_credential_encoding,
+    create_collector,
     create_orchestrator,
 )
 
@@ -128,3 +130,20 @@ class TestCreateOrchestratorHealthMonitor:
         )
         assert orchestrator is not None
         assert health_monitor is None
+
+
+class TestCollectorOptions:
+    """Collector options reach the ``ModemDataCollector`` from both factories."""
+
+    @pytest.mark.parametrize("stream_html", [False, True])
+    def test_stream_html_passed_through(self, stream_html: bool) -> None:
+        args = {
+            "modem_config": _none_auth_modem_config(),
+            "parser_config": None,
+            "post_processor": None,
+            "base_url": "http://192.168.100.1",
+        }
+        collector = create_collector(**args, stream_html=stream_html)
+        orchestrator, _, _ = create_orchestrator(**args, http_probe=False, supports_icmp=False, stream_html=stream_html)
+        assert collector._stream_html is stream_html
+        assert orchestrator._collector._stream_html is stream_html
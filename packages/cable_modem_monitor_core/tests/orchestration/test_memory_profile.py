@@ -0,0 +1,60 @@
+"""Tests for the per-poll tracemalloc profile."""
+
+from __future__ import annotations
+
+import tracemalloc
+
+from solentlabs.cable_modem_monitor_core.orchestration.memory_profile import (
+    PollMemory,
+    PollMemoryProfiler,
+)
+
+
+class TestPollMemoryProfiler:
+    """Peak and retained bytes per measured block; tracing lifetime."""
+
+    def test_measures_allocation(self) -> None:
+        """A freed allocation counts toward peak, not retained."""
+        profiler = PollMemoryProfiler()
+        try:
+            with profiler.measure():
+                block = bytearray(1_000_000)
+                del block
+        finally:
+            profiler.close()
+
+        assert profiler.last is not None
+        assert profiler.last.peak_bytes >= 1_000_000
+        assert profiler.last.retained_bytes < 1_000_000
+
+    def test_last_none_before_measure(self) -> None:
+        """No profile until a poll has been measured."""
+        assert PollMemoryProfiler().last is None
+
+    def test_stops_tracing_it_started(self) -> None:
+        """Tracing stops when the last profiler closes."""
+        assert not tracemalloc.is_tracing()
+        first, second = PollMemoryProfiler(), PollMemoryProfiler()
+        with first.measure(), second.measure():
+            pass
+
+        first.close()
+        assert tracemalloc.is_tracing()
+        second.close()
+        assert not tracemalloc.is_tracing()
+
+    def test_leaves_outside_tracing_running(self) -> None:
+        """Tracing started elsewhere is left running."""
+        tracemalloc.start()
+        try:
+            profiler = PollMemoryProfiler()
+            with profiler.measure():
+                pass
+            profiler.close()
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+    def test_to_dict(self) -> None:
+        """to_dict returns both figures."""
+        assert PollMemory(peak_bytes=10, retained_bytes=-2).to_dict() == {"peak_bytes": 10, "retained_bytes": -2}
@@ -2,6 +2,12 @@
 
 from __future__ import annotations
 
+import dataclasses
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+from solentlabs.cable_modem_monitor_core import orchestration
+from solentlabs.cable_modem_monitor_core.orchestration.event_payload import ChannelPayload
 from solentlabs.cable_modem_monitor_core.orchestration.models import (
     HealthInfo,
     ModemIdentity,
@@ -177,6 +183,63 @@ class TestModemSnapshotToEventPayload:
         assert payload.modem_data is not None
         assert payload.modem_data.system_info == {"system_uptime": "2 days"}
 
+    def test_channels_are_slotted_records(self) -> None:
+        """A 32x8 modem's channels validate into slotted records and dump as dicts."""
+        downstream = [
+            {"channel_number": i, "channel_id": i, "channel_type": "qam", "power": i, "snr": "38.5", "extra": 1}
+            for i in range(1, 33)
+        ]
+        upstream = [{"channel_number": i, "channel_type": "atdma", "symbol_rate": 5120} for i in range(1, 9)]
+        snap = ModemSnapshot(
+            connection_status=ConnectionStatus.ONLINE,
+            docsis_status=DocsisStatus.OPERATIONAL,
+            modem_data={"downstream": downstream, "upstream": upstream, "system_info": {}},
+        )
+        payload = snap.to_event_payload()
+        assert payload.modem_data is not None
+        channel = payload.modem_data.downstream[0]
+        assert isinstance(channel, ChannelPayload)
+        assert not hasattr(channel, "__dict__")
+
+        dumped = payload.model_dump()["modem_data"]
+        assert len(dumped["downstream"]) == 32
+        assert len(dumped["upstream"]) == 8
+        assert dumped["downstream"][1] == {
+            "channel_number": 2,
+            "lock_status": None,
+            "channel_type": "qam",
+            "channel_id": 2,
+            "source_channel_number": None,
+            "frequency": None,
+            "power": 2.0,
+            "modulation": None,
+            "snr": 38.5,
+            "corrected": None,
+            "uncorrected": None,
+            "symbol_rate": None,
+        }
+
+    def test_channel_without_number_rejected(self) -> None:
+        """channel_number stays required on the slotted record."""
+        snap = ModemSnapshot(
+            connection_status=ConnectionStatus.ONLINE,
+            docsis_status=DocsisStatus.OPERATIONAL,
+            modem_data={"downstream": [{"channel_id": 1}], "upstream": [], "system_info": {}},
+        )
+        with pytest.raises(ValidationError):
+            snap.to_event_payload()
+
+    def test_channel_payload_public_surface(self) -> None:
+        """Standalone validation and dumping go through ``TypeAdapter``."""
+        adapter = TypeAdapter(orchestration.ChannelPayload)
+        channel = adapter.validate_python({"channel_number": "3", "power": "4.5", "extra": 1})
+        assert isinstance(channel, ChannelPayload)
+        assert adapter.dump_python(channel, exclude_none=True) == {"channel_number": 3, "power": 4.5}
+        assert dataclasses.asdict(channel)["channel_number"] == 3
+        assert adapter.json_schema()["required"] == ["channel_number"]
+        with pytest.raises(ValidationError):
+            adapter.validate_python({"power": 1.0})
+
 
 class TestResourceFetch:
     """ResourceFetch timing, size, and response metadata."""
@@ -302,6 +365,7 @@ class TestOrchestratorDiagnostics:
             "last_stub_body": {},
             "system_info_fields_missing": [],
             "system_info_fields_failed": {},
+            "poll_memory": None,
         }
 
     def test_to_dict_with_fetches(self) -> None:
@@ -379,6 +379,7 @@ ENRICH_CASES = [
     # Derivable from lock_status
     ([_LOCKED] * 3,                 _US1,  {},                           "Operational",  "all-locked+us"),
     ([_LOCKED] * 3,                 [],    {},                           "partial_lock", "all-locked-no-us"),
+    ([_LOCKED] * 3,                 None,  {},                           "Operational",  "all-locked-us-pruned"),
     ([_LOCKED, _UNLOCKED],          _US1,  {},                           "partial_lock", "some-locked"),
     ([_UNLOCKED] * 2,               _US1,  {},                           "not_locked",   "none-locked"),
     # Not derivable — field stays absent
@@ -398,7 +399,7 @@ ENRICH_CASES = [
 )
 def test_enrich_docsis_status(
     ds_channels: list[dict[str, Any]],
-    upstream: list[dict[str, Any]],
+    upstream: list[dict[str, Any]] | None,
     system_info: dict[str, Any],
     expected_docsis: str | None,
     desc: str,
@@ -408,9 +409,11 @@ def test_enrich_docsis_status(
 
     modem_data: dict[str, Any] = {
         "downstream": ds_channels,
-        "upstream": upstream,
         "system_info": dict(system_info),
     }
+    # None stands for a section pruned by the fetch mask — no key at all.
+    if upstream is not None:
+        modem_data["upstream"] = upstream
 
     enrich_docsis_status(modem_data)
 
@@ -1443,6 +1446,27 @@ class TestDiagnostics:
         assert m.circuit_breaker_open is True
         assert m.auth_failure_streak == 1
 
+    def test_poll_memory_off_by_default(self) -> None:
+        """No memory profile unless the orchestrator was built with one."""
+        orch = _make_orchestrator()
+        orch.get_modem_data()
+
+        assert orch.diagnostics().poll_memory is None
+
+    def test_poll_memory_when_profiling(self) -> None:
+        """profile_memory=True records each poll's traced allocations."""
+        orch = Orchestrator(
+            collector=_mock_collector(), health_monitor=None, modem_config=_mock_config(), profile_memory=True
+        )
+        try:
+            orch.get_modem_data()
+            profile = orch.diagnostics().poll_memory
+        finally:
+            orch.close()
+
+        assert profile is not None
+        assert profile.peak_bytes >= 0
+
 
 # ==================================================================
 # Status property
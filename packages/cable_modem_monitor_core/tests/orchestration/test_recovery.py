@@ -14,7 +14,7 @@ Use case coverage:
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, cast
 from unittest.mock import MagicMock
 
 import pytest
@@ -117,6 +117,15 @@ def test_begin_resets_started_clock_on_re_entry(monkeypatch: pytest.MonkeyPatch)
     assert recovery._started_at == 160.0
 
 
+def test_begin_expires_refresh_tier() -> None:
+    """Opening a window makes the next poll re-read slow-tier pages."""
+    recovery = _make_recovery()
+
+    recovery.begin("restart_command")
+
+    cast(MagicMock, recovery._collector).expire_refresh_tier.assert_called_once()
+
+
 # ------------------------------------------------------------------
 # tick()
 # ------------------------------------------------------------------
@@ -218,6 +227,15 @@ def test_evaluate_failure_noop_for_non_connectivity(
     assert recovery.active is False
 
 
+def test_evaluate_failure_expires_refresh_tier() -> None:
+    """An outage window also invalidates the slow-tier cache."""
+    recovery = _make_recovery()
+
+    recovery.evaluate_failure(_failure(CollectorSignal.CONNECTIVITY))
+
+    cast(MagicMock, recovery._collector).expire_refresh_tier.assert_called_once()
+
+
 # ------------------------------------------------------------------
 # evaluate_snapshot() — reboot-signal vote
 # ------------------------------------------------------------------
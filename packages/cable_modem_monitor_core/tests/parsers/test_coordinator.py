@@ -14,6 +14,7 @@ from typing import Any
 import defusedxml.ElementTree as DefusedET
 import pytest
 from bs4 import BeautifulSoup
+from solentlabs.cable_modem_monitor_core.fetch_list import FetchMask
 from solentlabs.cable_modem_monitor_core.models.parser_config import ParserConfig
 from solentlabs.cable_modem_monitor_core.parsers.coordinator import (
     ModemParserCoordinator,
@@ -784,6 +785,112 @@ def test_parser_counted_resource_not_double_counted() -> None:
     assert (count.expected, count.fulfilled) == (3, 3)
 
 
+# ---------------------------------------------------------------------------
+# Document release — parse(release=True)
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "fixture_path",
+    VALID_FIXTURES + DIAGNOSTICS_FIXTURES,
+    ids=[f.stem for f in VALID_FIXTURES + DIAGNOSTICS_FIXTURES],
+)
+def test_release_matches_retained_parse(fixture_path: Path) -> None:
+    """Releasing documents changes neither ModemData nor diagnostics."""
+    data = load_fixture(fixture_path)
+    config = ParserConfig.model_validate(data["_config"] if "_resources" in data else data["_parser_config"])
+
+    expected = ModemParserCoordinator(config).parse(_fixture_resources(data))
+    assert ModemParserCoordinator(config).parse(_fixture_resources(data), release=True) == expected
+
+
+def _fixture_resources(data: dict[str, Any]) -> dict[str, Any]:
+    """Fresh resource dict for an extraction or diagnostics fixture."""
+    if "_resources" in data:
+        return _build_declared_resources(data)
+    return _build_resources(data.get("_html", {})) | _build_json_resources(data.get("_json", {}))
+
+
+def _json_channels(resource: str) -> dict[str, Any]:
+    return {
+        "format": "json",
+        "resource": resource,
+        "array_path": "channels",
+        "fields": [{"key": "id", "field": "channel_id", "type": "integer"}],
+    }
+
+
+_RELEASE_CONFIG = {
+    "downstream": _json_channels("/ds"),
+    "upstream": _json_channels("/us"),
+    "system_info": {
+        "sources": [
+            {
+                "format": "json",
+                "resource": "/info",
+                "fields": [{"key": "sw", "field": "software_version", "type": "string"}],
+            },
+        ]
+    },
+}
+
+
+class _RecordingResources(dict[str, Any]):
+    """Resource dict that records which paths it held at each lookup."""
+
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+        self.lookups: list[tuple[str, list[str]]] = []
+
+    def get(self, key: str, default: Any = None) -> Any:
+        self.lookups.append((key, sorted(self)))
+        return super().get(key, default)
+
+
+class TestRelease:
+    """Documents leave the dict once no later section or hook reads them."""
+
+    def _resources(self) -> _RecordingResources:
+        return _RecordingResources(
+            {"/ds": {"channels": [{"id": 1}]}, "/us": {"channels": [{"id": 2}]}, "/info": {"sw": "1.0"}}
+        )
+
+    def test_page_released_after_its_section(self) -> None:
+        resources = self._resources()
+        ModemParserCoordinator(ParserConfig.model_validate(_RELEASE_CONFIG)).parse(resources, release=True)
+
+        assert ("/us", ["/info", "/us"]) in resources.lookups
+        assert list(resources) == ["/info"]
+
+    def test_page_shared_with_later_section_kept(self) -> None:
+        config = {**_RELEASE_CONFIG, "upstream": _json_channels("/ds")}
+        resources = self._resources()
+        ModemParserCoordinator(ParserConfig.model_validate(config)).parse(resources, release=True)
+
+        assert ("/ds", ["/ds", "/info", "/us"]) in resources.lookups[1:]
+
+    def test_later_hook_blocks_release(self) -> None:
+        resources = self._resources()
+        coordinator = ModemParserCoordinator(ParserConfig.model_validate(_RELEASE_CONFIG), _MockPostProcessor())
+        coordinator.parse(resources, release=True)
+
+        assert sorted(resources) == ["/ds", "/info", "/us"]
+
+    def test_not_released_by_default(self) -> None:
+        resources = self._resources()
+        ModemParserCoordinator(ParserConfig.model_validate(_RELEASE_CONFIG)).parse(resources)
+
+        assert sorted(resources) == ["/ds", "/info", "/us"]
+
+    @pytest.mark.parametrize(("html", "kept"), [(_STUB_HTML, True), (_FULL_HTML, False)], ids=["stub", "full"])
+    def test_zero_fulfillment_page_kept(self, html: str, kept: bool) -> None:
+        config = ParserConfig.model_validate({"downstream": _JS_PARSER_CONFIG["downstream"]})
+        resources = _build_resources({"/status.html": html})
+        ModemParserCoordinator(config).parse(resources, release=True)
+
+        assert ("/status.html" in resources) is kept
+
+
 # ---------------------------------------------------------------------------
 # _parse_numeric — table-driven
 # ---------------------------------------------------------------------------
@@ -1014,3 +1121,68 @@ class TestFieldOutcomes:
 
         assert diagnostics.system_info_fields_missing == []
         assert diagnostics.system_info_fields_failed == {}
+
+
+class TestFetchMask:
+    """Sections pruned by the consumer fetch mask are not extracted.
+
+    See RESOURCE_LOADING_SPEC.md § Fetch List Derivation.
+    """
+
+    def _config(self) -> ParserConfig:
+        return ParserConfig.model_validate(
+            {
+                "downstream": _table_section("/ds.html", channel_type="qam"),
+                "upstream": _table_section("/us.html", channel_type="atdma"),
+                "system_info": _sysinfo_section(
+                    "/info.html", [{"label": "Software Version", "field": "software_version", "type": "string"}]
+                ),
+            }
+        )
+
+    def _resources(self) -> dict[str, Any]:
+        return _build_resources(
+            {
+                "/ds.html": _make_table_html("Downstream", [["1", "500"]]),
+                "/info.html": _make_field_html({"Software Version": "1.0"}),
+            }
+        )
+
+    def test_pruned_section_absent_and_not_counted(self) -> None:
+        """A pruned upstream has no key, no channel count, and no stub verdict."""
+        coordinator = ModemParserCoordinator(self._config(), mask=FetchMask(sections=frozenset({"downstream"})))
+
+        data, diagnostics = coordinator.parse(self._resources())
+
+        assert "upstream" not in data
+        assert "upstream_channel_count" not in data["system_info"]
+        assert "software_version" not in data["system_info"]
+        assert data["system_info"]["downstream_channel_count"] == 1
+        assert set(diagnostics.by_resource) == {"/ds.html"}
+        assert diagnostics.has_zero_fulfillment is False
+
+    def test_pruned_section_hook_not_invoked(self) -> None:
+        """parser.py hooks for pruned sections do not run."""
+        calls: list[str] = []
+
+        class _Recorder:
+            def parse_upstream(self, channels: list[dict[str, Any]], resources: dict[str, Any]) -> Any:
+                calls.append("upstream")
+                return channels
+
+        coordinator = ModemParserCoordinator(
+            self._config(), _Recorder(), mask=FetchMask(sections=frozenset({"downstream", "system_info"}))
+        )
+        coordinator.parse(self._resources())
+
+        assert calls == []
+
+    def test_no_mask_parses_everything(self) -> None:
+        """Without a mask the coordinator reads every configured section."""
+        coordinator = ModemParserCoordinator(self._config())
+
+        data, diagnostics = coordinator.parse(self._resources())
+
+        assert data["upstream"] == []
+        assert data["system_info"]["upstream_channel_count"] == 0
+        assert "/us.html" in diagnostics.by_resource
@@ -9,13 +9,14 @@ Adding a test case = drop a JSON file in fixtures/html_fields/valid/.
 from __future__ import annotations
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from bs4 import BeautifulSoup
 from solentlabs.cable_modem_monitor_core.models.parser_config.system_info import (
     HTMLFieldsSource,
 )
-from solentlabs.cable_modem_monitor_core.parsers.formats.html_fields import HTMLFieldsParser
+from solentlabs.cable_modem_monitor_core.parsers.formats.html_fields import HTMLFieldsParser, label_index
 
 from tests._helpers import collect_fixtures, load_fixture
 
@@ -49,3 +50,40 @@ def test_extraction(fixture_path: Path) -> None:
     assert result == expected, (
         f"Mismatch for {fixture_path.stem}:\n" f"  actual:   {result}\n" f"  expected: {expected}"
     )
+
+
+# =====================================================================
+# Label index — inline
+# =====================================================================
+
+_LABEL_PAGE = (
+    "<table><tr><td>Software Version</td><td>1.0.2</td></tr>"
+    "<tr><td>Hardware Version</td><td>A1</td></tr></table>"
+    "<div><span>Uptime</span><span>3 days</span></div>"
+)
+
+
+class TestLabelIndex:
+    """One document walk per resource, shared by every label field."""
+
+    def test_sources_share_one_walk(self) -> None:
+        soup = BeautifulSoup(_LABEL_PAGE, "html.parser")
+        sources = [
+            HTMLFieldsSource(
+                format="html_fields",
+                resource="/info.html",
+                fields=[{"label": label, "field": field, "type": "string"}],
+            )
+            for label, field in (("Software Version", "software_version"), ("Hardware Version", "hardware_version"))
+        ]
+        with patch.object(soup, "find_all", wraps=soup.find_all) as find_all:
+            results = [HTMLFieldsParser(source).parse({"/info.html": soup}) for source in sources]
+        assert results == [{"software_version": "1.0.2"}, {"hardware_version": "A1"}]
+        # Block-level scan plus candidate scan, once for both sources.
+        assert find_all.call_count == 2
+
+    def test_index_is_per_soup(self) -> None:
+        soup = BeautifulSoup(_LABEL_PAGE, "html.parser")
+        assert label_index(soup) is label_index(soup)
+        assert label_index(soup).lookup("uptime") == "3 days"
+        assert label_index(soup).lookup("Missing") is None
@@ -0,0 +1,104 @@
+"""Tests for the per-document script index shared by the JS formats.
+
+Table-driven tests for function-body delimiting; inline tests for the
+index being built once per soup and for anchor counting.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from bs4 import BeautifulSoup
+from solentlabs.cable_modem_monitor_core.parsers.registries import (
+    _count_js_function_anchors,
+    _count_js_variable_anchors,
+)
+from solentlabs.cable_modem_monitor_core.parsers.script_index import script_index
+
+
+def _page(*scripts: str) -> BeautifulSoup:
+    return BeautifulSoup("".join(f"<script>{s}</script>" for s in scripts), "html.parser")
+
+
+# =====================================================================
+# tagValueList — table-driven
+# =====================================================================
+
+# ┌──────────────────┬──────────────────────────────────────────┬──────────┐
+# │ id               │ script                                   │ value    │
+# ├──────────────────┼──────────────────────────────────────────┼──────────┤
+# │ function-body    │ function f() { var tagValueList = ... }  │ "2|a|b"  │
+# │ crlf             │ same, \r\n line endings                  │ "2|a|b"  │
+# │ indented-close   │ closing brace indented                   │ "2|a|b"  │
+# │ commented-out    │ example in a comment precedes the value  │ "2|a|b"  │
+# │ other-function   │ value belongs to g(), not f()            │ None     │
+# │ line-close-only  │ body ends at first line starting with }  │ None     │
+# └──────────────────┴──────────────────────────────────────────┴──────────┘
+#
+# fmt: off
+_TAG_VALUE_CASES = [
+    ("function-body",   "function f() {\nvar tagValueList = '2|a|b';\n}",                     "2|a|b"),
+    ("crlf",            "function f() {\r\nvar tagValueList = '2|a|b';\r\n}",                 "2|a|b"),
+    ("indented-close",  "  function f(x) {\n    var tagValueList = \"2|a|b\";\n  }",          "2|a|b"),
+    ("commented-out",   "function f() {\n// var tagValueList = 'x';\nvar tagValueList = '2|a|b';\n}", "2|a|b"),
+    ("other-function",  "function g() {\nvar tagValueList = '2|a|b';\n}",                     None),
+    ("line-close-only", "function f() {\nif (x) {\n}\nvar tagValueList = '2|a|b';\n}",        None),
+]
+# fmt: on
+
+
+@pytest.mark.parametrize(
+    ("script", "expected"),
+    [(c[1], c[2]) for c in _TAG_VALUE_CASES],
+    ids=[c[0] for c in _TAG_VALUE_CASES],
+)
+def test_tag_value_list(script: str, expected: str | None) -> None:
+    assert script_index(_page(script)).tag_value_list("f") == expected
+
+
+# =====================================================================
+# Index — inline
+# =====================================================================
+
+
+class TestScriptIndex:
+    """Scripts are collected once per soup and lookups are memoized."""
+
+    def test_scripts_collected_once(self) -> None:
+        soup = _page("function f() {\nvar tagValueList = '1|a';\n}", "var js_FW = 'v1'; json_dsData = [{\"a\": 1}];")
+        with patch.object(soup, "find_all", wraps=soup.find_all) as find_all:
+            index = script_index(soup)
+            assert index.tag_value_list("f") == "1|a"
+            assert index.assignments == [("tagValueList", "1|a"), ("js_FW", "v1")]
+            assert index.json_array("json_dsData") == [{"a": 1}]
+            assert script_index(soup) is index
+        assert find_all.call_count == 1
+
+    def test_top_level_tag_value_list(self) -> None:
+        soup = _page("/* var tagValueList = 'x'; */ var tagValueList = '3|a|b|c';")
+        assert script_index(soup).tag_value_list("") == "3|a|b|c"
+
+    def test_invalid_json_tries_next_script(self) -> None:
+        soup = _page("data = [oops];", 'data = [{"ok": true}];')
+        assert script_index(soup).json_array("data") == [{"ok": True}]
+
+
+class TestAnchors:
+    """Anchors found in scripts never serialize the document."""
+
+    def test_present_anchor_skips_serialization(self) -> None:
+        soup = _page("function f() {\n}\njson_dsData = [];")
+        with patch.object(BeautifulSoup, "decode", side_effect=AssertionError("serialized")):
+            assert _count_js_function_anchors(soup, ["f"]).fulfilled == 1
+            assert _count_js_variable_anchors(soup, ["json_dsData"]).fulfilled == 1
+
+    def test_anchor_outside_scripts_still_counts(self) -> None:
+        soup = BeautifulSoup('<a onclick="function f(){}">x</a>', "html.parser")
+        assert _count_js_function_anchors(soup, ["f", "g"]).fulfilled == 1
+
+    def test_missing_anchors_serialize_once(self) -> None:
+        soup = _page("var x = 1;")
+        with patch.object(BeautifulSoup, "decode", autospec=True, side_effect=BeautifulSoup.decode) as decode:
+            assert _count_js_variable_anchors(soup, ["a", "b", "c"]).fulfilled == 0
+        assert decode.call_count == 1
@@ -10,13 +10,14 @@ Adding a test case = drop a JSON file in fixtures/table_selector/.
 from __future__ import annotations
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from bs4 import BeautifulSoup
 from solentlabs.cable_modem_monitor_core.models.parser_config.common import (
     TableSelector,
 )
-from solentlabs.cable_modem_monitor_core.parsers.table_selector import find_table
+from solentlabs.cable_modem_monitor_core.parsers.table_selector import find_table, table_index
 
 from tests._helpers import collect_fixtures, load_fixture
 
@@ -58,3 +59,37 @@ def test_find_table(fixture_path: Path) -> None:
             assert actual == attr_value, (
                 f"Expected {attr_name}={attr_value}, " f"got {attr_name}={actual} for {fixture_path.stem}"
             )
+
+
+# =====================================================================
+# Table index — inline
+# =====================================================================
+
+_PAGE = (
+    "<table><tr><td><table id='ds'><tr><th>Frequency</th><th>SNR</th></tr></table></td></tr></table>"
+    "<table id='us'><tr><th>Frequency</th><th>Symb. Rate</th></tr></table>"
+)
+
+
+class TestTableIndex:
+    """One index per soup; lookups after the first do not walk the tree."""
+
+    def test_index_is_per_soup(self) -> None:
+        soup = BeautifulSoup(_PAGE, "html.parser")
+        assert table_index(soup) is table_index(soup)
+        assert table_index(BeautifulSoup(_PAGE, "html.parser")) is not table_index(soup)
+
+    def test_header_lookups_share_one_walk(self) -> None:
+        soup = BeautifulSoup(_PAGE, "html.parser")
+        with patch.object(soup, "find_all", wraps=soup.find_all) as find_all:
+            downstream = find_table(soup, TableSelector(type="header_text", match="snr"))
+            walks = find_all.call_count
+            upstream = find_table(soup, TableSelector(type="header_text", match="Symb. Rate"))
+            assert find_all.call_count == walks
+        assert downstream is not None and downstream.get("id") == "ds"
+        assert upstream is not None and upstream.get("id") == "us"
+
+    def test_fallback_and_nth_use_ordinals(self) -> None:
+        soup = BeautifulSoup(_PAGE, "html.parser")
+        selector = TableSelector(type="id", match="absent", fallback=TableSelector(type="nth", match=2))
+        assert find_table(soup, selector) is table_index(soup).tables[2]
@@ -6,8 +6,12 @@ frequency normalization, map application, and edge cases.
 
 from __future__ import annotations
 
+from typing import TypedDict
+
 import pytest
 from solentlabs.cable_modem_monitor_core.parsers.type_conversion import (
+    column_converter,
+    convert_column,
     convert_value,
     normalize_frequency,
     strip_unit,
@@ -413,3 +417,70 @@ def test_uptime_pattern_cached_on_repeat() -> None:
     # Second call hits the cached-pattern branch
     result = convert_value("5d 6h 7m 8s", "uptime", input_format=fmt)
     assert result == "5 days 06h:07m:08s"
+
+
+# --- Column conversion ---
+
+
+class _ConversionOptions(TypedDict, total=False):
+    """Keyword arguments shared by ``convert_value`` and ``convert_column``."""
+
+    unit: str
+    map_config: dict[str, str]
+    scale: float
+    input_format: str
+
+
+# ┌─────────────────┬─────────────────────────────────────────────────────┐
+# │ id              │ declaration                                         │
+# ├─────────────────┼─────────────────────────────────────────────────────┤
+# │ every-type      │ each CONVERT_VALUE_CASES type, no options           │
+# │ unit            │ float with dBmV suffix                              │
+# │ map-then-unit   │ map output is unit-stripped and converted           │
+# │ scale           │ integer scaled down to float                        │
+# │ uptime-pattern  │ custom uptime format                                │
+# │ uptime-no-fmt   │ uptime without format passes through                │
+# │ unknown-type    │ unknown type returns strings                        │
+# └─────────────────┴─────────────────────────────────────────────────────┘
+#
+_COLUMN_RAWS = ["", "  ", "42", "3.2 dBmV", "507 MHz", "Locked", "-", "256qam", "D: 1 H: 2 M: 3 S: 4", 7, 1.5]
+
+# fmt: off
+COLUMN_CASES = [
+    # (id,               field_type,  options)
+    *[(f"every-type-{t}", t,          {}) for t in sorted({c[1] for c in CONVERT_VALUE_CASES})],
+    ("unit",             "float",     {"unit": "dBmV"}),
+    ("map-then-unit",    "float",     {"unit": "dBmV", "map_config": {"-": "0 dBmV"}}),
+    ("scale",            "integer",   {"scale": 0.001}),
+    ("uptime-pattern",   "uptime",    {"input_format": "D: {days} H: {hours} M: {minutes} S: {seconds}"}),
+    ("uptime-no-fmt",    "uptime",    {}),
+    ("unknown-type",     "mystery",   {}),
+]
+# fmt: on
+
+
+@pytest.mark.parametrize(
+    "field_type,options",
+    [(c[1], c[2]) for c in COLUMN_CASES],
+    ids=[c[0] for c in COLUMN_CASES],
+)
+def test_convert_column_matches_convert_value(field_type: str, options: _ConversionOptions) -> None:
+    """A converted column equals ``convert_value`` applied to each cell."""
+    expected = [convert_value(raw, field_type, **options) for raw in _COLUMN_RAWS]
+    assert convert_column(_COLUMN_RAWS, field_type, **options) == expected
+
+
+def test_column_converter_resolves_uptime_pattern_once() -> None:
+    """The uptime pattern is compiled when the converter is built, not per value."""
+    from solentlabs.cable_modem_monitor_core.parsers.type_conversion import (
+        _uptime_pattern_cache,
+    )
+
+    fmt = "{hours}h {minutes}m"
+    _uptime_pattern_cache.pop(fmt, None)
+
+    convert = column_converter("uptime", input_format=fmt)
+    _uptime_pattern_cache.pop(fmt, None)
+
+    assert convert("3h 4m") == "0 days 03h:04m:00s"
+    assert fmt not in _uptime_pattern_cache
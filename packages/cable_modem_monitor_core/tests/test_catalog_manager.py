@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 from typing import Any
 
+import pytest
 import yaml
 from solentlabs.cable_modem_monitor_core.catalog_manager import (
+    CATALOG_INDEX_NAME,
     ModemSummary,
     VariantInfo,
     list_modems,
     list_variants,
+    load_catalog_index,
+    verify_catalog_index,
+    write_catalog_index,
 )
 
 
@@ -515,3 +521,101 @@ class TestVariantInfo:
         assert info.isps == []
         assert info.notes is None
         assert info.status == "awaiting_verification"
+
+
+def _same_size_edit(path: Path, old: str, new: str) -> None:
+    """Rewrite a file so its size is unchanged — only a content hash tells."""
+    assert len(old) == len(new)
+    path.write_text(path.read_text().replace(old, new))
+
+
+class TestCatalogIndex:
+    """Prebuilt catalog_index.json — fast path and scan fallback."""
+
+    def _catalog(self, root: Path) -> Path:
+        _write_modem_yaml(
+            root / "solent" / "t100",
+            {"manufacturer": "Solent Labs", "model": "T100", "status": "awaiting_verification"},
+        )
+        _write_variant_yaml(
+            root / "solent" / "t100" / "modem-form.yaml",
+            {"auth": {"strategy": "form"}, "hardware": {"hw_version": "v2"}, "isps": ["Comcast"]},
+        )
+        _write_modem_yaml(root / "solent" / "t200", {"manufacturer": "Solent Labs", "model": "T200"})
+        return root
+
+    def test_index_matches_scan(self, tmp_path: Path) -> None:
+        """Listings from the index equal listings from the YAML scan."""
+        catalog = self._catalog(tmp_path)
+        scanned = list_modems(catalog)
+        scanned_variants = list_variants(catalog / "solent" / "t100")
+
+        write_catalog_index(catalog)
+
+        assert load_catalog_index(catalog) is not None
+        assert list_modems(catalog) == scanned
+        assert list_variants(catalog / "solent" / "t100") == scanned_variants
+
+    def test_index_is_read_instead_of_yaml(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A current index answers without parsing the YAML files."""
+        catalog = self._catalog(tmp_path)
+        write_catalog_index(catalog)
+
+        def _no_parse(*args: object) -> None:
+            raise AssertionError("YAML parsed despite a current index")
+
+        monkeypatch.setattr(yaml, "safe_load", _no_parse)
+        assert {s.model for s in list_modems(catalog)} == {"T100", "T200"}
+
+    def test_same_size_edit_makes_index_stale(self, tmp_path: Path) -> None:
+        """Edits that keep the file size are caught by the content hash."""
+        catalog = self._catalog(tmp_path)
+        write_catalog_index(catalog)
+        _same_size_edit(catalog / "solent" / "t200" / "modem.yaml", "T200", "T999")
+
+        assert load_catalog_index(catalog) is None
+        assert load_catalog_index(catalog, [catalog / "solent" / "t100"]) is not None
+        assert {s.model for s in list_modems(catalog)} == {"T100", "T999"}
+
+    def test_stale_index_falls_back_to_scan(self, tmp_path: Path) -> None:
+        """Added or resized files make the index stale."""
+        catalog = self._catalog(tmp_path)
+        write_catalog_index(catalog)
+        _write_modem_yaml(catalog / "solent" / "t300", {"manufacturer": "Solent Labs", "model": "T300"})
+
+        assert load_catalog_index(catalog) is None
+        assert {s.model for s in list_modems(catalog)} == {"T100", "T200", "T300"}
+
+    def test_variants_stale_only_for_their_dirs(self, tmp_path: Path) -> None:
+        """list_variants checks staleness for the requested directories only."""
+        catalog = self._catalog(tmp_path)
+        write_catalog_index(catalog)
+        _write_modem_yaml(catalog / "solent" / "t300", {"manufacturer": "Solent Labs", "model": "T300"})
+        _write_variant_yaml(catalog / "solent" / "t100" / "modem-new.yaml", {"auth": {"strategy": "none"}})
+
+        assert load_catalog_index(catalog, [catalog / "solent" / "t200"]) is not None
+        names = [v.name for v in list_variants(catalog / "solent" / "t100")]
+        assert names == [None, "form", "new"]
+
+    def test_version_mismatch_ignored(self, tmp_path: Path) -> None:
+        catalog = self._catalog(tmp_path)
+        (catalog / CATALOG_INDEX_NAME).write_text(json.dumps({"version": 0, "files": {}}))
+        assert load_catalog_index(catalog) is None
+        assert len(list_modems(catalog)) == 2
+
+    def test_corrupt_index_ignored(self, tmp_path: Path) -> None:
+        catalog = self._catalog(tmp_path)
+        (catalog / CATALOG_INDEX_NAME).write_text("{not json")
+        assert load_catalog_index(catalog) is None
+        assert len(list_modems(catalog)) == 2
+
+    def test_verify_detects_content_change(self, tmp_path: Path) -> None:
+        """The build check compares hashes, catching same-size edits."""
+        catalog = self._catalog(tmp_path)
+        assert verify_catalog_index(catalog) == [CATALOG_INDEX_NAME]
+
+        write_catalog_index(catalog)
+        assert verify_catalog_index(catalog) == []
+
+        _same_size_edit(catalog / "solent" / "t200" / "modem.yaml", "T200", "T999")
+        assert verify_catalog_index(catalog) == ["solent/t200/modem.yaml"]
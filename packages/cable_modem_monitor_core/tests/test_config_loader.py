@@ -15,16 +15,19 @@ and Pydantic validation. Invalid fixtures verify appropriate errors.
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
 
 import pytest
 import yaml
 from pydantic import ValidationError
 from solentlabs.cable_modem_monitor_core.config_loader import (
+    clear_config_cache,
     load_modem_config,
     load_parser_config,
     validate_modem_config,
     validate_parser_config,
 )
+from solentlabs.cable_modem_monitor_core.models.modem_config import ModemConfig
 
 from tests._helpers import collect_fixtures, load_fixture
 
@@ -148,3 +151,37 @@ class TestFileErrors:
         path.write_text("key: [unclosed", encoding="utf-8")
         with pytest.raises(yaml.YAMLError):
             load_modem_config(path)
+
+
+class TestConfigCache:
+    """Validated configs are cached by path and content hash."""
+
+    @pytest.fixture
+    def modem_yaml(self, tmp_path: Path) -> Path:
+        fixture = load_fixture(VALID_DIR / "modem_auth_none.json")
+        return _write_yaml(tmp_path, fixture["_yaml"], "modem")
+
+    def test_unchanged_file_validated_once(self, modem_yaml: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        clear_config_cache()
+        calls: list[Any] = []
+        original = ModemConfig.model_validate
+        monkeypatch.setattr(ModemConfig, "model_validate", lambda data: calls.append(data) or original(data))
+
+        first = load_modem_config(modem_yaml)
+        second = load_modem_config(modem_yaml)
+
+        assert len(calls) == 1
+        assert first == second
+
+    def test_callers_get_independent_copies(self, modem_yaml: Path) -> None:
+        first = load_modem_config(modem_yaml)
+        first.model = "Mutated"
+        assert load_modem_config(modem_yaml).model != "Mutated"
+
+    def test_edited_file_revalidated(self, modem_yaml: Path) -> None:
+        before = load_modem_config(modem_yaml)
+        modem_yaml.write_text(
+            modem_yaml.read_text(encoding="utf-8").replace(f"model: {before.model}", "model: Edited"),
+            encoding="utf-8",
+        )
+        assert load_modem_config(modem_yaml).model == "Edited"
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import threading
+import time
+from collections.abc import Callable, Mapping
+from functools import partial
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -13,6 +17,7 @@ from solentlabs.cable_modem_monitor_core.connectivity import (
     LegacySSLAdapter,
     create_session,
     detect_protocol,
+    run_probes,
     test_http_head as probe_http_head,
     test_icmp as probe_icmp,
 )
@@ -159,7 +164,8 @@ class TestDetectProtocol:
         else:
             assert result.working_url == expected_working_url, description
 
-        assert tcp_calls == expected_tcp_ports, description
+        # HTTP and HTTPS are probed concurrently — order is not defined.
+        assert sorted(tcp_calls) == sorted(expected_tcp_ports), description
 
         if tls_outcome is None:
             tls.assert_not_called()
@@ -167,6 +173,132 @@ class TestDetectProtocol:
             tls.assert_called_once()
 
 
+class TestDetectProtocolConcurrency:
+    """Both transports share one deadline; a conclusive HTTPS ends the race."""
+
+    def test_hanging_ports_cost_one_timeout(self) -> None:
+        """Two unresponsive ports finish in ~timeout, not 2x timeout."""
+
+        def hang(host: str, port: int, timeout: float) -> bool:
+            time.sleep(timeout)
+            return False
+
+        with patch(f"{_MODULE}._tcp_probe", side_effect=hang):
+            start = time.monotonic()
+            result = detect_protocol("192.168.100.1", timeout=0.3)
+            elapsed = time.monotonic() - start
+
+        assert result.success is False
+        assert elapsed < 0.5
+
+    def test_https_success_does_not_wait_for_http(self) -> None:
+        """A completed HTTPS handshake returns while :80 is still hanging."""
+        release = threading.Event()
+
+        def tcp(host: str, port: int, timeout: float) -> bool:
+            if port == 80:
+                release.wait(timeout)
+            return True
+
+        with (
+            patch(f"{_MODULE}._tcp_probe", side_effect=tcp),
+            patch(f"{_MODULE}._tls_handshake", return_value=(True, False)),
+        ):
+            start = time.monotonic()
+            result = detect_protocol("192.168.100.1", timeout=2.0)
+            elapsed = time.monotonic() - start
+        release.set()
+
+        assert result.protocol == "https"
+        assert elapsed < 1.0
+
+    def test_open_http_waits_for_https_verdict(self) -> None:
+        """HTTPS is preferred, so an open :80 alone is not conclusive."""
+
+        def tls(host: str, port: int, timeout: float) -> tuple[bool, bool]:
+            time.sleep(0.1)
+            return (True, True)
+
+        with (
+            patch(f"{_MODULE}._tcp_probe", return_value=True),
+            patch(f"{_MODULE}._tls_handshake", side_effect=tls),
+        ):
+            result = detect_protocol("192.168.100.1", timeout=2.0)
+
+        assert (result.protocol, result.legacy_ssl) == ("https", True)
+
+    def test_tls_skipped_when_deadline_spent(self) -> None:
+        """TCP :443 consuming the whole deadline leaves no TLS attempt."""
+
+        def slow_open(host: str, port: int, timeout: float) -> bool:
+            time.sleep(timeout)
+            return True
+
+        with (
+            patch(f"{_MODULE}._tcp_probe", side_effect=slow_open),
+            patch(f"{_MODULE}._tls_handshake") as tls,
+        ):
+            detect_protocol("https://192.168.100.1", timeout=0.1)
+
+        tls.assert_not_called()
+
+
+# =====================================================================
+# run_probes()
+# =====================================================================
+
+
+def _sleeper(seconds: float, value: object) -> object:
+    time.sleep(seconds)
+    return value
+
+
+def _boom() -> bool:
+    raise OSError("unreachable")
+
+
+# ┌───────────────────────┬────────────────────────────────┬─────────┬──────────────────┬─────────────────┐
+# │ id                    │ probes (delay s → value)       │ timeout │ until            │ expected        │
+# ├───────────────────────┼────────────────────────────────┼─────────┼──────────────────┼─────────────────┤
+# │ all_finish            │ a 0.05→1, b 0.1→2              │ 1.0     │ —                │ {a:1, b:2}      │
+# │ deadline_drops_slow   │ a 0.05→1, b 1.0→2              │ 0.3     │ —                │ {a:1}           │
+# │ early_exit            │ a 0.05→1, b 1.0→2              │ 2.0     │ "a" in results   │ {a:1}           │
+# │ exception_is_absent   │ a raises OSError, b 0.05→2     │ 1.0     │ —                │ {b:2}           │
+# │ no_probes             │ —                              │ 1.0     │ —                │ {}              │
+# └───────────────────────┴────────────────────────────────┴─────────┴──────────────────┴─────────────────┘
+#
+# fmt: off
+_RUN_PROBES_CASES = [
+    ("all_finish",          {"a": (0.05, 1), "b": (0.1, 2)}, 1.0, None,               {"a": 1, "b": 2}),
+    ("deadline_drops_slow", {"a": (0.05, 1), "b": (1.0, 2)}, 0.3, None,               {"a": 1}),
+    ("early_exit",          {"a": (0.05, 1), "b": (1.0, 2)}, 2.0, lambda r: "a" in r, {"a": 1}),
+    ("exception_is_absent", {"a": None,      "b": (0.05, 2)}, 1.0, None,              {"b": 2}),
+    ("no_probes",           {},                               1.0, None,              {}),
+]
+# fmt: on
+
+
+@pytest.mark.parametrize(
+    "description, spec, timeout, until, expected",
+    _RUN_PROBES_CASES,
+    ids=[c[0] for c in _RUN_PROBES_CASES],
+)
+def test_run_probes(
+    description: str,
+    spec: dict[str, tuple[float, int] | None],
+    timeout: float,
+    until: Callable[[Mapping[str, object]], bool] | None,
+    expected: dict[str, int],
+) -> None:
+    """run_probes returns finished results and never outlives its deadline."""
+    probes: dict[str, Callable[[], object]] = {
+        name: (_boom if step is None else partial(_sleeper, *step)) for name, step in spec.items()
+    }
+    start = time.monotonic()
+    assert run_probes(probes, timeout=timeout, until=until) == expected, description
+    assert time.monotonic() - start < timeout + 0.2, description
+
+
 # =====================================================================
 # _strip_protocol() — pure helper, exhaustive table
 # =====================================================================
@@ -300,7 +432,7 @@ class TestTlsHandshake:
         ctx = mock_context_cls.return_value
         ctx.wrap_socket.return_value.__enter__.return_value = tls_sock
 
-        ok, legacy = _tls_handshake("192.168.100.1", 443, timeout=2.0)
+        ok, legacy = _tls_handshake("192.168.100.1", 443, deadline=time.monotonic() + 2.0)
 
         assert ok is True
         assert legacy is expected_legacy
@@ -332,7 +464,7 @@ class TestTlsHandshake:
 
         mock_context_cls.side_effect = [standard_ctx, legacy_ctx]
 
-        ok, legacy = _tls_handshake("192.168.100.1", 443, timeout=2.0)
+        ok, legacy = _tls_handshake("192.168.100.1", 443, deadline=time.monotonic() + 2.0)
 
         assert ok is True
         assert legacy is True
@@ -347,7 +479,7 @@ class TestTlsHandshake:
 
         mock_create_conn.side_effect = TimeoutError("timed out")
 
-        ok, legacy = _tls_handshake("192.168.100.1", 443, timeout=2.0)
+        ok, legacy = _tls_handshake("192.168.100.1", 443, deadline=time.monotonic() + 2.0)
 
         assert ok is False
         assert legacy is False
@@ -365,7 +497,7 @@ class TestTlsHandshake:
 
         mock_create_conn.side_effect = _ssl.SSLError("handshake failure")
 
-        ok, legacy = _tls_handshake("192.168.100.1", 443, timeout=2.0)
+        ok, legacy = _tls_handshake("192.168.100.1", 443, deadline=time.monotonic() + 2.0)
 
         assert ok is False
         assert legacy is False
@@ -382,13 +514,37 @@ class TestTlsHandshake:
 
         mock_create_conn.side_effect = ConnectionResetError("connection reset by peer")
 
-        ok, legacy = _tls_handshake("192.168.100.1", 443, timeout=2.0)
+        ok, legacy = _tls_handshake("192.168.100.1", 443, deadline=time.monotonic() + 2.0)
 
         assert ok is False
         assert legacy is False
         # Non-ssl.SSLError OSError exits immediately — no second probe.
         assert mock_create_conn.call_count == 1
 
+    @patch(f"{_MODULE}.socket.create_connection")
+    def test_slow_rejection_leaves_phase2_the_remaining_time(
+        self,
+        mock_create_conn: MagicMock,
+    ) -> None:
+        """Phase 2 gets what Phase 1 left of the deadline, and is skipped when nothing is left."""
+        import ssl as _ssl
+
+        from solentlabs.cable_modem_monitor_core.connectivity import _tls_handshake
+
+        def _slow_reject(*args: object, timeout: float) -> None:
+            time.sleep(0.1)
+            raise _ssl.SSLError("handshake failure")
+
+        mock_create_conn.side_effect = _slow_reject
+
+        assert _tls_handshake("192.168.100.1", 443, deadline=time.monotonic() + 0.5) == (False, False)
+        phase1, phase2 = (c.kwargs["timeout"] for c in mock_create_conn.call_args_list)
+        assert phase2 <= phase1 - 0.1
+
+        mock_create_conn.reset_mock()
+        assert _tls_handshake("192.168.100.1", 443, deadline=time.monotonic() + 0.05) == (False, False)
+        assert mock_create_conn.call_count == 1
+
 
 # =====================================================================
 # probe_icmp()
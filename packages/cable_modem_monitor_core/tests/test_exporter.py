@@ -0,0 +1,275 @@
+"""Tests for the OpenMetrics exporter and its HTTP endpoint.
+
+Covers per-family rendering of channel, system_info, health,
+diagnostics and poll-timing series; family grouping across modems;
+incremental updates and the scrape cache; label escaping; and
+``/metrics`` over a real loopback server.
+
+See ORCHESTRATION_SPEC.md § Metrics Exporter.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+import requests
+from solentlabs.cable_modem_monitor_core.exporter import (
+    CONTENT_TYPE,
+    MetricsServer,
+    OpenMetricsExporter,
+)
+from solentlabs.cable_modem_monitor_core.orchestration.models import (
+    HealthInfo,
+    ModemSnapshot,
+    OrchestratorDiagnostics,
+    ResourceFetch,
+)
+from solentlabs.cable_modem_monitor_core.orchestration.signals import ConnectionStatus, HealthStatus
+
+# ------------------------------------------------------------------
+# Helpers
+# ------------------------------------------------------------------
+
+
+def _snapshot(
+    downstream: list[dict[str, Any]] | None = None,
+    system_info: dict[str, Any] | None = None,
+    *,
+    status: ConnectionStatus = ConnectionStatus.ONLINE,
+    health: HealthInfo | None = None,
+) -> ModemSnapshot:
+    return ModemSnapshot(
+        connection_status=status,
+        docsis_status="operational",
+        modem_data={
+            "downstream": downstream or [],
+            "upstream": [],
+            "system_info": system_info or {},
+        },
+        health_info=health,
+    )
+
+
+def _diagnostics(poll_duration: float = 1.5) -> OrchestratorDiagnostics:
+    return OrchestratorDiagnostics(
+        poll_duration=poll_duration,
+        auth_failure_streak=2,
+        circuit_breaker_open=False,
+        session_is_valid=True,
+        resource_fetches=[ResourceFetch(path="/status.html", duration_ms=250.0, size_bytes=4096)],
+    )
+
+
+_QAM_1 = {
+    "channel_id": 1,
+    "channel_number": 1,
+    "channel_type": "qam",
+    "frequency": 507000000,
+    "power": 2.5,
+    "snr": 40.1,
+    "corrected": 10,
+    "uncorrected": 0,
+    "lock_status": "locked",
+    "modulation": "QAM256",
+}
+
+
+def _samples(text: str) -> list[str]:
+    return [line for line in text.splitlines() if line and not line.startswith("#")]
+
+
+# ------------------------------------------------------------------
+# Rendering
+# ------------------------------------------------------------------
+
+
+# ┌──────────────────────────┬──────────────────────────────────────────────────────────────────────────────────┐
+# │ id                       │ expected sample line                                                             │
+# ├──────────────────────────┼──────────────────────────────────────────────────────────────────────────────────┤
+# │ channel-gauge            │ cable_modem_downstream_power_dbmv{...,channel_number="1"} 2.5                    │
+# │ channel-frequency        │ cable_modem_downstream_frequency_hertz{...} 507000000                            │
+# │ channel-counter          │ cable_modem_downstream_corrected_codewords_total{...} 10                         │
+# │ channel-locked           │ cable_modem_downstream_locked{...} 1                                             │
+# │ system-aggregate         │ cable_modem_system_total_corrected{modem="m"} 10                                 │
+# │ info                     │ cable_modem_info{...,software_version="1.0"} 1                                   │
+# │ health-latency-seconds   │ cable_modem_health_icmp_latency_seconds{modem="m"} 0.004                         │
+# │ diagnostics-streak       │ cable_modem_orchestrator_auth_failure_streak{modem="m"} 2                        │
+# │ resource-fetch           │ cable_modem_resource_fetch_seconds{modem="m",path="/status.html"} 0.25           │
+# │ poll-counter             │ cable_modem_polls_total{modem="m",connection_status="online"} 1                  │
+# │ histogram-bucket         │ cable_modem_poll_duration_seconds_bucket{modem="m",le="2.5"} 1                   │
+# └──────────────────────────┴──────────────────────────────────────────────────────────────────────────────────┘
+#
+# fmt: off
+_CH = 'modem="m",channel_type="qam",channel_id="1",channel_number="1"'
+RENDER_CASES = [
+    ("channel-gauge",          f"cable_modem_downstream_power_dbmv{{{_CH}}} 2.5"),
+    ("channel-frequency",      f"cable_modem_downstream_frequency_hertz{{{_CH}}} 507000000"),
+    ("channel-counter",        f"cable_modem_downstream_corrected_codewords_total{{{_CH}}} 10"),
+    ("channel-locked",         f"cable_modem_downstream_locked{{{_CH}}} 1"),
+    ("system-aggregate",       'cable_modem_system_total_corrected{modem="m"} 10'),
+    ("info",                   'cable_modem_info{modem="m",connection_status="online",docsis_status="operational",'
+                               'software_version="1.0"} 1'),
+    ("health-latency-seconds", 'cable_modem_health_icmp_latency_seconds{modem="m"} 0.004'),
+    ("diagnostics-streak",     'cable_modem_orchestrator_auth_failure_streak{modem="m"} 2'),
+    ("resource-fetch",         'cable_modem_resource_fetch_seconds{modem="m",path="/status.html"} 0.25'),
+    ("poll-counter",           'cable_modem_polls_total{modem="m",connection_status="online"} 1'),
+    ("histogram-bucket",       'cable_modem_poll_duration_seconds_bucket{modem="m",le="2.5"} 1'),
+]
+# fmt: on
+
+
+@pytest.fixture
+def rendered() -> str:
+    exporter = OpenMetricsExporter()
+    exporter.update_snapshot(
+        "m",
+        _snapshot(
+            [_QAM_1],
+            {"total_corrected": 10, "software_version": "1.0", "system_uptime": "1d 2h"},
+            health=HealthInfo(health_status=HealthStatus.RESPONSIVE, icmp_latency_ms=4.0),
+        ),
+        _diagnostics(),
+        queue_delay=0.0,
+    )
+    return exporter.render()
+
+
+@pytest.mark.parametrize("expected", [c[1] for c in RENDER_CASES], ids=[c[0] for c in RENDER_CASES])
+def test_render_sample(rendered: str, expected: str) -> None:
+    assert expected in _samples(rendered)
+
+
+class TestExposition:
+    """Structure of the full exposition."""
+
+    def test_ends_with_eof(self, rendered: str) -> None:
+        assert rendered.endswith("# EOF\n")
+
+    def test_strings_and_identity_not_sampled(self, rendered: str) -> None:
+        """Non-numeric fields and channel identity never become samples."""
+        names = {line.split("{", 1)[0] for line in _samples(rendered)}
+        assert "cable_modem_downstream_modulation" not in names
+        assert "cable_modem_downstream_channel_id" not in names
+        assert "cable_modem_downstream_channel_number" not in names
+        assert "cable_modem_system_system_uptime" not in names
+
+    def test_histogram_is_cumulative(self, rendered: str) -> None:
+        buckets = [line for line in _samples(rendered) if line.startswith("cable_modem_poll_duration_seconds_bucket")]
+        counts = [int(line.rsplit(" ", 1)[1]) for line in buckets]
+        assert counts == sorted(counts)
+        assert buckets[-1].endswith('le="+Inf"} 1')
+        assert 'cable_modem_poll_duration_seconds_sum{modem="m"} 1.5' in rendered
+
+    def test_families_grouped_across_modems(self) -> None:
+        """Each family appears once with every modem's samples contiguous."""
+        exporter = OpenMetricsExporter()
+        for name in ("a", "b"):
+            exporter.update_snapshot(name, _snapshot([_QAM_1]), _diagnostics())
+        text = exporter.render()
+
+        assert text.count("# TYPE cable_modem_downstream_power_dbmv gauge") == 1
+        lines = text.splitlines()
+        start = lines.index("# TYPE cable_modem_downstream_power_dbmv gauge")
+        assert lines[start + 2].startswith('cable_modem_downstream_power_dbmv{modem="a"')
+        assert lines[start + 3].startswith('cable_modem_downstream_power_dbmv{modem="b"')
+
+    def test_unlocked_channels_distinct(self) -> None:
+        """Unlocked channels keep only channel_number; each is its own series."""
+        unlocked = [{"channel_number": n, "lock_status": "not_locked"} for n in (2, 3)]
+        exporter = OpenMetricsExporter()
+        exporter.update_snapshot("m", _snapshot([_QAM_1, *unlocked, {"lock_status": "not_locked"}]))
+        locked = [line for line in _samples(exporter.render()) if line.startswith("cable_modem_downstream_locked")]
+
+        assert len(locked) == len(set(locked)) == 3
+        assert 'cable_modem_downstream_locked{modem="m",channel_type="",channel_id="",channel_number="3"} 0' in locked
+
+    def test_label_escaping(self) -> None:
+        exporter = OpenMetricsExporter()
+        exporter.update_snapshot('we"ird\\name', _snapshot())
+        assert 'modem="we\\"ird\\\\name"' in exporter.render()
+
+
+# ------------------------------------------------------------------
+# Incremental updates
+# ------------------------------------------------------------------
+
+
+class TestIncremental:
+    """Updates replace one modem's series; scrapes are cached."""
+
+    def test_update_replaces_only_that_modem(self) -> None:
+        exporter = OpenMetricsExporter()
+        exporter.update_snapshot("a", _snapshot([_QAM_1]))
+        exporter.update_snapshot("b", _snapshot([_QAM_1]))
+
+        exporter.update_snapshot("a", _snapshot([{**_QAM_1, "power": 5.0}]))
+        samples = _samples(exporter.render())
+
+        labels = 'channel_type="qam",channel_id="1",channel_number="1"'
+        assert f'cable_modem_downstream_power_dbmv{{modem="a",{labels}}} 5' in samples
+        assert f'cable_modem_downstream_power_dbmv{{modem="b",{labels}}} 2.5' in samples
+
+    def test_vanished_channel_dropped(self) -> None:
+        exporter = OpenMetricsExporter()
+        exporter.update_snapshot("m", _snapshot([_QAM_1, {**_QAM_1, "channel_id": 2, "channel_number": 2}]))
+        exporter.update_snapshot("m", _snapshot([_QAM_1]))
+        assert 'channel_id="2"' not in exporter.render()
+
+    def test_scrape_cached_until_update(self) -> None:
+        exporter = OpenMetricsExporter()
+        exporter.update_snapshot("m", _snapshot([_QAM_1]))
+        first = exporter.render()
+        assert exporter.render() is first
+
+        exporter.update_health("m", HealthInfo(health_status=HealthStatus.UNRESPONSIVE))
+        second = exporter.render()
+        assert second is not first
+        assert 'cable_modem_health_responsive{modem="m"} 0' in second
+
+    def test_health_survives_snapshot_update(self) -> None:
+        """A snapshot without health_info keeps the last probe's series."""
+        exporter = OpenMetricsExporter()
+        exporter.update_health("m", HealthInfo(health_status=HealthStatus.RESPONSIVE, tcp_latency_ms=2.0))
+        exporter.update_snapshot("m", _snapshot())
+        assert 'cable_modem_health_tcp_latency_seconds{modem="m"} 0.002' in exporter.render()
+
+    def test_counters_accumulate_by_status(self) -> None:
+        exporter = OpenMetricsExporter()
+        exporter.update_snapshot("m", _snapshot())
+        exporter.update_snapshot("m", _snapshot(status=ConnectionStatus.UNREACHABLE))
+        exporter.update_snapshot("m", _snapshot())
+        samples = _samples(exporter.render())
+        assert 'cable_modem_polls_total{modem="m",connection_status="online"} 2' in samples
+        assert 'cable_modem_polls_total{modem="m",connection_status="unreachable"} 1' in samples
+
+    def test_remove(self) -> None:
+        exporter = OpenMetricsExporter()
+        exporter.update_snapshot("m", _snapshot([_QAM_1]))
+        exporter.remove("m")
+        assert exporter.render() == "# EOF\n"
+
+
+# ------------------------------------------------------------------
+# HTTP endpoint
+# ------------------------------------------------------------------
+
+
+class TestMetricsServer:
+    """``/metrics`` over loopback."""
+
+    def test_serves_metrics(self) -> None:
+        exporter = OpenMetricsExporter()
+        exporter.update_snapshot("m", _snapshot([_QAM_1]))
+        server = MetricsServer(exporter, port=0)
+        server.start()
+        try:
+            resp = requests.get(f"{server.base_url}/metrics", timeout=5)
+            missing = requests.get(f"{server.base_url}/other", timeout=5)
+        finally:
+            server.close()
+
+        assert resp.status_code == 200
+        assert resp.headers["Content-Type"] == CONTENT_TYPE
+        assert resp.text == exporter.render()
+        assert missing.status_code == 404
@@ -14,8 +14,11 @@ from typing import Any
 
 import pytest
 from solentlabs.cable_modem_monitor_core.fetch_list import (
+    FetchMask,
     ResourceTarget,
     collect_fetch_targets,
+    prune_parser_config,
+    resolve_fetch_mask,
 )
 from solentlabs.cable_modem_monitor_core.models.parser_config import ParserConfig
 
@@ -53,6 +56,45 @@ POST_PROCESSOR_RESOURCES_CASES = [
     ({},                         {("/status.html", "table")}, "empty declaration is a no-op"),
 ]
 
+# ┌───────────────────────────────────────┬──────────────────────────────────────────┬───────────────────────────────┐
+# │ mask (sections, ignored fields)       │ pruned paths                             │ description                   │
+# ├───────────────────────────────────────┼──────────────────────────────────────────┼───────────────────────────────┤
+# │ all sections, none ignored            │ none                                     │ full mask prunes nothing      │
+# │ no upstream                           │ upstream page                            │ disabled upstream sensors     │
+# │ no upstream, upstream_total needed    │ none                                     │ aggregate keeps direction     │
+# │ no downstream                         │ none                                     │ Core reads downstream         │
+# │ no system_info                        │ every system_info page                   │ all system_info disabled      │
+# │ version fields ignored                │ version page                             │ source feeds nothing          │
+# │ one version field ignored             │ none                                     │ source still feeds            │
+# │ system_uptime ignored                 │ none                                     │ Core reads uptime             │
+# │ memory fields ignored, pct needed     │ none                                     │ computed keeps inputs         │
+# └───────────────────────────────────────┴──────────────────────────────────────────┴───────────────────────────────┘
+#
+# The fixture (parser_config_split_pages.json) splits every section onto
+# its own page. aggregate "upstream_total" reads upstream; ignored in the
+# rows that prune upstream unless the row says otherwise.
+_ALL_PAGES = {"/downstream.html", "/upstream.html", "/uptime.html", "/version.html", "/memory.html"}
+_NO_US_TOTAL = frozenset({"upstream_total"})
+_ALL = {"downstream", "upstream", "system_info"}
+_NO_US = {"downstream", "system_info"}
+_SYSTEM_INFO_PAGES = {"/uptime.html", "/version.html", "/memory.html"}
+_VERSION_FIELDS = frozenset({"software_version", "hardware_version"})
+_MEMORY_INPUTS = frozenset({"memory_total", "memory_free"})
+
+# fmt: off
+FETCH_MASK_CASES = [
+    # (sections,                  ignored fields,                  pruned paths,       description)
+    (_ALL,                        frozenset(),                     set(),              "full mask prunes nothing"),
+    (_NO_US,                      _NO_US_TOTAL,                    {"/upstream.html"}, "disabled upstream sensors"),
+    (_NO_US,                      frozenset(),                     set(),              "aggregate keeps direction"),
+    ({"upstream", "system_info"}, frozenset(),                     set(),              "Core reads downstream"),
+    ({"downstream", "upstream"},  frozenset(),                     _SYSTEM_INFO_PAGES, "all system_info disabled"),
+    (_ALL,                        _VERSION_FIELDS,                 {"/version.html"},  "source feeds nothing"),
+    (_ALL,                        frozenset({"software_version"}), set(),              "source still feeds"),
+    (_ALL,                        frozenset({"system_uptime"}),    set(),              "Core reads uptime"),
+    (_ALL,                        _MEMORY_INPUTS,                  set(),              "computed keeps inputs"),
+]
+
 INVALID_RESOURCES_CASES = [
     # (declared,               description)
     (["/extra.json"],          "list instead of dict"),
@@ -71,6 +113,11 @@ def _make_post_processor(declared: Any) -> Any:
     return SimpleNamespace(resources=declared)
 
 
+def _split_pages_config() -> ParserConfig:
+    """Load the config with every section on its own page."""
+    return ParserConfig.model_validate(load_fixture(LOCAL_FIXTURES_DIR / "parser_config_split_pages.json"))
+
+
 def _table_single_config() -> ParserConfig:
     """Load the shared single-table parser config fixture."""
     data = load_fixture(FIXTURES_DIR / "table_single.json")
@@ -219,3 +266,57 @@ class TestPostProcessorResources:
         """A wrongly shaped resources declaration raises at startup."""
         with pytest.raises(TypeError, match="resources"):
             collect_fetch_targets(_table_single_config(), _make_post_processor(declared))
+
+
+class TestFetchMask:
+    """Consumer fetch mask prunes sections and sources nothing reads."""
+
+    @pytest.mark.parametrize(
+        "sections,ignored,pruned_paths,desc",
+        FETCH_MASK_CASES,
+        ids=[c[3] for c in FETCH_MASK_CASES],
+    )
+    def test_mask_prunes_targets(
+        self,
+        sections: set[str],
+        ignored: frozenset[str],
+        pruned_paths: set[str],
+        desc: str,
+    ) -> None:
+        """Only pages that feed a needed section or field are fetched."""
+        mask = FetchMask(sections=frozenset(sections), ignored_system_info_fields=ignored)
+        targets = collect_fetch_targets(_split_pages_config(), mask=mask)
+        assert {t.path for t in targets} == _ALL_PAGES - pruned_paths, f"Failed: {desc}"
+
+    def test_prune_does_not_mutate_config(self) -> None:
+        """Pruning returns a copy; the loaded config keeps every section."""
+        config = _split_pages_config()
+        mask = resolve_fetch_mask(config, FetchMask(sections=frozenset({"downstream"})))
+        pruned = prune_parser_config(config, mask)
+
+        assert pruned.system_info is None
+        assert config.upstream is not None
+        assert config.system_info is not None
+
+    def test_full_mask_returns_same_config(self) -> None:
+        """A mask that prunes nothing returns the config unchanged."""
+        config = _split_pages_config()
+        assert prune_parser_config(config, FetchMask()) is config
+
+    def test_post_processor_resources_dropped_with_hooked_sections(self) -> None:
+        """parser.py resources are skipped when every hooked section is pruned."""
+        pp = SimpleNamespace(resources={"/extra.json": "json"}, parse_upstream=lambda c, r: c)
+        mask = FetchMask(sections=frozenset({"downstream"}))
+
+        targets = collect_fetch_targets(_table_single_config(), pp, mask)
+
+        assert {t.path for t in targets} == {"/status.html"}
+
+    def test_post_processor_resources_kept_while_hooked_section_needed(self) -> None:
+        """parser.py resources stay while any hooked section is needed."""
+        pp = SimpleNamespace(resources={"/extra.json": "json"}, parse_upstream=lambda c, r: c)
+        mask = FetchMask(sections=frozenset({"downstream", "upstream"}))
+
+        targets = collect_fetch_targets(_table_single_config(), pp, mask)
+
+        assert {t.path for t in targets} == {"/status.html", "/extra.json"}
@@ -0,0 +1,404 @@
+"""Tests for FleetScheduler — many orchestrators on one bounded pool.
+
+Covers staggered starts, the global concurrency cap, per-host mutual
+exclusion (poll, health, restart), queueing-delay stats, recovery
+cadence, membership changes, and the background loop.
+
+Orchestrators and health monitors are mocks; the worker pool and
+locking are real. A fake clock makes due times deterministic.
+
+See RUNTIME_POLLING_SPEC.md § Fleet Scheduling.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from solentlabs.cable_modem_monitor_core.fleet import FleetScheduler
+
+# ------------------------------------------------------------------
+# Helpers
+# ------------------------------------------------------------------
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _orchestrator(gate: threading.Event | None = None) -> MagicMock:
+    """Mock Orchestrator whose get_modem_data blocks on *gate* if given."""
+    orch = MagicMock()
+    orch.recovery_active = False
+
+    def _poll() -> str:
+        if gate is not None:
+            assert gate.wait(5)
+        return "snapshot"
+
+    orch.get_modem_data.side_effect = _poll
+    return orch
+
+
+def _scheduler(clock: _Clock, **kwargs: Any) -> FleetScheduler:
+    """Deterministic scheduler: no stagger, no jitter."""
+    kwargs.setdefault("startup_spread", 0.0)
+    kwargs.setdefault("jitter", 0.0)
+    return FleetScheduler(clock=clock, rng=random.Random(0), **kwargs)
+
+
+def _wait_for(predicate: Callable[[], object], timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.005)
+
+
+# ------------------------------------------------------------------
+# Membership and validation
+# ------------------------------------------------------------------
+
+
+class TestMembership:
+    """add / remove validation and bookkeeping."""
+
+    def test_rejects_zero_workers(self) -> None:
+        with pytest.raises(ValueError, match="max_workers"):
+            FleetScheduler(max_workers=0)
+
+    def test_rejects_duplicate_name(self) -> None:
+        fleet = _scheduler(_Clock())
+        fleet.add("a", _orchestrator(), host="h1", poll_interval=60)
+        with pytest.raises(ValueError, match="already in the fleet"):
+            fleet.add("a", _orchestrator(), host="h2", poll_interval=60)
+
+    def test_health_monitor_requires_interval(self) -> None:
+        fleet = _scheduler(_Clock())
+        with pytest.raises(ValueError, match="health_interval"):
+            fleet.add("a", _orchestrator(), host="h1", poll_interval=60, health_monitor=MagicMock())
+
+    def test_stagger_spreads_first_polls(self) -> None:
+        """First polls land in [now, now + min(spread, interval))."""
+        clock = _Clock()
+        fleet = _scheduler(clock, max_workers=20, startup_spread=30.0)
+        for i in range(20):
+            fleet.add(f"m{i}", _orchestrator(), host=f"h{i}", poll_interval=600)
+
+        first = fleet.seconds_until_next_due()
+        assert first is not None and 0.0 <= first < 30.0
+        assert fleet.run_pending() < 20
+
+        clock.now += 30.0
+        fleet.run_pending()
+        assert fleet.drain(5)
+        assert all(s.polls == 1 for s in fleet.stats().values())
+        fleet.stop()
+
+    def test_removed_member_not_rescheduled(self) -> None:
+        """A member removed mid-poll finishes but never runs again."""
+        clock = _Clock()
+        gate = threading.Event()
+        orch = _orchestrator(gate)
+        fleet = _scheduler(clock)
+        fleet.add("a", orch, host="h1", poll_interval=60)
+
+        assert fleet.run_pending() == 1
+        fleet.remove("a")
+        gate.set()
+        assert fleet.drain(5)
+
+        clock.now += 120
+        assert fleet.run_pending() == 0
+        assert fleet.seconds_until_next_due() is None
+        fleet.stop()
+
+
+# ------------------------------------------------------------------
+# Dispatch — cap, exclusion, stats
+# ------------------------------------------------------------------
+
+
+class TestDispatch:
+    """Global cap, per-host exclusion, queueing delay."""
+
+    def test_global_cap(self) -> None:
+        """Never more than max_workers jobs run at once."""
+        clock = _Clock()
+        gate = threading.Event()
+        fleet = _scheduler(clock, max_workers=2)
+        for i in range(5):
+            fleet.add(f"m{i}", _orchestrator(gate), host=f"h{i}", poll_interval=60)
+
+        assert fleet.run_pending() == 2
+        assert fleet.run_pending() == 0
+
+        gate.set()
+        assert fleet.drain(5)
+        assert fleet.run_pending() == 2
+        assert fleet.drain(5)
+        assert fleet.run_pending() == 1
+        assert fleet.drain(5)
+        assert sum(s.polls for s in fleet.stats().values()) == 5
+        fleet.stop()
+
+    def test_same_host_serialized_with_queue_delay(self) -> None:
+        """Second member on a busy host waits and records the delay."""
+        clock = _Clock()
+        gate = threading.Event()
+        fleet = _scheduler(clock, max_workers=4)
+        fleet.add("a", _orchestrator(gate), host="shared", poll_interval=60)
+        fleet.add("b", _orchestrator(), host="shared", poll_interval=60)
+
+        assert fleet.run_pending() == 1
+
+        clock.now += 7.0
+        gate.set()
+        assert fleet.drain(5)
+        assert fleet.run_pending() == 1
+        assert fleet.drain(5)
+
+        stats = fleet.stats()
+        assert stats["a"].last_queue_delay == 0.0
+        assert stats["b"].last_queue_delay == pytest.approx(7.0)
+        assert stats["b"].max_queue_delay == pytest.approx(7.0)
+        fleet.stop()
+
+    def test_health_probe_excluded_from_running_poll(self) -> None:
+        """A probe for the same host waits for the poll to finish."""
+        clock = _Clock()
+        gate = threading.Event()
+        monitor = MagicMock()
+        monitor.ping.return_value = "health"
+        fleet = _scheduler(clock)
+        fleet.add(
+            "a",
+            _orchestrator(gate),
+            host="h1",
+            poll_interval=60,
+            health_monitor=monitor,
+            health_interval=10,
+        )
+
+        assert fleet.run_pending() == 1
+        monitor.ping.assert_not_called()
+
+        gate.set()
+        assert fleet.drain(5)
+        assert fleet.run_pending() == 1
+        assert fleet.drain(5)
+        monitor.ping.assert_called_once()
+        stats = fleet.stats()["a"]
+        assert (stats.polls, stats.health_checks) == (1, 1)
+        fleet.stop()
+
+    def test_callbacks_receive_results(self) -> None:
+        clock = _Clock()
+        snapshots: list[tuple[str, object]] = []
+        health: list[tuple[str, object]] = []
+        monitor = MagicMock()
+        monitor.ping.return_value = "health"
+        fleet = _scheduler(
+            clock,
+            on_snapshot=lambda n, s: snapshots.append((n, s)),
+            on_health=lambda n, h: health.append((n, h)),
+        )
+        fleet.add("a", _orchestrator(), host="h1", poll_interval=60)
+        fleet.add("b", _orchestrator(), host="h2", poll_interval=60, health_monitor=monitor, health_interval=60)
+
+        fleet.run_pending()
+        assert fleet.drain(5)
+        fleet.run_pending()
+        assert fleet.drain(5)
+
+        assert sorted(snapshots) == [("a", "snapshot"), ("b", "snapshot")]
+        assert health == [("b", "health")]
+        fleet.stop()
+
+    def test_callback_error_keeps_schedule(self) -> None:
+        """A raising consumer callback is logged; the member is rescheduled."""
+        clock = _Clock()
+
+        def _boom(name: str, snapshot: object) -> None:
+            raise RuntimeError("consumer bug")
+
+        fleet = _scheduler(clock, on_snapshot=_boom)
+        fleet.add("a", _orchestrator(), host="h1", poll_interval=60)
+
+        fleet.run_pending()
+        assert fleet.drain(5)
+        assert fleet.seconds_until_next_due() == pytest.approx(60.0)
+        assert fleet.stats()["a"].polls == 1
+        fleet.stop()
+
+
+# ------------------------------------------------------------------
+# Cadence — jitter, recovery, manual refresh
+# ------------------------------------------------------------------
+
+
+class TestCadence:
+    """Reschedule timing after a job completes."""
+
+    def test_jitter_bounds(self) -> None:
+        clock = _Clock()
+        fleet = _scheduler(clock, jitter=0.1)
+        fleet.add("a", _orchestrator(), host="h1", poll_interval=100)
+
+        for _ in range(10):
+            fleet.run_pending()
+            assert fleet.drain(5)
+            wait = fleet.seconds_until_next_due()
+            assert wait is not None and 90.0 <= wait <= 110.0
+            clock.now += wait
+        fleet.stop()
+
+    def test_recovery_active_uses_recovery_interval(self) -> None:
+        clock = _Clock()
+        orch = _orchestrator()
+        orch.recovery_active = True
+        fleet = _scheduler(clock, recovery_interval=30.0)
+        fleet.add("a", orch, host="h1", poll_interval=600)
+
+        fleet.run_pending()
+        assert fleet.drain(5)
+        assert fleet.seconds_until_next_due() == pytest.approx(30.0)
+        fleet.stop()
+
+    def test_request_refresh_makes_poll_due(self) -> None:
+        clock = _Clock()
+        fleet = _scheduler(clock)
+        fleet.add("a", _orchestrator(), host="h1", poll_interval=600)
+        fleet.run_pending()
+        assert fleet.drain(5)
+
+        fleet.request_refresh("a")
+        assert fleet.run_pending() == 1
+        assert fleet.drain(5)
+        assert fleet.stats()["a"].polls == 2
+        fleet.stop()
+
+
+# ------------------------------------------------------------------
+# Restart
+# ------------------------------------------------------------------
+
+
+class TestRestart:
+    """restart() holds the host exclusively."""
+
+    def test_restart_waits_for_running_poll(self) -> None:
+        clock = _Clock()
+        gate = threading.Event()
+        orch = _orchestrator(gate)
+        orch.restart.return_value = "restarted"
+        fleet = _scheduler(clock)
+        fleet.add("a", orch, host="h1", poll_interval=600)
+        assert fleet.run_pending() == 1
+
+        results: list[object] = []
+        worker = threading.Thread(target=lambda: results.append(fleet.restart("a")))
+        worker.start()
+        time.sleep(0.05)
+        orch.restart.assert_not_called()
+
+        gate.set()
+        worker.join(5)
+        assert results == ["restarted"]
+        fleet.stop()
+
+    def test_restart_blocks_polls_on_host(self) -> None:
+        """While the restart runs, due polls for the host stay queued."""
+        clock = _Clock()
+        release = threading.Event()
+        in_restart = threading.Event()
+        orch = _orchestrator()
+
+        def _restart() -> str:
+            in_restart.set()
+            assert release.wait(5)
+            return "restarted"
+
+        orch.restart.side_effect = _restart
+        fleet = _scheduler(clock, recovery_interval=30.0)
+        fleet.add("a", orch, host="h1", poll_interval=600)
+
+        worker = threading.Thread(target=fleet.restart, args=("a",))
+        worker.start()
+        assert in_restart.wait(5)
+        assert fleet.run_pending() == 0
+
+        release.set()
+        worker.join(5)
+        assert fleet.run_pending() == 1
+        assert fleet.drain(5)
+        fleet.stop()
+
+    def test_restart_timeout(self) -> None:
+        clock = _Clock()
+        gate = threading.Event()
+        fleet = _scheduler(clock)
+        fleet.add("a", _orchestrator(gate), host="h1", poll_interval=600)
+        fleet.run_pending()
+
+        with pytest.raises(TimeoutError):
+            fleet.restart("a", timeout=0.01)
+        gate.set()
+        fleet.stop()
+
+
+# ------------------------------------------------------------------
+# Background loop
+# ------------------------------------------------------------------
+
+
+def test_background_loop_polls_every_member() -> None:
+    """start() dispatches on its own thread until stop()."""
+    fleet = FleetScheduler(max_workers=2, startup_spread=0.0, jitter=0.0)
+    orchestrators = [_orchestrator() for _ in range(3)]
+    for i, orch in enumerate(orchestrators):
+        fleet.add(f"m{i}", orch, host=f"h{i}", poll_interval=0.02)
+
+    fleet.start()
+    try:
+        _wait_for(lambda: all(o.get_modem_data.call_count >= 2 for o in orchestrators))
+    finally:
+        fleet.stop(5)
+
+
+def test_background_loop_sleeps_while_slot_held(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Due jobs blocked by the cap do not spin the loop."""
+    gate = threading.Event()
+    fleet = FleetScheduler(max_workers=1, startup_spread=0.0, jitter=0.0)
+    orchestrators = [_orchestrator(gate) for _ in range(2)]
+    for i, orch in enumerate(orchestrators):
+        fleet.add(f"m{i}", orch, host=f"h{i}", poll_interval=60)
+
+    calls = 0
+    run_pending = fleet.run_pending
+
+    def _counting_run_pending() -> int:
+        nonlocal calls
+        calls += 1
+        return run_pending()
+
+    monkeypatch.setattr(fleet, "run_pending", _counting_run_pending)
+    fleet.start()
+    try:
+        _wait_for(lambda: orchestrators[0].get_modem_data.called or orchestrators[1].get_modem_data.called)
+        time.sleep(0.3)
+        assert calls < 10
+        gate.set()
+        _wait_for(lambda: all(o.get_modem_data.call_count == 1 for o in orchestrators))
+    finally:
+        fleet.stop(5)
@@ -1,21 +1,28 @@
 """Tests for HAR loading and resource building.
 
-Covers load_har_json() (LFS pointer detection, normal loading) and
+Covers load_har_json() (LFS pointer detection, normal loading,
+streaming, compression, memoization), iter_har_entries(), and
 build_resource_dict() (JSON body sniffing, root-level array wrapping).
 """
 
 from __future__ import annotations
 
 import base64
+import gzip
 import json
 import subprocess
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
+from solentlabs.cable_modem_monitor_core import har as har_module
 from solentlabs.cable_modem_monitor_core.har import (
     LfsPointerError,
     build_resource_dict,
+    clear_har_cache,
+    find_har_files,
+    har_stem,
+    iter_har_entries,
     load_har_json,
 )
 
@@ -143,6 +150,142 @@ class TestLoadHarJsonLfsDetection:
         assert result["version"] == "1.2"
 
 
+# -----------------------------------------------------------------------
+# Streaming reader, compression, memoization
+# -----------------------------------------------------------------------
+
+_STREAM_HAR = {
+    "log": {
+        "version": "1.2",
+        "creator": {"name": "har-capture", "version": "0.4"},
+        "entries": [
+            {
+                "request": {"url": f"http://192.168.100.1/p{i}", "method": "GET"},
+                "response": {"status": 200, "bodySize": -1, "content": {"text": "<p>\u00e9 ]}, " + "x" * i}},
+            }
+            for i in range(5)
+        ],
+        "pages": [],
+    },
+    "_comment": 12.5,
+}
+
+# ┌──────────────────┬────────────────────────────────────────────────────┐
+# │ id               │ document                                           │
+# ├──────────────────┼────────────────────────────────────────────────────┤
+# │ har              │ entries between other log members, trailing key    │
+# │ empty_entries    │ log.entries == []                                  │
+# │ empty_log        │ log == {}                                          │
+# │ log_not_object   │ log is a list — parsed, not streamed               │
+# │ not_har          │ top-level array                                    │
+# └──────────────────┴────────────────────────────────────────────────────┘
+#
+# fmt: off
+_DOCUMENT_CASES = [
+    ("har",            _STREAM_HAR),
+    ("empty_entries",  {"log": {"entries": []}}),
+    ("empty_log",      {"log": {}}),
+    ("log_not_object", {"log": [1, 2]}),
+    ("not_har",        [{"log": 1}]),
+]
+# fmt: on
+
+
+@pytest.fixture(autouse=True)
+def _fresh_har_cache() -> None:
+    clear_har_cache()
+
+
+class TestStreamingReader:
+    """The streamed parse matches json.loads at any chunk size."""
+
+    @pytest.mark.parametrize("chunk", [1, 7, 1 << 20])
+    @pytest.mark.parametrize(("name", "document"), _DOCUMENT_CASES, ids=[c[0] for c in _DOCUMENT_CASES])
+    def test_matches_json_loads(self, tmp_path: Path, chunk: int, name: str, document: object) -> None:
+        har_file = tmp_path / "modem.har"
+        har_file.write_text(json.dumps(document, indent=1), encoding="utf-8")
+
+        with patch.object(har_module, "_CHUNK_CHARS", chunk):
+            assert load_har_json(har_file) == document
+
+    @pytest.mark.parametrize(
+        "text",
+        ['{"log": {"entries": [{},]}}', '{"log": {}} trailing', '{"log": {"entries": [', "12 3", ""],
+    )
+    def test_malformed_raises(self, tmp_path: Path, text: str) -> None:
+        har_file = tmp_path / "bad.har"
+        har_file.write_text(text, encoding="utf-8")
+
+        with pytest.raises(json.JSONDecodeError):
+            load_har_json(har_file)
+
+    def test_iter_entries_in_order(self, tmp_path: Path) -> None:
+        har_file = tmp_path / "modem.har"
+        har_file.write_text(json.dumps(_STREAM_HAR), encoding="utf-8")
+
+        urls = [entry["request"]["url"] for entry in iter_har_entries(har_file)]
+
+        assert urls == [f"http://192.168.100.1/p{i}" for i in range(5)]
+
+    def test_gzip_detected_by_magic(self, tmp_path: Path) -> None:
+        har_file = tmp_path / "modem.har.gz"
+        har_file.write_bytes(gzip.compress(json.dumps(_STREAM_HAR).encode("utf-8")))
+
+        assert load_har_json(har_file) == _STREAM_HAR
+        assert len(list(iter_har_entries(har_file))) == 5
+
+    def test_lfs_pointer_without_resolution(self, tmp_path: Path) -> None:
+        har_file = tmp_path / "modem.har"
+        har_file.write_text(LFS_POINTER, encoding="utf-8")
+
+        with patch("subprocess.run") as mock_run, pytest.raises(LfsPointerError):
+            list(iter_har_entries(har_file, resolve_lfs=False))
+        mock_run.assert_not_called()
+
+
+class TestHarCache:
+    """One parse per unchanged file."""
+
+    def test_unchanged_file_returns_same_object(self, tmp_path: Path) -> None:
+        har_file = tmp_path / "modem.har"
+        har_file.write_text(json.dumps(MINIMAL_HAR), encoding="utf-8")
+
+        assert load_har_json(har_file) is load_har_json(str(har_file))
+
+    def test_rewritten_file_is_reparsed(self, tmp_path: Path) -> None:
+        har_file = tmp_path / "modem.har"
+        har_file.write_text(json.dumps(MINIMAL_HAR), encoding="utf-8")
+        load_har_json(har_file)
+
+        har_file.write_text(json.dumps(_STREAM_HAR), encoding="utf-8")
+
+        assert load_har_json(har_file) == _STREAM_HAR
+
+    def test_cache_is_bounded(self, tmp_path: Path) -> None:
+        paths = []
+        for i in range(har_module._HAR_CACHE_SIZE + 1):
+            paths.append(tmp_path / f"modem-{i}.har")
+            paths[-1].write_text(json.dumps(MINIMAL_HAR), encoding="utf-8")
+        first = load_har_json(paths[0])
+        for path in paths[1:]:
+            load_har_json(path)
+
+        assert len(har_module._har_cache) == har_module._HAR_CACHE_SIZE
+        assert load_har_json(paths[0]) is not first
+
+
+class TestFixtureNames:
+    """Compressed fixtures pair by stem."""
+
+    def test_har_stem_and_discovery(self, tmp_path: Path) -> None:
+        for name in ("modem.har", "modem-v2.har.gz", "modem-v3.har.zst", "modem.expected.json", "notes.txt"):
+            (tmp_path / name).write_text("{}", encoding="utf-8")
+
+        found = find_har_files(tmp_path)
+
+        assert [har_stem(path) for path in found] == ["modem-v2", "modem-v3", "modem"]
+
+
 def _har_entry(
     url: str,
     body: str,
@@ -30,6 +30,7 @@ from solentlabs.cable_modem_monitor_core.test_harness.routes import (
 from solentlabs.cable_modem_monitor_core.test_harness.server import (
     _UNRESOLVED_PLACEHOLDER_RE,
     HARMockServer,
+    ServerFault,
     _find_route,
 )
 
@@ -1005,6 +1006,48 @@ class TestHARMockServerFormAuth:
             assert data_resp.status_code == 200
 
 
+class TestHARMockServerFaults:
+    """Injected faults fail requests until cleared (soak runs)."""
+
+    @pytest.fixture()
+    def entries(self) -> list[dict[str, Any]]:
+        """Load form-auth HAR entries from fixture."""
+        return _load_entries("har_entries_form_auth.json")
+
+    @pytest.fixture()
+    def config(self) -> Any:
+        """Form-auth modem config."""
+        return _make_config({"auth": {"strategy": "form", "action": "/goform/login"}})
+
+    def test_auth_expiry_challenges_until_login(self, entries: list[dict[str, Any]], config: Any) -> None:
+        """An expired session is challenged; the next login restores it."""
+        with HARMockServer(entries, modem_config=config) as server:
+            requests.post(f"{server.base_url}/goform/login", data="username=admin&password=secret")
+            server.inject_fault(ServerFault.AUTH_EXPIRY)
+
+            assert requests.get(f"{server.base_url}/status.html").status_code == 401
+            requests.post(f"{server.base_url}/goform/login", data="username=admin&password=secret")
+            assert server.fault is None
+            assert requests.get(f"{server.base_url}/status.html").status_code == 200
+
+    def test_down_drops_connection(self, entries: list[dict[str, Any]], config: Any) -> None:
+        """A down server answers nothing until cleared."""
+        with HARMockServer(entries, modem_config=config) as server:
+            server.inject_fault(ServerFault.DOWN)
+            with pytest.raises(requests.ConnectionError):
+                requests.get(f"{server.base_url}/status.html", timeout=5)
+
+            server.inject_fault(None)
+            assert requests.get(f"{server.base_url}/status.html", timeout=5).status_code == 401
+
+    def test_timeout_stalls_past_client_timeout(self, entries: list[dict[str, Any]], config: Any) -> None:
+        """A stalled request outlasts the client's read timeout."""
+        with HARMockServer(entries, modem_config=config) as server:
+            server.inject_fault(ServerFault.TIMEOUT, stall_seconds=0.3)
+            with pytest.raises(requests.Timeout):
+                requests.get(f"{server.base_url}/status.html", timeout=0.1)
+
+
 class TestAuthFactoryRestartWiring:
     """Verify create_auth_handler wires restart config correctly."""
 
@@ -0,0 +1,140 @@
+"""Tests for the soak runner.
+
+Table-driven tests for the fault schedule; integration tests run short
+soaks against ``tmp_path`` modem directories and real mock servers.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from solentlabs.cable_modem_monitor_core.test_harness.discovery import (
+    ModemTestCase,
+    discover_modem_tests,
+)
+from solentlabs.cable_modem_monitor_core.test_harness.server import ServerFault
+from solentlabs.cable_modem_monitor_core.test_harness.soak import (
+    FaultSchedule,
+    SoakBudget,
+    run_soak,
+)
+
+from tests._helpers import load_fixture
+
+_PIPELINE_FIXTURES = Path(__file__).parent.parent / "fixtures" / "pipeline"
+
+_MODEM_YAML = (_PIPELINE_FIXTURES / "modem.yaml").read_text()
+_MODEM_FORM_AUTH_YAML = (_PIPELINE_FIXTURES / "modem_form_auth.yaml").read_text()
+
+# Short, fast schedule — no timeouts, which stall for over a second each.
+_FAULTS = FaultSchedule(auth_expiry_every=7, timeout_every=0, reboot_every=15, reboot_cycles=2)
+
+
+def _build_test_dir(tmp_path: Path, *, modem_yaml: str = _MODEM_YAML, golden: bool = True) -> ModemTestCase:
+    """Build a modem dir from the shared pipeline fixtures; return its test case."""
+    modem_dir = tmp_path / "modems" / "solentlabs" / "t100"
+    tests_dir = modem_dir / "test_data"
+    tests_dir.mkdir(parents=True)
+
+    (modem_dir / "modem.yaml").write_text(modem_yaml)
+    (modem_dir / "parser.yaml").write_text((_PIPELINE_FIXTURES / "parser.yaml").read_text())
+    (tests_dir / "modem.har").write_text(json.dumps(load_fixture(_PIPELINE_FIXTURES / "har_2ch.json")))
+    if golden:
+        (tests_dir / "modem.expected.json").write_text(
+            json.dumps(load_fixture(_PIPELINE_FIXTURES / "golden_2ch.json")),
+        )
+
+    cases = discover_modem_tests(modem_dir)
+    assert len(cases) == 1
+    return cases[0]
+
+
+# ┌───────┬──────────────────────────┬─────────────┐
+# │ cycle │ why                      │ fault       │
+# ├───────┼──────────────────────────┼─────────────┤
+# │ 1     │ no period reached        │ None        │
+# │ 7     │ auth expiry period       │ AUTH_EXPIRY │
+# │ 15    │ reboot starts            │ DOWN        │
+# │ 16    │ reboot continues         │ DOWN        │
+# │ 17    │ reboot over              │ None        │
+# │ 20    │ timeout period           │ TIMEOUT     │
+# │ 28    │ auth expiry again        │ AUTH_EXPIRY │
+# │ 30    │ reboot beats timeout     │ DOWN        │
+# │ 35    │ timeout beats expiry     │ TIMEOUT     │
+# └───────┴──────────────────────────┴─────────────┘
+#
+# fmt: off
+_SCHEDULE_CASES = [
+    (1,  "no period reached",     None),
+    (7,  "auth expiry period",    ServerFault.AUTH_EXPIRY),
+    (15, "reboot starts",         ServerFault.DOWN),
+    (16, "reboot continues",      ServerFault.DOWN),
+    (17, "reboot over",           None),
+    (20, "timeout period",        ServerFault.TIMEOUT),
+    (28, "auth expiry again",     ServerFault.AUTH_EXPIRY),
+    (30, "reboot beats timeout",  ServerFault.DOWN),
+    (35, "timeout beats expiry",  ServerFault.TIMEOUT),
+]
+# fmt: on
+
+
+@pytest.mark.parametrize(
+    "cycle,desc,expected",
+    _SCHEDULE_CASES,
+    ids=[c[1] for c in _SCHEDULE_CASES],
+)
+def test_fault_schedule(cycle: int, desc: str, expected: ServerFault | None) -> None:
+    schedule = FaultSchedule(auth_expiry_every=7, timeout_every=5, reboot_every=15, reboot_cycles=2)
+    assert schedule.fault_for(cycle) is expected, desc
+
+
+class TestRunSoak:
+    """Short soaks against the pipeline fixtures."""
+
+    def test_passes_and_recovers(self, tmp_path: Path) -> None:
+        """Faults are played back, the run recovers and stays in budget."""
+        case = _build_test_dir(tmp_path)
+
+        result = run_soak(case, cycles=40, warmup=10, sample_every=10, faults=_FAULTS)
+
+        assert result.passed is True, result.violations or result.error
+        assert [s.cycle for s in result.samples] == [10, 20, 30, 40]
+        assert {"online", "auth_failed", "unreachable"} <= set(result.statuses)
+        assert sum(result.statuses.values()) == 40
+
+    def test_over_budget_fails(self, tmp_path: Path) -> None:
+        """A zero latency budget is always exceeded."""
+        case = _build_test_dir(tmp_path)
+        budget = SoakBudget(latency_ratio=0.0, latency_slack_seconds=0.0)
+
+        result = run_soak(case, cycles=30, warmup=10, sample_every=10, faults=_FAULTS, budget=budget)
+
+        assert result.passed is False
+        assert any("median poll latency rose" in v for v in result.violations)
+
+    def test_no_recovery_fails(self, tmp_path: Path) -> None:
+        """A modem that never comes back ONLINE fails the run."""
+        case = _build_test_dir(tmp_path, modem_yaml=_MODEM_FORM_AUTH_YAML)
+
+        result = run_soak(case, cycles=20, warmup=5, sample_every=5, faults=_FAULTS)
+
+        assert result.passed is False
+        assert any("did not recover" in v for v in result.violations)
+
+    def test_load_error_captured(self, tmp_path: Path) -> None:
+        """A test case that cannot load is an error result."""
+        case = _build_test_dir(tmp_path, golden=False)
+
+        result = run_soak(case, cycles=20, warmup=5)
+
+        assert result.passed is False
+        assert "Golden file not found" in result.error
+
+    def test_no_measured_window_rejected(self, tmp_path: Path) -> None:
+        """cycles must leave room after the warm-up and the quiet tail."""
+        case = _build_test_dir(tmp_path)
+
+        with pytest.raises(ValueError, match="cycles > warmup"):
+            run_soak(case, cycles=15, warmup=10)
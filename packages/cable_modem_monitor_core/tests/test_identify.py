@@ -0,0 +1,306 @@
+"""Tests for modem auto-identification.
+
+Covers marker extraction from modem.yaml, parser.yaml and HAR
+fixtures; rarity weighting; ranking against observed pages; the
+second-request probe; and detection end to end against the HAR mock
+server and through the ``identify`` CLI.
+
+See ORCHESTRATION_SPEC.md § Modem Identification.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+from typing import Any
+
+import pytest
+from solentlabs.cable_modem_monitor_core.__main__ import main
+from solentlabs.cable_modem_monitor_core.identify import (
+    FingerprintIndex,
+    Marker,
+    MarkerKind,
+    ObservedPage,
+    build_fingerprint_index,
+    identify_modem,
+    rank_candidates,
+)
+from solentlabs.cable_modem_monitor_core.test_harness.server import HARMockServer
+
+PIPELINE_DIR = Path(__file__).parent / "fixtures" / "pipeline"
+
+_T200_MODEM = """\
+manufacturer: Solent Labs
+model: T200
+transport: http
+default_host: 192.168.100.1
+auth:
+  strategy: form
+  action: /goform/login
+  username_field: loginUser
+  password_field: [loginPass]
+hardware:
+  docsis_version: "3.1"
+status: awaiting_verification
+attribution:
+  contributors:
+    - github: test-user
+      contribution: Initial capture
+isps:
+  - Various
+"""
+
+_T200_PARSER = """\
+downstream:
+  format: javascript
+  resource: /cgi/status.asp
+  functions:
+    - name: InitDsTableTagValue
+      delimiter: "|"
+      fields_per_channel: 2
+      fields:
+        - offset: 0
+          field: channel_id
+          type: integer
+        - offset: 1
+          field: power
+          type: float
+"""
+
+
+# ------------------------------------------------------------------
+# Helpers
+# ------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def catalog(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Three-modem catalog: T100 (table, no auth), T200 (JS, form), Z9 (HNAP)."""
+    root = tmp_path_factory.mktemp("catalog")
+    t100 = root / "solent" / "t100"
+    t100.mkdir(parents=True)
+    shutil.copy(PIPELINE_DIR / "modem.yaml", t100 / "modem.yaml")
+    shutil.copy(PIPELINE_DIR / "parser.yaml", t100 / "parser.yaml")
+
+    t200 = root / "solent" / "t200"
+    t200.mkdir(parents=True)
+    (t200 / "modem.yaml").write_text(_T200_MODEM)
+    (t200 / "parser.yaml").write_text(_T200_PARSER)
+    (t200 / "test_data").mkdir()
+    (t200 / "test_data" / "modem.har").write_text(
+        json.dumps(
+            {
+                "log": {
+                    "entries": [
+                        {
+                            "request": {"method": "GET", "url": "http://192.168.100.1/"},
+                            "response": {
+                                "status": 200,
+                                "headers": [],
+                                "content": {"text": "<html><title>T200  Gateway</title></html>"},
+                            },
+                        }
+                    ]
+                }
+            }
+        )
+    )
+
+    z9 = root / "zeta" / "z9"
+    z9.mkdir(parents=True)
+    z9_modem = (PIPELINE_DIR / "modem_hnap.yaml").read_text()
+    (z9 / "modem.yaml").write_text(z9_modem.replace("Solent Labs", "Zeta").replace("model: T100", "model: Z9"))
+    shutil.copy(PIPELINE_DIR / "parser_hnap.yaml", z9 / "parser.yaml")
+    return root
+
+
+@pytest.fixture(scope="module")
+def index(catalog: Path) -> FingerprintIndex:
+    return build_fingerprint_index(catalog)
+
+
+def _page(text: str, *, path: str = "/", status: int = 200, headers: dict[str, str] | None = None) -> ObservedPage:
+    return ObservedPage(path=path, final_path=path, status_code=status, headers=headers or {}, text=text)
+
+
+def _markers(index: FingerprintIndex, modem_dir: str) -> set[tuple[str, str]]:
+    fp = next(fp for fp in index.fingerprints if fp.modem_dir == modem_dir)
+    return {(m.kind.value, m.value) for m in fp.markers}
+
+
+# ------------------------------------------------------------------
+# Index
+# ------------------------------------------------------------------
+
+
+class TestFingerprintIndex:
+    """Markers derived from configs and fixtures."""
+
+    def test_every_variant_indexed(self, index: FingerprintIndex) -> None:
+        assert sorted(fp.modem_dir for fp in index.fingerprints) == ["solent/t100", "solent/t200", "zeta/z9"]
+
+    def test_parser_markers(self, index: FingerprintIndex) -> None:
+        markers = _markers(index, "solent/t200")
+        assert ("path", "/cgi/status.asp") in markers
+        assert ("js_function", "InitDsTableTagValue") in markers
+        assert ("text", "Downstream") in _markers(index, "solent/t100")
+
+    def test_auth_markers(self, index: FingerprintIndex) -> None:
+        markers = _markers(index, "solent/t200")
+        assert {("path", "/goform/login"), ("login_field", "loginUser"), ("login_field", "loginPass")} <= markers
+        assert ("endpoint", "/HNAP1/") in _markers(index, "zeta/z9")
+
+    def test_har_title(self, index: FingerprintIndex) -> None:
+        assert ("title", "T200 Gateway") in _markers(index, "solent/t200")
+
+    def test_lfs_pointer_har_ignored(self, tmp_path: Path, catalog: Path) -> None:
+        copy = tmp_path / "catalog"
+        shutil.copytree(catalog, copy)
+        (copy / "solent" / "t200" / "test_data" / "modem.har").write_text(
+            "version https://git-lfs.github.com/spec/v1\noid sha256:00\nsize 1\n"
+        )
+        markers = _markers(build_fingerprint_index(copy), "solent/t200")
+        assert not any(kind == "title" for kind, _ in markers)
+
+    def test_shared_markers_weigh_less(self, index: FingerprintIndex) -> None:
+        shared = Marker(MarkerKind.MANUFACTURER, "Solent Labs")
+        unique = Marker(MarkerKind.MANUFACTURER, "Zeta")
+        assert index.weight(shared) < index.weight(unique)
+
+
+# ------------------------------------------------------------------
+# Ranking
+# ------------------------------------------------------------------
+
+
+# ┌────────────────────┬────────────────────────────────────────────────────┬─────────────┐
+# │ id                 │ landing page                                       │ top         │
+# ├────────────────────┼────────────────────────────────────────────────────┼─────────────┤
+# │ model-in-body      │ "Welcome to your T200"                             │ solent/t200 │
+# │ js-function        │ function InitDsTableTagValue() in a script         │ solent/t200 │
+# │ login-form         │ <form action="/goform/login"> with loginUser field │ solent/t200 │
+# │ har-title          │ <title>T200 Gateway</title>                        │ solent/t200 │
+# │ data-page-link     │ <a href="/status.html"> + "Downstream" header      │ solent/t100 │
+# │ hnap-endpoint      │ script posting to /HNAP1/                          │ zeta/z9     │
+# │ model-word-bounded │ "T1000" must not match T100                        │ none        │
+# └────────────────────┴────────────────────────────────────────────────────┴─────────────┘
+#
+# fmt: off
+RANK_CASES = [
+    ("model-in-body",      "<p>Welcome to your T200</p>",                                   "solent/t200"),
+    ("js-function",        "<script>function InitDsTableTagValue() {}</script>",           "solent/t200"),
+    ("login-form",         '<form action="/goform/login"><input name="loginUser"></form>',  "solent/t200"),
+    ("har-title",          "<html><title>T200 Gateway</title></html>",                     "solent/t200"),
+    ("data-page-link",     '<a href="/status.html">Downstream</a>',                        "solent/t100"),
+    ("hnap-endpoint",      "<script>xhr.open('POST', '/HNAP1/')</script>",                 "zeta/z9"),
+    ("model-word-bounded", "<p>T1000</p>",                                                  None),
+]
+# fmt: on
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [(c[1], c[2]) for c in RANK_CASES],
+    ids=[c[0] for c in RANK_CASES],
+)
+def test_rank_top_candidate(index: FingerprintIndex, text: str, expected: str | None) -> None:
+    candidates = rank_candidates(index, [_page(text)])
+    top = candidates[0].modem_dir if candidates else None
+    assert top == expected
+
+
+class TestRanking:
+    """Scores, evidence and multi-page ranking."""
+
+    def test_matched_evidence_reported(self, index: FingerprintIndex) -> None:
+        top, *_ = rank_candidates(index, [_page("<p>T200</p><script>function InitDsTableTagValue(){}</script>")])
+        assert top.matched == ("js_function:InitDsTableTagValue", "model:T200")
+        assert top.score > 0
+
+    def test_more_evidence_scores_higher(self, index: FingerprintIndex) -> None:
+        one = rank_candidates(index, [_page("T200")])[0].score
+        two = rank_candidates(index, [_page("T200 /cgi/status.asp")])[0].score
+        assert two > one
+
+    def test_requested_path_counts_when_served(self, index: FingerprintIndex) -> None:
+        page = _page("<table></table>", path="/cgi/status.asp")
+        assert rank_candidates(index, [page])[0].modem_dir == "solent/t200"
+        assert rank_candidates(index, [_page("", path="/cgi/status.asp", status=404)]) == []
+
+    def test_basic_auth_realm(self, catalog: Path, tmp_path: Path) -> None:
+        copy = tmp_path / "catalog"
+        shutil.copytree(catalog, copy)
+        har = copy / "solent" / "t100" / "test_data"
+        har.mkdir()
+        entry: dict[str, Any] = {
+            "request": {"method": "GET", "url": "http://192.168.100.1/"},
+            "response": {
+                "status": 401,
+                "headers": [{"name": "WWW-Authenticate", "value": 'Basic realm="T100 Admin"'}],
+                "content": {"text": ""},
+            },
+        }
+        (har / "modem.har").write_text(json.dumps({"log": {"entries": [entry]}}))
+
+        page = _page("", status=401, headers={"www-authenticate": 'Basic realm="T100 Admin"'})
+        top, *_ = rank_candidates(build_fingerprint_index(copy), [page])
+        assert (top.modem_dir, top.matched) == ("solent/t100", ("realm:T100 Admin",))
+
+
+# ------------------------------------------------------------------
+# Detection
+# ------------------------------------------------------------------
+
+
+def _entry(path: str, body: str, status: int = 200) -> dict[str, Any]:
+    return {
+        "request": {"method": "GET", "url": f"http://192.168.100.1{path}", "headers": []},
+        "response": {
+            "status": status,
+            "headers": [{"name": "Content-Type", "value": "text/html"}],
+            "content": {"mimeType": "text/html", "text": body},
+        },
+    }
+
+
+class TestIdentifyModem:
+    """Unauthenticated requests against the HAR mock server."""
+
+    def test_single_request_when_unambiguous(self, catalog: Path) -> None:
+        entries = [_entry("/", "<title>T200 Gateway</title><script>function InitDsTableTagValue(){}</script>")]
+        with HARMockServer(entries) as server:
+            result = identify_modem(server.base_url, catalog)
+        assert result.pages == ["/"]
+        assert result.candidates[0].model == "T200"
+
+    def test_second_request_when_nothing_matched(self, catalog: Path) -> None:
+        """A blank landing page probes the catalog's most common data page."""
+        entries = [
+            _entry("/", "<html></html>"),
+            _entry("/cgi/status.asp", "<script>function InitDsTableTagValue(){}</script>"),
+            _entry("/status.html", "<table><tr><th>Downstream</th></tr></table>"),
+        ]
+        with HARMockServer(entries) as server:
+            result = identify_modem(server.base_url, catalog)
+        assert len(result.pages) == 2
+        assert result.candidates[0].modem_dir in ("solent/t100", "solent/t200")
+        assert result.candidates[0].score > 0
+
+    def test_max_requests_one(self, catalog: Path) -> None:
+        with HARMockServer([_entry("/", "<html></html>")]) as server:
+            result = identify_modem(server.base_url, catalog, max_requests=1)
+        assert result.pages == ["/"]
+        assert result.candidates == []
+
+    def test_unreachable_raises(self, catalog: Path) -> None:
+        with pytest.raises(ConnectionError):
+            identify_modem("http://127.0.0.1:9", catalog, timeout=0.5)
+
+    def test_cli(self, catalog: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        entries = [_entry("/", "<p>Zeta Z9</p><script>post('/HNAP1/')</script>")]
+        with HARMockServer(entries) as server:
+            host = server.base_url.removeprefix("http://")
+            assert main(["identify", "--host", host, "--catalog", str(catalog), "--limit", "1"]) == 0
+        (line,) = capsys.readouterr().out.splitlines()
+        assert json.loads(line)["modem_dir"] == "zeta/z9"
@@ -0,0 +1,121 @@
+"""Import-time budget for the modules the HA integration imports.
+
+Home Assistant imports the integration — and with it Core — on the
+event loop. Everything a single entry does not need at import time
+(bs4 and its tree builders, format parsers, auth strategies other than
+the factory's fallback) must stay deferred until first use.
+
+Measured with ``python -X importtime`` in a fresh interpreter, so the
+result reflects a cold import regardless of what this test session
+has already loaded.
+
+See ``lazy_exports`` and ARCHITECTURE.md § Import Cost.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+from solentlabs.cable_modem_monitor_core.auth import FormAuthManager
+from solentlabs.cable_modem_monitor_core.lazy_exports import lazy_exports
+from solentlabs.cable_modem_monitor_core.parsers import registries
+
+CORE = "solentlabs.cable_modem_monitor_core"
+
+# What custom_components/cable_modem_monitor imports at module level.
+ENTRY_MODULES = [
+    f"{CORE}.auth.base",
+    f"{CORE}.auth.factory",
+    f"{CORE}.catalog_manager",
+    f"{CORE}.config_loader",
+    f"{CORE}.connectivity",
+    f"{CORE}.fetch_list",
+    f"{CORE}.models.field_registry",
+    f"{CORE}.orchestration",
+    f"{CORE}.post_processor",
+]
+
+# Core's own self-time (sum over solentlabs.* modules), in ms. Measured
+# ~105 ms on a developer laptop; the headroom absorbs slow CI runners.
+# Third-party time (pydantic, requests) is excluded — it is paid by
+# every HA integration and is not ours to budget.
+BUDGET_MS = float(os.environ.get("CMM_IMPORT_BUDGET_MS", "400"))
+
+# ┌─────────────────────────────────┬────────────────────────────────────────┐
+# │ deferred module (prefix)        │ loaded when                            │
+# ├─────────────────────────────────┼────────────────────────────────────────┤
+# │ bs4                             │ first HTML response / form login       │
+# │ lxml, html5lib                  │ bs4 tree builders                      │
+# │ parsers.formats.                │ first parse of that format             │
+# │ parsers.table_selector          │ first HTML table parse                 │
+# │ auth.form, auth.form_nonce, ... │ factory resolves the declared strategy │
+# └─────────────────────────────────┴────────────────────────────────────────┘
+#
+# fmt: off
+DEFERRED = [
+    "bs4",
+    "lxml",
+    "html5lib",
+    f"{CORE}.parsers.formats.",
+    f"{CORE}.parsers.table_selector",
+    f"{CORE}.auth.basic",
+    f"{CORE}.auth.form",
+    f"{CORE}.auth.form_nonce",
+    f"{CORE}.auth.form_pbkdf2",
+    f"{CORE}.auth.hnap",
+    f"{CORE}.auth.url_token",
+]
+# fmt: on
+
+
+@pytest.fixture(scope="module")
+def import_times() -> dict[str, int]:
+    """Self-time in microseconds per module for a cold import of ENTRY_MODULES."""
+    code = "; ".join(f"import {name}" for name in ENTRY_MODULES)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(self_us)
+    return times
+
+
+@pytest.mark.parametrize("prefix", DEFERRED)
+def test_not_imported_eagerly(import_times: dict[str, int], prefix: str) -> None:
+    loaded = sorted(name for name in import_times if name == prefix or name.startswith(prefix))
+    assert not loaded, f"imported at integration load: {loaded}"
+
+
+def test_core_self_time_within_budget(import_times: dict[str, int]) -> None:
+    core = {name: us for name, us in import_times.items() if name.startswith(CORE)}
+    total_ms = sum(core.values()) / 1000
+    slowest = sorted(core.items(), key=lambda item: item[1], reverse=True)[:10]
+    report = "\n".join(f"  {us / 1000:7.1f} ms  {name}" for name, us in slowest)
+    assert total_ms <= BUDGET_MS, f"Core import self-time {total_ms:.0f} ms > {BUDGET_MS:.0f} ms:\n{report}"
+
+
+class TestLazyExports:
+    """Deferred names still resolve like eager imports."""
+
+    def test_package_export_resolves(self) -> None:
+        assert FormAuthManager.__name__ == "FormAuthManager"
+
+    def test_registry_parser_resolves_and_caches(self) -> None:
+        cls = registries._parser("HTMLTableParser")
+        assert cls.__name__ == "HTMLTableParser"
+        assert vars(registries)["HTMLTableParser"] is cls
+
+    def test_unknown_name_raises_attribute_error(self) -> None:
+        getter = lazy_exports(registries.__name__, {})
+        with pytest.raises(AttributeError, match="has no attribute 'Missing'"):
+            getter("Missing")
@@ -0,0 +1,80 @@
+"""Tests for the orjson-or-stdlib JSON decoder.
+
+Table-driven tests check every result against the stdlib, with orjson
+(when installed) and with it forced off; inline tests for errors.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+
+import pytest
+from solentlabs.cable_modem_monitor_core import json_codec
+from solentlabs.cable_modem_monitor_core.json_codec import decode_json
+
+
+@pytest.fixture(params=["installed", "stdlib"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    """Run once with whatever is installed and once with orjson off."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(json_codec, "orjson", None)
+    yield request.param
+
+
+# ┌────────────────┬──────────────────────────────────────────────┐
+# │ id             │ document                                     │
+# ├────────────────┼──────────────────────────────────────────────┤
+# │ object         │ nested object, floats, literals              │
+# │ unicode        │ non-ASCII text and \u escapes                │
+# │ nan            │ NaN / Infinity literals (stdlib extension)   │
+# │ big-int        │ integer beyond 64 bits stays an int          │
+# │ long-digits    │ 19-digit string value                        │
+# │ overflow-float │ 1e400 reads as inf                           │
+# │ lone-surrogate │ \ud800 escape                                │
+# │ deep           │ nesting deeper than 1024                     │
+# │ duplicate-key  │ last value wins                              │
+# │ negative-zero  │ -0 and -0.0                                  │
+# └────────────────┴──────────────────────────────────────────────┘
+#
+# fmt: off
+_DOCUMENT_CASES = [
+    ("object",         '{"a": {"b": [1, 2.5, true, null]}, "c": "x"}'),
+    ("unicode",        '{"s": "café", "e": "\\u00e9\\ud83d\\ude00"}'),
+    ("nan",            '[NaN, Infinity, -Infinity]'),
+    ("big-int",        '{"v": 18446744073709551616, "n": -9223372036854775809}'),
+    ("long-digits",    '{"serial": "1234567890123456789"}'),
+    ("overflow-float", '[1e400, -1e400, 5e-324]'),
+    ("lone-surrogate", '"\\ud800"'),
+    ("deep",           "[" * 1100 + "]" * 1100),
+    ("duplicate-key",  '{"a": 1, "a": 2}'),
+    ("negative-zero",  '[-0, -0.0]'),
+]
+# fmt: on
+
+
+@pytest.mark.parametrize(
+    "document",
+    [c[1] for c in _DOCUMENT_CASES],
+    ids=[c[0] for c in _DOCUMENT_CASES],
+)
+@pytest.mark.usefixtures("backend")
+def test_decode_matches_stdlib(document: str) -> None:
+    expected = json.loads(document)
+    for data in (document, document.encode("utf-8", "surrogatepass")):
+        result = decode_json(data)
+        assert repr(result) == repr(expected)
+
+
+class TestDecodeJSON:
+    """Errors and byte input are the stdlib's."""
+
+    @pytest.mark.usefixtures("backend")
+    @pytest.mark.parametrize("document", ["", "{", "[1,]", "01", "{'a': 1}"])
+    def test_invalid_raises_json_decode_error(self, document: str) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            decode_json(document)
+
+    @pytest.mark.usefixtures("backend")
+    def test_utf16_bytes(self) -> None:
+        assert decode_json('{"a": "é"}'.encode("utf-16")) == {"a": "é"}
@@ -0,0 +1,348 @@
+"""Tests for the headless poller and the ``poll`` CLI.
+
+Covers fleet-file validation, JSON Lines sinks (file, Unix socket),
+record shape, one-shot and daemon runs, and an end-to-end CLI poll
+against the HAR mock server using the pipeline fixtures as a
+one-modem catalog.
+
+See ORCHESTRATION_SPEC.md § Headless Poller.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import shutil
+import socket
+import threading
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pydantic import ValidationError
+from solentlabs.cable_modem_monitor_core.__main__ import main
+from solentlabs.cable_modem_monitor_core.exporter import OpenMetricsExporter
+from solentlabs.cable_modem_monitor_core.har import load_har_json
+from solentlabs.cable_modem_monitor_core.loaders.http import HTTPResourceLoader
+from solentlabs.cable_modem_monitor_core.orchestration.models import (
+    HealthInfo,
+    ModemIdentity,
+    ModemSnapshot,
+    OrchestratorDiagnostics,
+    ResourceFetch,
+)
+from solentlabs.cable_modem_monitor_core.orchestration.signals import ConnectionStatus, HealthStatus
+from solentlabs.cable_modem_monitor_core.poller import (
+    FileSink,
+    JsonLinesWriter,
+    Poller,
+    PollerConfig,
+    PollTarget,
+    SocketSink,
+    StreamSink,
+    load_poller_config,
+)
+from solentlabs.cable_modem_monitor_core.test_harness.server import HARMockServer
+
+PIPELINE_DIR = Path(__file__).parent / "fixtures" / "pipeline"
+_COLLECTOR = "solentlabs.cable_modem_monitor_core.orchestration.collector"
+
+# ------------------------------------------------------------------
+# Helpers
+# ------------------------------------------------------------------
+
+
+def _target(name: str = "office", **kwargs: Any) -> PollTarget:
+    return PollTarget(name=name, modem_dir="acme/t100", host=f"{name}.lan", **kwargs)
+
+
+def _fake_build(target: PollTarget, catalog_path: Path) -> tuple[MagicMock, MagicMock, ModemIdentity]:
+    """Component factory returning a mock orchestrator with a real snapshot."""
+    orchestrator = MagicMock()
+    orchestrator.recovery_active = False
+    orchestrator.get_modem_data.return_value = ModemSnapshot(
+        connection_status=ConnectionStatus.ONLINE,
+        docsis_status="operational",
+        modem_data={"downstream": [], "upstream": [], "system_info": {}},
+    )
+    orchestrator.diagnostics.return_value = OrchestratorDiagnostics(
+        poll_duration=0.25,
+        auth_failure_streak=0,
+        circuit_breaker_open=False,
+        session_is_valid=True,
+        resource_fetches=[ResourceFetch(path="/status.html", duration_ms=12.0, size_bytes=2048)],
+    )
+    health = MagicMock()
+    health.ping.return_value = HealthInfo(health_status=HealthStatus.RESPONSIVE, icmp_latency_ms=1.5)
+    return orchestrator, health, ModemIdentity(manufacturer="Acme", model="T100")
+
+
+def _records(buffer: io.StringIO) -> list[dict[str, Any]]:
+    return [json.loads(line) for line in buffer.getvalue().splitlines()]
+
+
+# ------------------------------------------------------------------
+# Fleet file
+# ------------------------------------------------------------------
+
+
+class TestPollerConfig:
+    """Fleet file loading and validation."""
+
+    def test_loads_yaml(self, tmp_path: Path) -> None:
+        path = tmp_path / "fleet.yaml"
+        path.write_text(
+            "max_workers: 8\n"
+            "modems:\n"
+            "  - {name: a, modem_dir: arris/sb8200, host: 10.0.0.1}\n"
+            "  - {name: b, modem_dir: netgear/cm1200, host: 10.0.0.2, scan_interval: 60, health_interval: null}\n"
+        )
+        config = load_poller_config(path)
+        assert config.max_workers == 8
+        assert [t.name for t in config.modems] == ["a", "b"]
+        assert config.modems[1].health_interval is None
+
+    def test_rejects_duplicate_names(self) -> None:
+        with pytest.raises(ValidationError, match="duplicate modem name 'a'"):
+            PollerConfig(modems=[_target("a"), _target("a")])
+
+    def test_rejects_unknown_keys(self) -> None:
+        with pytest.raises(ValidationError):
+            PollTarget.model_validate({"name": "a", "modem_dir": "x", "host": "h", "pasword": "typo"})
+
+    def test_password_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("CMM_TEST_PW", "secret")
+        assert _target(password="ignored", password_env="CMM_TEST_PW").resolved_password() == "secret"
+        assert _target(password="inline").resolved_password() == "inline"
+
+
+# ------------------------------------------------------------------
+# Sinks
+# ------------------------------------------------------------------
+
+
+class TestSinks:
+    """JSON Lines fan-out."""
+
+    def test_writer_fans_out(self, tmp_path: Path) -> None:
+        stream = io.StringIO()
+        path = tmp_path / "out.jsonl"
+        writer = JsonLinesWriter([StreamSink(stream), FileSink(path)])
+        writer.write({"a": 1})
+        writer.write({"b": 2})
+        writer.close()
+        assert stream.getvalue() == path.read_text() == '{"a":1}\n{"b":2}\n'
+
+    def test_writer_output_is_stdlib_json(self) -> None:
+        stream = io.StringIO()
+        writer = JsonLinesWriter([StreamSink(stream)])
+        writer.write({"s": "café", "f": float("nan"), "t": datetime(2026, 1, 1, tzinfo=UTC)})
+        assert stream.getvalue() == '{"s":"caf\\u00e9","f":NaN,"t":"2026-01-01 00:00:00+00:00"}\n'
+
+    def test_file_sink_appends(self, tmp_path: Path) -> None:
+        path = tmp_path / "out.jsonl"
+        path.write_text("old\n")
+        sink = FileSink(path)
+        sink.write("new\n")
+        sink.close()
+        assert path.read_text() == "old\nnew\n"
+
+    def test_socket_sink_broadcasts(self, tmp_path: Path) -> None:
+        path = tmp_path / "cmm.sock"
+        sink = SocketSink(path)
+        readers = []
+        for _ in range(2):
+            reader = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            reader.connect(str(path))
+            readers.append(reader)
+        deadline = time.monotonic() + 5
+        while sink.client_count < 2:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+        sink.write('{"x":1}\n')
+        for reader in readers:
+            reader.settimeout(5)
+            assert reader.recv(64) == b'{"x":1}\n'
+            reader.close()
+
+        sink.close()
+        assert not path.exists()
+
+    def test_socket_sink_drops_stalled_reader(self, tmp_path: Path) -> None:
+        """A reader that never reads is dropped instead of blocking writes."""
+        path = tmp_path / "cmm.sock"
+        sink = SocketSink(path, send_timeout=0.1)
+        reader = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        reader.connect(str(path))
+        deadline = time.monotonic() + 5
+        while sink.client_count < 1:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+        record = "x" * 65536 + "\n"
+        started = time.monotonic()
+        while sink.client_count:
+            assert time.monotonic() - started < 5, "stalled reader never dropped"
+            sink.write(record)
+
+        reader.close()
+        sink.close()
+
+
+# ------------------------------------------------------------------
+# Poller
+# ------------------------------------------------------------------
+
+
+class TestPoller:
+    """Record shape and run modes with mocked components."""
+
+    def test_run_once_emits_one_snapshot_per_modem(self) -> None:
+        stream = io.StringIO()
+        poller = Poller(
+            [_target("a"), _target("b"), _target("c")],
+            JsonLinesWriter([StreamSink(stream)]),
+            catalog_path=Path("/catalog"),
+            max_workers=2,
+            build=_fake_build,
+        )
+        assert poller.run_once(timeout=5) == 3
+
+        records = _records(stream)
+        assert sorted(r["modem"] for r in records) == ["a", "b", "c"]
+        record = records[0]
+        assert record["type"] == "snapshot"
+        assert record["model"] == "T100"
+        assert record["host"] == f"{record['modem']}.lan"
+        assert record["timings"]["poll_duration_s"] == 0.25
+        assert record["timings"]["queue_delay_s"] >= 0.0
+        assert record["timings"]["resources"][0]["path"] == "/status.html"
+        assert record["snapshot"]["connection_status"] == "online"
+        assert record["snapshot"]["schema_version"] == 1
+
+    def test_run_once_timeout_covers_the_whole_run(self) -> None:
+        """With one worker the polls queue; ``timeout`` bounds them together, not each."""
+
+        def slow_build(target: PollTarget, catalog_path: Path) -> tuple[MagicMock, MagicMock, ModemIdentity]:
+            orchestrator, health, identity = _fake_build(target, catalog_path)
+            snapshot = orchestrator.get_modem_data.return_value
+            orchestrator.get_modem_data.side_effect = lambda: time.sleep(0.2) or snapshot
+            return orchestrator, health, identity
+
+        poller = Poller(
+            [_target("a"), _target("b"), _target("c")],
+            JsonLinesWriter([StreamSink(io.StringIO())]),
+            catalog_path=Path("/catalog"),
+            max_workers=1,
+            build=slow_build,
+        )
+        started = time.monotonic()
+        with pytest.raises(TimeoutError):
+            poller.run_once(timeout=0.3)
+        assert time.monotonic() - started < 0.55
+
+    def test_exporter_receives_snapshots(self) -> None:
+        exporter = OpenMetricsExporter()
+        poller = Poller(
+            [_target("a")],
+            JsonLinesWriter([StreamSink(io.StringIO())]),
+            catalog_path=Path("/catalog"),
+            exporter=exporter,
+            build=_fake_build,
+        )
+        poller.run_once(timeout=5)
+        metrics = exporter.render()
+        assert 'cable_modem_polls_total{modem="a",connection_status="online"} 1' in metrics
+        assert 'cable_modem_resource_fetch_seconds{modem="a",path="/status.html"} 0.012' in metrics
+
+    def test_run_forever_emits_health_and_polls(self) -> None:
+        stream = io.StringIO()
+        poller = Poller(
+            [_target("a", scan_interval=0.05, health_interval=0.02)],
+            JsonLinesWriter([StreamSink(stream)]),
+            catalog_path=Path("/catalog"),
+            build=_fake_build,
+        )
+        stop = threading.Event()
+        worker = threading.Thread(target=poller.run_forever, args=(stop,))
+        worker.start()
+        deadline = time.monotonic() + 5
+        while not {"snapshot", "health"} <= {r["type"] for r in _records(stream)}:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        stop.set()
+        worker.join(5)
+
+        health = next(r for r in _records(stream) if r["type"] == "health")
+        assert health["health"] == {
+            "health_status": "responsive",
+            "icmp_latency_ms": 1.5,
+            "tcp_latency_ms": None,
+            "http_latency_ms": None,
+        }
+
+
+# ------------------------------------------------------------------
+# CLI
+# ------------------------------------------------------------------
+
+
+class TestCli:
+    """``python -m solentlabs.cable_modem_monitor_core poll``."""
+
+    def test_modem_requires_host(self, capsys: pytest.CaptureFixture[str]) -> None:
+        assert main(["poll", "--modem", "acme/t100", "--catalog", "/nowhere"]) == 1
+        assert "--host is required" in capsys.readouterr().err
+
+    def test_metrics_requires_daemon(self, capsys: pytest.CaptureFixture[str]) -> None:
+        argv = ["poll", "--modem", "acme/t100", "--host", "h", "--catalog", "/nowhere", "--metrics-port", "0"]
+        assert main(argv) == 1
+        assert "--metrics-port requires --daemon" in capsys.readouterr().err
+
+    def test_missing_fleet_file(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        assert main(["poll", "--config", str(tmp_path / "missing.yaml"), "--catalog", "/nowhere"]) == 1
+        assert "Error:" in capsys.readouterr().err
+
+    def test_unopenable_output(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """A bad sink path is reported before the metrics server starts."""
+        modem_dir = tmp_path / "acme" / "t100"
+        modem_dir.mkdir(parents=True)
+        argv = ["poll", "--modem", "acme/t100", "--host", "h", "--catalog", str(tmp_path), "--daemon"]
+        argv += ["--metrics-port", "0", "--output", str(tmp_path / "missing" / "out.jsonl")]
+        assert main(argv) == 1
+        err = capsys.readouterr().err
+        assert "Error:" in err
+        assert "Serving metrics" not in err
+
+    def test_unknown_modem_dir(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        assert main(["poll", "--modem", "acme/none", "--host", "h", "--catalog", str(tmp_path)]) == 1
+        assert "Error:" in capsys.readouterr().err
+
+    @pytest.mark.parametrize("stream_html", [False, True], ids=["buffered", "stream-html"])
+    def test_end_to_end_against_mock_server(self, tmp_path: Path, stream_html: bool) -> None:
+        """One-shot poll of a HAR-backed modem writes one online snapshot."""
+        modem_dir = tmp_path / "catalog" / "acme" / "t100"
+        modem_dir.mkdir(parents=True)
+        shutil.copy(PIPELINE_DIR / "modem.yaml", modem_dir / "modem.yaml")
+        shutil.copy(PIPELINE_DIR / "parser.yaml", modem_dir / "parser.yaml")
+        entries = load_har_json(PIPELINE_DIR / "har_1ch.json")["log"]["entries"]
+        out = tmp_path / "out.jsonl"
+
+        loader_cls = MagicMock(wraps=HTTPResourceLoader)
+        with HARMockServer(entries) as server, patch(f"{_COLLECTOR}.HTTPResourceLoader", loader_cls):
+            host = server.base_url.removeprefix("http://")
+            argv = ["poll", "--catalog", str(tmp_path / "catalog"), "--modem", "acme/t100", "--host", host]
+            if stream_html:
+                argv.append("--stream-html")
+            assert main([*argv, "--output", str(out)]) == 0
+
+        assert loader_cls.call_args.kwargs["stream_html"] is stream_html
+
+        (record,) = [json.loads(line) for line in out.read_text().splitlines()]
+        assert record["snapshot"]["connection_status"] == "online"
+        assert len(record["snapshot"]["modem_data"]["downstream"]) == 1
+        assert record["timings"]["resources"][0]["status_code"] == 200
@@ -2,7 +2,8 @@
 
 Unit tests for ``load_post_processor`` in isolation — covers the
 positive case (parser.py defines a ``PostProcessor`` class), the
-missing-class case, and the non-Python-file edge case.
+missing-class case, the non-Python-file edge case, and the class
+cache.
 
 Pipeline integration tests that exercise PostProcessor *through* the
 runner live in ``tests/test_harness/test_runner.py`` (the runner is
@@ -53,3 +54,27 @@ class TestLoadPostProcessor:
         pp = load_post_processor(bad_file)
 
         assert pp is None
+
+    def test_module_executed_once_per_content(self, tmp_path: Path) -> None:
+        """Unchanged parser.py is imported once; each call gets a new instance."""
+        parser_py = tmp_path / "parser.py"
+        parser_py.write_text(textwrap.dedent("""\
+            from pathlib import Path
+
+            with open(Path(__file__).with_name("imports.log"), "a") as f:
+                f.write("x")
+
+            class PostProcessor:
+                pass
+        """))
+        imports = tmp_path / "imports.log"
+
+        first = load_post_processor(parser_py)
+        second = load_post_processor(parser_py)
+        assert first is not second
+        assert type(first) is type(second)
+        assert imports.read_text() == "x"
+
+        parser_py.write_text(parser_py.read_text() + "# edited\n")
+        load_post_processor(parser_py)
+        assert imports.read_text() == "xx"
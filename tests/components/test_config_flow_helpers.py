@@ -12,6 +12,7 @@ Pre-fetch encoding detection — connectivity vs non-connectivity error handling
 from __future__ import annotations
 
 import json
+import time
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -524,6 +525,25 @@ class TestDetectProbes:
         detect_probes("192.168.100.1", "https://192.168.100.1", config, legacy_ssl=True)
         mock_head.assert_called_once_with("https://192.168.100.1", legacy_ssl=True)
 
+    def test_probes_run_concurrently(self):
+        """Setup waits for the slowest probe, not the sum of both."""
+
+        def slow(*_args, **_kwargs):
+            time.sleep(0.3)
+            return True
+
+        config = MagicMock()
+        config.health.supports_head = True
+        with (
+            patch(f"{_MODULE}.test_icmp", side_effect=slow),
+            patch(f"{_MODULE}.test_http_head", side_effect=slow),
+        ):
+            start = time.monotonic()
+            result = detect_probes("192.168.100.1", "http://192.168.100.1", config)
+            elapsed = time.monotonic() - start
+        assert result == {"supports_icmp": True, "supports_head": True}
+        assert elapsed < 0.55
+
 
 # =====================================================================
 # default_health_check_interval — single default cadence
@@ -0,0 +1,148 @@
+"""Tests for the HA-side fetch mask wiring.
+
+Covers ``build_fetch_mask`` and ``attach_fetch_mask_listener`` in
+``fetch_mask_adapter.py`` — translating the entity registry's disabled
+sensors into a Core ``FetchMask`` and keeping it current.
+
+Uses a real entity registry; the orchestrator is mocked.
+
+See HA_ADAPTER_SPEC.md § Fetch Mask Adapter.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from solentlabs.cable_modem_monitor_core.fetch_list import FetchMask
+
+from custom_components.cable_modem_monitor.const import DOMAIN
+from custom_components.cable_modem_monitor.fetch_mask_adapter import (
+    attach_fetch_mask_listener,
+    build_fetch_mask,
+)
+
+ENTRY_ID = "mask_entry"
+
+# Sensor unique_id suffixes registered for every case
+_SENSORS = [
+    "cable_modem_status",
+    "cable_modem_ds_qam_ch_1_power",
+    "cable_modem_ds_qam_ch_1_snr",
+    "cable_modem_downstream_channel_count",
+    "cable_modem_us_atdma_ch_1_power",
+    "cable_modem_upstream_channel_count",
+    "cable_modem_software_version",
+    "cable_modem_memory_used_pct",
+    "cable_modem_total_corrected",
+    "cable_modem_lan_eth0_received_bytes",
+]
+
+# ┌───────────────────────┬──────────────────────────────────┬─────────────────────────┬──────────────────┐
+# │ id                    │ disabled suffixes                │ expected sections       │ expected ignored │
+# ├───────────────────────┼──────────────────────────────────┼─────────────────────────┼──────────────────┤
+# │ all-enabled           │ —                                │ None (no mask)          │ —                │
+# │ upstream-all-disabled │ us_* + upstream_channel_count    │ downstream, system_info │ —                │
+# │ upstream-partly       │ us_* only (count sensor enabled) │ None (no mask)          │ —                │
+# │ field-disabled        │ memory_used_pct                  │ all                     │ memory_used_pct  │
+# │ unrelated-disabled    │ status, total_corrected, lan_*   │ None (no mask)          │ —                │
+# └───────────────────────┴──────────────────────────────────┴─────────────────────────┴──────────────────┘
+#
+# fmt: off
+MASK_CASES = [
+    ("all-enabled", [], None),
+    (
+        "upstream-all-disabled",
+        ["cable_modem_us_atdma_ch_1_power", "cable_modem_upstream_channel_count"],
+        FetchMask(sections=frozenset({"downstream", "system_info"})),
+    ),
+    ("upstream-partly", ["cable_modem_us_atdma_ch_1_power"], None),
+    (
+        "field-disabled",
+        ["cable_modem_memory_used_pct"],
+        FetchMask(ignored_system_info_fields=frozenset({"memory_used_pct"})),
+    ),
+    (
+        "unrelated-disabled",
+        ["cable_modem_status", "cable_modem_total_corrected", "cable_modem_lan_eth0_received_bytes"],
+        None,
+    ),
+]
+# fmt: on
+
+
+def _register(hass: HomeAssistant, disabled: list[str]) -> tuple[MockConfigEntry, er.EntityRegistry]:
+    """Add a config entry and register its sensors, disabling *disabled*."""
+    entry = MockConfigEntry(domain=DOMAIN, entry_id=ENTRY_ID, data={"model": "T100"})
+    entry.add_to_hass(hass)
+    registry = er.async_get(hass)
+    for suffix in _SENSORS:
+        registry.async_get_or_create(
+            "sensor",
+            DOMAIN,
+            f"{ENTRY_ID}_{suffix}",
+            config_entry=entry,
+            disabled_by=er.RegistryEntryDisabler.USER if suffix in disabled else None,
+        )
+    return entry, registry
+
+
+@pytest.mark.parametrize(
+    "disabled,expected",
+    [(d, e) for _, d, e in MASK_CASES],
+    ids=[c[0] for c in MASK_CASES],
+)
+async def test_build_fetch_mask(hass: HomeAssistant, disabled: list[str], expected: FetchMask | None) -> None:
+    """Mask prunes only categories whose registered sensors are all disabled."""
+    entry, _ = _register(hass, disabled)
+    assert build_fetch_mask(hass, entry) == expected
+
+
+async def test_listener_applies_initial_mask(hass: HomeAssistant) -> None:
+    """Attach pushes the current mask to the orchestrator immediately."""
+    entry, _ = _register(hass, ["cable_modem_memory_used_pct"])
+    orchestrator = MagicMock()
+
+    attach_fetch_mask_listener(hass, entry, orchestrator)
+
+    orchestrator.set_fetch_mask.assert_called_once_with(
+        FetchMask(ignored_system_info_fields=frozenset({"memory_used_pct"}))
+    )
+
+
+async def test_listener_reapplies_on_disable(hass: HomeAssistant) -> None:
+    """Disabling an entry's sensor re-derives and pushes the mask."""
+    entry, registry = _register(hass, [])
+    orchestrator = MagicMock()
+    attach_fetch_mask_listener(hass, entry, orchestrator)
+    orchestrator.set_fetch_mask.assert_called_once_with(None)
+
+    entity_id = registry.async_get_entity_id("sensor", DOMAIN, f"{ENTRY_ID}_cable_modem_memory_used_pct")
+    assert entity_id is not None
+    registry.async_update_entity(entity_id, disabled_by=er.RegistryEntryDisabler.USER)
+    await hass.async_block_till_done()
+
+    orchestrator.set_fetch_mask.assert_called_with(FetchMask(ignored_system_info_fields=frozenset({"memory_used_pct"})))
+
+
+async def test_listener_ignores_other_changes(hass: HomeAssistant) -> None:
+    """Renames and other entries' entities do not re-derive the mask."""
+    entry, registry = _register(hass, [])
+    other = MockConfigEntry(domain=DOMAIN, entry_id="other_entry")
+    other.add_to_hass(hass)
+    foreign = registry.async_get_or_create(
+        "sensor", DOMAIN, "other_entry_cable_modem_software_version", config_entry=other
+    )
+    orchestrator = MagicMock()
+    attach_fetch_mask_listener(hass, entry, orchestrator)
+
+    own_id = registry.async_get_entity_id("sensor", DOMAIN, f"{ENTRY_ID}_cable_modem_software_version")
+    assert own_id is not None
+    registry.async_update_entity(own_id, name="Renamed")
+    registry.async_update_entity(foreign.entity_id, disabled_by=er.RegistryEntryDisabler.USER)
+    await hass.async_block_till_done()
+
+    assert orchestrator.set_fetch_mask.call_count == 1